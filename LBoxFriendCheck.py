@@ -28,25 +28,13 @@ import sys
 import time
 import logging
 import datetime
-import requests
 import itertools
 import tkinter as tk
-from bs4 import BeautifulSoup
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 import sqlite3
-import json
-import random
 import re
 import threading
-import queue
 
 # Username validation regex - alphanumeric, underscore, hyphen
 USERNAME_REGEX = re.compile(r"^[a-zA-Z0-9_-]+$")
@@ -55,6 +43,62 @@ USERNAME_REGEX = re.compile(r"^[a-zA-Z0-9_-]+$")
 current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
+
+from letterboxd_friend_check.api.credentials import invalidate_tmdb_api_key  # noqa: E402
+from letterboxd_friend_check.config import get_config_store  # noqa: E402
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.data.export_import import (  # noqa: E402
+    ExportError,
+    import_letterboxd_export,
+)
+from letterboxd_friend_check.data.maintenance import (  # noqa: E402
+    IdleMaintenance,
+    maintenance_running,
+    run_maintenance,
+    wait_for_maintenance,
+)
+from letterboxd_friend_check.data.movie_index import MOVIE_COLUMNS, FriendMovieIndex  # noqa: E402
+from letterboxd_friend_check.engine import (  # noqa: E402
+    POLICY_SKIP,
+    SyncEngine,
+    SyncProgress,
+    compare_watchlists,
+)
+from letterboxd_friend_check.gui.event_bus import GuiEventBus, PipeWakeup  # noqa: E402
+from letterboxd_friend_check.gui.friend_checklist import FriendChecklistModel  # noqa: E402
+from letterboxd_friend_check.gui.results_model import (  # noqa: E402
+    ALL_FACET_LABEL,
+    RESULT_FACETS,
+    ResultsModel,
+    facet_options,
+    filter_common_movies,
+    new_overlap_movies,
+    new_overlaps_summary,
+    search_common_movies,
+)
+from letterboxd_friend_check.gui.database_dialog import DatabaseDialog  # noqa: E402
+from letterboxd_friend_check.gui.posters import (  # noqa: E402
+    DEFAULT_IMAGE_BASE_URL,
+    THUMBNAIL_SIZE,
+    PosterDiskCache,
+    PosterLoader,
+    default_cache_dir,
+    visible_rows,
+)
+from letterboxd_friend_check.gui.sync_report import SyncReportDialog  # noqa: E402
+from letterboxd_friend_check.gui.theme import THEME_COLORS, ThemeRegistry  # noqa: E402
+from letterboxd_friend_check.utils.instrumentation import SyncInstrumentation  # noqa: E402
+from letterboxd_friend_check.utils.single_flight import SingleFlight  # noqa: E402
+from letterboxd_friend_check.utils.web import (  # noqa: E402, F401 - re-exported API
+    BASE_URL,
+    get_friends,
+    get_session as _get_session,
+    get_watched_films,
+    get_watchlist,
+    get_watchlist_count,
+    load_cookies_from_json,
+)
+
 # Try different import approaches
 try:
     from tmdb_api import get_movie_details, enrich_movie_data, bulk_enrich_movies
@@ -175,9 +219,25 @@ def validate_confirmation_input(prompt: str, expected_values: list = None) -> st
 
 
 # --- Constants and Global Configuration ---
-BASE_URL = "https://letterboxd.com"
-# Use a single global session for requests
-session = requests.Session()
+# Number of friend checklist rows inserted per idle-time chunk
+FRIEND_LIST_CHUNK_SIZE = 200
+# GUI event bus: tasks run per tick, and the poll interval (ms) while it is
+# empty, without a wakeup pipe (Windows) and as a fallback with one
+GUI_QUEUE_MAX_TASKS_PER_TICK = 50
+GUI_QUEUE_POLL_MS = 50
+GUI_QUEUE_FALLBACK_POLL_MS = 1000
+# How often (ms) to check whether idle-time database maintenance is due
+MAINTENANCE_POLL_MS = 30_000
+# Posters are requested once scrolling or resizing of the results pauses this long
+POSTER_LOAD_DELAY_MS = 150
+# The results are re-filtered once typing in the movie search box pauses this long
+RESULTS_SEARCH_DELAY_MS = 150
+# Results rows are tall enough for a poster thumbnail
+RESULTS_ROW_HEIGHT = THUMBNAIL_SIZE[1] + 4
+# Default database file (relative to the working directory)
+DEFAULT_DB_PATH = "letterboxd.db"
+# GUI settings file (relative to the working directory)
+CONFIG_FILE = "config.json"
 
 # --- Setup Logging ---
 logger = logging.getLogger(__name__)
@@ -212,6 +272,14 @@ if not logger.handlers:
     logger.addHandler(console_handler)
 
 
+def __getattr__(name):
+    # Keep `LBoxFriendCheck.session` working for callers of the old global; the
+    # shared session (and requests itself) is only created on first use
+    if name == "session":
+        return _get_session()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ASCII spinner animation for loading
 def spinner_animation(message, stop_event):
     spinner = itertools.cycle(["|", "/", "-", "\\"])
@@ -235,6 +303,12 @@ def get_letterboxd_session_cookie_via_selenium():
     # is manually managed to allow for user interaction.
 
     try:
+        # Selenium and webdriver-manager are only needed here, so import them on demand
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
         # --- Performance and Security ---
         # Initialize Chrome options for a streamlined, secure browsing session.
         chrome_options = Options()
@@ -260,6 +334,10 @@ def get_letterboxd_session_cookie_via_selenium():
         return None
 
     try:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         # Navigate to the Letterboxd login page
         driver.get(f"{BASE_URL}/sign-in/")
 
@@ -289,372 +367,75 @@ def get_letterboxd_session_cookie_via_selenium():
 
 
 # --- Database Module ---
-def init_db(db_path="letterboxd.db"):
+# Thin wrappers over letterboxd_friend_check.data.database that keep this
+# module's historical default of a letterboxd.db in the working directory.
+def init_db(db_path=DEFAULT_DB_PATH):
     """
     Initializes the SQLite database and tables if they do not exist.
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    # Create tables for users, movies, watchlists, and friends
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            username TEXT PRIMARY KEY,
-            last_sync TIMESTAMP
-        )
-    """
-    )
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS movies (
-            movie_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT UNIQUE,
-            director TEXT,
-            genres TEXT,
-            rating TEXT,
-            synopsis TEXT,
-            tmdb_id INTEGER,
-            tmdb_rating REAL,
-            release_date TEXT,
-            runtime INTEGER,
-            poster_path TEXT,
-            backdrop_path TEXT,
-            overview TEXT,
-            last_updated TIMESTAMP
-        )
-    """
-    )
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS watchlists (
-            username TEXT,
-            movie_id INTEGER,
-            FOREIGN KEY(username) REFERENCES users(username),
-            FOREIGN KEY(movie_id) REFERENCES movies(movie_id)
-        )
-    """
-    )
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS friends (
-            username TEXT,
-            friend_username TEXT,
-            FOREIGN KEY(username) REFERENCES users(username)
-        )
-    """
-    )
-    conn.commit()
-    conn.close()
+    database.init_db(db_path)
 
 
-def sync_watchlist_to_db(username, movies, db_path="letterboxd.db"):
+def sync_watchlist_to_db(username, movies, db_path=DEFAULT_DB_PATH):
     """
     Syncs the user's watchlist to the database.
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    # Upsert user
-    c.execute(
-        "INSERT OR REPLACE INTO users (username, last_sync) VALUES (?, ?)",
-        (username, datetime.datetime.now()),
-    )
-    # Insert movies and get their IDs
-    movie_ids = []
-    for title in movies:
-        c.execute("INSERT OR IGNORE INTO movies (title) VALUES (?)", (title,))
-        c.execute("SELECT movie_id FROM movies WHERE title=?", (title,))
-        movie_id = c.fetchone()[0]
-        movie_ids.append(movie_id)
-    # Remove old watchlist and insert new
-    c.execute("DELETE FROM watchlists WHERE username=?", (username,))
-    c.executemany(
-        "INSERT INTO watchlists (username, movie_id) VALUES (?, ?)",
-        [(username, mid) for mid in movie_ids],
-    )
-    conn.commit()
-    conn.close()
-
-
-def sync_friends_to_db(username, friends, db_path="letterboxd.db"):
+    database.sync_watchlist_to_db(username, movies, db_path)
+
+
+def sync_friends_to_db(username, friends, db_path=DEFAULT_DB_PATH):
     """
     Syncs the user's friends to the database.
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute("DELETE FROM friends WHERE username=?", (username,))
-    c.executemany(
-        "INSERT INTO friends (username, friend_username) VALUES (?, ?)",
-        [(username, friend) for friend in friends],
-    )
-    conn.commit()
-    conn.close()
-
-
-def get_watchlist_from_db(username, db_path="letterboxd.db"):
+    database.sync_friends_to_db(username, friends, db_path)
+
+
+def get_watchlist_from_db(username, db_path=DEFAULT_DB_PATH):
     """
     Retrieves the user's watchlist from the database.
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute(
-        """
-        SELECT m.title FROM watchlists w
-        JOIN movies m ON w.movie_id = m.movie_id
-        WHERE w.username=?
-    """,
-        (username,),
-    )
-    movies = set(row[0] for row in c.fetchall())
-    conn.close()
-    return movies
-
-
-def get_friends_from_db(username, db_path="letterboxd.db"):
+    return database.get_watchlist_from_db(username, db_path)
+
+
+def get_friends_from_db(username, db_path=DEFAULT_DB_PATH):
     """
     Retrieves the user's friends from the database.
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute("SELECT friend_username FROM friends WHERE username=?", (username,))
-    friends = [row[0] for row in c.fetchall()]
-    conn.close()
-    return friends
+    return database.get_friends_from_db(username, db_path)
 
 
-def should_resync(username, db_path="letterboxd.db", threshold_hours=24):
+def should_resync(username, db_path=DEFAULT_DB_PATH, threshold_hours=24):
     """
     Determines if the user's data should be resynced based on last_sync timestamp.
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute("SELECT last_sync FROM users WHERE username=?", (username,))
-    row = c.fetchone()
-    conn.close()
-    if not row or not row[0]:
-        return None
-    last_sync = datetime.datetime.fromisoformat(row[0])
-    return last_sync
+    return database.should_resync(username, db_path, threshold_hours)
 
 
-# --- Web Scraping Module ---
-def get_watchlist(username, limit=None):
+def get_new_overlaps(username, friends, db_path=DEFAULT_DB_PATH):
     """
-    Fetches the watchlist for a given Letterboxd username using the CSV export feature.
-    Returns a set of movie titles.
+    Retrieves the movies that became common with each friend in the latest syncs.
     """
-    movies = set()
-    page = 1
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (compatible; LetterboxdWatchlistBot/1.0; "
-            "+https://github.com/yourusername)"
-        )
-    }
-    logger.info(f"Starting to fetch watchlist for {username}...")
-    # Get total movie count for percentage display
-    total_count = get_watchlist_count(username)
-    last_percent = -1
-
-    def print_progress(fetched, total):
-        nonlocal last_percent
-        if total and isinstance(total, int) and total > 0:
-            percent = min(100, int((fetched / total) * 100))
-            if percent != last_percent:
-                print(
-                    f"\rFetching watchlist for {username}: {percent}% ({fetched}/{total})",
-                    end="",
-                    flush=True,
-                )
-                last_percent = percent
-        else:
-            if fetched % 10 == 0 or fetched == 1:
-                print(
-                    f"\rFetching watchlist for {username}: {fetched} movies fetched",
-                    end="",
-                    flush=True,
-                )
-
-    while True:
-        # Check if we've reached the specified limit
-        if limit and len(movies) >= limit:
-            logger.info(f"Reached specified limit of {limit} movies for {username}")
-            break
-        url = f"{BASE_URL}/{username}/watchlist/page/{page}/"
-        logger.debug(f"Fetching page {page} for {username}: {url}")
-        try:
-            response = session.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            poster_items = soup.select("li.poster-container")
-            if not poster_items:
-                logger.info(
-                    f"No more movies found for {username} on page {page}. Ending pagination."
-                )
-                break
-            page_movie_count = 0
-            for item in poster_items:
-                anchor = item.find("a", attrs={"data-film-name": True})
-                if anchor:
-                    title = anchor.get("data-film-name")
-                    if title:
-                        movies.add(title)
-                        page_movie_count += 1
-                        print_progress(len(movies), total_count)
-                else:
-                    img = item.find("img", alt=True)
-                    if img:
-                        title = img.get("alt")
-                        if title:
-                            movies.add(title)
-                            page_movie_count += 1
-                            print_progress(len(movies), total_count)
-                # Check if we've reached the specified limit
-                if limit and len(movies) >= limit:
-                    break
-            logger.info(f"Fetched {page_movie_count} movies from page {page} for {username}.")
-            page += 1
-            sleep_time = random.uniform(1, 1.5)
-            logger.debug(f"Sleeping for {sleep_time:.2f} seconds to avoid rate limiting.")
-            time.sleep(sleep_time)
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 429:
-                logger.warning(
-                    "Rate limited by Letterboxd (429 Too Many Requests) on page "
-                    f"{page}. Stopping further requests."
-                )
-                break
-            else:
-                logger.error(f"HTTP error scraping watchlist page {page} for {username}: {e}")
-                break
-        except KeyboardInterrupt:
-            print("\nFetch interrupted by user (Ctrl+C). Exiting...")
-            raise
-        except Exception as e:
-            logger.error(f"Error scraping watchlist page {page} for {username}: {e}")
-            break
-    if (
-        total_count
-        and isinstance(total_count, int)
-        and total_count > 0
-        and len(movies) == total_count
-    ):
-        print(
-            f"\rFetching watchlist for {username}: 100% ({len(movies)}/{total_count}) Done!        "
-        )
-    else:
-        print(f"\rFetching watchlist for {username}: {len(movies)} movies fetched. Done!        ")
-    logger.info(f"Finished fetching watchlist for {username}. Total movies fetched: {len(movies)}.")
-    return movies
+    return database.get_new_overlaps(username, friends, db_path=db_path)
 
 
-def get_friends(username):
+def save_friend_selection(username, friends, selected, db_path=DEFAULT_DB_PATH):
     """
-    Fetches the complete list of friends for a given Letterboxd username by handling pagination.
-    Returns a set of unique friend usernames to prevent duplicates.
-    Signature: Copilot (2025-07-21T00:00:00Z)
+    Stores which friends are ticked in the sync checklist.
     """
-    friends = set()
-    page = 1
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (compatible; LetterboxdFriendCheck/2.0; "
-            "+https://github.com/yourusername/repo)"
-        )
-    }
-    logger.info(f"Starting to fetch friends for {username}...")
-
-    while True:
-        url = f"{BASE_URL}/{username}/following/page/{page}/"
-        logger.debug(f"Fetching friends page {page} for {username}: {url}")
-        try:
-            response = session.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            person_divs = soup.select(".person-summary")
-            if not person_divs:
-                logger.info(
-                    f"No more friends found for {username} on page {page}. Ending pagination."
-                )
-                break
-
-            page_friends_found = 0
-            for div in person_divs:
-                a_tag = div.find("a", class_="avatar")
-                if a_tag and a_tag.has_attr("href"):
-                    friend_username = a_tag["href"].strip("/").split("/")[0]
-                    if friend_username:
-                        friends.add(friend_username)
-                        page_friends_found += 1
-
-            logger.info(f"Found {page_friends_found} friends on page {page}.")
-            page += 1
-            time.sleep(random.uniform(0.5, 1.5))  # Respectful delay
-
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching friends page {page} for {username}: {e}")
-            break
-        except Exception as e:
-            logger.error(f"Error scraping friends page {page} for {username}: {e}")
-            break
+    database.save_friend_selection(username, friends, selected, db_path)
 
-    logger.info(
-        f"Finished fetching friends for {username}. Total unique friends found: {len(friends)}."
-    )
-    return friends
 
-
-def compare_watchlists(user_watchlist, friends_watchlists):
+def get_friend_selection(username, db_path=DEFAULT_DB_PATH):
     """
-    Compares the user's watchlist with each friend's watchlist.
-    Returns a dict mapping friend usernames to sets of common movies.
+    Retrieves the ticked friends, or None if no selection was saved.
     """
-    common = {}
-    for friend, watchlist in friends_watchlists.items():
-        common_movies = user_watchlist & watchlist
-        if common_movies:
-            common[friend] = common_movies
-    return common
+    return database.get_friend_selection(username, db_path)
 
 
-def load_cookies_from_json(session_obj, cookie_path):
-    """Loads cookies from a JSON file and adds them to a requests session."""
-    try:
-        with open(cookie_path, "r") as f:
-            cookies = json.load(f)
-            for cookie in cookies:
-                session_obj.cookies.set(cookie["name"], cookie["value"])
-    except Exception as e:
-        logger.error(f"Error loading cookies from {cookie_path}: {e}")
-
-
-def get_watchlist_count(username):
-    """
-    Scrapes the user's watchlist page for the js-watchlist-count element
-    to get the total number of movies. Returns the count as an integer, or None if not found.
-    """
-    url = f"{BASE_URL}/{username}/watchlist/"
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (compatible; LetterboxdWatchlistBot/1.0; "
-            "+https://github.com/yourusername)"
-        )
-    }
-    try:
-        response = session.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        count_tag = soup.find("span", class_="js-watchlist-count")
-        if count_tag:
-            # Extract digits from text, e.g. '7,727 films' or '7,727\u00a0films'
-            match = re.search(r"([\d,]+)", count_tag.text)
-            if match:
-                count_str = match.group(1).replace(",", "")
-                return int(count_str)
-        return None
-    except Exception as e:
-        logger.error(f"Error fetching watchlist count for {username}: {e}")
-        return None
+def create_sync_engine(db_path=DEFAULT_DB_PATH, **kwargs):
+    """Create the shared sync engine used by the GUI and the CLI."""
+    kwargs.setdefault("fetch_watched", get_watched_films)
+    return SyncEngine(db_path=db_path, **kwargs)
 
 
 # --- GUI Application ---
@@ -674,46 +455,9 @@ class LetterboxdGUI(tk.Tk):
 
         # --- Theme Configuration ---
         self.dark_mode = tk.BooleanVar(value=False)  # Default to light mode
-        self.theme_colors = {
-            "dark": {
-                "bg": "#0d1117",  # Very dark background (GitHub dark)
-                "fg": "#f0f6fc",  # Light text for maximum contrast
-                "select_bg": "#404040",  # Selection background
-                "select_fg": "#ffffff",  # Selection text
-                "entry_bg": "#ffffff",  # Entry field background - white for black text visibility
-                "entry_fg": "#000000",  # Entry field text - black for readability
-                "canvas_bg": "#0d1117",  # Canvas background
-                "frame_bg": "#0d1117",  # Frame background
-                "button_bg": "#58a6ff",  # Bright blue background for high contrast
-                "button_fg": "#000000",  # Black text for maximum contrast
-                "menu_bg": "#0d1117",  # Menu background
-                "menu_fg": "#f0f6fc",  # Menu text
-                "highlight": "#404040",  # Dark gray for selected elements
-                "tab_selected_bg": "#e6e6e6",  # Light gray for black text visibility
-                "tab_selected_fg": "#000000",  # Selected tab text - black (same as light mode)
-                "tab_active_bg": "#58a6ff",  # Bright blue for active tabs
-                "tab_active_fg": "#000000",  # Black text for contrast
-            },
-            "light": {
-                "bg": "#ffffff",  # White background
-                "fg": "#24292f",  # Dark gray text for better readability
-                "select_bg": "#0969da",  # Selection background
-                "select_fg": "#ffffff",  # Selection text
-                "entry_bg": "#ffffff",  # Entry field background
-                "entry_fg": "#24292f",  # Entry field text
-                "canvas_bg": "#ffffff",  # Canvas background
-                "frame_bg": "#f6f8fa",  # Very light gray frame background
-                "button_bg": "#f6f8fa",  # Button background
-                "button_fg": "#24292f",  # Button text
-                "menu_bg": "#ffffff",  # Menu background
-                "menu_fg": "#24292f",  # Menu text
-                "highlight": "#e6e6e6",  # Light gray for selected elements
-                "tab_selected_bg": "#e6e6e6",  # Selected tab - light gray background
-                "tab_selected_fg": "#000000",  # Selected tab text - black (like unselected)
-                "tab_active_bg": "#d0d7de",  # Active tab background
-                "tab_active_fg": "#24292f",  # Active tab text
-            },
-        }
+        self.theme_colors = THEME_COLORS
+        # Raw Tk widgets (Text/Canvas/Menu) that ttk.Style can't reach
+        self.theme_registry = ThemeRegistry()
 
         # --- Initialize GUI State Variables ---
         self.username = tk.StringVar()
@@ -722,21 +466,48 @@ class LetterboxdGUI(tk.Tk):
         self.user_watchlist = set()
         self.friends_watchlists = {}
         self.common_movies = {}
+        # Bumped whenever the watchlists or common movies change; cached
+        # per-friend movie indexes built for an older version are rebuilt
+        self.movie_data_version = 0
+        self._movie_index_cache = {}
+        # GUI-free fetch/persist/compare pipeline shared with the CLI
+        self.sync_engine = create_sync_engine()
+        # Settings are read once; saves are debounced and written atomically
+        self.config_store = get_config_store(CONFIG_FILE)
 
         # --- Thread control variables ---
         self.sync_cancelled = threading.Event()  # For cancelling sync operations
+        # Request/stage timings of the last sync (see show_sync_report)
+        self.last_sync_instrumentation = None
+        # Watchlists the last sync only partly fetched (resumed by the next sync)
+        self.last_sync_incomplete = []
         self.sync_in_progress = False
         self.gui_queue_active = True  # For controlling GUI queue processing
         self.gui_queue_after_id = None  # Store after() ID for cleanup
 
-        # --- Thread-safe queue for GUI updates ---
-        self.gui_queue = queue.Queue()
+        # --- Thread-safe event bus for GUI updates ---
+        # Background threads only post to the bus (Tk calls are not safe from
+        # them); posting wakes the main thread through a pipe Tk watches, and
+        # the main thread drains the bus. Progress and status updates are
+        # coalesced so only the latest value is applied.
+        self.gui_queue = GuiEventBus()
+        self.gui_queue_wakeup = None
+        if PipeWakeup.supported(self):
+            self.gui_queue_wakeup = PipeWakeup(self, self.process_gui_queue)
+            self.gui_queue.set_wakeup(self.gui_queue_wakeup)
+
+        # Poster thumbnails of the visible results rows, loaded off the Tk thread
+        self.poster_loader = PosterLoader(
+            self.gui_queue.post,
+            PosterDiskCache(default_cache_dir(DEFAULT_DB_PATH)),
+            base_url=self.config_store.get("poster_image_base_url", DEFAULT_IMAGE_BASE_URL),
+        )
+        # Movie title -> TMDB poster path (None without stored details)
+        self.poster_paths = {}
+        self.poster_after_id = None
 
         self.protocol("WM_DELETE_WINDOW", self.save_all_and_exit)
 
-        # Bind window resize events to handle canvas scaling
-        self.bind("<Configure>", self._on_window_resize)
-
         self.create_menubar()
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(expand=True, fill="both")
@@ -760,20 +531,34 @@ class LetterboxdGUI(tk.Tk):
         # Start the queue processor
         self.process_gui_queue()
 
+        # Database maintenance runs in the background once the user is idle
+        self.maintenance_thread = None
+        self.maintenance_after_id = None
+        self.idle_maintenance = IdleMaintenance(self._start_background_maintenance)
+        for sequence in ("<Any-KeyPress>", "<Any-ButtonPress>"):
+            self.bind_all(sequence, lambda e: self.idle_maintenance.note_activity(), add="+")
+        self._check_idle_maintenance()
+
     def process_gui_queue(self):
         """
-        Process any pending GUI updates from the background threads.
+        Process pending GUI updates from the background threads.
         This is the standard thread-safe way to update Tkinter UIs.
+
+        Runs when a post wakes the bus. At most GUI_QUEUE_MAX_TASKS_PER_TICK
+        tasks run per call; leftovers are picked up on the next tick. Without a
+        wakeup pipe an empty bus is polled every GUI_QUEUE_POLL_MS.
         """
         if not self.gui_queue_active:
             return  # Stop processing if queue is deactivated
 
         try:
-            while True:
-                task, args, kwargs = self.gui_queue.get_nowait()
-                task(*args, **kwargs)
-        except queue.Empty:
-            pass
+            for task, args, kwargs in self.gui_queue.drain(GUI_QUEUE_MAX_TASKS_PER_TICK):
+                try:
+                    task(*args, **kwargs)
+                except tk.TclError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error running queued GUI task {task!r}: {e}")
         except tk.TclError:
             # Widget has been destroyed, stop processing
             self.gui_queue_active = False
@@ -782,7 +567,15 @@ class LetterboxdGUI(tk.Tk):
         # Only schedule next update if queue is still active
         if self.gui_queue_active:
             try:
-                self.gui_queue_after_id = self.after(100, self.process_gui_queue)
+                if self.gui_queue_after_id:
+                    self.after_cancel(self.gui_queue_after_id)
+                if self.gui_queue.pending():
+                    delay = 1
+                elif self.gui_queue_wakeup is not None:
+                    delay = GUI_QUEUE_FALLBACK_POLL_MS
+                else:
+                    delay = GUI_QUEUE_POLL_MS
+                self.gui_queue_after_id = self.after(delay, self.process_gui_queue)
             except tk.TclError:
                 # Window is being destroyed, stop processing
                 self.gui_queue_active = False
@@ -795,8 +588,6 @@ class LetterboxdGUI(tk.Tk):
         new_mode = not self.dark_mode.get()
         self.dark_mode.set(new_mode)
         self.apply_theme()
-        # Recreate menubar with new theme
-        self.create_menubar()
         # Save the new theme preference immediately
         self.save_config()
 
@@ -902,71 +693,56 @@ class LetterboxdGUI(tk.Tk):
         # Configure separator style
         style.configure("TSeparator", background=colors["select_bg"])
 
-        # Apply theme to any existing canvas widgets
-        if hasattr(self, "friends_canvas"):
-            self.friends_canvas.configure(bg=colors["canvas_bg"])
-
-        # Apply theme to results canvas if it exists
-        for widget in self._get_all_canvas_widgets():
-            widget.configure(bg=colors["canvas_bg"])
-
-        # Update any existing text widgets
-        for widget in self._get_all_text_widgets():
-            widget.configure(
-                bg=colors["entry_bg"],
-                fg=colors["entry_fg"],
-                insertbackground=colors["fg"],
-                selectbackground=colors["highlight"],
-                selectforeground=colors["select_fg"],
-            )
-
-    def _get_all_text_widgets(self):
-        """Helper method to find all text widgets for theme application."""
-        text_widgets = []
-
-        def find_text_widgets(parent):
-            for child in parent.winfo_children():
-                if isinstance(child, tk.Text):
-                    text_widgets.append(child)
-                find_text_widgets(child)
-
-        try:
-            find_text_widgets(self)
-        except tk.TclError:
-            # Widget might be destroyed, ignore
-            pass
-
-        return text_widgets
-
-    def _get_all_canvas_widgets(self):
-        """Helper method to find all canvas widgets for theme application."""
-        canvas_widgets = []
-
-        def find_canvas_widgets(parent):
-            for child in parent.winfo_children():
-                if isinstance(child, tk.Canvas):
-                    canvas_widgets.append(child)
-                find_canvas_widgets(child)
+        # Style the Treeview-based lists
+        style.configure(
+            "Treeview",
+            background=colors["entry_bg"],
+            fieldbackground=colors["entry_bg"],
+            foreground=colors["entry_fg"],
+        )
+        style.map(
+            "Treeview",
+            background=[("selected", colors["select_bg"])],
+            foreground=[("selected", colors["select_fg"])],
+        )
+        style.configure(
+            "Treeview.Heading", background=colors["button_bg"], foreground=colors["button_fg"]
+        )
 
-        try:
-            find_canvas_widgets(self)
-        except tk.TclError:
-            # Widget might be destroyed, ignore
-            pass
+        # Raw Tk widgets are tracked in a registry instead of walking the widget tree
+        self.theme_registry.apply(colors)
 
-        return canvas_widgets
+        # Keep the theme toggle label in sync without rebuilding the menubar
+        if hasattr(self, "view_menu"):
+            theme_text = "Switch to Light Theme" if self.dark_mode.get() else "Switch to Dark Theme"
+            self.view_menu.entryconfigure(self.theme_menu_index, label=theme_text)
 
     def load_config(self):
-        try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
-                self.username.set(config.get("username", ""))
-                self.remember_user.set(config.get("remember_user", False))
-                self.dark_mode.set(config.get("dark_mode", False))  # Default to light mode
-        except FileNotFoundError:
-            self.username.set("")
-            self.remember_user.set(False)
-            self.dark_mode.set(False)  # Default to light mode
+        config = self.config_store
+        self.username.set(config.get("username", ""))
+        self.remember_user.set(config.get("remember_user", False))
+        self.dark_mode.set(config.get("dark_mode", False))  # Default to light mode
+        self._migrate_friend_state_from_config()
+
+    def _migrate_friend_state_from_config(self):
+        """
+        Move the friends list and selection that older versions kept in
+        config.json into the database, then drop them from the config.
+        """
+        config = self.config_store
+        if "friends_list" not in config and "selected_friends" not in config:
+            return
+        username = self.username.get()
+        friends_list = config.get("friends_list") or []
+        if username:
+            if friends_list and not get_friends_from_db(username):
+                sync_friends_to_db(username, friends_list)
+            selected = config.get("selected_friends")
+            if friends_list and selected is not None:
+                save_friend_selection(username, friends_list, selected)
+        config.pop("friends_list")
+        config.pop("selected_friends")
+        logger.info("Moved saved friends list and selection from config.json to the database")
 
     def load_previous_data_from_db(self):
         username = self.username.get()
@@ -994,24 +770,30 @@ class LetterboxdGUI(tk.Tk):
             self.notebook.select(0)
 
     def create_menubar(self):
-        current_theme = "dark" if self.dark_mode.get() else "light"
-        colors = self.theme_colors[current_theme]
-
-        menubar = tk.Menu(self, bg=colors["menu_bg"], fg=colors["menu_fg"])
+        menubar = tk.Menu(self)
         self.config(menu=menubar)
+        self.theme_registry.register(menubar, "menu")
 
-        file_menu = tk.Menu(menubar, tearoff=0, bg=colors["menu_bg"], fg=colors["menu_fg"])
+        file_menu = tk.Menu(menubar, tearoff=0)
+        self.theme_registry.register(file_menu, "menu")
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Change User", command=self.change_user)
+        file_menu.add_command(
+            label="Import Letterboxd Export...", command=self.import_letterboxd_export
+        )
+        file_menu.add_command(label="Database...", command=self.show_database_dialog)
         file_menu.add_separator()
         file_menu.add_command(label="Save & Exit", command=self.save_all_and_exit)
 
-        view_menu = tk.Menu(menubar, tearoff=0, bg=colors["menu_bg"], fg=colors["menu_fg"])
-        menubar.add_cascade(label="View", menu=view_menu)
+        self.view_menu = tk.Menu(menubar, tearoff=0)
+        self.theme_registry.register(self.view_menu, "menu")
+        menubar.add_cascade(label="View", menu=self.view_menu)
         theme_text = "Switch to Light Theme" if self.dark_mode.get() else "Switch to Dark Theme"
-        view_menu.add_command(label=theme_text, command=self.toggle_theme)
+        self.view_menu.add_command(label=theme_text, command=self.toggle_theme)
+        self.theme_menu_index = self.view_menu.index("end")
 
-        help_menu = tk.Menu(menubar, tearoff=0, bg=colors["menu_bg"], fg=colors["menu_fg"])
+        help_menu = tk.Menu(menubar, tearoff=0)
+        self.theme_registry.register(help_menu, "menu")
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self.show_about)
 
@@ -1030,6 +812,7 @@ class LetterboxdGUI(tk.Tk):
         self.friends_watchlists = {}
         for friend in self.friends:
             self.friends_watchlists[friend] = get_watchlist_from_db(friend)
+        self.invalidate_movie_index()
 
     def change_user(self):
         self.notebook.select(0)
@@ -1043,27 +826,21 @@ class LetterboxdGUI(tk.Tk):
         )
 
     def save_config(self):
+        """
+        Update the settings store (written to config.json after a short debounce,
+        and only if something changed). The friends list and selection live in
+        the database.
+        """
+        username = self.username.get()
         config = {
-            "username": self.username.get(),
+            "username": username,
             "remember_user": self.remember_user.get(),
             "tmdb_api_key": self.tmdb_api_key.get().strip(),
             "dark_mode": self.dark_mode.get(),
         }
 
-        # Save friends list if available
-        if hasattr(self, "friends") and self.friends:
-            config["friends_list"] = self.friends
-
-        # Save friends selection state if available
-        if hasattr(self, "friend_check_vars") and self.friend_check_vars:
-            selected_friends = [
-                friend for friend, var in self.friend_check_vars.items() if var.get()
-            ]
-            config["selected_friends"] = selected_friends
-
         # Save last sync timestamp from database
         try:
-            username = self.username.get()
             if username:
                 last_sync = self.get_last_sync_from_db(username)
                 if last_sync:
@@ -1071,8 +848,20 @@ class LetterboxdGUI(tk.Tk):
         except Exception:
             pass  # Don't fail if we can't get last sync time
 
-        with open("config.json", "w") as f:
-            json.dump(config, f, indent=4)
+        key_changed = config["tmdb_api_key"] != self.config_store.get("tmdb_api_key", "")
+        self.config_store.update(config)
+        if key_changed:
+            # TMDB lookups memoize the key; make the next one pick up the new key
+            invalidate_tmdb_api_key()
+
+        # Save friends selection state if available
+        if username and hasattr(self, "friend_checklist") and len(self.friend_checklist):
+            try:
+                save_friend_selection(
+                    username, self.friends, self.friend_checklist.selected_in_order()
+                )
+            except sqlite3.Error as e:
+                logger.error(f"Could not save friend selection: {e}")
 
     def setup_setup_frame(self):
         """
@@ -1249,6 +1038,8 @@ class LetterboxdGUI(tk.Tk):
         self.status_var.set(f"Verifying '{username}'...")
         self.update_idletasks()
 
+        import requests
+
         try:
             response = requests.get(f"https://letterboxd.com/{username}/", timeout=10)
             if response.status_code == 200:
@@ -1339,14 +1130,9 @@ class LetterboxdGUI(tk.Tk):
 
     def load_tmdb_config(self):
         """Load existing TMDB API key from config if available."""
-        try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
-                tmdb_key = config.get("tmdb_api_key", "")
-                if tmdb_key:
-                    self.tmdb_api_key.set(tmdb_key)
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass  # No config file or invalid JSON, use empty key
+        tmdb_key = self.config_store.get("tmdb_api_key", "")
+        if tmdb_key:
+            self.tmdb_api_key.set(tmdb_key)
 
     def get_last_sync_from_db(self, username):
         """Get last sync timestamp from database for the given username."""
@@ -1363,37 +1149,21 @@ class LetterboxdGUI(tk.Tk):
         return None
 
     def load_saved_data(self):
-        """Load saved friends list and results from config file."""
-        try:
-            with open("config.json", "r") as f:
-                config = json.load(f)
-
-            # Load friends list if available and we have the UI components
-            if (
-                "friends_list" in config
-                and config["friends_list"]
-                and hasattr(self, "scrollable_friends_frame")
-            ):
-                self.friends = config["friends_list"]
-                self._populate_friends_list(self.friends)
-
-                # Restore friend selection state
-                if "selected_friends" in config:
-                    selected_friends = config["selected_friends"]
-                    # Update checkboxes based on saved selection
-                    for friend_name, var in self.friend_check_vars.items():
-                        var.set(friend_name in selected_friends)
-                    self.update_sync_stats()
-
-            # Load and display results if they exist in database
-            if hasattr(self, "friends") and self.friends:
-                self.load_friends_watchlists()
-                if self.friends_watchlists:
-                    # Enable results tab
-                    self.notebook.tab(2, state="normal")
-
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass  # No saved data, start fresh
+        """Load the saved friends list, its selection and results from the database."""
+        username = self.username.get()
+        if not username or not self.friends:
+            return  # No saved data, start fresh
+
+        if hasattr(self, "friend_checklist"):
+            # Restore the friends list together with its saved selection state
+            self._populate_friends_list(self.friends, get_friend_selection(username))
+
+        # Load and display results if they exist in database
+        if not self.friends_watchlists:
+            self.load_friends_watchlists()
+        if self.friends_watchlists:
+            # Enable results tab
+            self.notebook.tab(2, state="normal")
 
     def update_last_sync_display(self):
         """Update the display of last sync date and time."""
@@ -1433,6 +1203,12 @@ class LetterboxdGUI(tk.Tk):
         ttk.Button(
             top_frame, text="Fetch Friends List", command=self.fetch_friends_for_sync_tab
         ).pack(side=tk.LEFT)
+        # The list above is served from the database while fresh; this refetches it
+        ttk.Button(
+            top_frame,
+            text="Refresh",
+            command=lambda: self.fetch_friends_for_sync_tab(force=True),
+        ).pack(side=tk.LEFT, padx=(5, 0))
         self.sync_status_var = tk.StringVar(value="Ready. Fetch friends to begin.")
         ttk.Label(top_frame, textvariable=self.sync_status_var, wraplength=600).pack(
             side=tk.LEFT, padx=10
@@ -1454,84 +1230,44 @@ class LetterboxdGUI(tk.Tk):
         # Update last sync display
         self.update_last_sync_display()
 
-        # --- Friends List (Checkboxes) ---
+        # --- Friends List (Checklist) ---
         friends_frame = ttk.LabelFrame(self.sync_frame, text="Select Friends to Sync", padding="10")
         friends_frame.grid(row=1, column=0, sticky="nsew", pady=5)
         friends_frame.grid_rowconfigure(1, weight=1)
         friends_frame.grid_columnconfigure(0, weight=1)
 
+        list_controls = ttk.Frame(friends_frame)
+        list_controls.grid(row=0, column=0, columnspan=2, sticky="ew")
+
         # Select All/None
         self.select_all_friends_var = tk.BooleanVar()
         select_all_check = ttk.Checkbutton(
-            friends_frame,
+            list_controls,
             text="Select All / Deselect All",
             variable=self.select_all_friends_var,
             command=self.toggle_select_all_friends,
         )
-        select_all_check.grid(row=0, column=0, sticky="w")
+        select_all_check.pack(side=tk.LEFT)
 
-        # Canvas and Scrollbar for the list of friends
-        current_theme = "dark" if self.dark_mode.get() else "light"
-        colors = self.theme_colors[current_theme]
-        canvas = tk.Canvas(friends_frame, highlightthickness=0, height=300, bg=colors["canvas_bg"])
-        scrollbar = ttk.Scrollbar(friends_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_friends_frame = ttk.Frame(canvas)
-
-        # Store canvas reference for proper cleanup
-        self.friends_canvas = canvas
-
-        # Configure scroll region when frame content changes
-        def _update_scroll_region():
-            """Update scroll region and ensure proper sizing."""
-            # Force a proper update sequence
-            self.scrollable_friends_frame.update_idletasks()
-            canvas.update_idletasks()
-            # Get the bounding box and configure scroll region
-            bbox = canvas.bbox("all")
-            if bbox:
-                canvas.configure(scrollregion=bbox)
-            else:
-                # Fallback: use frame's required size
-                frame_height = self.scrollable_friends_frame.winfo_reqheight()
-                frame_width = self.scrollable_friends_frame.winfo_reqwidth()
-                canvas.configure(scrollregion=(0, 0, frame_width, frame_height))
+        # Search filter
+        self.friend_search_var = tk.StringVar()
+        self.friend_search_var.trace_add("write", self._on_friend_search_changed)
+        ttk.Entry(list_controls, textvariable=self.friend_search_var, width=25).pack(side=tk.RIGHT)
+        ttk.Label(list_controls, text="Search:").pack(side=tk.RIGHT, padx=(0, 5))
 
-        self.scrollable_friends_frame.bind("<Configure>", lambda e: _update_scroll_region())
-
-        # Create canvas window
-        self.friends_canvas_window = canvas.create_window(
-            (0, 0), window=self.scrollable_friends_frame, anchor="nw"
-        )
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Selection state lives in a plain set; the Treeview only displays it
+        self.friend_checklist = FriendChecklistModel()
+        self._friend_render_generation = 0
+        self._friend_search_after_id = None
 
-        # Configure canvas to resize content window when canvas size changes
-        def _configure_friends_canvas(event):
-            # Update scroll region
-            _update_scroll_region()
-            # Make the scrollable frame match the canvas width (minus scrollbar)
-            canvas_width = event.width
-            if canvas_width > 1:  # Valid width
-                canvas.itemconfig(self.friends_canvas_window, width=canvas_width)
+        self.friends_tree = ttk.Treeview(friends_frame, show="tree", selectmode="none", height=14)
+        scrollbar = ttk.Scrollbar(friends_frame, orient="vertical", command=self.friends_tree.yview)
+        self.friends_tree.configure(yscrollcommand=scrollbar.set)
+        self.friends_tree.bind("<Button-1>", self._on_friend_row_click)
+        self.friends_tree.bind("<space>", self._on_friend_row_key)
 
-        canvas.bind("<Configure>", _configure_friends_canvas)
-
-        # Ensure scrollable frame expands to fill canvas width
-        def _configure_scrollable_friends_frame(event):
-            # Set minimum width to match canvas
-            canvas_width = canvas.winfo_width()
-            if canvas_width > 1:  # Valid width
-                min_width = max(canvas_width, self.scrollable_friends_frame.winfo_reqwidth())
-                canvas.itemconfig(self.friends_canvas_window, width=min_width)
-
-        self.scrollable_friends_frame.bind("<Configure>", _configure_scrollable_friends_frame)
-
-        # Add mouse wheel scrolling support
-        self._bind_mousewheel_to_canvas(canvas)
-
-        canvas.grid(row=1, column=0, sticky="nsew")
-        scrollbar.grid(row=1, column=1, sticky="ns")
-
-        self.friend_check_vars = {}  # To hold {friend_name: tk.BooleanVar}
+        self.friends_tree.grid(row=1, column=0, sticky="nsew", pady=(5, 0))
+        scrollbar.grid(row=1, column=1, sticky="ns", pady=(5, 0))
 
         # --- Bottom Controls ---
         bottom_frame = ttk.Frame(self.sync_frame)
@@ -1564,6 +1300,15 @@ class LetterboxdGUI(tk.Tk):
             row=1, column=2, sticky="w", padx=10
         )
 
+        self.sync_report_button = ttk.Button(
+            bottom_frame, text="Timing Report", command=self.show_sync_report, state="disabled"
+        )
+        self.sync_report_button.grid(row=1, column=0, columnspan=2, sticky="w", pady=(5, 0))
+        self.sync_timing_var = tk.StringVar()
+        ttk.Label(bottom_frame, textvariable=self.sync_timing_var, wraplength=500).grid(
+            row=2, column=0, columnspan=3, sticky="w"
+        )
+
     def setup_results_frame(self):
         """
         Set up the frame for displaying sync results and common movies with enhanced details.
@@ -1582,6 +1327,21 @@ class LetterboxdGUI(tk.Tk):
         )
         summary_label.pack(pady=(0, 10))
 
+        # Movies that became common since the previous sync (from the watchlist
+        # event log), with a toggle to show only those
+        self.new_overlaps = {}
+        new_frame = ttk.LabelFrame(self.results_frame, text="New since last sync", padding="5")
+        new_frame.pack(fill="x", pady=(0, 10))
+        self.new_overlaps_var = tk.StringVar(value="")
+        ttk.Label(new_frame, textvariable=self.new_overlaps_var).pack(side=tk.LEFT)
+        self.show_new_only_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            new_frame,
+            text="Show only these",
+            variable=self.show_new_only_var,
+            command=self._render_results,
+        ).pack(side=tk.RIGHT)
+
         # Create paned window for main content and details
         paned_window = ttk.PanedWindow(self.results_frame, orient=tk.HORIZONTAL)
         paned_window.pack(expand=True, fill="both")
@@ -1590,70 +1350,123 @@ class LetterboxdGUI(tk.Tk):
         left_frame = ttk.Frame(paned_window)
         paned_window.add(left_frame, weight=3)
 
-        # Canvas and scrollbar for scrollable results
-        current_theme = "dark" if self.dark_mode.get() else "light"
-        colors = self.theme_colors[current_theme]
-        results_canvas = tk.Canvas(left_frame, bg=colors["canvas_bg"])
-        results_scrollbar = ttk.Scrollbar(
-            left_frame, orient="vertical", command=results_canvas.yview
+        # Virtualized results list: one Treeview row per friend, movies are only
+        # materialized when a friend row is expanded (see _on_results_tree_open)
+        self.results_model = ResultsModel()
+
+        # Movie search (titles, directors and plots, or the start of titles) and sort order
+        search_frame = ttk.Frame(left_frame)
+        search_frame.pack(side="top", fill="x", pady=(0, 5))
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 2))
+        self.results_search_var = tk.StringVar()
+        self.results_search_var.trace_add("write", self._on_results_search_changed)
+        self._results_search_after_id = None
+        ttk.Entry(search_frame, textvariable=self.results_search_var, width=25).pack(
+            side=tk.LEFT, padx=(0, 5)
         )
-        self.scrollable_results_frame = ttk.Frame(results_canvas)
-
-        self.scrollable_results_frame.bind(
-            "<Configure>",
-            lambda e: results_canvas.configure(scrollregion=results_canvas.bbox("all")),
+        self.results_prefix_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            search_frame,
+            text="Title starts with",
+            variable=self.results_prefix_var,
+            command=self._render_results,
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(search_frame, text="Sort by:").pack(side=tk.LEFT, padx=(0, 2))
+        self.results_sort_var = tk.StringVar(value=MOVIE_COLUMNS[0].capitalize())
+        sort_box = ttk.Combobox(
+            search_frame,
+            textvariable=self.results_sort_var,
+            values=[column.capitalize() for column in MOVIE_COLUMNS],
+            state="readonly",
+            width=10,
         )
+        sort_box.bind("<<ComboboxSelected>>", lambda e: self._render_results())
+        sort_box.pack(side=tk.LEFT, padx=(0, 5))
+        self.results_descending_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            search_frame,
+            text="Descending",
+            variable=self.results_descending_var,
+            command=self._render_results,
+        ).pack(side=tk.LEFT)
 
-        results_canvas.create_window((0, 0), window=self.scrollable_results_frame, anchor="nw")
-        results_canvas.configure(yscrollcommand=results_scrollbar.set)
-
-        # Configure canvas to resize content window when canvas size changes
-        def _configure_results_canvas(event):
-            # Update scroll region
-            results_canvas.configure(scrollregion=results_canvas.bbox("all"))
-            # Make the scrollable frame match the canvas width (minus scrollbar)
-            canvas_width = event.width
-            if results_canvas.find_all():  # Check if window exists
-                results_canvas.itemconfig(results_canvas.find_all()[0], width=canvas_width)
-
-        results_canvas.bind("<Configure>", _configure_results_canvas)
+        # Facet filters over the common movies, with counts per value
+        facet_frame = ttk.Frame(left_frame)
+        facet_frame.pack(side="top", fill="x", pady=(0, 5))
+        self.result_facet_vars = {}
+        self.result_facet_boxes = {}
+        self.result_facet_options = {}
+        for facet, label in RESULT_FACETS:
+            ttk.Label(facet_frame, text=f"{label}:").pack(side=tk.LEFT, padx=(0, 2))
+            var = tk.StringVar(value=ALL_FACET_LABEL)
+            box = ttk.Combobox(
+                facet_frame,
+                textvariable=var,
+                values=(ALL_FACET_LABEL,),
+                state="readonly",
+                width=16,
+            )
+            box.bind("<<ComboboxSelected>>", lambda e: self._render_results())
+            box.pack(side=tk.LEFT, padx=(0, 10))
+            self.result_facet_vars[facet] = var
+            self.result_facet_boxes[facet] = box
+            self.result_facet_options[facet] = {ALL_FACET_LABEL: None}
+
+        tree_frame = ttk.Frame(left_frame)
+        tree_frame.pack(side="top", fill="both", expand=True)
+
+        ttk.Style(self).configure("Results.Treeview", rowheight=RESULTS_ROW_HEIGHT)
+        self.results_tree = ttk.Treeview(
+            tree_frame, columns=("info",), selectmode="browse", style="Results.Treeview"
+        )
+        self.results_tree.heading("#0", text="Friend / Movie", anchor="w")
+        self.results_tree.heading("info", text="Common Movies", anchor="w")
+        self.results_tree.column("#0", stretch=True, width=320)
+        self.results_tree.column("info", stretch=False, width=120)
+        results_scrollbar = ttk.Scrollbar(
+            tree_frame, orient="vertical", command=self.results_tree.yview
+        )
 
-        # Ensure scrollable frame expands to fill canvas width
-        def _configure_scrollable_results_frame(event):
-            # Set minimum width to match canvas
-            canvas_width = results_canvas.winfo_width()
-            if canvas_width > 1:  # Valid width
-                min_width = max(canvas_width, self.scrollable_results_frame.winfo_reqwidth())
-                if results_canvas.find_all():
-                    results_canvas.itemconfig(results_canvas.find_all()[0], width=min_width)
+        def on_results_scroll(first, last):
+            results_scrollbar.set(first, last)
+            self._schedule_poster_load()
 
-        self.scrollable_results_frame.bind("<Configure>", _configure_scrollable_results_frame)
+        self.results_tree.configure(yscrollcommand=on_results_scroll)
 
-        # Add mouse wheel scrolling to results
-        self._bind_mousewheel_to_canvas(results_canvas)
+        self.results_tree.bind("<<TreeviewOpen>>", self._on_results_tree_open)
+        self.results_tree.bind("<<TreeviewSelect>>", self._on_results_tree_select)
+        self.results_tree.bind("<Double-1>", lambda e: self._show_selected_movie_details())
+        self.results_tree.bind("<Return>", lambda e: self._show_selected_movie_details())
+        self.results_tree.bind("<Configure>", lambda e: self._schedule_poster_load(), add="+")
 
-        results_canvas.pack(side="left", fill="both", expand=True)
+        self.results_tree.pack(side="left", fill="both", expand=True)
         results_scrollbar.pack(side="right", fill="y")
 
+        # Selection-driven actions replace the per-movie buttons
+        actions_frame = ttk.Frame(left_frame)
+        actions_frame.pack(side="bottom", fill="x", pady=(5, 0))
+        self.open_movie_button = ttk.Button(
+            actions_frame,
+            text="View on Letterboxd",
+            state="disabled",
+            command=self._open_selected_movie,
+        )
+        self.open_movie_button.pack(side=tk.LEFT)
+        self.movie_details_button = ttk.Button(
+            actions_frame,
+            text="Details",
+            state="disabled",
+            command=self._show_selected_movie_details,
+        )
+        self.movie_details_button.pack(side=tk.LEFT, padx=(5, 0))
+
         # Right panel: Movie details
         right_frame = ttk.LabelFrame(paned_window, text="Movie Details", padding="10")
         paned_window.add(right_frame, weight=1)
 
         # Details display area
-        current_theme = "dark" if self.dark_mode.get() else "light"
-        colors = self.theme_colors[current_theme]
-        self.details_text = tk.Text(
-            right_frame,
-            wrap="word",
-            height=15,
-            width=30,
-            state="disabled",
-            bg=colors["entry_bg"],
-            fg=colors["entry_fg"],
-            insertbackground=colors["fg"],
-            selectbackground=colors["highlight"],
-            selectforeground=colors["select_fg"],
-        )
+        self.details_text = tk.Text(right_frame, wrap="word", height=15, width=30, state="disabled")
+        self.theme_registry.register(self.details_text, "text")
         details_text_scrollbar = ttk.Scrollbar(
             right_frame, orient="vertical", command=self.details_text.yview
         )
@@ -1665,76 +1478,250 @@ class LetterboxdGUI(tk.Tk):
         # Initialize with placeholder text
         self.details_text.config(state="normal")
         self.details_text.insert(
-            "1.0", "Click 'Details' next to any movie to view information here."
+            "1.0", "Select a movie and click 'Details' to view information here."
         )
         self.details_text.config(state="disabled")
 
-        # Store canvas reference for updating
-        self.results_canvas = results_canvas
-
-    def _bind_mousewheel_to_canvas(self, canvas):
+    def _render_results(self):
         """
-        Bind mouse wheel scrolling to a canvas widget.
-        Simple reliable approach using global binding with canvas tracking.
-        Signature: Copilot (2025-07-24T22:00:00Z)
+        Rebuild the results Treeview from self.common_movies.
+        Only friend rows are inserted here; movies are added on expansion, so the
+        cost of a render does not grow with the number of common movies.
         """
+        self.results_model.load(*self._searched_common_movies(self._facet_filtered_common_movies()))
+        self.results_tree.delete(*self.results_tree.get_children())
+        # Details (and posters) may have been fetched since the last render
+        self.poster_paths = {}
+
+        for index, friend in enumerate(self.results_model.friends):
+            friend_iid = ResultsModel.friend_iid(index)
+            movie_count = len(self.results_model.movies_for(friend))
+            self.results_tree.insert(
+                "", "end", iid=friend_iid, text=friend, values=(f"{movie_count} common",)
+            )
+            # Placeholder child so the row shows an expand arrow
+            self.results_tree.insert(friend_iid, "end", iid=ResultsModel.placeholder_iid(index))
 
-        def _on_mousewheel(event):
-            # Simple and reliable: just scroll this canvas
-            try:
-                if canvas.winfo_exists():
-                    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            except tk.TclError:
-                pass  # Canvas might be destroyed
+        self._on_results_tree_select()
 
-        def _bind_to_mousewheel(event):
-            # Use global binding (which we know works)
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    def _update_result_facets(self):
+        """Recount the facet values over all common movies and reset the selection."""
+        counts = {}
+        all_common = set().union(*self.common_movies.values()) if self.common_movies else set()
+        if all_common:
+            try:
+                import movie_database
+
+                counts = movie_database.get_facet_counts(all_common)
+            except ImportError:
+                counts = {}
+
+        for facet, box in self.result_facet_boxes.items():
+            options = facet_options(facet, counts.get(facet, {}))
+            self.result_facet_options[facet] = options
+            box.configure(values=list(options))
+            self.result_facet_vars[facet].set(ALL_FACET_LABEL)
+
+    def _facet_filtered_common_movies(self):
+        """self.common_movies narrowed to the new overlaps (if toggled) and the facet values."""
+        common = self.common_movies
+        if self.show_new_only_var.get():
+            common = new_overlap_movies(common, self.new_overlaps)
+        selected = {
+            facet: self.result_facet_options[facet].get(var.get())
+            for facet, var in self.result_facet_vars.items()
+        }
+        if all(value is None for value in selected.values()):
+            return common
 
-        def _unbind_from_mousewheel(event):
-            canvas.unbind_all("<MouseWheel>")
+        import movie_database
 
-        canvas.bind("<Enter>", _bind_to_mousewheel)
-        canvas.bind("<Leave>", _unbind_from_mousewheel)
+        all_common = set().union(*common.values()) if common else set()
+        keep = movie_database.filter_titles_by_facets(all_common, **selected)
+        return filter_common_movies(common, keep)
 
-    def _on_window_resize(self, event):
-        """
-        Handle main window resize events to properly scale canvas content.
-        Only processes resize events for the main window, not child widgets.
-        Signature: Copilot (2025-07-24T22:50:00Z)
+    def _searched_common_movies(self, common):
         """
-        # Only handle resize events for the main window
-        if event.widget == self:
-            # Small delay to batch resize events
-            self.after_idle(self._update_canvas_scaling)
+        Apply the movie search and sort order to {friend: movies}.
 
-    def _update_canvas_scaling(self):
-        """
-        Update canvas content scaling after window resize.
-        Signature: Copilot (2025-07-24T22:50:00Z)
+        Returns:
+            (common movies, sort) for ResultsModel.load; sort is False when the
+            movies are already in the chosen order
         """
+        term = self.results_search_var.get().strip()
+        sort_column = self.results_sort_var.get().lower()
+        descending = self.results_descending_var.get()
+        prefix = self.results_prefix_var.get()
+        if not term and sort_column == "title" and not descending:
+            return common, True  # Plain title order needs no index
+
+        # Substring search also matches directors, original titles and plots
+        # through the full-text index over the stored movie details
+        fulltext_matches = None
+        if term and not prefix:
+            try:
+                import movie_database
+
+                all_common = set().union(*common.values()) if common else set()
+                fulltext_matches = movie_database.search_movie_titles(term, all_common)
+            except (ImportError, sqlite3.Error) as e:
+                logger.debug(f"Full-text movie search unavailable: {e}")
+        return (
+            search_common_movies(
+                common,
+                self._get_friend_index,
+                term,
+                prefix=prefix,
+                sort_column=sort_column,
+                descending=descending,
+                also_matching=fulltext_matches,
+            ),
+            False,
+        )
+
+    def _on_results_search_changed(self, *args):
+        """Re-filter the results once typing in the movie search box pauses."""
+        if self._results_search_after_id:
+            self.after_cancel(self._results_search_after_id)
+        self._results_search_after_id = self.after(
+            RESULTS_SEARCH_DELAY_MS, self._apply_results_search
+        )
+
+    def _apply_results_search(self):
+        self._results_search_after_id = None
+        self._render_results()
+
+    def _get_friend_index(self, friend):
+        """Return the cached index of a friend's common movies, rebuilt if the data changed."""
+        cached = self._movie_index_cache.get(friend)
+        if cached and cached[0] == self.movie_data_version:
+            return cached[1]
+
+        common = self.common_movies.get(friend, set())
         try:
-            # Update friends canvas if it exists
-            if hasattr(self, "scrollable_friends_frame"):
-                # Force canvas to reconfigure its scroll region
-                for child in self.sync_frame.winfo_children():
-                    if isinstance(child, ttk.Frame):
-                        for grandchild in child.winfo_children():
-                            if isinstance(grandchild, tk.Canvas):
-                                grandchild.update_idletasks()
-                                grandchild.configure(scrollregion=grandchild.bbox("all"))
-
-            # Update results canvas if it exists
-            if hasattr(self, "results_canvas"):
-                self.results_canvas.update_idletasks()
-                self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all"))
-
-        except (tk.TclError, AttributeError):
-            # Ignore errors if widgets don't exist or are being destroyed
-            pass
+            import movie_database
+
+            details = movie_database.get_movie_details_for_titles(list(common))
+        except (ImportError, sqlite3.Error) as e:
+            logger.debug(f"Movie details unavailable for the search index: {e}")
+            details = {}
+        index = FriendMovieIndex(common, common, details)
+        self._movie_index_cache[friend] = (self.movie_data_version, index)
+        return index
+
+    def invalidate_movie_index(self, friend=None):
+        """Drop the cached movie index of a friend, or of everyone (bumping the data version)."""
+        if friend is None:
+            self.movie_data_version += 1
+            self._movie_index_cache.clear()
+        else:
+            self._movie_index_cache.pop(friend, None)
 
-    def fetch_friends_for_sync_tab(self):
-        """Fetches the user's friends and populates the checklist on the Sync tab."""
+    def _update_new_overlaps(self):
+        """Read the movies newly in common with the synced friends from the event log."""
+        try:
+            self.new_overlaps = get_new_overlaps(self.username.get(), list(self.friends_watchlists))
+        except sqlite3.Error as e:
+            logger.error(f"Could not read new overlaps: {e}")
+            self.new_overlaps = {}
+        self.new_overlaps_var.set(new_overlaps_summary(self.new_overlaps))
+
+    def _on_results_tree_open(self, event=None):
+        """Materialize the movie rows of a friend the first time it is expanded."""
+        friend_iid = self.results_tree.focus()
+        friend_index = ResultsModel.friend_index_for_iid(friend_iid)
+        if friend_index is None:
+            return
+        placeholder = ResultsModel.placeholder_iid(friend_index)
+        if not self.results_tree.exists(placeholder):
+            return  # Already populated
+        self.results_tree.delete(placeholder)
+
+        friend = self.results_model.friends[friend_index]
+        for movie_index, title in enumerate(self.results_model.movies_for(friend)):
+            self.results_tree.insert(
+                friend_iid,
+                "end",
+                iid=ResultsModel.movie_iid(friend_index, movie_index),
+                text=title,
+            )
+        self._schedule_poster_load()
+
+    def _schedule_poster_load(self):
+        """Load the posters of the visible rows once scrolling and resizing settle."""
+        if self.poster_after_id is not None:
+            self.after_cancel(self.poster_after_id)
+        self.poster_after_id = self.after(POSTER_LOAD_DELAY_MS, self._load_visible_posters)
+
+    def _load_visible_posters(self):
+        """Request the posters of the movie rows on screen, dropping queued loads of others."""
+        self.poster_after_id = None
+        visible = {}
+        for iid in visible_rows(self.results_tree, RESULTS_ROW_HEIGHT):
+            row = self.results_model.row_for_iid(iid)
+            if row and row.is_movie:
+                visible[iid] = row.title
+
+        missing = [title for title in visible.values() if title not in self.poster_paths]
+        if missing:
+            try:
+                import movie_database
+
+                details = movie_database.get_movie_details_for_titles(missing)
+            except ImportError:
+                details = {}
+            for title in missing:
+                self.poster_paths[title] = (details.get(title) or {}).get("poster_path")
+
+        wanted = {
+            iid: (title, self.poster_paths[title])
+            for iid, title in visible.items()
+            if self.poster_paths[title]
+        }
+        self.poster_loader.retain(poster_path for _, poster_path in wanted.values())
+        for iid, (title, poster_path) in wanted.items():
+            image = self.poster_loader.request(
+                poster_path,
+                lambda image, iid=iid, title=title: self._set_row_poster(iid, title, image),
+            )
+            if image is not None:
+                self._set_row_poster(iid, title, image)
+
+    def _set_row_poster(self, iid, title, image):
+        """Show a poster on a results row, unless the row has since been re-rendered."""
+        row = self.results_model.row_for_iid(iid)
+        if row and row.title == title and self.results_tree.exists(iid):
+            self.results_tree.item(iid, image=image)
+
+    def _selected_result_movie(self):
+        """Return the movie title of the selected results row, or None."""
+        selection = self.results_tree.selection()
+        if not selection:
+            return None
+        row = self.results_model.row_for_iid(selection[0])
+        return row.title if row and row.is_movie else None
+
+    def _on_results_tree_select(self, event=None):
+        """Enable the movie actions only while a movie row is selected."""
+        state = "normal" if self._selected_result_movie() else "disabled"
+        self.open_movie_button.config(state=state)
+        self.movie_details_button.config(state=state)
+
+    def _open_selected_movie(self):
+        movie_title = self._selected_result_movie()
+        if movie_title:
+            self._open_letterboxd_movie(movie_title)
+
+    def _show_selected_movie_details(self):
+        movie_title = self._selected_result_movie()
+        if movie_title:
+            self._show_movie_details_inline(movie_title)
+
+    def fetch_friends_for_sync_tab(self, force=False):
+        """
+        Fetches the user's friends and populates the checklist on the Sync tab.
+        A recently fetched list is read from the database unless force is set.
+        """
         username = self.username.get()
         if not username:
             messagebox.showerror("Error", "Please set a username in the Setup tab first.")
@@ -1745,79 +1732,106 @@ class LetterboxdGUI(tk.Tk):
 
         # Run in a separate thread to keep the GUI responsive
         threading.Thread(
-            target=self._fetch_and_populate_friends, args=(username,), daemon=True
+            target=self._fetch_and_populate_friends, args=(username, force), daemon=True
         ).start()
 
-    def _fetch_and_populate_friends(self, username):
+    def _fetch_and_populate_friends(self, username, force=False):
         """
         Worker method to fetch friends and then queue the GUI update.
         The fetched friends list is passed through the queue.
         Signature: Copilot (2025-07-21T00:30:00Z)
         """
-        friends_set = get_friends(username)
-        sorted_friends = sorted(list(friends_set))
+        try:
+            sorted_friends = self.sync_engine.sync_friends(username, force=force)
+        except Exception as e:
+            logger.error(f"Error fetching friends for {username}: {e}")
+            self.gui_queue.post(
+                self.sync_status_var.set, f"Could not fetch friends for {username}: {e}"
+            )
+            return
 
         # Use the queue to schedule the GUI update, passing the result directly.
-        self.gui_queue.put((self._populate_friends_list, (sorted_friends,), {}))
+        self.gui_queue.post(self._populate_friends_list, sorted_friends)
 
-    def _populate_friends_list(self, friends_list):
+    def _populate_friends_list(self, friends_list, selected_friends=None):
         """
         This method runs on the main GUI thread to update the friends checklist.
-        It receives the list of friends directly from the queue.
-        Enhanced with better scroll region management.
+        It receives the list of friends directly from the queue; rows are
+        inserted in idle-time chunks so large follow lists don't stall the UI.
         Signature: Copilot (2025-07-24T21:00:00Z)
         """
         self.friends = friends_list
-        # Clear previous friend checkboxes
-        for widget in self.scrollable_friends_frame.winfo_children():
-            widget.destroy()
-        self.friend_check_vars.clear()
-
-        # Populate with new friends
-        for friend_name in self.friends:
-            var = tk.BooleanVar(value=True)
-            cb = ttk.Checkbutton(
-                self.scrollable_friends_frame,
-                text=friend_name,
-                variable=var,
-                command=self.update_sync_stats,
-            )
-            cb.pack(anchor="w", padx=5, pady=1)  # Added pady for better spacing
-            self.friend_check_vars[friend_name] = var
+        self.friend_checklist.set_friends(friends_list, selected_friends)
 
-        # Force update scroll region after populating
-        # Use a more robust update sequence
-        self.update_idletasks()
-        self.scrollable_friends_frame.update_idletasks()
+        self._render_friend_rows()
+        self.friends_tree.yview_moveto(0)
 
-        if hasattr(self, "friends_canvas"):
-            # Multiple update calls to ensure proper sizing
-            self.friends_canvas.update_idletasks()
+        self.update_sync_stats()
+        self.sync_status_var.set(f"Found {len(self.friends)} friends. Ready to sync.")
 
-            # Get the actual bounding box
-            bbox = self.friends_canvas.bbox("all")
-            if bbox:
-                self.friends_canvas.configure(scrollregion=bbox)
-            else:
-                # Fallback calculation
-                frame_height = self.scrollable_friends_frame.winfo_reqheight()
-                frame_width = self.scrollable_friends_frame.winfo_reqwidth()
-                self.friends_canvas.configure(scrollregion=(0, 0, frame_width, frame_height))
+    def _render_friend_rows(self):
+        """
+        Rebuild the visible checklist rows for the current search filter.
+        Any chunked render still in flight is abandoned.
+        """
+        self._friend_render_generation += 1
+        self.friends_tree.delete(*self.friends_tree.get_children())
+        rows = self.friend_checklist.filtered(self.friend_search_var.get())
+        self._insert_friend_rows(self._friend_render_generation, rows, 0)
+
+    def _insert_friend_rows(self, generation, rows, start):
+        """Insert one chunk of checklist rows and schedule the next one."""
+        if generation != self._friend_render_generation:
+            return  # A newer render superseded this one
+        try:
+            end = min(start + FRIEND_LIST_CHUNK_SIZE, len(rows))
+            for friend in rows[start:end]:
+                self.friends_tree.insert(
+                    "", "end", iid=friend, text=self.friend_checklist.label(friend)
+                )
+            if end < len(rows):
+                self.after(1, self._insert_friend_rows, generation, rows, end)
+        except tk.TclError:
+            pass  # Window is being destroyed
+
+    def _refresh_friend_row(self, friend):
+        if self.friends_tree.exists(friend):
+            self.friends_tree.item(friend, text=self.friend_checklist.label(friend))
+
+    def _on_friend_row_click(self, event):
+        """Toggle a friend when its row is clicked."""
+        friend = self.friends_tree.identify_row(event.y)
+        if friend:
+            self.friends_tree.focus(friend)
+            self._toggle_friend(friend)
+
+    def _on_friend_row_key(self, event):
+        """Toggle the focused friend with the space bar."""
+        friend = self.friends_tree.focus()
+        if friend:
+            self._toggle_friend(friend)
+
+    def _toggle_friend(self, friend):
+        self.friend_checklist.toggle(friend)
+        self._refresh_friend_row(friend)
+        self.update_sync_stats()
 
-            # Reset scroll position to top
-            self.friends_canvas.yview_moveto(0)
+    def _on_friend_search_changed(self, *args):
+        """Debounce search input before re-filtering the checklist."""
+        if self._friend_search_after_id:
+            self.after_cancel(self._friend_search_after_id)
+        self._friend_search_after_id = self.after(150, self._apply_friend_search)
 
-        self.select_all_friends_var.set(True)
-        self.update_sync_stats()
-        self.sync_status_var.set(f"Found {len(self.friends)} friends. Ready to sync.")
+    def _apply_friend_search(self):
+        self._friend_search_after_id = None
+        self._render_friend_rows()
 
     def toggle_select_all_friends(self):
         """
         Toggle selection of all friends in the sync tab.
         """
-        select_all = self.select_all_friends_var.get()
-        for var in self.friend_check_vars.values():
-            var.set(select_all)
+        self.friend_checklist.set_all(self.select_all_friends_var.get())
+        self._render_friend_rows()
         self.update_sync_stats()
 
     def update_sync_stats(self):
@@ -1825,16 +1839,14 @@ class LetterboxdGUI(tk.Tk):
         Updates the statistics display showing how many friends are selected.
         Signature: Copilot (2025-07-24T12:00:00Z)
         """
-        if hasattr(self, "friend_check_vars"):
-            selected_count = sum(1 for var in self.friend_check_vars.values() if var.get())
-            total_count = len(self.friend_check_vars)
-            self.sync_stats_var.set(f"Selected: {selected_count} of {total_count} friends")
-        else:
-            self.sync_stats_var.set("Selected: 0 friends")
+        selected_count = self.friend_checklist.selected_count
+        total_count = len(self.friend_checklist)
+        self.select_all_friends_var.set(self.friend_checklist.all_selected)
+        self.sync_stats_var.set(f"Selected: {selected_count} of {total_count} friends")
 
     def perform_sync_selected(self):
         """Performs the sync operation for the friends selected in the checklist."""
-        selected_friends = [name for name, var in self.friend_check_vars.items() if var.get()]
+        selected_friends = self.friend_checklist.selected_in_order()
         if not selected_friends:
             messagebox.showwarning("Warning", "No friends selected to sync.")
             return
@@ -1880,12 +1892,76 @@ class LetterboxdGUI(tk.Tk):
         self.cancel_sync_button.config(state="disabled")
 
         if cancelled:
-            self.sync_status_var.set("Sync cancelled by user. Partial results available.")
+            self.sync_status_var.set(
+                "Sync cancelled by user. Partial results available; "
+                "the next sync resumes where this one stopped."
+            )
+
+        if self.last_sync_instrumentation is not None:
+            summary = self.last_sync_instrumentation.summary_line()
+            logger.info(f"Sync timings: {summary}")
+            self.sync_timing_var.set(f"Last sync {summary}")
+            self.sync_report_button.config(state="normal")
 
         # Update last sync display and save current state
         self.update_last_sync_display()
         self.save_config()
 
+    def import_letterboxd_export(self):
+        """
+        Load the user's watchlist, watched films and ratings from a Letterboxd
+        data export; syncs then read the user's watchlist from the database.
+        """
+        path = filedialog.askopenfilename(
+            title="Import Letterboxd Export",
+            filetypes=[("Letterboxd export", "*.zip"), ("All Files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            result = import_letterboxd_export(path, self.username.get() or None, DEFAULT_DB_PATH)
+        except (ExportError, sqlite3.Error) as e:
+            messagebox.showerror("Import Error", f"Could not import the export:\n{e}")
+            return
+
+        if not self.username.get():
+            self.username.set(result.username)
+        if result.username == self.username.get():
+            self.user_watchlist = get_watchlist_from_db(result.username)
+        messagebox.showinfo(
+            "Import Complete",
+            f"Imported {result.watchlist} watchlist films, {result.watched} watched films "
+            f"and {result.ratings} ratings for {result.username} "
+            f"in {result.seconds:.2f}s.\n\n"
+            "Syncs will use this watchlist instead of fetching it; import a newer "
+            "export to update it.",
+        )
+
+    def show_database_dialog(self):
+        """Open the database statistics and maintenance dialog."""
+        DatabaseDialog(self, DEFAULT_DB_PATH)
+
+    def _check_idle_maintenance(self):
+        """Start background maintenance when due, then check again later."""
+        if not self.gui_queue_active:
+            return
+        running = self.maintenance_thread is not None and self.maintenance_thread.is_alive()
+        self.idle_maintenance.run_if_idle(busy=self.sync_in_progress or running)
+        self.maintenance_after_id = self.after(MAINTENANCE_POLL_MS, self._check_idle_maintenance)
+
+    def _start_background_maintenance(self):
+        self.maintenance_thread = threading.Thread(
+            target=run_maintenance, args=(DEFAULT_DB_PATH,), daemon=True
+        )
+        self.maintenance_thread.start()
+
+    def show_sync_report(self):
+        """Open the timing report of the last sync (exportable as JSON)."""
+        if self.last_sync_instrumentation is None:
+            messagebox.showinfo("Sync Timing Report", "Run a sync first.")
+            return
+        SyncReportDialog(self, self.last_sync_instrumentation.report())
+
     def _handle_large_watchlist(self, friend_name, movie_count):
         """
         Handle friends with large watchlists (500+ movies) by asking user preference.
@@ -1961,202 +2037,112 @@ class LetterboxdGUI(tk.Tk):
     def _sync_worker(self, username, friends_to_sync):
         """
         The actual sync logic that runs in a background thread.
-        All GUI updates are put into a queue to be processed by the main thread.
+        The sync engine does the work; its progress updates are posted to the
+        GUI event bus to be applied by the main thread.
         Signature: Copilot (2025-07-21T00:15:00Z)
         """
 
         def queue_update(task, *args, **kwargs):
             """Helper to put a GUI update task into the queue."""
-            self.gui_queue.put((task, args, kwargs))
-
-        queue_update(self.sync_progress_var.set, 0)
+            self.gui_queue.post(task, *args, **kwargs)
+
+        def on_progress(update):
+            """Coalesced status/progress updates: only the latest values are applied."""
+            self.gui_queue.post_latest("sync_status", self.sync_status_var.set, update.message)
+            self.gui_queue.post_latest("sync_progress", self.sync_progress_var.set, update.percent)
+
+        def ask_large_watchlist(friend, count):
+            """Ask on the GUI thread what to do with a large watchlist and wait for the answer."""
+            answer = {"value": POLICY_SKIP}
+            answered = threading.Event()
+
+            def ask():
+                try:
+                    answer["value"] = self._handle_large_watchlist(friend, count)
+                finally:
+                    answered.set()
+
+            queue_update(ask)
+            # Give up (skip) if the window goes away or the sync is cancelled
+            while not answered.wait(0.2):
+                if self.sync_cancelled.is_set() or not self.gui_queue_active:
+                    return POLICY_SKIP
+            return answer["value"]
+
+        self.gui_queue.post_latest("sync_progress", self.sync_progress_var.set, 0)
         queue_update(self.notebook.tab, 2, state="disabled")
 
-        # 1. Sync user's own watchlist
+        # A running VACUUM locks the whole database; start once it is done
+        if maintenance_running():
+            on_progress(SyncProgress("user", "Waiting for database maintenance to finish...", 0))
+            wait_for_maintenance()
+
         if self.sync_cancelled.is_set():
             queue_update(self._finish_sync_operation, True)
             return
 
-        queue_update(self.sync_status_var.set, f"Fetching your watchlist ({username})...")
-        try:
-            self.user_watchlist = get_watchlist(username)
-            sync_watchlist_to_db(username, self.user_watchlist)
-        except Exception as e:
-            logger.error(f"Error fetching user watchlist: {e}")
-            if self.sync_cancelled.is_set():
-                queue_update(self._finish_sync_operation, True)
-                return
-
-        # 2. Sync friends' watchlists
-        self.friends_watchlists = {}
-        total_friends = len(friends_to_sync)
-        friends_completed = 0
-
-        for i, friend in enumerate(friends_to_sync):
-            # Check for cancellation before each friend
-            if self.sync_cancelled.is_set():
-                logger.info(
-                    "Sync cancelled after processing "
-                    f"{friends_completed} of {total_friends} friends"
+        # Time every request and stage of this run for the timing report
+        with SyncInstrumentation() as recorder:
+            result = self.sync_engine.sync(
+                username,
+                friends_to_sync,
+                progress=on_progress,
+                watchlist_policy=ask_large_watchlist,
+                cancel_event=self.sync_cancelled,
+            )
+        # The results view reads these on the Tk thread, so swap them in there
+        queue_update(self._apply_sync_result, result, recorder)
+
+        if result.cancelled:
+            on_progress(
+                SyncProgress(
+                    "done",
+                    f"Sync cancelled. Processed {result.friends_completed} of "
+                    f"{len(friends_to_sync)} friends.",
+                    100,
                 )
-                break
-
-            status_msg = f"Checking watchlist size for '{friend}' ({i + 1}/{total_friends})..."
-            queue_update(self.sync_status_var.set, status_msg)
-
-            try:
-                # Check watchlist count first
-                watchlist_count = get_watchlist_count(friend)
-
-                # Handle large watchlists (500+ movies)
-                if watchlist_count and watchlist_count >= 500:
-                    # Ask user what to do with large watchlist
-                    user_choice = self._handle_large_watchlist(friend, watchlist_count)
+            )
 
-                    if user_choice == "skip":
-                        logger.info(
-                            f"Skipping {friend} due to large watchlist ({watchlist_count} movies)"
-                        )
-                        continue
-                    elif user_choice == "limit":
-                        # Fetch first 500 movies
-                        status_msg = (
-                            f"Fetching first 500 movies for '{friend}' ({i + 1}/{total_friends})..."
-                        )
-                        queue_update(self.sync_status_var.set, status_msg)
-                        watchlist = get_watchlist(friend, limit=500)
-                    else:  # user_choice == "full"
-                        # Fetch all movies
-                        status_msg = (
-                            f"Fetching all {watchlist_count} movies for '{friend}' "
-                            f"({i + 1}/{total_friends})... This may take a while."
-                        )
-                        queue_update(self.sync_status_var.set, status_msg)
-                        watchlist = get_watchlist(friend)
-                else:
-                    # Normal size watchlist
-                    status_msg = f"Fetching watchlist for '{friend}' ({i + 1}/{total_friends})..."
-                    queue_update(self.sync_status_var.set, status_msg)
-                    watchlist = get_watchlist(friend)
-
-                self.friends_watchlists[friend] = watchlist
-                sync_watchlist_to_db(friend, watchlist)
-                friends_completed += 1
-            except Exception as exc:
-                logger.error(f"'{friend}' generated an exception during sync: {exc}")
-                # Continue with next friend even if one fails
-
-            progress = ((i + 1) / total_friends) * 100
-            queue_update(self.sync_progress_var.set, progress)
-
-            # Check cancellation after each friend is processed
-            if self.sync_cancelled.is_set():
-                logger.info(
-                    f"Sync cancelled after processing "
-                    f"{friends_completed} of {total_friends} friends"
-                )
-                break
+        queue_update(self.update_results_tab)
 
-        # 3. Finalize and update UI
-        cancelled = self.sync_cancelled.is_set()
-        if cancelled:
-            status_msg = (
-                f"Sync cancelled. Processed {friends_completed} of {total_friends} friends."
+        # Reset sync state
+        queue_update(self._finish_sync_operation, result.cancelled)
+
+    def _apply_sync_result(self, result, recorder):
+        """Store the results of a finished sync (Tk thread)"""
+        self.last_sync_instrumentation = recorder
+        self.user_watchlist = result.user_watchlist
+        self.friends_watchlists = result.friends_watchlists
+        self.common_movies = result.common_movies
+        self.invalidate_movie_index()
+        self.last_sync_incomplete = result.incomplete
+
+    def update_results_tab(self):
+        """
+        Updates the results tab with the common movies of the last sync.
+        Signature: Copilot (2025-07-24T20:00:00Z)
+        """
+        friend_count = len(self.common_movies)
+        self._update_new_overlaps()
+        self._update_result_facets()
+        self._render_results()
+
+        if friend_count > 0:
+            self.results_summary_var.set(
+                f"Found {len(self.results_model)} common movies with {friend_count} friends"
             )
         else:
-            status_msg = "Comparing watchlists and finalizing..."
-        queue_update(self.sync_status_var.set, status_msg)
-
-        # Compare watchlists with whatever data we have
-        self.common_movies = compare_watchlists(self.user_watchlist, self.friends_watchlists)
-
-        def update_results_tab():
-            """
-            Updates the results tab with detailed movie information and links.
-            Signature: Copilot (2025-07-24T20:00:00Z)
-            """
-            # Clear existing results
-            for widget in self.scrollable_results_frame.winfo_children():
-                widget.destroy()
-
-            total_common_movies = 0
-            friend_count = len(self.common_movies)
-
-            # Update summary
-            if friend_count > 0:
-                total_common_movies = sum(len(movies) for movies in self.common_movies.values())
-                self.results_summary_var.set(
-                    f"Found {total_common_movies} common movies with {friend_count} friends"
-                )
-
-                # Create detailed results display
-                for i, (friend, movies) in enumerate(sorted(self.common_movies.items())):
-                    # Friend header frame
-                    friend_frame = ttk.LabelFrame(
-                        self.scrollable_results_frame,
-                        text=f"{friend} ({len(movies)} common movies)",
-                        padding="10",
-                    )
-                    friend_frame.pack(fill="x", padx=5, pady=5)
-
-                    # Movies grid
-                    movies_frame = ttk.Frame(friend_frame)
-                    movies_frame.pack(fill="x")
-
-                    # Configure grid to be responsive
-                    movies_frame.grid_columnconfigure(0, weight=1)
-
-                    for j, movie in enumerate(sorted(movies)):
-                        movie_row = ttk.Frame(movies_frame)
-                        movie_row.grid(row=j, column=0, sticky="ew", pady=2)
-                        movie_row.grid_columnconfigure(1, weight=1)
-
-                        # Movie title
-                        movie_label = ttk.Label(
-                            movie_row, text=f"• {movie}", font=("TkDefaultFont", 9)
-                        )
-                        movie_label.grid(row=0, column=0, sticky="w")
-
-                        # Letterboxd link
-                        link_button = ttk.Button(
-                            movie_row,
-                            text="View on Letterboxd",
-                            width=18,
-                            command=lambda m=movie: self._open_letterboxd_movie(m),
-                        )
-                        link_button.grid(row=0, column=1, sticky="e", padx=(10, 0))
-
-                        # Details button - shows details in same window
-                        details_button = ttk.Button(
-                            movie_row,
-                            text="Details",
-                            width=8,
-                            command=lambda m=movie: self._show_movie_details_inline(m),
-                        )
-                        details_button.grid(row=0, column=2, sticky="e", padx=(5, 0))
-            else:
-                self.results_summary_var.set("No common movies found")
-                no_results_label = ttk.Label(
-                    self.scrollable_results_frame,
-                    text="No common movies were found with the selected friends.",
-                    font=("TkDefaultFont", 10),
-                )
-                no_results_label.pack(pady=20)
-
-            # Update canvas scroll region
-            self.scrollable_results_frame.update_idletasks()
-            self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all"))
+            self.results_summary_var.set("No common movies were found with the selected friends.")
 
-            self.sync_status_var.set(
-                f"Sync complete! Found common movies with {friend_count} friends."
+        status = f"Sync complete! Found common movies with {friend_count} friends."
+        if self.last_sync_incomplete:
+            status += (
+                f" {len(self.last_sync_incomplete)} watchlist(s) were only partly fetched;"
+                " sync again to resume them."
             )
-            self.notebook.tab(2, state="normal")
-            self.notebook.select(2)
-
-        queue_update(update_results_tab)
-
-        # Reset sync state
-        queue_update(self._finish_sync_operation, cancelled)
+        self.sync_status_var.set(status)
+        self.notebook.tab(2, state="normal")
+        self.notebook.select(2)
 
     def _open_letterboxd_movie(self, movie_title):
         """
@@ -2260,6 +2246,10 @@ class LetterboxdGUI(tk.Tk):
             try:
                 movie_details = get_movie_details(movie_title)
                 logger.debug(f"TMDB details for '{movie_title}': {movie_details}")
+                # Newly fetched details feed the sort columns of the search indexes
+                for friend, movies in self.common_movies.items():
+                    if movie_details and movie_title in movies:
+                        self.invalidate_movie_index(friend)
             except Exception as e:
                 logger.error(f"Error fetching TMDB details for '{movie_title}': {e}")
 
@@ -2373,19 +2363,8 @@ class LetterboxdGUI(tk.Tk):
             title_label.pack(pady=(0, 10))
 
             # Details text area
-            current_theme = "dark" if self.dark_mode.get() else "light"
-            colors = self.theme_colors[current_theme]
-            details_text = tk.Text(
-                main_frame,
-                wrap="word",
-                height=15,
-                width=60,
-                bg=colors["entry_bg"],
-                fg=colors["entry_fg"],
-                insertbackground=colors["fg"],
-                selectbackground=colors["highlight"],
-                selectforeground=colors["select_fg"],
-            )
+            details_text = tk.Text(main_frame, wrap="word", height=15, width=60)
+            self.theme_registry.register(details_text, "text")
             details_scrollbar = ttk.Scrollbar(
                 main_frame, orient="vertical", command=details_text.yview
             )
@@ -2455,7 +2434,9 @@ class LetterboxdGUI(tk.Tk):
 
     def fetch_movie_details_background(self, movies_list):
         with ThreadPoolExecutor(max_workers=4) as executor:
-            executor.map(get_movie_details, movies_list)
+            list(executor.map(get_movie_details, movies_list))
+        # Ratings, directors and genres may have changed; rebuild the indexes on the Tk thread
+        self.gui_queue.post(self.invalidate_movie_index)
 
     def save_all_and_exit(self):
         """
@@ -2472,13 +2453,30 @@ class LetterboxdGUI(tk.Tk):
                 self.gui_queue_after_id = None
             except tk.TclError:
                 pass  # Already destroyed or invalid
+        if getattr(self, "maintenance_after_id", None):
+            try:
+                self.after_cancel(self.maintenance_after_id)
+                self.maintenance_after_id = None
+            except tk.TclError:
+                pass
+        if self.poster_after_id is not None:
+            try:
+                self.after_cancel(self.poster_after_id)
+                self.poster_after_id = None
+            except tk.TclError:
+                pass
+        self.poster_loader.close()
+        if self.gui_queue_wakeup is not None:
+            self.gui_queue.set_wakeup(None)
+            self.gui_queue_wakeup.close()
 
         # Cancel any ongoing sync operations
         if self.sync_in_progress:
             self.sync_cancelled.set()
 
-        # Save configuration
+        # Save configuration and write it out now rather than after the debounce
         self.save_config()
+        self.config_store.flush()
 
         # Log application close
         logger.info("Application has been closed.")
@@ -2563,7 +2561,7 @@ def cli_main():
     """
     max_workers = 4  # Safe limit for concurrent requests
     clear_output_file()
-    init_db()
+    engine = create_sync_engine()
     while True:
         username = validate_username_input("Enter your Letterboxd username (or 'exit' to quit): ")
         if username.lower() == "exit":
@@ -2575,7 +2573,7 @@ def cli_main():
     # Use a path relative to the script file
     script_dir = os.path.dirname(os.path.abspath(__file__))
     cookie_path = os.path.join(script_dir, "Cookie.json")
-    load_cookies_from_json(session, cookie_path)
+    load_cookies_from_json(_get_session(), cookie_path)
 
     while True:
         print("\n--- Menu ---")
@@ -2585,15 +2583,18 @@ def cli_main():
         print("4. Exit")
         choice = validate_menu_choice("Enter your choice: ", ["1", "2", "3", "4"])
         if choice == "1":
-            user_watchlist = get_watchlist(username)
+            user_watchlist = engine.sync_user(username)
             print(f"\nFound {len(user_watchlist)} movies in your watchlist.")
         elif choice == "2":
-            friends = get_friends(username)
+            friends = engine.sync_friends(username)
             print(f"\nFound {len(friends)} friends.")
             friends_watchlists = {}
+            # One registry per run: a watchlist requested twice is fetched once
+            registry = SingleFlight()
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 future_to_friend = {
-                    executor.submit(get_watchlist, friend): friend for friend in friends
+                    executor.submit(engine.sync_user, friend, registry=registry): friend
+                    for friend in friends
                 }
                 for future in as_completed(future_to_friend):
                     friend = future_to_friend[future]
@@ -2610,7 +2611,9 @@ def cli_main():
             if "friends_watchlists" not in locals():
                 print("\nPlease fetch your friends' watchlists first (Option 2).")
                 continue
-            common_movies = compare_watchlists(user_watchlist, friends_watchlists)
+            common_movies = compare_watchlists(
+                user_watchlist, friends_watchlists, engine.sync_watched(username)
+            )
             print("\n--- Common Movies ---")
             for friend, movies in common_movies.items():
                 print(f"\n{friend} ({len(movies)} common movies):")
@@ -0,0 +1,151 @@
+"""
+Optional asyncio TMDB client for Letterboxd Friend Check App
+
+AsyncTMDBApi mirrors TMDBApi (search, details, enrichment) but runs many
+lookups concurrently over one aiohttp keep-alive pool, bounded by a
+semaphore and paced by an optional shared RateLimiter. Results are mapped
+with the same helpers as TMDBApi, so both clients enrich movies identically.
+Requires aiohttp.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from letterboxd_friend_check.api.tmdb import TMDBApi, tmdb_info_from_result
+from letterboxd_friend_check.data.movie_index import split_title_year
+from letterboxd_friend_check.utils.rate_limit import RateLimiter
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency
+    aiohttp = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# TMDB requests in flight at once
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncTMDBApi:
+    """Concurrent TMDB lookups (use as an async context manager)"""
+
+    BASE_URL = TMDBApi.BASE_URL
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: float = 10,
+        cancel_event: Optional[threading.Event] = None,
+        base_url: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            api_key: TMDB API key
+            max_concurrency: Requests in flight at once (also the pool size)
+            rate_limiter: Optional limiter pacing every request
+            timeout: Total seconds allowed per request
+            cancel_event: Set it to stop issuing new requests
+            base_url: API root (overridable for tests)
+        """
+        if aiohttp is None:
+            raise ImportError("The asyncio TMDB client requires aiohttp (pip install aiohttp)")
+        self.api_key = api_key
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.params = {"api_key": api_key, "language": "en-US", "include_adult": "false"}
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.cancel_event = cancel_event or threading.Event()
+        # Cache to avoid repeated API calls for the same movie
+        self.movie_cache: Dict[str, Optional[Dict]] = {}
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncTMDBApi":
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_json(self, path: str, params: Dict) -> Optional[Dict]:
+        """GET an API path; None on cancellation or any error"""
+        async with self._semaphore:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            if self.cancel_event.is_set():
+                return None
+            try:
+                async with self._session.get(f"{self.base_url}{path}", params=params) as response:
+                    if response.status != 200:
+                        logger.error(f"TMDB API error: {response.status}, {await response.text()}")
+                        return None
+                    return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error calling TMDB {path}: {e}")
+                return None
+
+    async def get_movie_details(self, movie_id: int) -> Optional[Dict]:
+        """Get detailed information for a specific movie by ID"""
+        return await self._get_json(f"/movie/{movie_id}", self.params)
+
+    async def search_movie(self, title: str, year: Optional[int] = None) -> Optional[Dict]:
+        """Search for a movie by title and optional year; returns the best match with details"""
+        cache_key = f"{title}_{year if year else 'no_year'}"
+        if cache_key in self.movie_cache:
+            return self.movie_cache[cache_key]
+
+        search_params = dict(self.params, query=title)
+        if year:
+            search_params["year"] = year
+        data = await self._get_json("/search/movie", search_params)
+        results = (data or {}).get("results", [])
+        if not results:
+            if data is not None:
+                logger.warning(f"No TMDB results found for '{title}'")
+            return None
+
+        movie = results[0]
+        if movie.get("id"):
+            details = await self.get_movie_details(movie["id"])
+            if details:
+                movie.update(details)
+        self.movie_cache[cache_key] = movie
+        return movie
+
+    async def enrich_movie_data(self, movie_data: Dict) -> Dict:
+        """Enrich existing movie data with TMDB information (updated in place)"""
+        title, year = split_title_year(movie_data.get("title", ""))
+        tmdb_data = await self.search_movie(title, year)
+        if tmdb_data:
+            movie_data.update(tmdb_info_from_result(tmdb_data))
+        return movie_data
+
+    async def bulk_enrich_movies(self, movies: List[Dict]) -> List[Dict]:
+        """Enrich a list of movies concurrently, keeping their order"""
+        logger.info(f"Enriching {len(movies)} movies with TMDB data")
+        return list(await asyncio.gather(*(self.enrich_movie_data(movie) for movie in movies)))
+
+
+def bulk_enrich_movies(movies: List[Dict], api_key: str, **client_kwargs) -> List[Dict]:
+    """Blocking helper: enrich movies concurrently on a fresh event loop"""
+
+    async def run() -> List[Dict]:
+        async with AsyncTMDBApi(api_key, **client_kwargs) as api:
+            return await api.bulk_enrich_movies(movies)
+
+    return asyncio.run(run())
@@ -0,0 +1,111 @@
+"""
+TMDB credential provider for Letterboxd Friend Check App
+
+The API key is looked up once (environment first, then the known config
+files) and memoized, including a "no key" answer, so TMDB calls don't stat
+and parse config files per request. Call invalidate_tmdb_api_key() after
+the key is changed (the setup tab does) and the next lookup reads it again.
+"""
+
+import os
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+
+from letterboxd_friend_check.config import DEFAULT_CONFIG_PATH, get_config_store
+
+logger = logging.getLogger(__name__)
+
+TMDB_API_KEY_ENV = "TMDB_API_KEY"
+CONFIG_KEY = "tmdb_api_key"
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def default_config_paths() -> List[Path]:
+    """
+    Config files searched for the key, in order: the GUI's config.json in the
+    working directory, the one next to the launcher scripts, the package config
+    and the legacy data/config.json
+    """
+    return [
+        Path(os.path.abspath("config.json")),
+        _PROJECT_ROOT / "config.json",
+        DEFAULT_CONFIG_PATH,
+        _PROJECT_ROOT / "data" / "config.json",
+    ]
+
+
+class CredentialProvider:
+    """Memoized TMDB API key lookup with explicit invalidation"""
+
+    _UNSET = object()
+
+    def __init__(
+        self,
+        config_paths: Optional[Union[Sequence[Path], Callable[[], Sequence[Path]]]] = None,
+        env_var: str = TMDB_API_KEY_ENV,
+    ) -> None:
+        """
+        Args:
+            config_paths: Config files to search, or a callable returning them
+                (default_config_paths if None)
+            env_var: Environment variable checked before any file
+        """
+        self._config_paths = config_paths or default_config_paths
+        self.env_var = env_var
+        self._lock = threading.Lock()
+        self._key = self._UNSET
+        self.lookups = 0
+
+    def get_tmdb_api_key(self) -> Optional[str]:
+        """The TMDB API key, or None if none is configured"""
+        key = self._key
+        if key is self._UNSET:
+            with self._lock:
+                if self._key is self._UNSET:
+                    self._key = self._lookup()
+                key = self._key
+        return key
+
+    def invalidate(self) -> None:
+        """Forget the memoized key; the next call looks it up again"""
+        with self._lock:
+            self._key = self._UNSET
+
+    def _lookup(self) -> Optional[str]:
+        self.lookups += 1
+        api_key = os.environ.get(self.env_var)
+        if api_key:
+            return api_key
+
+        paths = self._config_paths() if callable(self._config_paths) else self._config_paths
+        for path in dict.fromkeys(os.path.abspath(p) for p in paths):
+            try:
+                api_key = get_config_store(path).get(CONFIG_KEY)
+            except Exception as e:
+                logger.error(f"Error loading TMDB API key from {path}: {e}")
+                continue
+            if api_key:
+                logger.debug(f"Using TMDB API key from {path}")
+                return api_key.strip()
+        return None
+
+
+_provider = CredentialProvider()
+
+
+def get_provider() -> CredentialProvider:
+    """The process-wide provider shared by every TMDB module"""
+    return _provider
+
+
+def get_tmdb_api_key() -> Optional[str]:
+    """The memoized TMDB API key, or None"""
+    return _provider.get_tmdb_api_key()
+
+
+def invalidate_tmdb_api_key() -> None:
+    """Drop the memoized key (call after saving a new one)"""
+    _provider.invalidate()
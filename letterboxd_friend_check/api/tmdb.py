@@ -3,16 +3,47 @@ TMDB API integration for Letterboxd Friend Check App
 Fetches movie details from The Movie Database (themoviedb.org)
 """
 
-import re
 import time
 import logging
 import requests
 from typing import Dict, List, Optional
 
+from letterboxd_friend_check.api.credentials import get_tmdb_api_key
+from letterboxd_friend_check.data.movie_index import split_title_year
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def tmdb_info_from_result(tmdb_data: Dict) -> Dict:
+    """Map a TMDB search/details result to the fields stored with a movie"""
+    tmdb_info = {
+        "tmdb_id": tmdb_data.get("id"),
+        "poster_path": tmdb_data.get("poster_path"),
+        "overview": tmdb_data.get("overview"),
+        "tmdb_rating": tmdb_data.get("vote_average"),
+        "release_date": tmdb_data.get("release_date"),
+        "runtime": tmdb_data.get("runtime"),
+        "genres": (
+            [genre["name"] for genre in tmdb_data.get("genres", [])]
+            if "genres" in tmdb_data
+            else None
+        ),
+        "backdrop_path": tmdb_data.get("backdrop_path"),
+    }
+
+    # Update director info if available
+    if "credits" in tmdb_data:
+        directors = [
+            crew["name"]
+            for crew in tmdb_data["credits"].get("crew", [])
+            if crew.get("job") == "Director"
+        ]
+        if directors:
+            tmdb_info["director"] = ", ".join(directors)
+    return tmdb_info
+
+
 class TMDBApi:
     """Class to handle TMDB API requests and data processing"""
 
@@ -106,15 +137,7 @@ class TMDBApi:
         Enrich existing movie data with TMDB information
         Returns the original data updated with TMDB info
         """
-        title = movie_data.get("title", "")
-        year = None
-
-        # Try to extract year if it's in the title format "Movie Title (YYYY)"
-        year_match = re.search(r"\((\d{4})\)$", title)
-        if year_match:
-            year = int(year_match.group(1))
-            # Clean title of the year part
-            title = re.sub(r"\s*\(\d{4}\)$", "", title)
+        title, year = split_title_year(movie_data.get("title", ""))
 
         # Search TMDB
         tmdb_data = self.search_movie(title, year)
@@ -122,34 +145,8 @@ class TMDBApi:
         if not tmdb_data:
             return movie_data
 
-        # Update movie_data with TMDB information
-        tmdb_info = {
-            "tmdb_id": tmdb_data.get("id"),
-            "poster_path": tmdb_data.get("poster_path"),
-            "overview": tmdb_data.get("overview"),
-            "tmdb_rating": tmdb_data.get("vote_average"),
-            "release_date": tmdb_data.get("release_date"),
-            "runtime": tmdb_data.get("runtime"),
-            "genres": (
-                [genre["name"] for genre in tmdb_data.get("genres", [])]
-                if "genres" in tmdb_data
-                else None
-            ),
-            "backdrop_path": tmdb_data.get("backdrop_path"),
-        }
-
-        # Update director info if available
-        if "credits" in tmdb_data:
-            directors = [
-                crew["name"]
-                for crew in tmdb_data["credits"].get("crew", [])
-                if crew.get("job") == "Director"
-            ]
-            if directors:
-                tmdb_info["director"] = ", ".join(directors)
-
         # Update the movie data with TMDB info
-        movie_data.update(tmdb_info)
+        movie_data.update(tmdb_info_from_result(tmdb_data))
 
         return movie_data
 
@@ -180,12 +177,9 @@ def get_movie_details(
     title: str, year: Optional[int] = None, api_key: Optional[str] = None
 ) -> Optional[Dict]:
     """Get movie details from TMDB by title and optional year"""
-    from letterboxd_friend_check.config import Config
-
-    # Get API key from config if not provided
+    # Get API key from the shared credential provider if not provided
     if not api_key:
-        config = Config()
-        api_key = config.get("tmdb_api_key", "")
+        api_key = get_tmdb_api_key()
 
     # Ensure we have a valid API key
     if not api_key:
@@ -198,12 +192,9 @@ def get_movie_details(
 
 def enrich_movie_data(movie_data: Dict, api_key: Optional[str] = None) -> Dict:
     """Enrich existing movie data with TMDB info"""
-    from letterboxd_friend_check.config import Config
-
-    # Get API key from config if not provided
+    # Get API key from the shared credential provider if not provided
     if not api_key:
-        config = Config()
-        api_key = config.get("tmdb_api_key", "")
+        api_key = get_tmdb_api_key()
 
     # Ensure we have a valid API key
     if not api_key:
@@ -216,12 +207,9 @@ def enrich_movie_data(movie_data: Dict, api_key: Optional[str] = None) -> Dict:
 
 def bulk_enrich_movies(movies: List[Dict], api_key: Optional[str] = None) -> List[Dict]:
     """Enrich a list of movies with TMDB data"""
-    from letterboxd_friend_check.config import Config
-
-    # Get API key from config if not provided
+    # Get API key from the shared credential provider if not provided
     if not api_key:
-        config = Config()
-        api_key = config.get("tmdb_api_key", "")
+        api_key = get_tmdb_api_key()
 
     # Ensure we have a valid API key
     if not api_key:
@@ -5,8 +5,6 @@ This module provides both TMDB API integration and the main application entry po
 """
 
 import logging
-import requests
-import os
 import sys
 from pathlib import Path
 
@@ -18,29 +16,11 @@ SEARCH_MOVIE_URL = f"{TMDB_BASE_URL}/search/movie"
 MOVIE_DETAILS_URL = f"{TMDB_BASE_URL}/movie"
 
 
-# Get API key from environment or config
+# Get API key from environment or config (memoized; see api.credentials)
 def get_api_key():
-    # First try environment variable
-    api_key = os.environ.get("TMDB_API_KEY")
+    from letterboxd_friend_check.api.credentials import get_tmdb_api_key
 
-    # If not in environment, try config file
-    if not api_key:
-        try:
-            import json
-
-            config_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"
-            )
-            config_path = os.path.join(config_dir, "config.json")
-
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    api_key = config.get("tmdb_api_key")
-        except Exception as e:
-            logger.error(f"Error loading TMDB API key from config: {e}")
-
-    return api_key
+    return get_tmdb_api_key()
 
 
 def search_movie(title, year=None):
@@ -72,6 +52,8 @@ def search_movie(title, year=None):
         params["year"] = year
 
     try:
+        import requests  # deferred so importing the app module stays cheap
+
         # [2025-07-26 GitHub Copilot] Added timeout for security (B113 fix)
         response = requests.get(SEARCH_MOVIE_URL, params=params, timeout=10)
         response.raise_for_status()
@@ -112,6 +94,8 @@ def get_movie_details(title, year=None):
 
     # Fetch detailed movie information
     try:
+        import requests
+
         url = f"{MOVIE_DETAILS_URL}/{movie_id}"
         params = {"api_key": api_key, "language": "en-US", "append_to_response": "credits,keywords"}
 
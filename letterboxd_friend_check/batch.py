@@ -0,0 +1,241 @@
+"""
+Headless batch sync for several Letterboxd accounts.
+
+A batch run fetches the follow lists of every account first, then looks up
+every needed watchlist through a single-flight registry, so each distinct
+user is fetched exactly once (a friend followed by several accounts is
+scraped a single time, and recently synced users are read from the
+database). Everything is stored in the database and compared per account.
+All fetches share one rate limiter. With backend="async", pages are fetched
+concurrently on one event loop (see utils.async_web). The run returns a JSON-serializable
+summary with per-user timings, request counts, per-stage timings and cache hit rates.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from letterboxd_friend_check.engine import SyncEngine, compare_watchlists
+from letterboxd_friend_check.utils import web
+from letterboxd_friend_check.utils.instrumentation import SyncInstrumentation
+from letterboxd_friend_check.utils.rate_limit import RateLimiter
+from letterboxd_friend_check.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_WORKERS = 4
+# Combined requests per second across all workers
+DEFAULT_BATCH_RATE = 1.0
+# Scraping backends: blocking requests in worker threads, or aiohttp
+BACKEND_THREADS = "threads"
+BACKEND_ASYNC = "async"
+
+
+class RequestTally:
+    """Counts requests per Letterboxd user (taken from the URL path)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.by_user: Dict[str, int] = {}
+        self.by_status: Dict[str, int] = {}
+        self.total = 0
+        self.seconds = 0.0
+
+    def __call__(self, url: str, status: Optional[int], elapsed: float) -> None:
+        user = urlparse(url).path.strip("/").split("/")[0]
+        with self._lock:
+            self.total += 1
+            self.seconds += elapsed
+            self.by_user[user] = self.by_user.get(user, 0) + 1
+            key = str(status) if status is not None else "error"
+            self.by_status[key] = self.by_status.get(key, 0) + 1
+
+
+def read_usernames(values: Iterable[str], path: Optional[str] = None) -> List[str]:
+    """
+    Collect usernames from arguments and an optional file (one per line,
+    '#' starts a comment), keeping the first occurrence of each.
+    """
+    names = list(values)
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    names.append(line)
+    return list(dict.fromkeys(name.strip() for name in names if name.strip()))
+
+
+def run_batch(
+    usernames: Iterable[str],
+    db_path: Optional[str] = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    rate: Optional[float] = DEFAULT_BATCH_RATE,
+    max_movies: Optional[int] = None,
+    engine: Optional[SyncEngine] = None,
+    backend: str = BACKEND_THREADS,
+) -> Dict[str, Any]:
+    """
+    Sync several accounts and their friends without any user interaction.
+
+    Args:
+        usernames: Accounts to sync
+        db_path: SQLite database path (package default if None)
+        max_workers: Concurrent fetches
+        rate: Combined requests per second (None disables the shared limiter)
+        max_movies: Optional cap on movies fetched per watchlist
+        engine: Engine to use (built from the other arguments if None)
+        backend: BACKEND_THREADS or BACKEND_ASYNC (only used when building the engine)
+
+    Returns:
+        JSON-serializable job summary
+    """
+    accounts = list(dict.fromkeys(usernames))
+    async_backend = None
+    if engine is None:
+        if backend == BACKEND_ASYNC:
+            from letterboxd_friend_check.utils.async_web import AsyncBackend
+
+            async_backend = AsyncBackend()
+            engine = SyncEngine(
+                db_path=db_path,
+                fetch_watched=web.get_watched_films,
+                **async_backend.engine_fetchers(),
+            )
+        else:
+            engine = SyncEngine(db_path=db_path, fetch_watched=web.get_watched_films)
+    tally = RequestTally()
+    lock = threading.Lock()
+    started = time.perf_counter()
+    started_at = datetime.now().isoformat(timespec="seconds")
+
+    users: Dict[str, Dict[str, Any]] = {}
+    friends_of: Dict[str, List[str]] = {}
+    errors: Dict[str, str] = {}
+    registry = SingleFlight()
+    fresh_from_db: List[str] = []
+
+    def timed(username, kind, func):
+        start = time.perf_counter()
+        try:
+            return func()
+        except Exception as e:
+            logger.error(f"Batch {kind} for {username} failed: {e}")
+            with lock:
+                errors[f"{kind}:{username}"] = str(e)
+            return None
+        finally:
+            with lock:
+                entry = users.setdefault(username, {"seconds": 0.0})
+                entry["seconds"] = round(entry["seconds"] + time.perf_counter() - start, 3)
+
+    recorder = SyncInstrumentation().start()
+    web.add_request_listener(tally)
+    if rate:
+        web.set_rate_limiter(RateLimiter(rate))
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # 1. Follow lists of every account
+            for account, friends in zip(
+                accounts,
+                executor.map(
+                    lambda a: timed(a, "friends", lambda: engine.sync_friends(a)), accounts
+                ),
+            ):
+                friends_of[account] = friends or []
+
+            # 2. Every (account, friend) watchlist lookup goes through one
+            # single-flight registry, so each distinct user is fetched once
+            lookups = accounts + [f for a in accounts for f in friends_of[a]]
+
+            def load(username):
+                fresh = engine.fresh_watchlist(username)
+                if fresh is not None:
+                    with lock:
+                        fresh_from_db.append(username)
+                    return fresh
+                return engine.sync_user(
+                    username, limit=max_movies, page_callback=lambda *args: None
+                )
+
+            def lookup(username):
+                return registry.do(
+                    username, lambda: timed(username, "watchlist", lambda: load(username))
+                )
+
+            watchlists = dict(zip(lookups, executor.map(lookup, lookups)))
+
+            # 3. Films each account has watched, left out of its comparison
+            watched = dict(
+                zip(
+                    accounts,
+                    executor.map(
+                        lambda a: timed(a, "watched", lambda: engine.sync_watched(a)), accounts
+                    ),
+                )
+            )
+    finally:
+        recorder.stop()
+        web.remove_request_listener(tally)
+        web.set_rate_limiter(None)
+        if async_backend is not None:
+            async_backend.close()
+
+    # 4. Compare per account
+    compare_start = time.perf_counter()
+    account_summaries = {}
+    for account in accounts:
+        own = watchlists.get(account) or set()
+        friend_lists = {
+            friend: watchlists[friend]
+            for friend in friends_of[account]
+            if watchlists.get(friend) is not None
+        }
+        common = compare_watchlists(own, friend_lists, watched.get(account))
+        account_summaries[account] = {
+            "watchlist_size": len(own),
+            "watched": len(watched.get(account) or ()),
+            "friends": len(friends_of[account]),
+            "friends_synced": len(friend_lists),
+            "friends_with_common_movies": len(common),
+            "common_movies": sum(len(movies) for movies in common.values()),
+        }
+
+    recorder.add_time("compare", time.perf_counter() - compare_start)
+    timings = recorder.report()
+
+    for username, entry in users.items():
+        entry["requests"] = tally.by_user.get(username, 0)
+        watchlist = watchlists.get(username)
+        entry["movies"] = len(watchlist) if watchlist is not None else None
+
+    # Cache: the registry runs each distinct user once; every other lookup is a
+    # hit, and users synced recently are read from the database, not scraped
+    registry_stats = registry.stats()
+    hits = registry_stats["joined"] + registry_stats["reused"]
+    return {
+        "started_at": started_at,
+        "duration_seconds": round(time.perf_counter() - started, 3),
+        "accounts": account_summaries,
+        "users": users,
+        "requests": {
+            "total": tally.total,
+            "seconds": round(tally.seconds, 3),
+            "by_status": tally.by_status,
+            "bytes": timings["requests"]["bytes"],
+        },
+        # Seconds and call counts per sync stage (see utils.instrumentation)
+        "stages": timings["stages"],
+        "watchlist_cache": {
+            "lookups": len(lookups),
+            "scraped": registry_stats["executed"] - len(fresh_from_db),
+            "fresh_from_db": len(fresh_from_db),
+            "hits": hits,
+            "hit_rate": round(hits / len(lookups), 3) if lookups else 0.0,
+        },
+        "errors": errors,
+    }
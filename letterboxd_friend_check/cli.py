@@ -2,14 +2,112 @@
 """
 Command-line interface for the Letterboxd Friend Check application
 """
+import argparse
+import json
 import sys
 import os
 import traceback
 from datetime import datetime
 
 
-def main():
+def build_parser():
+    """Build the command-line parser (no subcommand launches the GUI)"""
+    parser = argparse.ArgumentParser(
+        prog="letterboxd-friend-check",
+        description="Compare Letterboxd watchlists with your friends.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser(
+        "batch", help="Sync several accounts headlessly and print a JSON summary"
+    )
+    batch.add_argument("usernames", nargs="*", help="Letterboxd usernames to sync")
+    batch.add_argument("-f", "--file", help="File with one username per line")
+    batch.add_argument("--db", help="SQLite database path (default: package database)")
+    batch.add_argument("-w", "--workers", type=int, default=4, help="Concurrent fetches")
+    batch.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help="Combined requests per second across workers (0 disables the limiter)",
+    )
+    batch.add_argument("--max-movies", type=int, help="Cap on movies fetched per watchlist")
+    batch.add_argument(
+        "--backend",
+        choices=("threads", "async"),
+        default="threads",
+        help="Scraping backend; 'async' fetches pages concurrently (requires aiohttp)",
+    )
+    batch.add_argument("-o", "--output", help="Write the JSON summary here instead of stdout")
+
+    export = subparsers.add_parser(
+        "import-export", help="Import a Letterboxd data export ZIP (watchlist, watched, ratings)"
+    )
+    export.add_argument("archive", help="The export ZIP from Letterboxd's Settings > Data")
+    export.add_argument("-u", "--username", help="Account name (default: from profile.csv)")
+    export.add_argument("--db", help="SQLite database path (default: package database)")
+    return parser
+
+
+def batch_main(args):
+    """Run a headless batch sync and emit its summary; returns the exit code"""
+    from letterboxd_friend_check.batch import read_usernames, run_batch
+
+    try:
+        usernames = read_usernames(args.usernames, args.file)
+    except OSError as e:
+        print(f"ERROR: Could not read usernames: {e}", file=sys.stderr)
+        return 2
+    if not usernames:
+        print("ERROR: No usernames given.", file=sys.stderr)
+        return 2
+    if args.backend == "async":
+        from letterboxd_friend_check.utils.async_web import is_available
+
+        if not is_available():
+            print("ERROR: The async backend requires aiohttp.", file=sys.stderr)
+            return 2
+
+    summary = run_batch(
+        usernames,
+        db_path=args.db,
+        max_workers=args.workers,
+        rate=args.rate or None,
+        max_movies=args.max_movies,
+        backend=args.backend,
+    )
+    text = json.dumps(summary, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if summary["errors"] else 0
+
+
+def import_export_main(args):
+    """Import a Letterboxd data export and print what was stored; returns the exit code"""
+    from dataclasses import asdict
+
+    from letterboxd_friend_check.data.export_import import ExportError, import_letterboxd_export
+
+    try:
+        result = import_letterboxd_export(args.archive, args.username, args.db)
+    except ExportError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(asdict(result), indent=2, sort_keys=True))
+    return 0
+
+
+def main(argv=None):
     """Main entry point for the Letterboxd Friend Check application"""
+    args = build_parser().parse_args(argv)
+    if args.command == "batch":
+        return batch_main(args)
+    if args.command == "import-export":
+        return import_export_main(args)
+
     print("Letterboxd Friend Check")
     print("---------------------")
     print(f"Launch date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -34,4 +132,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
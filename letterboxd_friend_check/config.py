@@ -1,67 +1,213 @@
 """
 Configuration manager for the Letterboxd Friend Check application
+
+Each config file is read once into a shared ConfigStore; every Config (and
+the GUI) for the same path reads and writes that in-memory copy. Changes are
+written back after a short debounce, atomically (temp file + rename), so a
+burst of updates costs one write and readers never see a half-written file.
+Changes still pending when the interpreter exits are written by an atexit
+hook, since the debounce timer is a daemon thread.
 """
 
+import atexit
 import os
 import json
 import logging
+import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Dict, Mapping, Union
 
 logger = logging.getLogger(__name__)
 
+# Default config file inside the package data directory
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "data" / "config.json"
+# Seconds to wait for further changes before writing the file
+SAVE_DEBOUNCE_SECONDS = 1.0
+
+
+class ConfigStore:
+    """In-memory view of one JSON config file with debounced atomic writes"""
+
+    def __init__(
+        self, path: Union[str, Path], debounce_seconds: float = SAVE_DEBOUNCE_SECONDS
+    ) -> None:
+        """
+        Args:
+            path: JSON file backing the store (need not exist yet)
+            debounce_seconds: Delay before pending changes are written (0 writes
+                immediately)
+        """
+        self.path = Path(path)
+        self.debounce_seconds = debounce_seconds
+        self.data: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self.writes = 0
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the file, discarding unsaved changes"""
+        with self._lock:
+            self._cancel_timer()
+            self._dirty = False
+            self.data.clear()
+            if not self.path.exists():
+                logger.info(f"Configuration file not found: {self.path}")
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.data.update(json.load(f))
+                logger.info(f"Configuration loaded from {self.path}")
+            except Exception as e:
+                logger.error(f"Error loading configuration: {e}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value with a default"""
+        with self._lock:
+            return self.data.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self.data
+
+    def set(self, key: str, value: Any) -> None:
+        """Set one value (written after the debounce if it changed)"""
+        self.update({key: value})
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """Set several values; nothing is written if none of them changed"""
+        with self._lock:
+            changed = {k: v for k, v in values.items() if k not in self.data or self.data[k] != v}
+            if changed:
+                self.data.update(changed)
+                self._schedule()
+
+    def setdefaults(self, defaults: Mapping[str, Any]) -> None:
+        """Fill in missing keys without marking the store dirty"""
+        with self._lock:
+            for key, value in defaults.items():
+                self.data.setdefault(key, value)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove a key and return its value"""
+        with self._lock:
+            if key not in self.data:
+                return default
+            value = self.data.pop(key)
+            self._schedule()
+            return value
+
+    def save(self) -> None:
+        """Write the current values now, whether or not they changed"""
+        with self._lock:
+            self._dirty = True
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes now (no-op if there are none)"""
+        with self._lock:
+            self._cancel_timer()
+            if not self._dirty:
+                return
+            try:
+                self._write()
+                self._dirty = False
+            except Exception as e:
+                logger.error(f"Error saving configuration: {e}")
+
+    def _schedule(self) -> None:
+        self._dirty = True
+        if self.debounce_seconds <= 0:
+            self.flush()
+            return
+        self._cancel_timer()
+        self._timer = threading.Timer(self.debounce_seconds, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write(self) -> None:
+        # Write a sibling temp file and rename it over the config in one step
+        directory = self.path.parent
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.writes += 1
+        logger.info(f"Configuration saved to {self.path}")
+
+
+_stores: Dict[str, ConfigStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_config_store(path: Optional[Union[str, Path]] = None) -> ConfigStore:
+    """Return the shared ConfigStore for a file (the package config if None)"""
+    key = os.path.abspath(path or DEFAULT_CONFIG_PATH)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = ConfigStore(key)
+        return store
+
+
+def flush_config_stores() -> None:
+    """Write pending changes of every store (registered to run at exit)"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush()
+
+
+atexit.register(flush_config_stores)
+
 
 class Config:
     """Configuration manager for the Letterboxd Friend Check application"""
 
+    # Default configuration values
+    DEFAULTS: Dict[str, Any] = {
+        "username": "",
+        "remember_user": False,
+        "last_sync": None,
+        "tmdb_api_key": "",
+        "cookie_path": "",
+        "database_path": "",
+    }
+
     def __init__(self, config_path: Optional[Union[str, Path]] = None) -> None:
-        """Initialize the configuration manager"""
-        # Default configuration values
-        self._config: Dict[str, Any] = {
-            "username": "",
-            "remember_user": False,
-            "last_sync": None,
-            "tmdb_api_key": "",
-            "cookie_path": "",
-            "database_path": "",
-        }
-
-        # Determine config file path
-        if config_path:
-            self.config_path = Path(config_path)
-        else:
-            # Use the data directory within the package
-            package_dir = Path(__file__).parent
-            self.config_path = package_dir / "data" / "config.json"
-
-        # Load config if it exists
-        self.load()
+        """Initialize the configuration manager (the file is only read once per path)"""
+        self.config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+        self._store = get_config_store(self.config_path)
+        self._store.setdefaults(self.DEFAULTS)
+        # Shared with every other Config for the same file
+        self._config: Dict[str, Any] = self._store.data
 
     def load(self) -> None:
-        """Load configuration from file"""
-        if not self.config_path.exists():
-            logger.info(f"Configuration file not found: {self.config_path}")
-            return
-
-        try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                loaded_config: Dict[str, Any] = json.load(f)
-                self._config.update(loaded_config)
-            logger.info(f"Configuration loaded from {self.config_path}")
-        except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+        """Re-read configuration from file"""
+        self._store.reload()
+        self._store.setdefaults(self.DEFAULTS)
 
     def save(self) -> None:
         """Save configuration to file"""
-        try:
-            # Ensure directory exists
-            os.makedirs(self.config_path.parent, exist_ok=True)
-
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=4)
-            logger.info(f"Configuration saved to {self.config_path}")
-        except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
+        self._store.save()
 
     def __getitem__(self, key: str) -> Any:
         """Get a configuration value"""
@@ -6,10 +6,39 @@ import sqlite3
 import logging
 import datetime
 from pathlib import Path
-from typing import List, Set, Dict, Optional, Any
+from typing import Iterable, List, Set, Dict, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Film columns beyond movie_id and title, in schema order. movies is the one
+# film table: watchlists reference it and movie details are stored on it.
+MOVIE_TABLE_COLUMNS: Dict[str, str] = {
+    "normalized_title": "TEXT",
+    "year": "INTEGER",
+    "director": "TEXT",
+    "genres": "TEXT",
+    "rating": "TEXT",
+    "synopsis": "TEXT",
+    "overview": "TEXT",
+    "tmdb_id": "INTEGER",
+    "tmdb_rating": "REAL",
+    "imdb_id": "TEXT",
+    "release_date": "TEXT",
+    "runtime": "INTEGER",
+    "poster_path": "TEXT",
+    "backdrop_path": "TEXT",
+    "budget": "INTEGER",
+    "revenue": "INTEGER",
+    "popularity": "REAL",
+    "vote_count": "INTEGER",
+    "status": "TEXT",
+    "tagline": "TEXT",
+    "homepage": "TEXT",
+    "original_title": "TEXT",
+    "letterboxd_url": "TEXT",
+    "last_updated": "TIMESTAMP",
+}
+
 
 def get_db_path() -> str:
     """Get the path to the SQLite database file"""
@@ -44,42 +73,59 @@ def init_db(db_path: Optional[str] = None) -> None:
         """
         CREATE TABLE IF NOT EXISTS users (
             username TEXT PRIMARY KEY,
-            last_sync TIMESTAMP
+            last_sync TIMESTAMP,
+            last_sync_complete INTEGER
         )
     """
     )
+    # Whether last_sync stored the whole watchlist (not a limited fetch)
+    if "last_sync_complete" not in {row[1] for row in c.execute("PRAGMA table_info(users)")}:
+        c.execute("ALTER TABLE users ADD COLUMN last_sync_complete INTEGER")
 
+    columns = ",\n            ".join(f"{name} {kind}" for name, kind in MOVIE_TABLE_COLUMNS.items())
     c.execute(
-        """
+        f"""
         CREATE TABLE IF NOT EXISTS movies (
             movie_id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT UNIQUE,
-            director TEXT,
-            genres TEXT,
-            rating TEXT,
-            synopsis TEXT,
-            tmdb_id INTEGER,
-            tmdb_rating REAL,
-            release_date TEXT,
-            runtime INTEGER,
-            poster_path TEXT,
-            backdrop_path TEXT,
-            overview TEXT,
-            last_updated TIMESTAMP
+            {columns}
         )
     """
     )
+    # Databases from older versions have fewer film columns
+    existing = {row[1] for row in c.execute("PRAGMA table_info(movies)")}
+    for name, kind in MOVIE_TABLE_COLUMNS.items():
+        if name not in existing:
+            c.execute(f"ALTER TABLE movies ADD COLUMN {name} {kind}")
+    c.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_movies_normalized_title
+        ON movies(normalized_title, year)
+    """
+    )
+    c.execute("CREATE INDEX IF NOT EXISTS idx_movies_tmdb_id ON movies(tmdb_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_movies_last_updated ON movies(last_updated)")
 
     c.execute(
         """
         CREATE TABLE IF NOT EXISTS watchlists (
             username TEXT,
             movie_id INTEGER,
+            first_seen TIMESTAMP,
             FOREIGN KEY(username) REFERENCES users(username),
             FOREIGN KEY(movie_id) REFERENCES movies(movie_id)
         )
     """
     )
+    if "first_seen" not in {row[1] for row in c.execute("PRAGMA table_info(watchlists)")}:
+        c.execute("ALTER TABLE watchlists ADD COLUMN first_seen TIMESTAMP")
+    # Serves per-user watchlist reads and the friend/common-movie filters
+    c.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_watchlists_username
+        ON watchlists(username, movie_id)
+    """
+    )
 
     c.execute(
         """
@@ -91,79 +137,322 @@ def init_db(db_path: Optional[str] = None) -> None:
     """
     )
 
+    # One row per follow: drop duplicates left by older versions, then enforce it
+    c.execute(
+        """
+        DELETE FROM friends WHERE rowid NOT IN (
+            SELECT MIN(rowid) FROM friends GROUP BY username, friend_username
+        )
+    """
+    )
+    c.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_friends_username_friend
+        ON friends(username, friend_username)
+    """
+    )
+
+    # When each follow list was last fetched (friends lists are served from
+    # the database while fresh)
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS friends_sync (
+            username TEXT PRIMARY KEY,
+            last_sync TIMESTAMP
+        )
+    """
+    )
+
+    # Friends checklist state (which friends are ticked for syncing)
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS friend_selections (
+            username TEXT,
+            friend_username TEXT,
+            selected INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY(username, friend_username)
+        )
+    """
+    )
+
+    # Sync journal: progress of watchlist fetches that have not finished yet,
+    # so an interrupted fetch resumes from its last page instead of restarting
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_journal (
+            username TEXT PRIMARY KEY,
+            run_id TEXT NOT NULL,
+            pages_done INTEGER NOT NULL DEFAULT 0,
+            films_done INTEGER NOT NULL DEFAULT 0,
+            started_at TIMESTAMP,
+            updated_at TIMESTAMP
+        )
+    """
+    )
+
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sync_journal_films (
+            username TEXT NOT NULL,
+            title TEXT NOT NULL,
+            page INTEGER NOT NULL,
+            PRIMARY KEY(username, title)
+        )
+    """
+    )
+
+    # Watchlist change history: one event per film added to or removed from a
+    # watchlist, stamped with the sync that saw the change (users.last_sync).
+    # Removals also keep when the film was first and last seen on the list.
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS watchlist_events (
+            event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            movie_id INTEGER NOT NULL,
+            action TEXT NOT NULL CHECK(action IN ('added', 'removed')),
+            at TIMESTAMP NOT NULL,
+            first_seen TIMESTAMP,
+            last_seen TIMESTAMP
+        )
+    """
+    )
+    c.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_watchlist_events_username
+        ON watchlist_events(username, at)
+    """
+    )
+
+    # Films a user has watched, with the date logged and their rating (0.5-5),
+    # as imported from a Letterboxd data export
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS watched (
+            username TEXT NOT NULL,
+            movie_id INTEGER NOT NULL,
+            watched_date TEXT,
+            rating REAL,
+            PRIMARY KEY(username, movie_id)
+        ) WITHOUT ROWID
+    """
+    )
+
+    # When each user's watched films were last scraped, and last scraped in
+    # full (between full fetches only the newest films are fetched)
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS watched_sync (
+            username TEXT PRIMARY KEY,
+            last_sync TIMESTAMP,
+            last_full_sync TIMESTAMP
+        )
+    """
+    )
+
+    # When each user's data export was last imported (see data.export_import)
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS export_imports (
+            username TEXT PRIMARY KEY,
+            imported_at TIMESTAMP,
+            source TEXT
+        )
+    """
+    )
+
+    # When each maintenance task (see data.maintenance) last ran
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS maintenance_log (
+            task TEXT PRIMARY KEY,
+            last_run TIMESTAMP,
+            seconds REAL,
+            detail TEXT
+        )
+    """
+    )
+
     conn.commit()
     conn.close()
 
     logger.info(f"Database initialized at {db_path}")
 
 
-def sync_watchlist_to_db(username: str, movies: Set[str], db_path: Optional[str] = None) -> None:
+def sync_watchlist_to_db(
+    username: str, movies: Set[str], db_path: Optional[str] = None, complete: bool = True
+) -> Tuple[List[str], List[str]]:
     """
     Syncs the user's watchlist to the database
 
+    Only the difference with the stored watchlist is written, and each film
+    added or removed is logged in watchlist_events. The first sync of a user
+    logs nothing: it is the baseline the later changes are measured from.
+
     Args:
         username: Letterboxd username
         movies: Set of movie titles in the watchlist
         db_path: Path to SQLite database file (if None, will use default)
+        complete: False if movies is only part of the watchlist (a limited
+            fetch): new films are added, but films missing from it are kept,
+            with their first_seen, since they were not actually removed
+
+    Returns:
+        (added, removed): sorted titles added to and removed from the watchlist
     """
     if db_path is None:
         db_path = get_db_path()
 
+    now = datetime.datetime.now().isoformat(sep=" ")
     conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-
-    # Upsert user
-    c.execute(
-        "INSERT OR REPLACE INTO users (username, last_sync) VALUES (?, ?)",
-        (username, datetime.datetime.now()),
-    )
+    with conn:
+        row = conn.execute("SELECT last_sync FROM users WHERE username=?", (username,)).fetchone()
+        previous_sync = row[0] if row else None
+        conn.execute(
+            """
+            INSERT INTO users (username, last_sync, last_sync_complete) VALUES (?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                last_sync = excluded.last_sync,
+                last_sync_complete = excluded.last_sync_complete
+        """,
+            (username, now, int(complete)),
+        )
 
-    # Insert movies and get their IDs
-    movie_ids = []
-    for title in movies:
-        c.execute("INSERT OR IGNORE INTO movies (title) VALUES (?)", (title,))
-        c.execute("SELECT movie_id FROM movies WHERE title=?", (title,))
-        movie_id = c.fetchone()[0]
-        movie_ids.append(movie_id)
-
-    # Remove old watchlist and insert new
-    c.execute("DELETE FROM watchlists WHERE username=?", (username,))
-    c.executemany(
-        "INSERT INTO watchlists (username, movie_id) VALUES (?, ?)",
-        [(username, mid) for mid in movie_ids],
-    )
+        stored = {
+            title: (movie_id, first_seen)
+            for title, movie_id, first_seen in conn.execute(
+                """
+                SELECT m.title, w.movie_id, w.first_seen FROM watchlists w
+                JOIN movies m ON m.movie_id = w.movie_id
+                WHERE w.username=?
+            """,
+                (username,),
+            )
+        }
+        current = set(movies)
+        added = sorted(current - set(stored))
+        removed = sorted(set(stored) - current) if complete else []
+
+        conn.executemany(
+            "DELETE FROM watchlists WHERE username=? AND movie_id=?",
+            [(username, stored[title][0]) for title in removed],
+        )
+        conn.executemany("INSERT OR IGNORE INTO movies (title) VALUES (?)", [(t,) for t in added])
+        conn.executemany(
+            """
+            INSERT INTO watchlists (username, movie_id, first_seen)
+            SELECT ?, movie_id, ? FROM movies WHERE title=?
+        """,
+            [(username, now, title) for title in added],
+        )
 
-    conn.commit()
+        if row is not None:
+            conn.executemany(
+                """
+                INSERT INTO watchlist_events (username, movie_id, action, at, first_seen)
+                SELECT ?, movie_id, 'added', ?, ? FROM movies WHERE title=?
+            """,
+                [(username, now, now, title) for title in added],
+            )
+            conn.executemany(
+                """
+                INSERT INTO watchlist_events
+                    (username, movie_id, action, at, first_seen, last_seen)
+                VALUES (?, ?, 'removed', ?, ?, ?)
+            """,
+                [
+                    (username, stored[title][0], now, stored[title][1], previous_sync)
+                    for title in removed
+                ],
+            )
     conn.close()
 
-    logger.info(f"Synced watchlist for {username} with {len(movies)} movies")
+    logger.info(
+        f"Synced watchlist for {username} with {len(current)} movies "
+        f"(+{len(added)} added, -{len(removed)} removed)"
+    )
+    return added, removed
 
 
-def sync_friends_to_db(username: str, friends: List[str], db_path: Optional[str] = None) -> None:
+def sync_friends_to_db(
+    username: str, friends: List[str], db_path: Optional[str] = None
+) -> Tuple[List[str], List[str]]:
     """
     Syncs the user's friends to the database
 
+    Only the difference with the stored list is written: new follows are
+    inserted and unfollows deleted, and the follow list's sync time is
+    updated.
+
     Args:
         username: Letterboxd username
         friends: List of friend usernames
         db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        (followed, unfollowed): sorted usernames added and removed
     """
     if db_path is None:
         db_path = get_db_path()
 
     conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+    with conn:
+        stored = {
+            friend
+            for (friend,) in conn.execute(
+                "SELECT friend_username FROM friends WHERE username=?", (username,)
+            )
+        }
+        current = set(friends)
+        followed = sorted(current - stored)
+        unfollowed = sorted(stored - current)
+        conn.executemany(
+            "DELETE FROM friends WHERE username=? AND friend_username=?",
+            [(username, f) for f in unfollowed],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO friends (username, friend_username) VALUES (?, ?)",
+            [(username, f) for f in followed],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO friends_sync (username, last_sync) VALUES (?, ?)",
+            (username, datetime.datetime.now().isoformat(sep=" ")),
+        )
+    conn.close()
 
-    c.execute("DELETE FROM friends WHERE username=?", (username,))
-    c.executemany(
-        "INSERT INTO friends (username, friend_username) VALUES (?, ?)",
-        [(username, f) for f in friends],
+    logger.info(
+        f"Synced {len(current)} friends for {username} "
+        f"(+{len(followed)} followed, -{len(unfollowed)} unfollowed)"
     )
+    return followed, unfollowed
 
-    conn.commit()
+
+def get_friends_last_sync(
+    username: str, db_path: Optional[str] = None
+) -> Optional[datetime.datetime]:
+    """
+    Returns when the user's follow list was last fetched
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        Last friends sync datetime, or None if the list was never synced
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT last_sync FROM friends_sync WHERE username=?", (username,)
+    ).fetchone()
     conn.close()
 
-    logger.info(f"Synced {len(friends)} friends for {username}")
+    if not row or not row[0]:
+        return None
+    return datetime.datetime.fromisoformat(row[0])
 
 
 def get_watchlist_from_db(username: str, db_path: Optional[str] = None) -> Set[str]:
@@ -199,6 +488,374 @@ def get_watchlist_from_db(username: str, db_path: Optional[str] = None) -> Set[s
     return movies
 
 
+def sync_watched_to_db(
+    username: str,
+    films: Dict[str, Tuple[Optional[str], Optional[float]]],
+    db_path: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    Replaces the user's watched films in the database
+
+    Films already stored keep their rows (date and rating are updated);
+    films no longer in `films` are deleted.
+
+    Args:
+        username: Letterboxd username
+        films: Movie title -> (date watched, rating), either may be None
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        (stored, deleted): number of watched films stored and removed
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        stored = dict(
+            conn.execute(
+                """
+                SELECT m.title, w.movie_id FROM watched w
+                JOIN movies m ON m.movie_id = w.movie_id
+                WHERE w.username=?
+            """,
+                (username,),
+            )
+        )
+        removed = [stored[title] for title in set(stored) - set(films)]
+        conn.executemany(
+            "DELETE FROM watched WHERE username=? AND movie_id=?",
+            [(username, movie_id) for movie_id in removed],
+        )
+        conn.executemany("INSERT OR IGNORE INTO movies (title) VALUES (?)", [(t,) for t in films])
+        conn.executemany(
+            """
+            INSERT INTO watched (username, movie_id, watched_date, rating)
+            SELECT ?, movie_id, ?, ? FROM movies WHERE title=?
+            ON CONFLICT(username, movie_id) DO UPDATE SET
+                watched_date = excluded.watched_date, rating = excluded.rating
+        """,
+            [(username, date, rating, title) for title, (date, rating) in films.items()],
+        )
+    conn.close()
+
+    logger.info(f"Stored {len(films)} watched films for {username} (-{len(removed)} removed)")
+    return len(films), len(removed)
+
+
+def get_watched_from_db(username: str, db_path: Optional[str] = None) -> Set[str]:
+    """
+    Retrieves the titles of the films the user has watched
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        Set of movie titles
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        """
+        SELECT m.title FROM watched w
+        JOIN movies m ON m.movie_id = w.movie_id
+        WHERE w.username=?
+    """,
+        (username,),
+    ).fetchall()
+    conn.close()
+    return {row[0] for row in rows}
+
+
+def update_watched_in_db(
+    username: str, titles: Set[str], db_path: Optional[str] = None, complete: bool = True
+) -> Tuple[int, int]:
+    """
+    Stores scraped watched films, writing only the difference
+
+    Films already stored keep their date and rating. With complete=True
+    `titles` is the whole watched list and stored films missing from it are
+    deleted; otherwise `titles` are only the newest films and are added.
+    Either way the scrape is recorded in watched_sync.
+
+    Args:
+        username: Letterboxd username
+        titles: Watched film titles
+        db_path: Path to SQLite database file (if None, will use default)
+        complete: Whether `titles` is the user's complete watched list
+
+    Returns:
+        (added, removed): number of watched films added and removed
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    now = datetime.datetime.now().isoformat(sep=" ")
+    conn = sqlite3.connect(db_path)
+    with conn:
+        stored = dict(
+            conn.execute(
+                """
+                SELECT m.title, w.movie_id FROM watched w
+                JOIN movies m ON m.movie_id = w.movie_id
+                WHERE w.username=?
+            """,
+                (username,),
+            )
+        )
+        added = set(titles) - set(stored)
+        removed = [stored[title] for title in set(stored) - set(titles)] if complete else []
+        conn.executemany(
+            "DELETE FROM watched WHERE username=? AND movie_id=?",
+            [(username, movie_id) for movie_id in removed],
+        )
+        conn.executemany("INSERT OR IGNORE INTO movies (title) VALUES (?)", [(t,) for t in added])
+        conn.executemany(
+            "INSERT OR IGNORE INTO watched (username, movie_id) "
+            "SELECT ?, movie_id FROM movies WHERE title=?",
+            [(username, title) for title in added],
+        )
+        conn.execute(
+            """
+            INSERT INTO watched_sync (username, last_sync, last_full_sync) VALUES (?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                last_sync = excluded.last_sync,
+                last_full_sync = COALESCE(excluded.last_full_sync, last_full_sync)
+        """,
+            (username, now, now if complete else None),
+        )
+    conn.close()
+
+    logger.info(
+        f"Updated watched films for {username} (+{len(added)} added, -{len(removed)} removed)"
+    )
+    return len(added), len(removed)
+
+
+def get_watched_last_sync(
+    username: str, db_path: Optional[str] = None
+) -> Tuple[Optional[datetime.datetime], Optional[datetime.datetime]]:
+    """
+    When the user's watched films were last scraped
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        (last scrape, last complete scrape), each None if there was none
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT last_sync, last_full_sync FROM watched_sync WHERE username=?", (username,)
+    ).fetchone()
+    conn.close()
+    if not row:
+        return None, None
+    return tuple(datetime.datetime.fromisoformat(value) if value else None for value in row)
+
+
+def get_watchlist_last_sync(
+    username: str, db_path: Optional[str] = None
+) -> Tuple[Optional[datetime.datetime], bool]:
+    """
+    When the user's watchlist was last synced, and whether that sync stored
+    the whole watchlist
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        (last sync or None, complete); syncs from before the flag was
+        recorded count as incomplete
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT last_sync, last_sync_complete FROM users WHERE username=?", (username,)
+    ).fetchone()
+    conn.close()
+    if not row or not row[0]:
+        return None, False
+    return datetime.datetime.fromisoformat(row[0]), bool(row[1])
+
+
+def record_export_import(username: str, source: str, db_path: Optional[str] = None) -> None:
+    """
+    Records that the user's data export was just imported
+
+    Args:
+        username: Letterboxd username
+        source: File the export was read from
+        db_path: Path to SQLite database file (if None, will use default)
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO export_imports (username, imported_at, source) "
+            "VALUES (?, ?, ?)",
+            (username, datetime.datetime.now().isoformat(sep=" "), source),
+        )
+    conn.close()
+
+
+def get_last_export_import(
+    username: str, db_path: Optional[str] = None
+) -> Optional[datetime.datetime]:
+    """
+    When the user's data export was last imported
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        Import datetime, or None if no export was imported
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT imported_at FROM export_imports WHERE username=?", (username,)
+    ).fetchone()
+    conn.close()
+    return datetime.datetime.fromisoformat(row[0]) if row else None
+
+
+def get_watchlist_events(
+    username: str, since: Optional[datetime.datetime] = None, db_path: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieves the logged changes to a user's watchlist, oldest first
+
+    Args:
+        username: Letterboxd username
+        since: Only changes seen at or after this time (all if None)
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        List of dicts with title, action ("added" or "removed"), at, and for
+        removals first_seen and last_seen (datetimes, or None if unknown)
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        """
+        SELECT m.title, e.action, e.at, e.first_seen, e.last_seen
+        FROM watchlist_events e
+        JOIN movies m ON m.movie_id = e.movie_id
+        WHERE e.username = ? AND e.at >= ?
+        ORDER BY e.event_id
+    """,
+        (username, since.isoformat(sep=" ") if since else ""),
+    ).fetchall()
+    conn.close()
+
+    def parse(value):
+        return datetime.datetime.fromisoformat(value) if value else None
+
+    return [
+        {
+            "title": title,
+            "action": action,
+            "at": parse(at),
+            "first_seen": parse(first_seen),
+            "last_seen": parse(last_seen),
+        }
+        for title, action, at, first_seen, last_seen in rows
+    ]
+
+
+def get_new_overlaps(
+    username: str,
+    friends: Iterable[str],
+    since: Optional[datetime.datetime] = None,
+    db_path: Optional[str] = None,
+) -> Dict[str, Set[str]]:
+    """
+    Finds the movies that became common with each friend recently
+
+    Read from the watchlist event log: a movie is a new overlap when the user
+    or the friend added it and both watchlists still hold it, so the full
+    watchlists are never compared. Movies the user has watched are left out
+    (an anti-join on the watched table's primary key).
+
+    Args:
+        username: The user whose watchlist is compared
+        friends: Friends to check
+        since: Count additions seen at or after this time; if None, those
+            found by the latest sync of the watchlist they were added to
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        Dict mapping each friend with new overlaps to the set of movie titles
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    since_value = since.isoformat(sep=" ") if since else None
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS overlap_friends (username TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM overlap_friends")
+        conn.executemany(
+            "INSERT OR IGNORE INTO overlap_friends VALUES (?)", [(f,) for f in friends]
+        )
+        rows = conn.execute(
+            """
+            -- Added by a friend, already on the user's watchlist
+            SELECT e.username, m.title
+            FROM watchlist_events e
+            JOIN overlap_friends o ON o.username = e.username
+            JOIN users s ON s.username = e.username
+            JOIN watchlists f ON f.username = e.username AND f.movie_id = e.movie_id
+            JOIN watchlists u ON u.username = :user AND u.movie_id = e.movie_id
+            JOIN movies m ON m.movie_id = e.movie_id
+            WHERE e.action = 'added' AND e.at >= COALESCE(:since, s.last_sync)
+              AND NOT EXISTS (
+                SELECT 1 FROM watched w WHERE w.username = :user AND w.movie_id = e.movie_id
+              )
+            UNION
+            -- Added by the user, already on a friend's watchlist
+            SELECT f.username, m.title
+            FROM watchlist_events e
+            JOIN users s ON s.username = e.username
+            JOIN watchlists u ON u.username = e.username AND u.movie_id = e.movie_id
+            JOIN overlap_friends o
+            JOIN watchlists f ON f.username = o.username AND f.movie_id = e.movie_id
+            JOIN movies m ON m.movie_id = e.movie_id
+            WHERE e.username = :user AND e.action = 'added'
+              AND e.at >= COALESCE(:since, s.last_sync)
+              AND NOT EXISTS (
+                SELECT 1 FROM watched w WHERE w.username = :user AND w.movie_id = e.movie_id
+              )
+        """,
+            {"user": username, "since": since_value},
+        ).fetchall()
+    finally:
+        conn.close()
+
+    overlaps: Dict[str, Set[str]] = {}
+    for friend, title in rows:
+        overlaps.setdefault(friend, set()).add(title)
+    return overlaps
+
+
 def get_friends_from_db(username: str, db_path: Optional[str] = None) -> List[str]:
     """
     Retrieves the user's friends from the database
@@ -269,24 +926,6 @@ def save_movie_data(title: str, data: Dict[str, Any], db_path: Optional[str] = N
     if db_path is None:
         db_path = get_db_path()
 
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-
-    # Get movie_id
-    c.execute("SELECT movie_id FROM movies WHERE title=?", (title,))
-    row = c.fetchone()
-
-    if not row:
-        # Insert new movie
-        c.execute("INSERT INTO movies (title) VALUES (?)", (title,))
-        movie_id = c.lastrowid
-    else:
-        movie_id = row[0]
-
-    # Update movie data
-    update_columns = []
-    update_values = []
-
     # Map data dictionary to database columns
     column_map = {
         "director": "director",
@@ -302,34 +941,28 @@ def save_movie_data(title: str, data: Dict[str, Any], db_path: Optional[str] = N
         "overview": "overview",
     }
 
+    values: Dict[str, Any] = {"title": title}
     for key, column in column_map.items():
         if key in data and data[key] is not None:
-            update_columns.append(f"{column} = ?")
-
             # Handle list values
             if isinstance(data[key], list):
-                update_values.append(", ".join(str(item) for item in data[key]))
+                values[column] = ", ".join(str(item) for item in data[key])
             else:
-                update_values.append(data[key])
-
-    # Add last_updated timestamp
-    update_columns.append("last_updated = ?")
-    update_values.append(datetime.datetime.now().isoformat())
-
-    # Add movie_id to values
-    update_values.append(movie_id)
-
-    # Execute update using explicit column updates to prevent SQL injection
-    if update_columns:
-        # Refactor to use a single parameterized UPDATE statement
-        # Prepare the SQL query using placeholders for column updates
-        # nosec B608: column count from controlled update_columns, values properly parameterized
-        query = (f"UPDATE movies SET {', '.join(update_columns)} "
-                 f"WHERE movie_id = ?")  # nosec B608
-
-        # Execute the query with parameterized values
-        c.execute(query, update_values)
+                values[column] = data[key]
+    values["last_updated"] = datetime.datetime.now().isoformat()
+
+    # One upsert: creates the film row if needed and only touches given columns
+    # nosec B608: column names come from column_map, values are parameterized
+    columns = list(values)
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+    query = (
+        f"INSERT INTO movies ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + column for column in columns)}) "
+        f"ON CONFLICT(title) DO UPDATE SET {updates}"
+    )  # nosec B608
 
+    conn = sqlite3.connect(db_path)
+    conn.execute(query, values)
     conn.commit()
     conn.close()
 
@@ -410,8 +1043,190 @@ def update_last_sync(username: str, timestamp: str, db_path: Optional[str] = Non
     logger.debug(f"Updated last_sync for {username} to {timestamp}")
 
 
+def save_friend_selection(
+    username: str, friends: List[str], selected: List[str], db_path: Optional[str] = None
+) -> None:
+    """
+    Stores which of the user's friends are ticked in the sync checklist
+
+    Args:
+        username: Letterboxd username
+        friends: Every friend in the checklist, in display order
+        selected: The ticked friends
+        db_path: Path to SQLite database file (if None, will use default)
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    ticked = set(selected)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("DELETE FROM friend_selections WHERE username=?", (username,))
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO friend_selections
+                (username, friend_username, selected, position)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(username, f, int(f in ticked), i) for i, f in enumerate(friends)],
+        )
+    conn.close()
+
+    logger.debug(f"Saved selection of {len(ticked)}/{len(friends)} friends for {username}")
+
+
+def get_friend_selection(username: str, db_path: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Retrieves the ticked friends saved by save_friend_selection
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        Ticked friends in checklist order, or None if no selection was saved
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        """
+        SELECT friend_username, selected FROM friend_selections
+        WHERE username=? ORDER BY position
+    """,
+        (username,),
+    ).fetchall()
+    conn.close()
+
+    if not rows:
+        return None
+    return [friend for friend, selected in rows if selected]
+
+
+def save_sync_checkpoint(
+    username: str, run_id: str, page: int, titles: List[str], db_path: Optional[str] = None
+) -> int:
+    """
+    Records that a page of a user's watchlist has been fetched
+
+    The page's films and the journal row are written in one transaction, so
+    the journal never points past the films it holds.
+
+    Args:
+        username: Letterboxd username
+        run_id: Identifier of the sync run doing the fetch
+        page: Number of the page just fetched (pages before it are done too)
+        titles: Films on that page
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        Number of films recorded for the user so far
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    now = datetime.datetime.now().isoformat(sep=" ")
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO sync_journal_films (username, title, page) VALUES (?, ?, ?)",
+            [(username, title, page) for title in titles],
+        )
+        films_done = conn.execute(
+            "SELECT COUNT(*) FROM sync_journal_films WHERE username=?", (username,)
+        ).fetchone()[0]
+        conn.execute(
+            """
+            INSERT INTO sync_journal
+                (username, run_id, pages_done, films_done, started_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                run_id=excluded.run_id,
+                pages_done=excluded.pages_done,
+                films_done=excluded.films_done,
+                updated_at=excluded.updated_at
+            """,
+            (username, run_id, page, films_done, now, now),
+        )
+    conn.close()
+
+    return films_done
+
+
+def get_sync_checkpoint(
+    username: str, db_path: Optional[str] = None, include_films: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Retrieves the unfinished watchlist fetch recorded for a user
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+        include_films: Also load the journaled titles (skip when only the
+            progress is needed)
+
+    Returns:
+        Dictionary with run_id, pages_done, films_done, started_at,
+        updated_at (datetimes) and films (set of titles, empty unless
+        include_films), or None if no fetch is in progress
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        """
+        SELECT run_id, pages_done, films_done, started_at, updated_at
+        FROM sync_journal WHERE username=?
+    """,
+        (username,),
+    ).fetchone()
+    films = set()
+    if row and include_films:
+        films = {
+            title
+            for (title,) in conn.execute(
+                "SELECT title FROM sync_journal_films WHERE username=?", (username,)
+            )
+        }
+    conn.close()
+
+    if not row:
+        return None
+    run_id, pages_done, films_done, started_at, updated_at = row
+    return {
+        "run_id": run_id,
+        "pages_done": pages_done,
+        "films_done": films_done,
+        "started_at": datetime.datetime.fromisoformat(started_at) if started_at else None,
+        "updated_at": datetime.datetime.fromisoformat(updated_at) if updated_at else None,
+        "films": films,
+    }
+
+
+def clear_sync_checkpoint(username: str, db_path: Optional[str] = None) -> None:
+    """
+    Removes a user's sync journal entry (after the fetch completed, or to restart it)
+
+    Args:
+        username: Letterboxd username
+        db_path: Path to SQLite database file (if None, will use default)
+    """
+    if db_path is None:
+        db_path = get_db_path()
+
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("DELETE FROM sync_journal WHERE username=?", (username,))
+        conn.execute("DELETE FROM sync_journal_films WHERE username=?", (username,))
+    conn.close()
+
+
 def compare_watchlists(
-    user_watchlist: Set[str], friends_watchlists: Dict[str, Set[str]]
+    user_watchlist: Set[str],
+    friends_watchlists: Dict[str, Set[str]],
+    watched: Optional[Set[str]] = None,
 ) -> Dict[str, Set[str]]:
     """
     Compares the user's watchlist with each friend's watchlist
@@ -419,10 +1234,14 @@ def compare_watchlists(
     Args:
         user_watchlist: Set of movie titles in the user's watchlist
         friends_watchlists: Dictionary mapping friend usernames to sets of movie titles
+        watched: Movie titles the user has already watched, left out of the result
 
     Returns:
         Dictionary mapping friend usernames to sets of common movie titles
     """
+    # Subtract the watched films once, not once per friend
+    if watched:
+        user_watchlist = user_watchlist - watched
     common = {}
     for friend, watchlist in friends_watchlists.items():
         common_movies = user_watchlist & watchlist
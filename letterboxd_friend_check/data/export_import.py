@@ -0,0 +1,176 @@
+"""
+Importer for the Letterboxd data export.
+
+Letterboxd's Settings > Data > Export produces a ZIP archive of CSV files.
+This module reads three of them straight out of the archive, row by row,
+without unpacking it:
+
+    watchlist.csv  Date, Name, Year, Letterboxd URI
+    watched.csv    Date, Name, Year, Letterboxd URI
+    ratings.csv    Date, Name, Year, Letterboxd URI, Rating
+
+and stores them with the bulk database writers: the watchlist through
+sync_watchlist_to_db (so changes land in the event log like a scraped
+sync), watched films and ratings in the watched table. The account name is
+taken from profile.csv unless given.
+
+Films are keyed by their name, as on scraped watchlist pages, so imported
+and scraped watchlists compare directly.
+"""
+
+import csv
+import io
+import logging
+import os
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from letterboxd_friend_check.data import database
+
+logger = logging.getLogger(__name__)
+
+WATCHLIST_FILE = "watchlist.csv"
+WATCHED_FILE = "watched.csv"
+RATINGS_FILE = "ratings.csv"
+PROFILE_FILE = "profile.csv"
+
+
+class ExportError(ValueError):
+    """The file is not a usable Letterboxd data export"""
+
+
+@dataclass
+class ExportImportResult:
+    """Outcome of an export import"""
+
+    username: str
+    watchlist: int = 0
+    watched: int = 0
+    ratings: int = 0
+    added: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+
+def _member(archive: zipfile.ZipFile, filename: str) -> Optional[str]:
+    """Archive path of an export file (at the top level or in one folder)"""
+    for name in archive.namelist():
+        if name == filename or (name.endswith(f"/{filename}") and name.count("/") == 1):
+            return name
+    return None
+
+
+def read_export_rows(archive: zipfile.ZipFile, filename: str) -> Iterator[Dict[str, str]]:
+    """Yield the rows of one CSV file in the archive (nothing if it is missing)"""
+    member = _member(archive, filename)
+    if member is None:
+        return
+    with archive.open(member) as raw:
+        # utf-8-sig drops the byte order mark some exports start with
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        yield from csv.DictReader(text)
+
+
+def export_username(archive: zipfile.ZipFile) -> Optional[str]:
+    """The account name recorded in profile.csv, if any"""
+    for row in read_export_rows(archive, PROFILE_FILE):
+        return (row.get("Username") or "").strip() or None
+    return None
+
+
+def _parse_rating(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def read_export(
+    path: str,
+) -> Tuple[Optional[str], Set[str], Dict[str, Tuple[Optional[str], Optional[float]]]]:
+    """
+    Read a Letterboxd data export.
+
+    Args:
+        path: The export ZIP file
+
+    Returns:
+        (username from profile.csv or None, watchlist titles,
+        {watched title: (date watched, rating)}); rated films count as watched
+
+    Raises:
+        ExportError: If the file is not a ZIP or has no watchlist/watched data
+    """
+    try:
+        archive = zipfile.ZipFile(path)
+    except (OSError, zipfile.BadZipFile) as e:
+        raise ExportError(f"Cannot open {path}: {e}") from e
+
+    with archive:
+        if not any(_member(archive, f) for f in (WATCHLIST_FILE, WATCHED_FILE, RATINGS_FILE)):
+            raise ExportError(f"{os.path.basename(path)} is not a Letterboxd data export")
+        username = export_username(archive)
+        watchlist = {
+            row["Name"].strip()
+            for row in read_export_rows(archive, WATCHLIST_FILE)
+            if row.get("Name")
+        }
+        watched: Dict[str, Tuple[Optional[str], Optional[float]]] = {}
+        for row in read_export_rows(archive, WATCHED_FILE):
+            if row.get("Name"):
+                watched[row["Name"].strip()] = (row.get("Date") or None, None)
+        for row in read_export_rows(archive, RATINGS_FILE):
+            if row.get("Name"):
+                title = row["Name"].strip()
+                date = watched.get(title, (row.get("Date") or None, None))[0]
+                watched[title] = (date, _parse_rating(row.get("Rating")))
+    return username, watchlist, watched
+
+
+def import_letterboxd_export(
+    path: str, username: Optional[str] = None, db_path: Optional[str] = None
+) -> ExportImportResult:
+    """
+    Import a Letterboxd data export into the database.
+
+    Args:
+        path: The export ZIP file
+        username: Account the export belongs to (default: from profile.csv)
+        db_path: Path to SQLite database file (if None, will use default)
+
+    Returns:
+        ExportImportResult with the row counts and watchlist changes
+
+    Raises:
+        ExportError: If the file is unusable or the account cannot be determined
+    """
+    started = time.perf_counter()
+    profile_username, watchlist, watched = read_export(path)
+    if not username:
+        username = profile_username
+    elif profile_username and profile_username.lower() != username.lower():
+        logger.warning(f"Export belongs to {profile_username}; importing it as {username}")
+    if not username:
+        raise ExportError("The export has no profile.csv; give the username to import it as")
+
+    database.init_db(db_path)
+    added, removed = database.sync_watchlist_to_db(username, watchlist, db_path)
+    database.sync_watched_to_db(username, watched, db_path)
+    database.record_export_import(username, os.path.abspath(path), db_path)
+
+    result = ExportImportResult(
+        username=username,
+        watchlist=len(watchlist),
+        watched=len(watched),
+        ratings=sum(1 for _, rating in watched.values() if rating is not None),
+        added=len(added),
+        removed=len(removed),
+        seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        f"Imported export for {username}: {result.watchlist} watchlist, "
+        f"{result.watched} watched, {result.ratings} rated in {result.seconds:.2f}s"
+    )
+    return result
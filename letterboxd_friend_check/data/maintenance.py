@@ -0,0 +1,240 @@
+"""
+Database maintenance: planner statistics, space reclaim and FTS merges.
+
+run_maintenance() runs every task whose interval has passed (or all of them
+with force=True) and records each run in the maintenance_log table:
+
+    optimize            PRAGMA optimize (a full ANALYZE the first time), so
+                        the query planner works from current statistics
+    vacuum              one full VACUUM to switch the file to incremental
+                        auto-vacuum; skipped once the file uses it
+    incremental_vacuum  returns free pages to the file system
+    fts_optimize        merges the segments of each FTS5 index
+
+VACUUM locks the whole database, so runs in one process are serialized and
+syncs wait for a running maintenance (see wait_for_maintenance) rather than
+fail with "database is locked".
+
+IdleMaintenance decides when the GUI may run it: only after the user has been
+idle for a while, and no more often than the shortest task interval.
+"""
+
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from letterboxd_friend_check.data import database
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between runs of each task
+TASK_INTERVALS: Dict[str, datetime.timedelta] = {
+    "optimize": datetime.timedelta(days=1),
+    "vacuum": datetime.timedelta(days=30),
+    "incremental_vacuum": datetime.timedelta(days=1),
+    "fts_optimize": datetime.timedelta(days=7),
+}
+TASKS = tuple(TASK_INTERVALS)
+
+# PRAGMA auto_vacuum value for INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+# Seconds without user input before idle maintenance may start
+IDLE_SECONDS = 120.0
+
+# Held while run_maintenance() works on a database
+_running = threading.Lock()
+
+
+def maintenance_running() -> bool:
+    """Whether maintenance is running in this process"""
+    return _running.locked()
+
+
+def wait_for_maintenance(timeout: Optional[float] = None) -> bool:
+    """
+    Block until no maintenance is running in this process.
+
+    Returns:
+        False if it was still running after timeout seconds
+    """
+    if not _running.acquire(timeout=-1 if timeout is None else timeout):
+        return False
+    _running.release()
+    return True
+
+
+def get_last_runs(conn: sqlite3.Connection) -> Dict[str, datetime.datetime]:
+    """When each maintenance task last ran (tasks that never ran are absent)"""
+    try:
+        rows = conn.execute("SELECT task, last_run FROM maintenance_log").fetchall()
+    except sqlite3.OperationalError:
+        # Database from before the maintenance log
+        return {}
+    return {task: datetime.datetime.fromisoformat(last_run) for task, last_run in rows}
+
+
+def due_tasks(
+    last_runs: Dict[str, datetime.datetime], now: Optional[datetime.datetime] = None
+) -> List[str]:
+    """Tasks whose interval has passed since their last run, in run order"""
+    now = now or datetime.datetime.now()
+    return [
+        task
+        for task in TASKS
+        if task not in last_runs or now - last_runs[task] >= TASK_INTERVALS[task]
+    ]
+
+
+def fts_tables(conn: sqlite3.Connection) -> List[str]:
+    """Names of the FTS5 tables in the database"""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE '%USING fts5%'"
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _optimize(conn: sqlite3.Connection, first_run: bool) -> Optional[str]:
+    if first_run:
+        conn.execute("ANALYZE")
+        return "analyzed"
+    conn.execute("PRAGMA optimize")
+    return "optimized"
+
+
+def _vacuum(conn: sqlite3.Connection, first_run: bool) -> Optional[str]:
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+        return None
+    conn.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+    conn.execute("VACUUM")
+    return "switched to incremental auto-vacuum"
+
+
+def _incremental_vacuum(conn: sqlite3.Connection, first_run: bool) -> Optional[str]:
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    if not free or conn.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+        return None
+    # The pragma frees one page per step; executescript() steps it to the end,
+    # execute() would stop after the first page
+    conn.executescript("PRAGMA incremental_vacuum")
+    return f"freed {free} pages"
+
+
+def _fts_optimize(conn: sqlite3.Connection, first_run: bool) -> Optional[str]:
+    tables = fts_tables(conn)
+    for table in tables:
+        conn.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")  # nosec B608
+    return f"optimized {', '.join(tables)}" if tables else None
+
+
+# Each task returns what it did, or None when there was nothing to do
+_TASK_FUNCTIONS: Dict[str, Callable[[sqlite3.Connection, bool], Optional[str]]] = {
+    "optimize": _optimize,
+    "vacuum": _vacuum,
+    "incremental_vacuum": _incremental_vacuum,
+    "fts_optimize": _fts_optimize,
+}
+
+
+def run_maintenance(
+    db_path: Optional[str] = None,
+    tasks: Optional[List[str]] = None,
+    force: bool = False,
+) -> Dict[str, Optional[str]]:
+    """
+    Run the maintenance tasks that are due (after any run already in progress).
+
+    Args:
+        db_path: Path to SQLite database file (if None, will use default)
+        tasks: Tasks to consider (default: all, in TASKS order)
+        force: Run the tasks even if their interval has not passed
+
+    Returns:
+        Task name -> what it did (None if there was nothing to do), for each task run
+    """
+    if db_path is None:
+        db_path = database.get_db_path()
+    if not os.path.exists(db_path):
+        return {}
+    database.init_db(db_path)
+
+    _running.acquire()
+    # Autocommit, since VACUUM cannot run inside a transaction
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    results: Dict[str, Optional[str]] = {}
+    try:
+        last_runs = get_last_runs(conn)
+        selected = [task for task in TASKS if tasks is None or task in tasks]
+        if not force:
+            selected = [task for task in selected if task in due_tasks(last_runs)]
+
+        for task in selected:
+            started = time.perf_counter()
+            try:
+                detail = _TASK_FUNCTIONS[task](conn, task not in last_runs)
+            except sqlite3.Error as e:
+                logger.warning(f"Maintenance task {task} failed: {e}")
+                continue
+            seconds = time.perf_counter() - started
+            conn.execute(
+                "INSERT OR REPLACE INTO maintenance_log (task, last_run, seconds, detail) "
+                "VALUES (?, ?, ?, ?)",
+                (task, datetime.datetime.now().isoformat(sep=" "), seconds, detail),
+            )
+            results[task] = detail
+            logger.info(f"Maintenance {task}: {detail or 'nothing to do'} ({seconds:.2f}s)")
+    finally:
+        conn.close()
+        _running.release()
+    return results
+
+
+class IdleMaintenance:
+    """
+    Decides when maintenance may run in the background.
+
+    The GUI calls note_activity() on user input and polls run_if_idle(); the
+    work itself is run by the caller-supplied runner (typically on a thread).
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[], None],
+        idle_seconds: float = IDLE_SECONDS,
+        min_interval: float = min(TASK_INTERVALS.values()).total_seconds(),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.runner = runner
+        self.idle_seconds = idle_seconds
+        self.min_interval = min_interval
+        self.clock = clock
+        self.last_activity = clock()
+        self.last_run: Optional[float] = None
+
+    def note_activity(self) -> None:
+        """Record user input, postponing maintenance"""
+        self.last_activity = self.clock()
+
+    def due(self) -> bool:
+        """True when the user is idle and the last run is old enough"""
+        now = self.clock()
+        if now - self.last_activity < self.idle_seconds:
+            return False
+        return self.last_run is None or now - self.last_run >= self.min_interval
+
+    def run_if_idle(self, busy: bool = False) -> bool:
+        """
+        Start the runner if maintenance is due and the app is not busy.
+
+        Returns:
+            True if the runner was started
+        """
+        if busy or not self.due():
+            return False
+        self.last_run = self.clock()
+        self.runner()
+        return True
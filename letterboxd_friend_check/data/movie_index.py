@@ -0,0 +1,175 @@
+"""
+In-memory search index over a friend's watchlist.
+
+The index is built once per friend and holds pre-lowered titles, parsed
+years, the common-movie flag and the display columns taken from
+movie_details, so filtering and sorting on every keystroke never re-parses
+titles or re-sorts the raw watchlist.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+YEAR_SUFFIX_REGEX = re.compile(r"(.+)\s+\((\d{4})\)$")
+
+# Treeview columns, in display order
+MOVIE_COLUMNS = ("title", "year", "rating", "director", "genres")
+MISSING_VALUE = "—"
+
+
+@dataclass(frozen=True)
+class IndexedMovie:
+    """A watchlist entry with its precomputed display and search fields"""
+
+    key: str
+    title: str
+    year: Optional[int]
+    lowered: str
+    common: bool
+    rating: Optional[float] = None
+    director: str = ""
+    genres: str = ""
+
+    def values(self) -> Tuple[str, ...]:
+        """Display values matching MOVIE_COLUMNS"""
+        return (
+            self.title,
+            str(self.year) if self.year else "",
+            f"{self.rating:.1f}" if self.rating is not None else MISSING_VALUE,
+            self.director or MISSING_VALUE,
+            self.genres or MISSING_VALUE,
+        )
+
+    @property
+    def tags(self) -> Tuple[str, ...]:
+        """Treeview tags for this row"""
+        return ("common",) if self.common else ()
+
+
+SORT_KEYS: Dict[str, Callable[[IndexedMovie], Any]] = {
+    "title": lambda m: (m.lowered, m.year or 0),
+    "year": lambda m: (m.year or 0, m.lowered),
+    "rating": lambda m: (m.rating if m.rating is not None else -1.0, m.lowered),
+    "director": lambda m: (m.director.lower(), m.lowered),
+    "genres": lambda m: (m.genres.lower(), m.lowered),
+}
+
+
+def split_title_year(movie: str) -> Tuple[str, Optional[int]]:
+    """Split "Title (YYYY)" into its title and year"""
+    match = YEAR_SUFFIX_REGEX.search(movie)
+    if match:
+        return match.group(1), int(match.group(2))
+    return movie, None
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return ", ".join(g["name"] if isinstance(g, dict) else str(g) for g in value)
+    return str(value) if value else ""
+
+
+class FriendMovieIndex:
+    """Precomputed, sortable and searchable view of one friend's watchlist"""
+
+    def __init__(
+        self,
+        movies: Iterable[str],
+        common_movies: Optional[Set[str]] = None,
+        details: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> None:
+        """
+        Args:
+            movies: Watchlist entries as stored (possibly "Title (YYYY)")
+            common_movies: Entries shared with the user's watchlist
+            details: Optional movie_details rows keyed by watchlist entry
+        """
+        common_movies = common_movies or set()
+        details = details or {}
+        self.movies: List[IndexedMovie] = []
+        for movie in movies:
+            title, year = split_title_year(movie)
+            info = details.get(movie) or {}
+            self.movies.append(
+                IndexedMovie(
+                    key=movie,
+                    title=title,
+                    year=year or info.get("year"),
+                    lowered=title.lower(),
+                    common=movie in common_movies,
+                    rating=_as_float(info.get("tmdb_rating") or info.get("vote_average")),
+                    director=_as_text(info.get("director")),
+                    genres=_as_text(info.get("genres")),
+                )
+            )
+        self.common_count = sum(1 for m in self.movies if m.common)
+        self._orders: Dict[str, List[IndexedMovie]] = {}
+        # Title-sorted lowered keys for O(log n) prefix lookups
+        self._by_title = self.sorted_by("title")
+        self._title_keys = [m.lowered for m in self._by_title]
+
+    def __len__(self) -> int:
+        return len(self.movies)
+
+    def sorted_by(self, column: str = "title", descending: bool = False) -> List[IndexedMovie]:
+        """All movies ordered by a column (orders are computed once and cached)"""
+        if column not in SORT_KEYS:
+            raise ValueError(f"Unknown sort column: {column}")
+        if column not in self._orders:
+            self._orders[column] = sorted(self.movies, key=SORT_KEYS[column])
+        order = self._orders[column]
+        return order[::-1] if descending else order
+
+    def prefix_matches(self, prefix: str) -> List[IndexedMovie]:
+        """Movies whose title starts with prefix, in title order"""
+        prefix = prefix.lower()
+        start = bisect_left(self._title_keys, prefix)
+        end = bisect_right(self._title_keys, prefix + "\U0010ffff", lo=start)
+        return self._by_title[start:end]
+
+    def search(
+        self,
+        term: str = "",
+        common_only: bool = False,
+        prefix: bool = False,
+        sort_column: str = "title",
+        descending: bool = False,
+        also_matching: Optional[Set[str]] = None,
+    ) -> List[IndexedMovie]:
+        """
+        Filter and sort the watchlist.
+
+        Args:
+            term: Search text (case-insensitive)
+            common_only: Only include movies shared with the user
+            prefix: Match the start of the title instead of any substring
+            sort_column: One of MOVIE_COLUMNS
+            descending: Reverse the sort order
+            also_matching: Keys that match the term by other means (e.g. the
+                full-text index over director and synopsis)
+
+        Returns:
+            Matching movies in display order
+        """
+        term = term.strip().lower()
+        order = self.sorted_by(sort_column, descending)
+
+        if term and prefix:
+            matched = {id(m) for m in self.prefix_matches(term)}
+            return [m for m in order if id(m) in matched and (m.common or not common_only)]
+
+        extra = also_matching or set()
+        return [
+            m
+            for m in order
+            if (m.common or not common_only) and (not term or term in m.lowered or m.key in extra)
+        ]
@@ -0,0 +1,295 @@
+"""
+Synthetic dataset generator for the Letterboxd Friend Check database.
+
+Fills the schemas created by data.database.init_db (users, movies,
+watchlists, friends) and movie_database.init_movie_database (genre index)
+with realistic data at a configurable scale: hundreds of users with
+1k-10k film watchlists, film popularity following a Zipf distribution (a
+few films are on most watchlists, most films on very few), and TMDB-style
+details for most films. Generation is deterministic for a given seed.
+
+Used by the scaling benchmarks (scripts/perf/scaling.py); it can also be
+run directly:
+
+    python -m letterboxd_friend_check.data.synthetic --users 200 --db synthetic.db
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+from letterboxd_friend_check.data import database
+
+logger = logging.getLogger(__name__)
+
+_ADJECTIVES = [
+    "Silent", "Red", "Broken", "Hidden", "Last", "Golden", "Midnight", "Burning", "Lost",
+    "Electric", "Wild", "Distant", "Frozen", "Secret", "Little", "Crimson", "Endless", "Quiet",
+    "Savage", "Paper", "Velvet", "Hollow", "Bright", "Lonely", "Glass", "Iron", "Painted",
+    "Dark", "Sweet", "Strange", "Northern", "Fallen", "Blue", "Holy", "Wicked", "Gentle",
+    "Restless", "Forgotten", "Eternal", "Neon",
+]  # fmt: skip
+_NOUNS = [
+    "River", "City", "Summer", "Ghost", "Road", "Heart", "Mountain", "Garden", "Station",
+    "Empire", "Harbor", "Kingdom", "Shadow", "Letter", "Island", "Machine", "Dance", "Witness",
+    "Frontier", "Mirror", "Orchard", "Tide", "Carnival", "Signal", "Hunter", "Circus",
+    "Lighthouse", "Desert", "Sister", "Stranger", "Window", "Promise", "Season", "Rain",
+    "Crown", "Horizon", "Choir", "Forest", "Engine", "Bridge",
+]  # fmt: skip
+_GENRES = [
+    "Drama", "Comedy", "Thriller", "Horror", "Romance", "Action", "Documentary",
+    "Science Fiction", "Animation", "Crime", "Mystery", "Adventure", "Fantasy", "Family",
+    "War", "History", "Music", "Western",
+]  # fmt: skip
+_FIRST_NAMES = ["Ana", "Bo", "Chen", "Dario", "Elif", "Farah", "Gus", "Hana", "Ivo", "Jun"]
+_LAST_NAMES = ["Abe", "Berg", "Costa", "Diaz", "Eze", "Fox", "Gray", "Holm", "Ito", "Jain"]
+
+# Offset added to popularity ranks so the top films don't saturate every watchlist
+_ZIPF_RANK_OFFSET = 10
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a generated dataset"""
+
+    users: int = 200
+    films: int = 50_000
+    min_watchlist: int = 1_000
+    max_watchlist: int = 10_000
+    friends_per_user: int = 50
+    # Zipf exponent of film popularity (0 is uniform; ~1 is typical of real catalogs)
+    popularity_skew: float = 1.0
+    # Share of films that get TMDB-style details
+    details_fraction: float = 0.8
+    seed: int = 42
+
+
+@dataclass
+class SyntheticDataset:
+    """Summary of a generated dataset"""
+
+    db_path: str
+    usernames: List[str]
+    films: int
+    watchlist_rows: int
+    friend_rows: int
+    details_rows: int
+    seconds: float
+
+
+def film_titles(count: int, seed: int = 42) -> List[str]:
+    """`count` unique titles like "Silent River (1987)", most popular first"""
+    combos = len(_ADJECTIVES) * len(_NOUNS) * 100
+    if count > combos:
+        raise ValueError(f"At most {combos} synthetic film titles are available")
+    titles = []
+    for code in random.Random(seed).sample(range(combos), count):
+        code, year = divmod(code, 100)
+        adjective, noun = divmod(code, len(_NOUNS))
+        titles.append(f"{_ADJECTIVES[adjective]} {_NOUNS[noun]} ({1925 + year})")
+    return titles
+
+
+def popularity_weights(count: int, skew: float) -> List[float]:
+    """Cumulative Zipf weights for films ranked 0..count-1 (for random.choices)"""
+    weights = (1.0 / (rank + _ZIPF_RANK_OFFSET) ** skew for rank in range(count))
+    return list(itertools.accumulate(weights))
+
+
+def sample_watchlist(
+    rng: random.Random, cum_weights: List[float], size: int, film_count: int
+) -> Set[int]:
+    """
+    Draw `size` distinct film indexes, skewed toward popular films.
+
+    Draws with replacement in a few rounds; whatever is still missing is
+    filled uniformly, which bounds the cost for very long watchlists.
+    """
+    size = min(size, film_count)
+    population = range(film_count)
+    chosen: Set[int] = set()
+    for _ in range(6):
+        missing = size - len(chosen)
+        if missing <= 0:
+            break
+        chosen.update(rng.choices(population, cum_weights=cum_weights, k=int(missing * 1.3) + 1))
+    while len(chosen) > size:
+        chosen.pop()
+    while len(chosen) < size:
+        chosen.add(rng.randrange(film_count))
+    return chosen
+
+
+def watchlist_size(rng: random.Random, spec: SyntheticSpec) -> int:
+    """Log-uniform size between min_watchlist and max_watchlist (most lists are short)"""
+    low, high = sorted((spec.min_watchlist, spec.max_watchlist))
+    if low <= 0:
+        return rng.randint(0, high)
+    return int(round(low * (high / low) ** rng.random()))
+
+
+def generate(
+    db_path: str,
+    spec: SyntheticSpec = SyntheticSpec(),
+    progress: Optional[Callable[[str], None]] = None,
+) -> SyntheticDataset:
+    """
+    Populate a database with a synthetic dataset.
+
+    The database should be new (or at least free of real data): rows are
+    inserted alongside whatever is already there.
+
+    Args:
+        db_path: SQLite database path (created if missing)
+        spec: Dataset shape
+        progress: Optional callback receiving status messages
+
+    Returns:
+        SyntheticDataset summary
+    """
+    import movie_database  # root-level module that owns the movie details indexes
+
+    report = progress or (lambda message: logger.info(message))
+    start = time.perf_counter()
+    rng = random.Random(spec.seed)
+
+    database.init_db(db_path)
+    movie_database.init_movie_database(db_path)
+
+    titles = film_titles(spec.films, spec.seed)
+    cum_weights = popularity_weights(spec.films, spec.popularity_skew)
+    usernames = [f"synthetic_user_{i:05d}" for i in range(spec.users)]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        # Scratch data: trade durability for speed while loading
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            report(f"Inserting {spec.films} films...")
+            conn.executemany(
+                "INSERT OR IGNORE INTO movies (title) VALUES (?)", ((t,) for t in titles)
+            )
+            movie_ids: Dict[str, int] = dict(conn.execute("SELECT title, movie_id FROM movies"))
+            ids = [movie_ids[title] for title in titles]
+
+            report(f"Generating watchlists for {spec.users} users...")
+            now = time.strftime("%Y-%m-%d %H:%M:%S")
+            conn.executemany(
+                "INSERT OR REPLACE INTO users (username, last_sync, last_sync_complete) "
+                "VALUES (?, ?, 1)",
+                ((username, now) for username in usernames),
+            )
+            watchlist_rows = 0
+            for username in usernames:
+                films = sample_watchlist(rng, cum_weights, watchlist_size(rng, spec), spec.films)
+                conn.executemany(
+                    "INSERT INTO watchlists (username, movie_id, first_seen) VALUES (?, ?, ?)",
+                    ((username, ids[index], now) for index in films),
+                )
+                watchlist_rows += len(films)
+
+            report("Generating follow lists...")
+            friend_rows = 0
+            for username in usernames:
+                others = [u for u in usernames if u != username]
+                follows = rng.sample(others, min(spec.friends_per_user, len(others)))
+                conn.executemany(
+                    "INSERT INTO friends (username, friend_username) VALUES (?, ?)",
+                    ((username, friend) for friend in follows),
+                )
+                friend_rows += len(follows)
+
+            report("Generating movie details...")
+            detailed = int(spec.films * spec.details_fraction)
+            conn.executemany(
+                """
+                UPDATE movies SET
+                    normalized_title = ?, year = ?, director = ?, genres = ?, rating = ?,
+                    tmdb_id = ?, tmdb_rating = ?, runtime = ?, popularity = ?, vote_count = ?,
+                    release_date = ?, last_updated = datetime('now')
+                WHERE title = ?
+                """,
+                (_details_row(rng, rank, titles[rank], movie_database) for rank in range(detailed)),
+            )
+            movie_database.rebuild_film_genres(conn.cursor())
+    finally:
+        conn.close()
+
+    dataset = SyntheticDataset(
+        db_path=db_path,
+        usernames=usernames,
+        films=spec.films,
+        watchlist_rows=watchlist_rows,
+        friend_rows=friend_rows,
+        details_rows=detailed,
+        seconds=round(time.perf_counter() - start, 3),
+    )
+    report(
+        f"Generated {watchlist_rows} watchlist entries for {spec.users} users "
+        f"in {dataset.seconds:.1f}s"
+    )
+    return dataset
+
+
+def _details_row(rng: random.Random, rank: int, title: str, movie_database) -> tuple:
+    clean_title, year = movie_database.extract_year_from_title(title)
+    rating = round(rng.uniform(4.0, 9.0), 1)
+    return (
+        movie_database.normalize_title(clean_title),
+        year,
+        f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+        ", ".join(rng.sample(_GENRES, rng.randint(1, 3))),
+        f"{rating / 2:.1f}",
+        100_000 + rank,
+        rating,
+        rng.randint(75, 190),
+        round(1000.0 / (rank + _ZIPF_RANK_OFFSET), 3),
+        max(1, int(50_000 / (rank + 1))),
+        f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        title,
+    )
+
+
+def main(argv=None) -> int:
+    """Generate a synthetic database from the command line"""
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(description="Generate a synthetic Letterboxd database")
+    parser.add_argument("--db", required=True, help="SQLite database to create")
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--films", type=int, default=defaults.films)
+    parser.add_argument("--min-watchlist", type=int, default=defaults.min_watchlist)
+    parser.add_argument("--max-watchlist", type=int, default=defaults.max_watchlist)
+    parser.add_argument("--friends", type=int, default=defaults.friends_per_user)
+    parser.add_argument("--skew", type=float, default=defaults.popularity_skew)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.db):
+        print(f"ERROR: {args.db} already exists.", file=sys.stderr)
+        return 2
+    spec = SyntheticSpec(
+        users=args.users,
+        films=args.films,
+        min_watchlist=args.min_watchlist,
+        max_watchlist=args.max_watchlist,
+        friends_per_user=args.friends,
+        popularity_skew=args.skew,
+        seed=args.seed,
+    )
+    dataset = generate(args.db, spec, progress=print)
+    summary = asdict(dataset)
+    summary["usernames"] = len(dataset.usernames)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,593 @@
+"""
+GUI-free sync engine for the Letterboxd Friend Check application.
+
+The engine runs the whole pipeline (fetch -> persist -> compare -> enrich)
+without importing tkinter, so the GUI, the CLI and headless batch jobs all
+drive the same code. Progress is reported through callbacks and
+cancellation through a threading.Event.
+
+Watchlist fetches are checkpointed page by page in the database's sync
+journal: a fetch interrupted by a crash, a network error or cancellation
+resumes from its last page on the next sync instead of starting over.
+
+Films the user has already watched are left out of the comparison. The
+watched list is scraped in full at most once per WATCHED_FULL_TTL_SECONDS;
+in between only its newest pages are read, so a resync costs in proportion
+to what was watched since.
+"""
+
+import datetime
+import inspect
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from letterboxd_friend_check.data import database
+from letterboxd_friend_check.utils import instrumentation, web
+from letterboxd_friend_check.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Watchlists at or above this size go through the watchlist policy
+LARGE_WATCHLIST_THRESHOLD = 500
+# Number of movies fetched when the policy answers "limit"
+LARGE_WATCHLIST_LIMIT = 500
+# Watchlists synced more recently than this are reused from the database
+FRESHNESS_SECONDS = 15 * 60
+# Follow lists fetched more recently than this are served from the database
+FRIENDS_TTL_SECONDS = 60 * 60
+# Watchlists imported from a data export more recently than this are not scraped
+EXPORT_TTL_SECONDS = 7 * 24 * 60 * 60
+# Watched films scraped more recently than this are served from the database
+WATCHED_TTL_SECONDS = 60 * 60
+# Watched films are scraped in full (catching films un-marked as watched) at
+# most this often; other scrapes only fetch the newest films
+WATCHED_FULL_TTL_SECONDS = 7 * 24 * 60 * 60
+# Checkpoints older than this are discarded rather than resumed: the
+# watchlist has likely changed, shifting films between pages
+CHECKPOINT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Watchlist policy answers
+POLICY_SKIP = "skip"
+POLICY_LIMIT = "limit"
+POLICY_FULL = "full"
+
+
+@dataclass(frozen=True)
+class SyncProgress:
+    """A progress update emitted by the engine"""
+
+    stage: str  # "user", "friends", "compare", "enrich" or "done"
+    message: str
+    percent: float
+    friend: Optional[str] = None
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a sync run"""
+
+    username: str
+    user_watchlist: Set[str] = field(default_factory=set)
+    friends_watchlists: Dict[str, Set[str]] = field(default_factory=dict)
+    common_movies: Dict[str, Set[str]] = field(default_factory=dict)
+    # Films the user has watched (left out of common_movies)
+    watched: Set[str] = field(default_factory=set)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    cancelled: bool = False
+    # Watchlists reused from the database because they were synced recently
+    reused_from_db: List[str] = field(default_factory=list)
+    # Watchlists only partly fetched (progress is journaled; the next sync resumes)
+    incomplete: List[str] = field(default_factory=list)
+
+    @property
+    def friends_completed(self) -> int:
+        """Number of friends whose watchlist was fetched"""
+        return len(self.friends_watchlists)
+
+
+ProgressCallback = Callable[[SyncProgress], None]
+# Called as policy(friend, watchlist_count) -> "skip" | "limit" | "full"
+WatchlistPolicy = Callable[[str, int], str]
+
+
+def compare_watchlists(
+    user_watchlist: Set[str],
+    friends_watchlists: Dict[str, Set[str]],
+    watched: Optional[Set[str]] = None,
+) -> Dict[str, Set[str]]:
+    """
+    Map each friend to the unwatched movies they share with the user
+    (friends with none are omitted)
+    """
+    return database.compare_watchlists(user_watchlist, friends_watchlists, watched)
+
+
+class SyncEngine:
+    """Fetches, stores and compares watchlists for a user and their friends"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        fetch_watchlist: Callable[..., Set[str]] = web.get_watchlist,
+        fetch_watchlist_count: Callable[[str], Optional[int]] = web.get_watchlist_count,
+        fetch_friends: Callable[[str], Iterable[str]] = web.get_friends,
+        fetch_watched: Optional[Callable[..., Set[str]]] = None,
+        enricher: Optional[Callable[[Set[str]], object]] = None,
+        max_workers: int = 1,
+        large_watchlist_threshold: int = LARGE_WATCHLIST_THRESHOLD,
+        large_watchlist_limit: int = LARGE_WATCHLIST_LIMIT,
+        freshness_seconds: float = FRESHNESS_SECONDS,
+        checkpoint_max_age: float = CHECKPOINT_MAX_AGE_SECONDS,
+        friends_ttl_seconds: float = FRIENDS_TTL_SECONDS,
+        export_ttl_seconds: float = EXPORT_TTL_SECONDS,
+        watched_ttl_seconds: float = WATCHED_TTL_SECONDS,
+        watched_full_ttl_seconds: float = WATCHED_FULL_TTL_SECONDS,
+    ) -> None:
+        """
+        Args:
+            db_path: SQLite database path (package default if None)
+            fetch_watchlist: Scraper called as fetch_watchlist(username, limit=...,
+                progress_callback=...); fetches are checkpointed if it also accepts
+                start_page, on_page and cancel_event (like web.get_watchlist)
+            fetch_watchlist_count: Returns a user's watchlist size, or None
+            fetch_friends: Returns the usernames a user follows; if it accepts
+                strict=True (like web.get_friends) a failed fetch raises instead
+                of returning a truncated list
+            fetch_watched: Returns the films a user has watched (like
+                web.get_watched_films; if it accepts known=..., scrapes between
+                full ones fetch only the newer films). None fetches nothing; the
+                watched films already stored, e.g. from a data export, are
+                still left out of the comparison
+            enricher: Optional callable given the union of common movies after
+                comparison (e.g. to fetch TMDB details)
+            max_workers: Friends fetched concurrently
+            large_watchlist_threshold: Size at which the watchlist policy is asked
+            large_watchlist_limit: Movies fetched when the policy answers "limit"
+            freshness_seconds: Reuse a stored watchlist instead of scraping it if
+                users.last_sync is at most this old (0 always scrapes)
+            checkpoint_max_age: Resume interrupted fetches journaled at most this
+                many seconds ago; older checkpoints are discarded
+            friends_ttl_seconds: Serve a follow list from the database if it was
+                fetched at most this long ago (0 always fetches)
+            export_ttl_seconds: Read a watchlist from the database instead of
+                scraping it if it was imported from a Letterboxd data export at
+                most this long ago (0 ignores imports); this also covers the
+                watched films imported with it
+            watched_ttl_seconds: Serve watched films from the database if they
+                were scraped at most this long ago (0 always scrapes)
+            watched_full_ttl_seconds: Scrape the whole watched list if its last
+                full scrape is older than this (0 always scrapes it in full)
+        """
+        self.db_path = db_path
+        self.fetch_watchlist = fetch_watchlist
+        self.fetch_watchlist_count = fetch_watchlist_count
+        self.fetch_friends = fetch_friends
+        self.fetch_watched = fetch_watched
+        self.enricher = enricher
+        self.max_workers = max(1, max_workers)
+        self.large_watchlist_threshold = large_watchlist_threshold
+        self.large_watchlist_limit = large_watchlist_limit
+        self.freshness_seconds = freshness_seconds
+        self.checkpoint_max_age = checkpoint_max_age
+        self.resumable = _accepts(fetch_watchlist, "start_page", "on_page", "cancel_event")
+        self.friends_ttl_seconds = friends_ttl_seconds
+        self.export_ttl_seconds = export_ttl_seconds
+        self.watched_ttl_seconds = watched_ttl_seconds
+        self.watched_full_ttl_seconds = watched_full_ttl_seconds
+        self._strict_friends = _accepts(fetch_friends, "strict")
+        self._counted = _accepts(fetch_watchlist, "total_count")
+        database.init_db(db_path)
+
+    # --- Individual steps ---
+    def sync_friends(self, username: str, force: bool = False) -> List[str]:
+        """
+        Return the users `username` follows, sorted.
+
+        A follow list fetched within friends_ttl_seconds is read from the
+        database; otherwise it is fetched and only the follow/unfollow
+        differences are stored. If fetching fails and a stored list exists,
+        the stored list is returned.
+
+        Args:
+            username: Letterboxd username
+            force: Fetch even if the stored list is fresh
+        """
+        last_sync = database.get_friends_last_sync(username, self.db_path)
+        if not force and last_sync is not None and self.friends_ttl_seconds > 0:
+            age = (datetime.datetime.now() - last_sync).total_seconds()
+            if 0 <= age <= self.friends_ttl_seconds:
+                logger.debug(f"Reusing friends of {username} fetched {age:.0f}s ago")
+                instrumentation.record_cache_hit("friends_from_db")
+                return sorted(database.get_friends_from_db(username, self.db_path))
+
+        try:
+            if self._strict_friends:
+                fetched = self.fetch_friends(username, strict=True)
+            else:
+                fetched = self.fetch_friends(username)
+        except Exception as e:
+            if last_sync is None:
+                raise
+            logger.warning(f"Using stored friends of {username}; fetching failed: {e}")
+            return sorted(database.get_friends_from_db(username, self.db_path))
+
+        friends = sorted(set(fetched))
+        with instrumentation.stage("persist", username):
+            database.sync_friends_to_db(username, friends, self.db_path)
+        return friends
+
+    def sync_watched(self, username: str) -> Set[str]:
+        """
+        Return the films `username` has watched.
+
+        They are read from the database when an export was imported within
+        export_ttl_seconds or they were scraped within watched_ttl_seconds.
+        Otherwise only the films watched since the last scrape are fetched, or
+        the whole list once its last full scrape is older than
+        watched_full_ttl_seconds; only the difference is stored. If scraping
+        fails, the stored films are returned.
+        """
+        stored = database.get_watched_from_db(username, self.db_path)
+        if self.fetch_watched is None:
+            return stored
+        now = datetime.datetime.now()
+        if self.export_ttl_seconds > 0:
+            imported = database.get_last_export_import(username, self.db_path)
+            if imported and 0 <= (now - imported).total_seconds() <= self.export_ttl_seconds:
+                instrumentation.record_cache_hit("watched_from_export")
+                return stored
+
+        last_sync, last_full_sync = database.get_watched_last_sync(username, self.db_path)
+        if last_sync and 0 <= (now - last_sync).total_seconds() <= self.watched_ttl_seconds:
+            instrumentation.record_cache_hit("watched_from_db")
+            return stored
+        incremental = (
+            last_full_sync is not None
+            and 0 <= (now - last_full_sync).total_seconds() <= self.watched_full_ttl_seconds
+            and _accepts(self.fetch_watched, "known")
+        )
+
+        try:
+            if incremental:
+                fetched = self.fetch_watched(username, known=stored)
+            elif _accepts(self.fetch_watched, "strict"):
+                fetched = self.fetch_watched(username, strict=True)
+            else:
+                fetched = self.fetch_watched(username)
+        except Exception as e:
+            logger.warning(f"Using stored watched films of {username}; fetching failed: {e}")
+            return stored
+
+        with instrumentation.stage("persist", username):
+            database.update_watched_in_db(username, fetched, self.db_path, complete=not incremental)
+        return stored | set(fetched) if incremental else set(fetched)
+
+    def fresh_watchlist(self, username: str) -> Optional[Set[str]]:
+        """
+        The stored watchlist if it was imported from a data export within
+        export_ttl_seconds or fully synced within freshness_seconds, else None.
+        A limited sync stored only part of the watchlist and is never reused.
+        """
+        if self.export_ttl_seconds > 0:
+            imported = database.get_last_export_import(username, self.db_path)
+            age = (datetime.datetime.now() - imported).total_seconds() if imported else -1
+            if 0 <= age <= self.export_ttl_seconds:
+                logger.debug(f"Using watchlist for {username} imported {age:.0f}s ago")
+                instrumentation.record_cache_hit("watchlist_from_export")
+                return database.get_watchlist_from_db(username, self.db_path)
+        if self.freshness_seconds <= 0:
+            return None
+        last_sync, complete = database.get_watchlist_last_sync(username, self.db_path)
+        if last_sync is None or not complete:
+            return None
+        age = (datetime.datetime.now() - last_sync).total_seconds()
+        if not 0 <= age <= self.freshness_seconds:
+            return None
+        logger.debug(f"Reusing watchlist for {username} synced {age:.0f}s ago")
+        instrumentation.record_cache_hit("watchlist_from_db")
+        return database.get_watchlist_from_db(username, self.db_path)
+
+    def fetch_resumable(
+        self,
+        username: str,
+        limit: Optional[int] = None,
+        page_callback: Optional[web.PageProgressCallback] = None,
+        run_id: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None,
+        total_count: Optional[int] = None,
+    ) -> Tuple[Set[str], bool]:
+        """
+        Fetch a watchlist, checkpointing each page in the sync journal.
+
+        A journaled fetch of the same user is continued from the page after
+        its last checkpoint, and the films already journaled are included.
+        A known total_count is passed on so the scraper skips its count request.
+
+        Returns:
+            (films, complete); complete is False when the fetch stopped early
+            (error, rate limit or cancellation) and its checkpoint was kept
+        """
+        counted = {"total_count": total_count} if self._counted and total_count else {}
+        if not self.resumable:
+            watchlist = self.fetch_watchlist(
+                username, limit=limit, progress_callback=page_callback, **counted
+            )
+            return watchlist, True
+
+        run_id = run_id or uuid.uuid4().hex
+        checkpoint = database.get_sync_checkpoint(username, self.db_path)
+        if checkpoint:
+            age = (datetime.datetime.now() - checkpoint["updated_at"]).total_seconds()
+            if not 0 <= age <= self.checkpoint_max_age:
+                logger.info(f"Discarding {age:.0f}s old sync checkpoint for {username}")
+                database.clear_sync_checkpoint(username, self.db_path)
+                checkpoint = None
+        done: Set[str] = set()
+        start_page = 1
+        if checkpoint:
+            done = checkpoint["films"]
+            start_page = checkpoint["pages_done"] + 1
+            logger.info(
+                f"Resuming watchlist for {username} at page {start_page} "
+                f"({len(done)} films from run {checkpoint['run_id']})"
+            )
+            instrumentation.record_cache_hit("resumed_watchlist")
+
+        remaining = None if limit is None else limit - len(done)
+        if remaining is not None and remaining <= 0:
+            return done, True
+
+        finished = False
+
+        def on_page(page: int, titles: List[str]) -> None:
+            nonlocal finished
+            if not titles:
+                finished = True
+                return
+            with instrumentation.stage("persist", username):
+                database.save_sync_checkpoint(username, run_id, page, titles, self.db_path)
+
+        def report(fetched: int, total: Optional[int]) -> None:
+            page_callback(len(done) + fetched, total)
+
+        fetched = self.fetch_watchlist(
+            username,
+            limit=remaining,
+            progress_callback=report if page_callback else None,
+            start_page=start_page,
+            on_page=on_page,
+            cancel_event=cancel_event,
+            **counted,
+        )
+        films = done | fetched
+        return films, finished or (limit is not None and len(films) >= limit)
+
+    def sync_user(
+        self,
+        username: str,
+        limit: Optional[int] = None,
+        page_callback: Optional[web.PageProgressCallback] = None,
+        registry: Optional[SingleFlight] = None,
+        run_id: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None,
+        total_count: Optional[int] = None,
+    ) -> Set[str]:
+        """
+        Fetch one user's watchlist and store it.
+
+        A recently synced watchlist is read back from the database instead. With
+        a registry, concurrent and repeated calls for the same user within a run
+        share a single fetch. A fetch that stops early returns the films fetched
+        so far without storing them as the watchlist; its progress stays in the
+        sync journal and the next call resumes it. A watchlist size the caller
+        already fetched is passed as total_count so it is not requested again.
+        """
+        loaded = False
+
+        def load():
+            nonlocal loaded
+            loaded = True
+            fresh = self.fresh_watchlist(username)
+            if fresh is not None:
+                return fresh
+            watchlist, complete = self.fetch_resumable(
+                username, limit, page_callback, run_id, cancel_event, total_count
+            )
+            if not complete:
+                logger.warning(
+                    f"Watchlist fetch for {username} stopped after {len(watchlist)} films; "
+                    "progress is saved and will be resumed"
+                )
+                return watchlist
+            with instrumentation.stage("persist", username):
+                # A limited fetch is not the whole watchlist: it only adds films
+                database.sync_watchlist_to_db(
+                    username, watchlist, self.db_path, complete=limit is None
+                )
+                if self.resumable:
+                    database.clear_sync_checkpoint(username, self.db_path)
+            return watchlist
+
+        if registry is None:
+            return load()
+        watchlist = registry.do(username, load)
+        if not loaded:
+            instrumentation.record_cache_hit("shared_fetch")
+        return watchlist
+
+    # --- Full pipeline ---
+    def sync(
+        self,
+        username: str,
+        friends: Iterable[str],
+        progress: Optional[ProgressCallback] = None,
+        watchlist_policy: Optional[WatchlistPolicy] = None,
+        cancel_event: Optional[threading.Event] = None,
+        registry: Optional[SingleFlight] = None,
+    ) -> SyncResult:
+        """
+        Sync the user's and the given friends' watchlists, then compare them.
+
+        Args:
+            username: The user whose watchlist is compared
+            friends: Friends to sync, in order
+            progress: Receives SyncProgress updates (from the calling thread, or
+                from worker threads when max_workers > 1)
+            watchlist_policy: Decides what to do with large watchlists; without
+                one, large watchlists are fetched in full
+            cancel_event: Set it to stop; watchlists being fetched stop before
+                their next page and are resumed by a later sync
+            registry: Per-run fetch registry shared with other concurrent syncs
+                (a new one is used if None)
+
+        Returns:
+            SyncResult with whatever was fetched, even when cancelled
+        """
+        friends = list(friends)
+        cancel_event = cancel_event or threading.Event()
+        registry = registry if registry is not None else SingleFlight()
+        result = SyncResult(username)
+        run_id = uuid.uuid4().hex
+        total = len(friends)
+        progress_lock = threading.Lock()
+        done = 0
+
+        def emit(stage, message, percent, friend=None):
+            if progress:
+                progress(SyncProgress(stage, message, percent, friend))
+
+        # 1. The user's own watchlist
+        emit("user", f"Fetching your watchlist ({username})...", 0)
+        try:
+            result.user_watchlist = self.sync_user(
+                username, registry=registry, run_id=run_id, cancel_event=cancel_event
+            )
+            if self._has_checkpoint(username):
+                result.incomplete.append(username)
+        except Exception as e:
+            logger.error(f"Error fetching user watchlist: {e}")
+        try:
+            result.watched = self.sync_watched(username)
+        except Exception as e:
+            logger.error(f"Error fetching watched films: {e}")
+
+        # 2. Friends' watchlists
+        def sync_one(index, friend):
+            nonlocal done
+            if cancel_event.is_set():
+                return
+            position = f"({index + 1}/{total})"
+
+            def report_pages(fetched, count):
+                # Advance the progress within the current friend, page by page
+                if count:
+                    fraction = min(fetched / count, 1.0)
+                    emit("friends", status, ((done + fraction) / total) * 100, friend)
+
+            status = f"Checking watchlist size for '{friend}' {position}..."
+            emit("friends", status, (done / total) * 100, friend)
+            try:
+                fresh = self.fresh_watchlist(friend)
+                if fresh is not None:
+                    # Synced moments ago (e.g. by another account's run): no scraping
+                    result.friends_watchlists[friend] = fresh
+                    result.reused_from_db.append(friend)
+                    return
+
+                limit = None
+                count = self.fetch_watchlist_count(friend)
+                if count and count >= self.large_watchlist_threshold and watchlist_policy:
+                    choice = watchlist_policy(friend, count)
+                    if choice == POLICY_SKIP:
+                        logger.info(f"Skipping {friend} due to large watchlist ({count} movies)")
+                        result.skipped.append(friend)
+                        return
+                    if choice == POLICY_LIMIT:
+                        limit = self.large_watchlist_limit
+                        status = f"Fetching first {limit} movies for '{friend}' {position}..."
+                    else:
+                        status = (
+                            f"Fetching all {count} movies for '{friend}' {position}... "
+                            "This may take a while."
+                        )
+                else:
+                    status = f"Fetching watchlist for '{friend}' {position}..."
+                emit("friends", status, (done / total) * 100, friend)
+
+                watchlist = self.sync_user(
+                    friend,
+                    limit=limit,
+                    page_callback=report_pages,
+                    registry=registry,
+                    run_id=run_id,
+                    cancel_event=cancel_event,
+                    total_count=count,
+                )
+                result.friends_watchlists[friend] = watchlist
+                if self._has_checkpoint(friend):
+                    result.incomplete.append(friend)
+            except Exception as exc:
+                logger.error(f"'{friend}' generated an exception during sync: {exc}")
+                result.failed[friend] = str(exc)
+            finally:
+                with progress_lock:
+                    done += 1
+                emit("friends", status, (done / total) * 100, friend)
+
+        if self.max_workers == 1:
+            for index, friend in enumerate(friends):
+                if cancel_event.is_set():
+                    break
+                sync_one(index, friend)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(sync_one, index, friend) for index, friend in enumerate(friends)
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+        result.cancelled = cancel_event.is_set()
+        if result.cancelled:
+            logger.info(
+                f"Sync cancelled after processing {result.friends_completed} of {total} friends"
+            )
+
+        # 3. Compare with whatever data we have
+        emit("compare", "Comparing watchlists and finalizing...", 100)
+        with instrumentation.stage("compare"):
+            result.common_movies = compare_watchlists(
+                result.user_watchlist, result.friends_watchlists, result.watched
+            )
+
+        # 4. Optional enrichment of the movies that matter
+        if self.enricher and result.common_movies and not result.cancelled:
+            emit("enrich", "Fetching movie details...", 100)
+            try:
+                with instrumentation.stage("enrich"):
+                    self.enricher(set().union(*result.common_movies.values()))
+            except Exception as e:
+                logger.error(f"Error enriching common movies: {e}")
+
+        emit("done", f"Found common movies with {len(result.common_movies)} friends.", 100)
+        return result
+
+    def _has_checkpoint(self, username: str) -> bool:
+        """Whether an unfinished fetch of username is journaled"""
+        if not self.resumable:
+            return False
+        return database.get_sync_checkpoint(username, self.db_path, include_films=False) is not None
+
+
+def _accepts(func: Callable, *names: str) -> bool:
+    """Whether func takes all of the given keyword arguments"""
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return all(name in parameters for name in names)
@@ -0,0 +1,206 @@
+"""
+Database management dialog.
+
+Shows movie_database.get_database_stats(): row counts and sizes per table,
+index sizes, file and page counts, how many films are served from stored
+details, and when each maintenance task last ran. Maintenance can also be
+run on demand; it runs on a worker thread and reports back through the GUI
+event bus, so VACUUM does not freeze the window.
+"""
+
+import datetime
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from letterboxd_friend_check.data import maintenance
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Human-readable size ("" when unknown)"""
+    if size is None:
+        return ""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1_048_576:
+        return f"{size / 1024:.0f} KB"
+    return f"{size / 1_048_576:.1f} MB"
+
+
+def summary_text(stats: Dict[str, Any]) -> str:
+    """One-paragraph summary of the file, pages and details cache"""
+    free_share = stats["freelist_count"] / stats["page_count"] if stats["page_count"] else 0
+    cache = stats["details_cache"]
+    hit_rate = f"{cache['hit_rate']:.0%}" if cache["hit_rate"] is not None else "n/a"
+    return (
+        f"File {format_bytes(stats['file_bytes'])} (WAL {format_bytes(stats['wal_bytes'])})"
+        f"  |  {stats['page_count']} pages of {stats['page_size']} B, "
+        f"{stats['freelist_count']} free ({free_share:.0%})"
+        f"  |  journal {stats['journal_mode']}"
+        f"  |  details stored for {cache['with_details']} of {cache['films']} films ({hit_rate})"
+    )
+
+
+def table_rows(stats: Dict[str, Any]) -> List[Tuple[str, int, str]]:
+    """(table, rows, size) rows, largest first"""
+    tables = sorted(stats["tables"].items(), key=lambda item: (-item[1]["rows"], item[0]))
+    return [(name, entry["rows"], format_bytes(entry["bytes"])) for name, entry in tables]
+
+
+def index_rows(stats: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """(index, table, size) rows, largest first"""
+    indexes = sorted(stats["indexes"].items(), key=lambda item: (-(item[1]["bytes"] or 0), item[0]))
+    return [(name, entry["table"], format_bytes(entry["bytes"])) for name, entry in indexes]
+
+
+def maintenance_rows(
+    stats: Dict[str, Any], now: Optional[datetime.datetime] = None
+) -> List[Tuple[str, str, str]]:
+    """(task, last run, next due) rows, one per maintenance task"""
+    now = now or datetime.datetime.now()
+    last_runs = stats["maintenance"]
+    due = set(maintenance.due_tasks(last_runs, now))
+    rows = []
+    for task in maintenance.TASKS:
+        last_run = last_runs.get(task)
+        if last_run is None:
+            rows.append((task, "never", "now"))
+            continue
+        next_run = "now" if task in due else f"{last_run + maintenance.TASK_INTERVALS[task]:%c}"
+        rows.append((task, f"{last_run:%c}", next_run))
+    return rows
+
+
+class DatabaseDialog(tk.Toplevel):
+    """Dialog showing database statistics, with a button to run maintenance"""
+
+    def __init__(
+        self, parent, db_path: Optional[str] = None, post: Optional[Callable[..., None]] = None
+    ):
+        """
+        Args:
+            parent: The main window
+            db_path: Database file (default: the app's database)
+            post: Runs post(task, *args) on the Tk thread (default: parent.gui_queue.post)
+        """
+        super().__init__(parent)
+        # Imported here: the root module is only on sys.path when run from the app
+        from movie_database import get_database_path, get_database_stats
+
+        self.db_path = db_path or get_database_path()
+        self.get_database_stats = get_database_stats
+        self.post = post or parent.gui_queue.post
+        self.maintenance_thread: Optional[threading.Thread] = None
+        self.title("Database Management")
+        self.geometry("720x560")
+        self.transient(parent)
+        self.summary_var = tk.StringVar()
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill="both", expand=True)
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(1, weight=1)
+        frame.grid_rowconfigure(2, weight=1)
+
+        ttk.Label(frame, textvariable=self.summary_var, wraplength=680).grid(
+            row=0, column=0, sticky="w"
+        )
+
+        self.tables = self._tree(frame, 1, "Table", (("rows", "Rows"), ("size", "Size")))
+        self.indexes = self._tree(frame, 2, "Index", (("table", "Table"), ("size", "Size")))
+        self.tasks = self._tree(
+            frame, 3, "Maintenance task", (("last_run", "Last run"), ("next_run", "Next due"))
+        )
+        self.tasks.configure(height=len(maintenance.TASKS))
+
+        buttons = ttk.Frame(frame)
+        buttons.grid(row=4, column=0, sticky="e", pady=(10, 0))
+        self.maintenance_button = ttk.Button(
+            buttons, text="Run Maintenance Now", command=self.run_maintenance
+        )
+        self.maintenance_button.pack(side="left")
+        ttk.Button(buttons, text="Refresh", command=self.refresh).pack(side="left", padx=(5, 0))
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side="left", padx=(5, 0))
+
+    def _tree(self, frame, row: int, label: str, columns) -> ttk.Treeview:
+        tree = ttk.Treeview(frame, columns=[name for name, _ in columns], selectmode="browse")
+        tree.heading("#0", text=label)
+        tree.column("#0", width=240)
+        for name, title in columns:
+            tree.heading(name, text=title)
+            tree.column(name, width=180 if "run" in name else 100, anchor="e")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set, height=6)
+        tree.grid(row=row, column=0, sticky="nsew", pady=(10, 0))
+        scrollbar.grid(row=row, column=1, sticky="ns", pady=(10, 0))
+        return tree
+
+    @staticmethod
+    def _fill(tree: ttk.Treeview, rows) -> None:
+        tree.delete(*tree.get_children())
+        for name, *values in rows:
+            tree.insert("", "end", text=name, values=values)
+
+    def refresh(self):
+        """Reload the statistics"""
+        stats = self.get_database_stats(self.db_path)
+        if not stats:
+            self.summary_var.set("No database found.")
+            return
+        self.summary_var.set(summary_text(stats))
+        self._fill(self.tables, table_rows(stats))
+        self._fill(self.indexes, index_rows(stats))
+        self._fill(self.tasks, maintenance_rows(stats))
+
+    def run_maintenance(self):
+        """Run every maintenance task now, on a worker thread"""
+        if getattr(self.master, "sync_in_progress", False):
+            # VACUUM would lock the database under the running sync
+            messagebox.showinfo(
+                "Sync in Progress", "Run maintenance once the sync has finished.", parent=self
+            )
+            return
+        if maintenance.maintenance_running():
+            # Background maintenance started while the user was idle
+            messagebox.showinfo(
+                "Maintenance in Progress",
+                "Maintenance is already running. Try again once it has finished.",
+                parent=self,
+            )
+            return
+        self.config(cursor="watch")
+        self.maintenance_button.state(["disabled"])
+        self.maintenance_thread = threading.Thread(
+            target=self._maintenance_worker, name="maintenance-dialog", daemon=True
+        )
+        self.maintenance_thread.start()
+
+    def _maintenance_worker(self):
+        try:
+            results = maintenance.run_maintenance(self.db_path, force=True)
+        except Exception as e:
+            self.post(self._maintenance_finished, None, str(e))
+            return
+        self.post(self._maintenance_finished, results, None)
+
+    def _maintenance_finished(
+        self, results: Optional[Dict[str, Optional[str]]], error: Optional[str]
+    ) -> None:
+        """Report a maintenance run (Tk thread)"""
+        self.maintenance_thread = None
+        if not self.winfo_exists():
+            return
+        self.config(cursor="")
+        self.maintenance_button.state(["!disabled"])
+        if error is not None:
+            messagebox.showerror("Maintenance Failed", error, parent=self)
+            return
+        done = [f"{task}: {detail}" for task, detail in results.items() if detail]
+        messagebox.showinfo(
+            "Maintenance Complete", "\n".join(done) or "Nothing to do.", parent=self
+        )
+        self.refresh()
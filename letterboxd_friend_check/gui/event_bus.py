@@ -0,0 +1,153 @@
+"""
+Thread-safe event bus for handing work from background threads to the Tk thread.
+
+Background threads post callables; the GUI drains them on the main thread in
+bounded batches. Updates posted with a key (status text, progress values) are
+coalesced so only the latest value per key is applied, which keeps heavy
+syncs from flooding the Tk event loop with redundant updates.
+
+Tk must only be called from its own thread, so PipeWakeup wakes the GUI by
+writing a byte to a pipe that Tk watches as a file handler; the handler then
+runs on the Tk thread. Tk file handlers are not available on Windows, where
+the GUI falls back to polling the bus.
+"""
+
+import itertools
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Task = Tuple[Callable[..., Any], tuple, dict]
+
+
+class GuiEventBus:
+    """Ordered task queue with latest-wins coalescing per key"""
+
+    def __init__(self, wakeup: Optional[Callable[[], None]] = None) -> None:
+        """
+        Args:
+            wakeup: Called (from the posting thread) when the bus goes from idle
+                to having pending work, so the GUI can schedule a drain
+        """
+        self._lock = threading.Lock()
+        # Plain tasks get a unique sequence key, coalesced updates use their own
+        # key and are moved to the end when replaced, so execution order always
+        # follows the order of the most recent post.
+        self._pending: "OrderedDict[Hashable, Task]" = OrderedDict()
+        self._sequence = itertools.count()
+        self._wakeup = wakeup
+        self._wakeup_pending = False
+        self.coalesced_count = 0
+
+    def set_wakeup(self, wakeup: Optional[Callable[[], None]]) -> None:
+        """Set the callback used to notify the GUI of new work"""
+        self._wakeup = wakeup
+
+    def post(self, task: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue a task that must run exactly once, in order"""
+        with self._lock:
+            self._pending[("task", next(self._sequence))] = (task, args, kwargs)
+        self._notify()
+
+    def post_latest(
+        self, key: Hashable, task: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> None:
+        """Queue a task that replaces any not-yet-run task posted with the same key"""
+        with self._lock:
+            if self._pending.pop(("latest", key), None) is not None:
+                self.coalesced_count += 1
+            self._pending[("latest", key)] = (task, args, kwargs)
+        self._notify()
+
+    def drain(self, max_items: Optional[int] = None) -> List[Task]:
+        """
+        Remove and return up to max_items pending tasks in execution order.
+
+        Once the bus is empty the next post triggers the wakeup callback again.
+        """
+        with self._lock:
+            count = len(self._pending) if max_items is None else max_items
+            tasks = []
+            while self._pending and len(tasks) < count:
+                tasks.append(self._pending.popitem(last=False)[1])
+            if not self._pending:
+                self._wakeup_pending = False
+        return tasks
+
+    def pending(self) -> int:
+        """Number of tasks waiting to be drained"""
+        with self._lock:
+            return len(self._pending)
+
+    def _notify(self) -> None:
+        with self._lock:
+            if self._wakeup_pending or self._wakeup is None:
+                return
+            self._wakeup_pending = True
+        try:
+            self._wakeup()
+        except Exception as e:
+            # The GUI's fallback poll still drains the bus (and re-arms the
+            # wakeup), so a failed wakeup only delays processing
+            logger.debug(f"GUI event bus wakeup failed: {e}")
+
+
+class PipeWakeup:
+    """
+    Event bus wakeup that is safe to call from any thread.
+
+    Calling it writes a byte to a pipe; Tk notices the readable pipe in its
+    event loop and runs callback() on the Tk thread.
+    """
+
+    def __init__(self, widget: Any, callback: Callable[[], None]) -> None:
+        """
+        Args:
+            widget: Any widget of the Tk interpreter to wake (Tk thread only)
+            callback: Run on the Tk thread after each wakeup
+        """
+        import tkinter
+
+        self._tk = widget.tk
+        self._callback = callback
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self._tk.createfilehandler(self._read_fd, tkinter.READABLE, self._on_readable)
+
+    @staticmethod
+    def supported(widget: Any) -> bool:
+        """Whether this Tk build has file handlers (not on Windows)"""
+        return hasattr(widget.tk, "createfilehandler")
+
+    def __call__(self) -> None:
+        try:
+            os.write(self._write_fd, b"\0")
+        except BlockingIOError:
+            pass  # The pipe is full, so a wakeup is already pending
+        except OSError as e:
+            logger.debug(f"GUI wakeup pipe closed: {e}")
+
+    def _on_readable(self, fd: int, mask: int) -> None:
+        try:
+            while os.read(self._read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._callback()
+
+    def close(self) -> None:
+        """Unregister the file handler and close the pipe (Tk thread)"""
+        if self._read_fd < 0:
+            return
+        try:
+            self._tk.deletefilehandler(self._read_fd)
+        except Exception as e:
+            logger.debug(f"Could not remove GUI wakeup handler: {e}")
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+        self._read_fd = self._write_fd = -1
@@ -0,0 +1,83 @@
+"""
+Selection model for the friends checklist on the Sync tab.
+
+Selection state lives in a plain set instead of one Tk variable per friend,
+so counting and (de)selecting everything never touches the widgets. The
+GUI renders the (optionally filtered) rows into a Treeview in idle-time chunks.
+"""
+
+from typing import Iterable, List, Optional, Set
+
+CHECKED_MARK = "☑"
+UNCHECKED_MARK = "☐"
+
+
+class FriendChecklistModel:
+    """Ordered friend list with a set of selected friends and a search filter"""
+
+    def __init__(self) -> None:
+        self.friends: List[str] = []
+        self.selected: Set[str] = set()
+        self._lowered: List[str] = []
+
+    def set_friends(self, friends: Iterable[str], selected: Optional[Iterable[str]] = None) -> None:
+        """
+        Replace the friend list.
+
+        Args:
+            friends: Friend usernames in display order
+            selected: Friends to mark as selected (all friends if None)
+        """
+        self.friends = list(friends)
+        self._lowered = [friend.lower() for friend in self.friends]
+        if selected is None:
+            self.selected = set(self.friends)
+        else:
+            self.selected = set(selected).intersection(self.friends)
+
+    def __len__(self) -> int:
+        return len(self.friends)
+
+    @property
+    def selected_count(self) -> int:
+        """Number of selected friends"""
+        return len(self.selected)
+
+    @property
+    def all_selected(self) -> bool:
+        """True if every friend is selected"""
+        return bool(self.friends) and len(self.selected) == len(self.friends)
+
+    def is_selected(self, friend: str) -> bool:
+        """Whether a friend is selected"""
+        return friend in self.selected
+
+    def toggle(self, friend: str) -> bool:
+        """Flip the selection of a friend and return the new state"""
+        if friend in self.selected:
+            self.selected.discard(friend)
+            return False
+        if friend in self.friends:
+            self.selected.add(friend)
+            return True
+        return False
+
+    def set_all(self, selected: bool) -> None:
+        """Select or deselect every friend"""
+        self.selected = set(self.friends) if selected else set()
+
+    def selected_in_order(self) -> List[str]:
+        """Selected friends in display order"""
+        return [friend for friend in self.friends if friend in self.selected]
+
+    def filtered(self, search_term: str = "") -> List[str]:
+        """Friends whose username contains the search term (case-insensitive)"""
+        term = search_term.strip().lower()
+        if not term:
+            return list(self.friends)
+        return [friend for friend, lowered in zip(self.friends, self._lowered) if term in lowered]
+
+    def label(self, friend: str) -> str:
+        """Display text of a checklist row"""
+        mark = CHECKED_MARK if friend in self.selected else UNCHECKED_MARK
+        return f"{mark} {friend}"
@@ -90,11 +90,11 @@ class MenuMethods:
         self.wait_window(setup_dialog)  # pylint: disable=no-member
 
     def show_database_dialog(self):
-        """Show database management dialog"""
-        messagebox.showinfo(
-            "Database Management",
-            "Database management features will be available in a future update.",
-        )
+        """Show the database statistics and maintenance dialog"""
+        # Import locally to avoid circular imports
+        from letterboxd_friend_check.gui.database_dialog import DatabaseDialog
+
+        DatabaseDialog(self, getattr(self, "db_path", None))
 
     def export_results(self):
         """Export results to file"""
@@ -0,0 +1,319 @@
+"""
+Poster thumbnails for the results view.
+
+Posters come from TMDB's image server (movie_details.poster_path appended
+to a configurable base URL) and pass through two caches:
+
+    PosterDiskCache   downscaled PNG thumbnails on disk, capped in total
+                      size; the least recently used files are evicted first
+    PhotoImageCache   the decoded PhotoImages of recently shown posters
+
+PosterLoader downloads, downscales and caches on worker threads and hands
+the PNG bytes back to the Tk thread, where the PhotoImage is created. Only
+rows currently visible in the Treeview are requested (see visible_rows),
+and requests for rows scrolled out of view are dropped before they start.
+Pillow is only imported by the workers.
+"""
+
+import base64
+import hashlib
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# TMDB's image server; w92 is the smallest poster rendition it offers
+DEFAULT_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w92"
+# Thumbnail bounding box in pixels (posters are 2:3)
+THUMBNAIL_SIZE = (24, 36)
+# Size cap of the on-disk thumbnail cache
+DISK_CACHE_MAX_BYTES = 20 * 1024 * 1024
+# Decoded PhotoImages kept in memory
+MEMORY_CACHE_SIZE = 256
+# Concurrent poster downloads
+DEFAULT_POSTER_WORKERS = 4
+
+THUMBNAIL_SUFFIX = ".png"
+
+
+def poster_url(base_url: str, poster_path: str) -> str:
+    """Full image URL of a TMDB poster path such as "/abc.jpg" """
+    return f"{base_url.rstrip('/')}/{poster_path.lstrip('/')}"
+
+
+def make_thumbnail(data: bytes, size: Tuple[int, int] = THUMBNAIL_SIZE) -> bytes:
+    """Downscale an image to fit in `size`, as PNG (which Tk reads without Pillow)"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        image.thumbnail(size)
+        out = io.BytesIO()
+        image.save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
+
+def default_cache_dir(db_path: Optional[str] = None) -> str:
+    """Thumbnail directory next to the database file (the default database if None)"""
+    if db_path is None:
+        from letterboxd_friend_check.data import database
+
+        db_path = database.get_db_path()
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), "posters")
+
+
+class PosterDiskCache:
+    """Thumbnails on disk, evicted least recently used first past max_bytes"""
+
+    def __init__(self, directory: str, max_bytes: int = DISK_CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # file name -> size, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        os.makedirs(directory, exist_ok=True)
+        # Recover the LRU order from modification times (get() touches them)
+        entries = [
+            entry
+            for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.endswith(THUMBNAIL_SUFFIX)
+        ]
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._index[entry.name] = size
+            self._total += size
+
+    @staticmethod
+    def file_name(key: str) -> str:
+        """Cache file name of a key (a poster path)"""
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + THUMBNAIL_SUFFIX  # nosec B324
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently stored"""
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """The cached thumbnail, marked as recently used, or None"""
+        name = self.file_name(key)
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            if name not in self._index:
+                return None
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except OSError:
+                self._total -= self._index.pop(name)
+                return None
+            self._index.move_to_end(name)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a thumbnail, evicting old ones to stay within max_bytes"""
+        name = self.file_name(key)
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            # Write to a temporary file first so readers never see half a file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._total += len(data) - self._index.pop(name, 0)
+            self._index[name] = len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes and len(self._index) > 1:
+            name, size = self._index.popitem(last=False)
+            self._total -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError as e:
+                logger.debug(f"Could not remove cached poster {name}: {e}")
+
+
+class PhotoImageCache:
+    """Least recently used cache of decoded images"""
+
+    def __init__(self, capacity: int = MEMORY_CACHE_SIZE) -> None:
+        self.capacity = capacity
+        self._images: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._images
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """The cached image, marked as recently used, or None"""
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def put(self, key: Hashable, image: Any) -> None:
+        """Cache an image, dropping the least recently used past capacity"""
+        self._images[key] = image
+        self._images.move_to_end(key)
+        while len(self._images) > self.capacity:
+            self._images.popitem(last=False)
+
+
+def _photo_image(data: bytes) -> Any:
+    import tkinter as tk
+
+    return tk.PhotoImage(data=base64.b64encode(data).decode("ascii"))
+
+
+def _download(url: str) -> bytes:
+    from letterboxd_friend_check.utils import web
+
+    response = web.get_session().get(url, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+class PosterLoader:
+    """
+    Loads poster thumbnails off the Tk thread.
+
+    request() is called on the Tk thread. Posters already decoded are
+    returned at once; others are loaded by a worker (disk cache, else
+    download and downscale) and the callback is posted back to the Tk
+    thread with the PhotoImage.
+    """
+
+    def __init__(
+        self,
+        post: Callable[..., None],
+        disk_cache: PosterDiskCache,
+        base_url: str = DEFAULT_IMAGE_BASE_URL,
+        fetch: Callable[[str], bytes] = _download,
+        image_factory: Callable[[bytes], Any] = _photo_image,
+        size: Tuple[int, int] = THUMBNAIL_SIZE,
+        max_workers: int = DEFAULT_POSTER_WORKERS,
+        memory_size: int = MEMORY_CACHE_SIZE,
+    ) -> None:
+        """
+        Args:
+            post: Runs post(task, *args) on the Tk thread (e.g. GuiEventBus.post)
+            disk_cache: Thumbnail cache on disk
+            base_url: Image server URL the poster paths are appended to
+            fetch: Downloads an image URL, returning its bytes
+            image_factory: Builds the displayed image from PNG bytes (on the Tk thread)
+            size: Thumbnail bounding box in pixels
+            max_workers: Concurrent downloads
+            memory_size: Decoded images kept in memory
+        """
+        self.post = post
+        self.disk_cache = disk_cache
+        self.base_url = base_url or DEFAULT_IMAGE_BASE_URL
+        self.fetch = fetch
+        self.image_factory = image_factory
+        self.size = size
+        self.max_workers = max_workers
+        self.images = PhotoImageCache(memory_size)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Tk thread only: poster path -> (future, callbacks waiting for it)
+        self._pending: Dict[str, Tuple[Future, List[Callable[[Any], None]]]] = {}
+        # Posters that failed this session, not retried
+        self._failed: Set[str] = set()
+
+    def thumbnail_bytes(self, poster_path: str) -> Optional[bytes]:
+        """The PNG thumbnail of a poster, from the disk cache or downloaded (worker thread)"""
+        data = self.disk_cache.get(poster_path)
+        if data is not None:
+            return data
+        try:
+            data = make_thumbnail(self.fetch(poster_url(self.base_url, poster_path)), self.size)
+        except Exception as e:
+            logger.debug(f"Could not load poster {poster_path}: {e}")
+            return None
+        self.disk_cache.put(poster_path, data)
+        return data
+
+    def request(self, poster_path: str, callback: Callable[[Any], None]) -> Optional[Any]:
+        """
+        Get a poster's image (Tk thread).
+
+        Returns:
+            The image if it is already decoded; otherwise None, and callback(image)
+            is posted to the Tk thread once it is loaded (not at all if it fails)
+        """
+        image = self.images.get(poster_path)
+        if image is not None or poster_path in self._failed:
+            return image
+        pending = self._pending.get(poster_path)
+        if pending is not None:
+            pending[1].append(callback)
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="poster"
+            )
+        future = self._executor.submit(self._load, poster_path)
+        self._pending[poster_path] = (future, [callback])
+        return None
+
+    def retain(self, poster_paths: Iterable[str]) -> int:
+        """
+        Drop queued loads of posters not in poster_paths (e.g. rows scrolled
+        out of view); loads already running finish and are cached.
+
+        Returns:
+            Number of loads dropped
+        """
+        keep = set(poster_paths)
+        dropped = 0
+        for poster_path in [p for p in self._pending if p not in keep]:
+            if self._pending[poster_path][0].cancel():
+                del self._pending[poster_path]
+                dropped += 1
+        return dropped
+
+    def close(self) -> None:
+        """Stop the workers, dropping queued loads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
+    def _load(self, poster_path: str) -> None:
+        self.post(self._deliver, poster_path, self.thumbnail_bytes(poster_path))
+
+    def _deliver(self, poster_path: str, data: Optional[bytes]) -> None:
+        _, callbacks = self._pending.pop(poster_path, (None, []))
+        image = None
+        if data is not None:
+            try:
+                image = self.image_factory(data)
+            except Exception as e:
+                logger.debug(f"Could not decode poster {poster_path}: {e}")
+        if image is None:
+            self._failed.add(poster_path)
+            return
+        self.images.put(poster_path, image)
+        for callback in callbacks:
+            callback(image)
+
+
+def visible_rows(tree: Any, row_height: int) -> List[str]:
+    """Treeview items currently on screen, top to bottom"""
+    rows: List[str] = []
+    for y in range(row_height // 2, max(tree.winfo_height(), 0), row_height):
+        iid = tree.identify_row(y)
+        if iid and (not rows or rows[-1] != iid):
+            rows.append(iid)
+    return rows
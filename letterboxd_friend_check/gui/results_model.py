@@ -0,0 +1,186 @@
+"""
+Flat data model backing the virtualized results view.
+
+The results view only inserts one Treeview row per friend up front and
+materializes a friend's movies when that row is expanded. This module keeps
+the sorted data and the mapping between Treeview item ids and model rows so
+the GUI never needs a widget per movie.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set
+
+from letterboxd_friend_check.data.movie_index import FriendMovieIndex
+
+FRIEND_IID_PREFIX = "friend"
+MOVIE_IID_PREFIX = "movie"
+PLACEHOLDER_IID_SUFFIX = "placeholder"
+
+# Facet filters above the results view: (facet, label), facet names as
+# returned by movie_database.get_facet_counts
+RESULT_FACETS = (("genre", "Genre"), ("decade", "Decade"), ("runtime", "Runtime"))
+ALL_FACET_LABEL = "All"
+
+
+def facet_options(facet: str, counts: Dict[Any, int]) -> Dict[str, Optional[Any]]:
+    """
+    Combobox choices for one facet: {display label: facet value}.
+
+    The first choice is ALL_FACET_LABEL (no filter); the rest show their
+    counts, e.g. "Drama (12)" or "1990s (4)".
+    """
+    options: Dict[str, Optional[Any]] = {ALL_FACET_LABEL: None}
+    for value, count in counts.items():
+        name = f"{value}s" if facet == "decade" else str(value)
+        options[f"{name} ({count})"] = value
+    return options
+
+
+def filter_common_movies(
+    common_movies: Dict[str, Iterable[str]], keep: Collection[str]
+) -> Dict[str, List[str]]:
+    """Restrict each friend's common movies to those in keep"""
+    return {friend: [m for m in movies if m in keep] for friend, movies in common_movies.items()}
+
+
+def new_overlap_movies(
+    common_movies: Dict[str, Iterable[str]], new_overlaps: Dict[str, Collection[str]]
+) -> Dict[str, List[str]]:
+    """Restrict each friend's common movies to those newly in common with that friend"""
+    return {
+        friend: [m for m in movies if m in new_overlaps.get(friend, ())]
+        for friend, movies in common_movies.items()
+    }
+
+
+def new_overlaps_summary(new_overlaps: Dict[str, Collection[str]]) -> str:
+    """One-line description of the new overlaps per friend, largest first"""
+    if not any(new_overlaps.values()):
+        return "No new common movies since the last sync."
+    counts = sorted(
+        ((friend, len(movies)) for friend, movies in new_overlaps.items() if movies),
+        key=lambda item: (-item[1], item[0]),
+    )
+    total = sum(count for _, count in counts)
+    friends = ", ".join(f"{friend} ({count})" for friend, count in counts)
+    return f"{total} new common movies with {len(counts)} friends: {friends}"
+
+
+def search_common_movies(
+    common_movies: Dict[str, Iterable[str]],
+    index_for: Callable[[str], FriendMovieIndex],
+    term: str = "",
+    prefix: bool = False,
+    sort_column: str = "title",
+    descending: bool = False,
+    also_matching: Optional[Set[str]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Filter each friend's common movies by the search text and order them by a
+    column, using the friend's cached FriendMovieIndex (see FriendMovieIndex.search).
+
+    Returns:
+        {friend: movies in display order}
+    """
+    results = {}
+    for friend, movies in common_movies.items():
+        keep = set(movies)
+        matches = index_for(friend).search(
+            term,
+            common_only=True,
+            prefix=prefix,
+            sort_column=sort_column,
+            descending=descending,
+            also_matching=also_matching,
+        )
+        results[friend] = [movie.key for movie in matches if movie.key in keep]
+    return results
+
+
+@dataclass(frozen=True)
+class ResultRow:
+    """A single row of the results view (a friend header or a common movie)"""
+
+    friend: str
+    title: Optional[str] = None
+
+    @property
+    def is_movie(self) -> bool:
+        """True if this row represents a movie rather than a friend header"""
+        return self.title is not None
+
+
+class ResultsModel:
+    """Sorted, index-addressable view of the common movies per friend"""
+
+    def __init__(self, common_movies: Optional[Dict[str, Iterable[str]]] = None) -> None:
+        self.friends: List[str] = []
+        self._movies: Dict[str, List[str]] = {}
+        self.total_movies = 0
+        if common_movies:
+            self.load(common_movies)
+
+    def load(self, common_movies: Dict[str, Iterable[str]], sort: bool = True) -> None:
+        """
+        Replace the model contents with a {friend: movies} mapping; movies are
+        sorted by title unless sort is False (already in display order).
+        """
+        self.friends = sorted(friend for friend, movies in common_movies.items() if movies)
+        self._movies = {
+            friend: sorted(common_movies[friend]) if sort else list(common_movies[friend])
+            for friend in self.friends
+        }
+        self.total_movies = sum(len(movies) for movies in self._movies.values())
+
+    def __len__(self) -> int:
+        return self.total_movies
+
+    def movies_for(self, friend: str) -> List[str]:
+        """Common movies for a friend in display order (empty if unknown)"""
+        return self._movies.get(friend, [])
+
+    def rows(self) -> Iterator[ResultRow]:
+        """Iterate over all movie rows in display order"""
+        for friend in self.friends:
+            for title in self._movies[friend]:
+                yield ResultRow(friend, title)
+
+    # --- Treeview item id mapping ---
+    @staticmethod
+    def friend_iid(friend_index: int) -> str:
+        """Treeview item id for a friend header row"""
+        return f"{FRIEND_IID_PREFIX}:{friend_index}"
+
+    @staticmethod
+    def movie_iid(friend_index: int, movie_index: int) -> str:
+        """Treeview item id for a movie row"""
+        return f"{MOVIE_IID_PREFIX}:{friend_index}:{movie_index}"
+
+    @staticmethod
+    def placeholder_iid(friend_index: int) -> str:
+        """Item id of the dummy child that makes a collapsed friend row expandable"""
+        return f"{FRIEND_IID_PREFIX}:{friend_index}:{PLACEHOLDER_IID_SUFFIX}"
+
+    def row_for_iid(self, iid: str) -> Optional[ResultRow]:
+        """Resolve a Treeview item id back to its model row"""
+        parts = iid.split(":")
+        try:
+            if parts[0] == FRIEND_IID_PREFIX and len(parts) == 2:
+                return ResultRow(self.friends[int(parts[1])])
+            if parts[0] == MOVIE_IID_PREFIX and len(parts) == 3:
+                friend = self.friends[int(parts[1])]
+                return ResultRow(friend, self._movies[friend][int(parts[2])])
+        except (ValueError, IndexError, KeyError):
+            pass
+        return None
+
+    @staticmethod
+    def friend_index_for_iid(iid: str) -> Optional[int]:
+        """Friend index encoded in a friend or placeholder item id"""
+        parts = iid.split(":")
+        if parts[0] == FRIEND_IID_PREFIX and len(parts) >= 2:
+            try:
+                return int(parts[1])
+            except ValueError:
+                return None
+        return None
@@ -5,7 +5,6 @@ Contains class for configuring user preferences.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import requests
 import logging
 
 # Configure logging
@@ -133,6 +132,8 @@ class SetupDialog(tk.Toplevel):
         self.update_idletasks()
 
         try:
+            import requests
+
             # Test by fetching the user profile page
             session = requests.Session()
             response = session.get(f"https://letterboxd.com/{username}/")
@@ -0,0 +1,118 @@
+"""
+Sync timing report dialog.
+
+Shows where the time of the last sync went, from a
+utils.instrumentation report: totals per stage, per friend, and the
+slowest requests. The report can be exported as JSON.
+"""
+
+import json
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from typing import Any, Dict, List, Tuple
+
+from letterboxd_friend_check.utils.instrumentation import STAGES
+
+USER_STAGES = ("count", "pages", "throttle", "parse", "persist")
+
+
+def stage_rows(report: Dict[str, Any]) -> List[Tuple[str, str, int, str]]:
+    """(stage, seconds, count, share of wall time) rows, slowest first"""
+    wall = report.get("wall_seconds") or 0
+    rows = []
+    for stage, values in sorted(report["stages"].items(), key=lambda item: -item[1]["seconds"]):
+        share = f"{values['seconds'] / wall:.0%}" if wall else ""
+        rows.append((stage, f"{values['seconds']:.2f}", values["count"], share))
+    return rows
+
+
+def user_rows(report: Dict[str, Any]) -> List[Tuple]:
+    """(user, total, <one column per USER_STAGES>, requests, KB) rows, slowest first"""
+    rows = []
+    for user, entry in report["users"].items():
+        stages = entry["stages"]
+        rows.append(
+            (
+                user,
+                f"{entry['seconds']:.2f}",
+                *(f"{stages[s]['seconds']:.2f}" if s in stages else "" for s in USER_STAGES),
+                entry["requests"],
+                f"{entry['bytes'] / 1024:.0f}",
+            )
+        )
+    return rows
+
+
+class SyncReportDialog(tk.Toplevel):
+    """Dialog showing a sync timing report"""
+
+    def __init__(self, parent, report: Dict[str, Any]):
+        super().__init__(parent)
+        self.report = report
+        self.title("Sync Timing Report")
+        self.geometry("720x520")
+        self.transient(parent)
+        self.create_widgets()
+
+    def create_widgets(self):
+        frame = ttk.Frame(self, padding=10)
+        frame.pack(fill="both", expand=True)
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(3, weight=1)
+
+        requests = self.report["requests"]
+        cache_hits = ", ".join(f"{k}: {v}" for k, v in self.report["cache_hits"].items())
+        summary = (
+            f"Total {self.report['wall_seconds']:.1f}s  |  {requests['count']} requests, "
+            f"{requests['bytes'] / 1_048_576:.2f} MB, {requests['seconds']:.1f}s on the network"
+            f"  |  rate limited (429): {requests['by_status'].get('429', 0)}"
+            f"  |  cache hits: {cache_hits or 'none'}"
+        )
+        ttk.Label(frame, text=summary, wraplength=680).grid(row=0, column=0, sticky="w")
+
+        stages = ttk.Treeview(
+            frame, columns=("seconds", "count", "share"), height=len(STAGES), selectmode="none"
+        )
+        stages.heading("#0", text="Stage")
+        for column, title in (("seconds", "Seconds"), ("count", "Count"), ("share", "Of total")):
+            stages.heading(column, text=title)
+            stages.column(column, width=90, anchor="e")
+        for stage, seconds, count, share in stage_rows(self.report):
+            stages.insert("", "end", text=stage, values=(seconds, count, share))
+        stages.grid(row=1, column=0, sticky="ew", pady=(10, 10))
+
+        ttk.Label(frame, text="Per friend (seconds)").grid(row=2, column=0, sticky="w")
+        columns = ("total",) + USER_STAGES + ("requests", "kb")
+        users = ttk.Treeview(frame, columns=columns, selectmode="browse")
+        users.heading("#0", text="User")
+        users.column("#0", width=140)
+        for column in columns:
+            users.heading(column, text="KB" if column == "kb" else column.capitalize())
+            users.column(column, width=64, anchor="e")
+        for user, *values in user_rows(self.report):
+            users.insert("", "end", text=user, values=values)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=users.yview)
+        users.configure(yscrollcommand=scrollbar.set)
+        users.grid(row=3, column=0, sticky="nsew")
+        scrollbar.grid(row=3, column=1, sticky="ns")
+
+        buttons = ttk.Frame(frame)
+        buttons.grid(row=4, column=0, sticky="e", pady=(10, 0))
+        ttk.Button(buttons, text="Export JSON...", command=self.export_json).pack(side="left")
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side="left", padx=(5, 0))
+
+    def export_json(self):
+        """Save the report as a JSON file"""
+        filename = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export Sync Report",
+            defaultextension=".json",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
+        )
+        if not filename:
+            return
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(self.report, f, indent=2)
+        except OSError as e:
+            messagebox.showerror("Export Error", f"Error exporting report: {e}", parent=self)
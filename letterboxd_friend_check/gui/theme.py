@@ -0,0 +1,116 @@
+"""
+Theme palettes and the registry of raw Tk widgets that follow the theme.
+
+ttk widgets pick up theme changes through ttk.Style. The few classic Tk
+widgets (Text, Canvas, Menu) can't, so they register here when created and
+a theme change reconfigures only those widgets instead of walking the whole
+widget tree.
+"""
+
+import logging
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+THEME_COLORS = {
+    "dark": {
+        "bg": "#0d1117",  # Very dark background (GitHub dark)
+        "fg": "#f0f6fc",  # Light text for maximum contrast
+        "select_bg": "#404040",  # Selection background
+        "select_fg": "#ffffff",  # Selection text
+        "entry_bg": "#ffffff",  # Entry field background - white for black text visibility
+        "entry_fg": "#000000",  # Entry field text - black for readability
+        "canvas_bg": "#0d1117",  # Canvas background
+        "frame_bg": "#0d1117",  # Frame background
+        "button_bg": "#58a6ff",  # Bright blue background for high contrast
+        "button_fg": "#000000",  # Black text for maximum contrast
+        "menu_bg": "#0d1117",  # Menu background
+        "menu_fg": "#f0f6fc",  # Menu text
+        "highlight": "#404040",  # Dark gray for selected elements
+        "tab_selected_bg": "#e6e6e6",  # Light gray for black text visibility
+        "tab_selected_fg": "#000000",  # Selected tab text - black (same as light mode)
+        "tab_active_bg": "#58a6ff",  # Bright blue for active tabs
+        "tab_active_fg": "#000000",  # Black text for contrast
+    },
+    "light": {
+        "bg": "#ffffff",  # White background
+        "fg": "#24292f",  # Dark gray text for better readability
+        "select_bg": "#0969da",  # Selection background
+        "select_fg": "#ffffff",  # Selection text
+        "entry_bg": "#ffffff",  # Entry field background
+        "entry_fg": "#24292f",  # Entry field text
+        "canvas_bg": "#ffffff",  # Canvas background
+        "frame_bg": "#f6f8fa",  # Very light gray frame background
+        "button_bg": "#f6f8fa",  # Button background
+        "button_fg": "#24292f",  # Button text
+        "menu_bg": "#ffffff",  # Menu background
+        "menu_fg": "#24292f",  # Menu text
+        "highlight": "#e6e6e6",  # Light gray for selected elements
+        "tab_selected_bg": "#e6e6e6",  # Selected tab - light gray background
+        "tab_selected_fg": "#000000",  # Selected tab text - black (like unselected)
+        "tab_active_bg": "#d0d7de",  # Active tab background
+        "tab_active_fg": "#24292f",  # Active tab text
+    },
+}
+
+# Widget options applied per role, derived from a theme palette
+ROLE_OPTIONS: Dict[str, Callable[[Dict[str, str]], Dict[str, str]]] = {
+    "text": lambda colors: {
+        "bg": colors["entry_bg"],
+        "fg": colors["entry_fg"],
+        "insertbackground": colors["fg"],
+        "selectbackground": colors["highlight"],
+        "selectforeground": colors["select_fg"],
+    },
+    "canvas": lambda colors: {"bg": colors["canvas_bg"]},
+    "menu": lambda colors: {"bg": colors["menu_bg"], "fg": colors["menu_fg"]},
+}
+
+
+class ThemeRegistry:
+    """Tracks raw Tk widgets by role and applies palette colors to them"""
+
+    def __init__(self) -> None:
+        self._widgets: Dict[str, tuple] = {}
+        self.colors: Optional[Dict[str, str]] = None
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    def register(self, widget: Any, role: str) -> None:
+        """
+        Track a widget and style it with the current palette (if one is set).
+
+        Args:
+            widget: A Tk widget supporting configure()
+            role: One of the keys of ROLE_OPTIONS
+        """
+        if role not in ROLE_OPTIONS:
+            raise ValueError(f"Unknown theme role: {role}")
+        key = str(widget)
+        self._widgets[key] = (widget, role)
+        try:
+            widget.bind("<Destroy>", lambda e, k=key: self._forget(e, k), add="+")
+        except (AttributeError, tk.TclError):
+            pass
+        if self.colors is not None:
+            self._configure(key, widget, role, self.colors)
+
+    def apply(self, colors: Dict[str, str]) -> None:
+        """Apply a palette to every registered widget"""
+        self.colors = colors
+        for key, (widget, role) in list(self._widgets.items()):
+            self._configure(key, widget, role, colors)
+
+    def _configure(self, key: str, widget: Any, role: str, colors: Dict[str, str]) -> None:
+        try:
+            widget.configure(**ROLE_OPTIONS[role](colors))
+        except tk.TclError:
+            # Widget was destroyed without us noticing
+            self._widgets.pop(key, None)
+
+    def _forget(self, event: Any, key: str) -> None:
+        # Menus and toplevels also see <Destroy> for their children
+        if str(getattr(event, "widget", key)) == key:
+            self._widgets.pop(key, None)
@@ -0,0 +1,401 @@
+"""
+Optional asyncio scraping backend for the Letterboxd Friend Check application.
+
+AsyncLetterboxdClient fetches watchlist and follow-list pages with aiohttp
+over one keep-alive connection pool. After the first page of a listing
+reveals how many pages there are, the remaining pages are fetched
+concurrently, bounded by a semaphore and paced by the same RateLimiter the
+blocking scraper uses. Pages are parsed with the shared parsers in
+letterboxd_friend_check.utils.web, so both backends return identical results.
+
+AsyncBackend wraps a client in a private event loop thread and exposes
+blocking methods with the signatures of web.get_watchlist, web.get_friends
+and web.get_watchlist_count, so it plugs straight into SyncEngine (including
+the sync journal: pages are reported in page order, so interrupted fetches
+resume like blocking ones). Every worker thread shares the one loop, so
+hundreds of page fetches can be in flight without a thread per request.
+
+aiohttp is optional: without it, is_available() returns False and the
+blocking backend should be used.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from letterboxd_friend_check.utils import instrumentation, web
+from letterboxd_friend_check.utils.rate_limit import RateLimiter
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Page requests in flight at once per client
+DEFAULT_MAX_CONCURRENCY = 16
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_SECONDS = 30
+
+T = TypeVar("T")
+
+
+def is_available() -> bool:
+    """Whether aiohttp is installed"""
+    return aiohttp is not None
+
+
+class AsyncLetterboxdClient:
+    """
+    Concurrent Letterboxd page fetcher (use as an async context manager).
+
+    Cancellation is cooperative: once cancel_event is set, requests that have
+    not started yet are skipped and the listing calls return what they have.
+    """
+
+    def __init__(
+        self,
+        base_url: str = web.BASE_URL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: float = 10,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Args:
+            base_url: Site root (overridable for tests)
+            max_concurrency: Requests in flight at once (also the pool size)
+            rate_limiter: Limiter pacing every request; falls back to the one
+                set with web.set_rate_limiter() if None
+            timeout: Total seconds allowed per request
+            cancel_event: Set it to stop issuing new requests
+        """
+        if aiohttp is None:
+            raise ImportError("The asyncio backend requires aiohttp (pip install aiohttp)")
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.cancel_event = cancel_event or threading.Event()
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncLetterboxdClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """Create the pooled HTTP session (called by `async with`)"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency, keepalive_timeout=KEEPALIVE_SECONDS
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": web.DEFAULT_USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested"""
+        return self.cancel_event.is_set()
+
+    async def fetch(
+        self, url: str, cancel_event: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """
+        GET a page through the pool, semaphore and rate limiter.
+
+        Args:
+            url: Page URL
+            cancel_event: Skips the request once set, like the client's cancel_event
+
+        Returns:
+            The page body, or None on cancellation or any HTTP/network error
+        """
+        if self._session is None:
+            await self.open()
+        async with self._semaphore:
+            limiter = self.rate_limiter or web.get_rate_limiter()
+            if limiter is not None:
+                wait = limiter.reserve()
+                if wait:
+                    instrumentation.add_time("throttle", wait, instrumentation.classify_url(url)[0])
+                    await asyncio.sleep(wait)
+            if self.cancelled or (cancel_event is not None and cancel_event.is_set()):
+                return None
+            status = None
+            nbytes = 0
+            start = time.perf_counter()
+            try:
+                async with self._session.get(url) as response:
+                    status = response.status
+                    if status == 429:
+                        logger.warning(f"Rate limited by Letterboxd (429) on {url}")
+                        return None
+                    if status >= 400:
+                        logger.error(f"HTTP error {status} fetching {url}")
+                        return None
+                    body = await response.read()
+                    nbytes = len(body)
+                    return body.decode(response.get_encoding(), errors="replace")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            finally:
+                web.notify_request_listeners(url, status, time.perf_counter() - start, nbytes)
+
+    async def _paginate(
+        self,
+        path: str,
+        parse: Callable[[str], List[str]],
+        max_items: Optional[int] = None,
+        on_page: Optional[Callable[[int, str, List[str]], None]] = None,
+        start_page: int = 1,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Tuple[List[List[str]], bool]:
+        """
+        Fetch every page of a listing from start_page on, that page first and
+        the rest concurrently.
+
+        Args:
+            path: Listing path without the page suffix, e.g. "/amy/watchlist"
+            parse: Extracts the items from a page
+            max_items: Only fetch the pages needed for this many items (the
+                page size is taken from the first page)
+            on_page: Called as on_page(page, html, items) in page order; pages
+                after one that failed are not reported, so a checkpoint taken
+                in on_page never skips a page
+            start_page: First page to fetch (to resume an interrupted fetch)
+            cancel_event: Stops this call's requests once set
+
+        Returns:
+            (the items of each fetched page in page order, complete); complete
+            is False if any page failed or was skipped by cancellation
+        """
+        url = f"{self.base_url}{path}/page/{{}}/"
+        user = path.strip("/").split("/")[0]
+
+        first_page = max(1, start_page)
+        pages: Dict[int, List[str]] = {}
+        bodies: Dict[int, str] = {}
+        failed: Set[int] = set()
+        reported = first_page - 1
+
+        def timed_parse(page_html: str) -> List[str]:
+            with instrumentation.stage("parse", user):
+                return parse(page_html)
+
+        def report() -> None:
+            # Hand over the pages that now follow on from the last one reported
+            nonlocal reported
+            while reported + 1 in pages:
+                reported += 1
+                page_html = bodies.pop(reported)
+                if on_page:
+                    on_page(reported, page_html, pages[reported])
+
+        async def load(page: int) -> Optional[str]:
+            page_html = await self.fetch(url.format(page), cancel_event)
+            if page_html is None:
+                failed.add(page)
+                return None
+            pages[page] = timed_parse(page_html)
+            bodies[page] = page_html
+            report()
+            return page_html
+
+        html = await load(first_page)
+        if html is None:
+            return [], False
+        first = pages[first_page]
+        if not first:
+            return [], True
+
+        last = max(web.parse_last_page(html), first_page)
+        max_pages = first_page - 1 + -(-max_items // len(first)) if max_items else None
+        if max_pages:
+            last = min(last, max_pages)
+
+        await asyncio.gather(*(load(page) for page in range(first_page + 1, last + 1)))
+
+        # Without pagination links (or when they undercount) continue one page
+        # at a time, like the blocking scraper, until an empty page
+        page = last
+        while (
+            pages.get(page)
+            and not self.cancelled
+            and not (cancel_event is not None and cancel_event.is_set())
+            and (not max_pages or page < max_pages)
+        ):
+            page += 1
+            await load(page)
+        # Complete: no page failed and the listing ran out (or reached max_items)
+        complete = not failed and (not pages.get(page) or page == max_pages)
+        return [pages[page] for page in sorted(pages)], complete
+
+    async def get_watchlist_count(self, username: str) -> Optional[int]:
+        """Total number of films in a user's watchlist, or None"""
+        html = await self.fetch(f"{self.base_url}/{username}/watchlist/")
+        return web.parse_watchlist_count(html) if html else None
+
+    async def get_watchlist(
+        self,
+        username: str,
+        limit: Optional[int] = None,
+        progress_callback: Optional[web.PageProgressCallback] = None,
+        total_count: Optional[int] = None,
+        start_page: int = 1,
+        on_page: Optional[web.PageCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Set[str]:
+        """
+        Fetch a user's watchlist (same contract as web.get_watchlist, without
+        console output).
+
+        The count is read from the first page instead of a separate request.
+        on_page(page, titles) is called in page order, ending with the empty
+        page after the last one, so SyncEngine journals async fetches too.
+        """
+        fetched = 0
+        total = total_count
+
+        def page_done(page: int, html: str, titles: List[str]) -> None:
+            nonlocal fetched, total
+            if total is None:
+                total = web.parse_watchlist_count(html)
+            fetched += len(titles)
+            if progress_callback:
+                progress_callback(min(fetched, limit) if limit else fetched, total)
+            if on_page:
+                on_page(page, titles)
+
+        pages, _ = await self._paginate(
+            f"/{username}/watchlist",
+            web.parse_watchlist_page,
+            limit,
+            page_done,
+            start_page,
+            cancel_event,
+        )
+
+        movies: Set[str] = set()
+        for titles in pages:
+            for title in titles:
+                movies.add(title)
+                if limit and len(movies) >= limit:
+                    break
+            if limit and len(movies) >= limit:
+                break
+        logger.info(f"Finished fetching watchlist for {username}. Total movies: {len(movies)}.")
+        return movies
+
+    async def get_friends(self, username: str, strict: bool = False) -> Set[str]:
+        """
+        Fetch every user `username` follows (same contract as web.get_friends).
+
+        With strict, a failed or cancelled page raises web.FriendsFetchError
+        instead of returning the friends found so far.
+        """
+        pages, complete = await self._paginate(
+            f"/{username}/following", lambda html: web.parse_friends_page(html, username)
+        )
+        friends = {friend for page in pages for friend in page}
+        if not complete:
+            message = f"Follow list of {username} is incomplete ({len(friends)} friends fetched)"
+            if strict:
+                raise web.FriendsFetchError(message)
+            logger.warning(message)
+        logger.info(f"Finished fetching friends for {username}. Total: {len(friends)}.")
+        return friends
+
+
+class AsyncBackend:
+    """
+    Blocking facade over AsyncLetterboxdClient.
+
+    The client runs on a private event loop thread; the methods below may be
+    called from any number of threads and block until their result is ready.
+    Call close() (or use it as a context manager) to stop the loop.
+    """
+
+    def __init__(self, **client_kwargs) -> None:
+        """
+        Args:
+            **client_kwargs: Passed to AsyncLetterboxdClient
+        """
+        self.client = AsyncLetterboxdClient(**client_kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="letterboxd-async", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "AsyncBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self, coro: Awaitable[T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def cancel(self) -> None:
+        """Stop issuing new requests; calls in progress return partial results"""
+        self.client.cancel_event.set()
+
+    def get_watchlist_count(self, username: str) -> Optional[int]:
+        """Blocking web.get_watchlist_count"""
+        return self._run(self.client.get_watchlist_count(username))
+
+    def get_watchlist(
+        self,
+        username: str,
+        limit: Optional[int] = None,
+        progress_callback: Optional[web.PageProgressCallback] = None,
+        total_count: Optional[int] = None,
+        start_page: int = 1,
+        on_page: Optional[web.PageCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Set[str]:
+        """Blocking web.get_watchlist (progress_callback and on_page run on the loop thread)"""
+        return self._run(
+            self.client.get_watchlist(
+                username, limit, progress_callback, total_count, start_page, on_page, cancel_event
+            )
+        )
+
+    def get_friends(self, username: str, strict: bool = False) -> Set[str]:
+        """Blocking web.get_friends"""
+        return self._run(self.client.get_friends(username, strict))
+
+    def close(self) -> None:
+        """Close the client and stop the event loop thread"""
+        if self._loop.is_closed():
+            return
+        self._run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def engine_fetchers(self) -> Dict[str, Callable]:
+        """Keyword arguments that make a SyncEngine use this backend"""
+        return {
+            "fetch_watchlist": self.get_watchlist,
+            "fetch_watchlist_count": self.get_watchlist_count,
+            "fetch_friends": self.get_friends,
+        }
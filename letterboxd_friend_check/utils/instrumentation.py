@@ -0,0 +1,253 @@
+"""
+Sync instrumentation: per-request and per-stage timings.
+
+A SyncInstrumentation recorder collects, while it is active, every HTTP
+request made through the shared scraping session (latency, bytes, status)
+and the time spent in each sync stage per user:
+
+    count    watchlist size requests
+    pages    watchlist page requests
+    throttle rate-limit and polite delays between requests
+    parse    HTML parsing
+    persist  database writes
+    compare  watchlist comparison
+    enrich   movie detail lookups
+
+The scrapers, engine and database callers report through the module-level
+functions below, which do nothing when no recorder is active, so the hooks
+cost nothing outside an instrumented sync. report() returns a
+JSON-serializable summary; to_json() writes it to a file.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+STAGES = ("count", "pages", "throttle", "parse", "persist", "compare", "enrich")
+
+# Slowest requests kept in the report
+SLOWEST_REQUESTS = 10
+
+
+@dataclass(frozen=True)
+class RequestRecord:
+    """One finished HTTP request"""
+
+    url: str
+    status: Optional[int]
+    seconds: float
+    bytes: int = 0
+    user: str = ""
+    kind: str = "other"
+
+
+def classify_url(url: str) -> tuple:
+    """
+    (user, kind) for a Letterboxd URL; kind is "count", "pages", "friends",
+    "watched" or "other"
+    """
+    parts = urlparse(url).path.strip("/").split("/")
+    user = parts[0] if parts and parts[0] else ""
+    if len(parts) >= 2 and parts[1] == "watchlist":
+        return user, "pages" if "page" in parts[2:] else "count"
+    if len(parts) >= 2 and parts[1] in ("following", "followers"):
+        return user, "friends"
+    if len(parts) >= 2 and parts[1] == "films":
+        return user, "watched"
+    return user, "other"
+
+
+class SyncInstrumentation:
+    """Collects request and stage timings while active (use as a context manager)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests: List[RequestRecord] = []
+        # stage -> user -> [seconds, count]
+        self._stages: Dict[str, Dict[str, List[float]]] = {}
+        self.cache_hits: Dict[str, int] = {}
+        self.started_at: Optional[str] = None
+        self._start: Optional[float] = None
+        self._end: Optional[float] = None
+
+    # --- Activation ---
+    def start(self) -> "SyncInstrumentation":
+        """Start receiving events from the module-level hooks"""
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._start = time.perf_counter()
+        self._end = None
+        activate(self)
+        return self
+
+    def stop(self) -> None:
+        """Stop receiving events"""
+        deactivate(self)
+        if self._start is not None and self._end is None:
+            self._end = time.perf_counter()
+
+    def __enter__(self) -> "SyncInstrumentation":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # --- Recording ---
+    def record_request(
+        self,
+        url: str,
+        status: Optional[int],
+        seconds: float,
+        nbytes: int = 0,
+    ) -> None:
+        """Record a finished request; watchlist requests also count toward their stage"""
+        user, kind = classify_url(url)
+        record = RequestRecord(url, status, seconds, nbytes, user, kind)
+        with self._lock:
+            self.requests.append(record)
+        if kind in ("count", "pages"):
+            self.add_time(kind, seconds, user)
+
+    def add_time(self, stage: str, seconds: float, user: Optional[str] = None) -> None:
+        """Add time spent in a stage, attributed to a user ("" for the whole run)"""
+        with self._lock:
+            entry = self._stages.setdefault(stage, {}).setdefault(user or "", [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def record_cache_hit(self, kind: str) -> None:
+        """Count work avoided, e.g. a watchlist reused from the database"""
+        with self._lock:
+            self.cache_hits[kind] = self.cache_hits.get(kind, 0) + 1
+
+    # --- Reporting ---
+    @property
+    def wall_seconds(self) -> float:
+        if self._start is None:
+            return 0.0
+        return (self._end or time.perf_counter()) - self._start
+
+    def report(self) -> Dict[str, Any]:
+        """JSON-serializable summary of everything recorded"""
+        with self._lock:
+            requests = list(self.requests)
+            stages = {stage: dict(users) for stage, users in self._stages.items()}
+            cache_hits = dict(self.cache_hits)
+
+        by_status: Dict[str, int] = {}
+        for record in requests:
+            key = str(record.status) if record.status is not None else "error"
+            by_status[key] = by_status.get(key, 0) + 1
+
+        stage_totals = {}
+        users: Dict[str, Dict[str, Any]] = {}
+        for stage in list(STAGES) + sorted(set(stages) - set(STAGES)):
+            if stage not in stages:
+                continue
+            stage_totals[stage] = {
+                "seconds": round(sum(v[0] for v in stages[stage].values()), 4),
+                "count": sum(v[1] for v in stages[stage].values()),
+            }
+            for user, (seconds, count) in stages[stage].items():
+                if user:
+                    entry = users.setdefault(user, {"stages": {}, "requests": 0, "bytes": 0})
+                    entry["stages"][stage] = {"seconds": round(seconds, 4), "count": count}
+        for record in requests:
+            if record.user in users:
+                users[record.user]["requests"] += 1
+                users[record.user]["bytes"] += record.bytes
+        for entry in users.values():
+            entry["seconds"] = round(sum(s["seconds"] for s in entry["stages"].values()), 4)
+
+        slowest = sorted(requests, key=lambda record: record.seconds, reverse=True)
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "requests": {
+                "count": len(requests),
+                "bytes": sum(record.bytes for record in requests),
+                "seconds": round(sum(record.seconds for record in requests), 4),
+                "by_status": by_status,
+                "slowest": [asdict(record) for record in slowest[:SLOWEST_REQUESTS]],
+            },
+            "stages": stage_totals,
+            "cache_hits": cache_hits,
+            "users": dict(sorted(users.items(), key=lambda item: -item[1]["seconds"])),
+        }
+
+    def summary_line(self) -> str:
+        """One-line summary for status bars, e.g. "12.3s: pages 8.1s, throttle 3.0s, ..." """
+        report = self.report()
+        parts = [
+            f"{stage} {values['seconds']:.1f}s"
+            for stage, values in sorted(
+                report["stages"].items(), key=lambda item: -item[1]["seconds"]
+            )
+        ]
+        requests = report["requests"]
+        parts.append(f"{requests['count']} requests, {requests['bytes'] / 1_048_576:.1f} MB")
+        return f"{report['wall_seconds']:.1f}s: " + ", ".join(parts)
+
+    def to_json(self, path: str) -> None:
+        """Write report() to a JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+# --- Module-level hooks ---
+_active: List[SyncInstrumentation] = []
+_active_lock = threading.Lock()
+
+
+def activate(recorder: SyncInstrumentation) -> None:
+    """Send hook events to recorder (several recorders may be active)"""
+    with _active_lock:
+        if recorder not in _active:
+            _active.append(recorder)
+
+
+def deactivate(recorder: SyncInstrumentation) -> None:
+    """Stop sending hook events to recorder"""
+    with _active_lock:
+        if recorder in _active:
+            _active.remove(recorder)
+
+
+def record_request(
+    url: str,
+    status: Optional[int],
+    seconds: float,
+    nbytes: int = 0,
+) -> None:
+    """Report a finished request to the active recorders"""
+    for recorder in list(_active):
+        recorder.record_request(url, status, seconds, nbytes)
+
+
+def add_time(stage: str, seconds: float, user: Optional[str] = None) -> None:
+    """Report time spent in a stage to the active recorders"""
+    for recorder in list(_active):
+        recorder.add_time(stage, seconds, user)
+
+
+def record_cache_hit(kind: str) -> None:
+    """Report work avoided to the active recorders"""
+    for recorder in list(_active):
+        recorder.record_cache_hit(kind)
+
+
+@contextmanager
+def stage(name: str, user: Optional[str] = None) -> Iterator[None]:
+    """Time the enclosed block as stage `name` (free when nothing is recording)"""
+    if not _active:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time(name, time.perf_counter() - start, user)
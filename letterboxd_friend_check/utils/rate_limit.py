@@ -0,0 +1,70 @@
+"""
+Thread-safe rate limiting for requests to Letterboxd.
+
+A single RateLimiter can be shared by every worker thread of a sync run so
+the combined request rate stays polite no matter how many threads fetch
+pages concurrently. The asyncio backend awaits RateLimiter.reserve() delays
+instead of blocking, so one limiter can also pace coroutines.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Token bucket: at most `rate` requests per second, with bursts of `burst`"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            rate: Sustained requests per second (must be positive)
+            burst: Requests allowed back-to-back after an idle period
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """
+        Reserve the next request slot without waiting.
+
+        Returns:
+            Seconds the caller must wait before making the request
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token now; a negative balance is the queue of waiters
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited_seconds += wait
+        return wait
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be made.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait:
+            self._sleep(wait)
+        return wait
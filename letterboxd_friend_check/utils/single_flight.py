@@ -0,0 +1,85 @@
+"""
+Single-flight call registry.
+
+Concurrent callers asking for the same key share one execution: the first
+caller runs the function, the others wait for its result. Successful results
+are kept for the lifetime of the registry (typically one sync run), so later
+callers get them without running the function again. Failures are not
+cached; the next caller retries.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Flight:
+    """An in-progress call that other callers can wait on"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent and repeated calls by key"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._results: Dict[Hashable, Any] = {}
+        self.executed = 0
+        self.joined = 0
+        self.reused = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Return func()'s result for key, running it at most once at a time.
+
+        Args:
+            key: Identity of the call (e.g. a username)
+            func: Computes the value; only called by the first caller
+
+        Returns:
+            The (possibly shared) result
+        """
+        with self._lock:
+            if key in self._results:
+                self.reused += 1
+                return self._results[key]
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+                self.executed += 1
+            else:
+                self.joined += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = func()
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if flight.error is None:
+                    self._results[key] = flight.value
+            flight.done.set()
+
+    def forget(self, key: Hashable) -> None:
+        """Drop a stored result so the next call runs again"""
+        with self._lock:
+            self._results.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of executed, joined (waited on in-flight) and reused calls"""
+        with self._lock:
+            return {"executed": self.executed, "joined": self.joined, "reused": self.reused}
@@ -6,13 +6,17 @@ and user data from Letterboxd. All functionality works without requiring authent
 as Letterboxd allows unauthenticated access to public user data.
 """
 
+import json
 import time
 import random
 import re
 import logging
-import requests
-from bs4 import BeautifulSoup
-from typing import Set, List, Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from letterboxd_friend_check.utils import instrumentation
+from letterboxd_friend_check.utils.rate_limit import RateLimiter
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -23,10 +27,198 @@ DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (compatible; LetterboxdWatchlistBot/1.0; +https://github.com/yourusername)"
 )
 
-# Global session for requests
-session = requests.Session()
-# Set default headers
-session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+# Called as progress_callback(fetched, total) once per fetched page
+PageProgressCallback = Callable[[int, Optional[int]], None]
+# Called as on_page(page_number, titles) after each watchlist page; the page
+# that ends the listing is reported with no titles
+PageCallback = Callable[[int, List[str]], None]
+# Called as listener(url, status_code, elapsed_seconds) after every request;
+# status_code is None when the request failed without a response
+RequestListener = Callable[[str, Optional[int], float], None]
+
+# Concurrent page fetches for one follow list
+DEFAULT_FRIENDS_WORKERS = 4
+# Follow-list pages per second when no shared rate limiter is set (the
+# serial fetch used to sleep 0.5-1.5s between pages)
+FRIENDS_PAGE_RATE = 1.0
+
+
+class FriendsFetchError(Exception):
+    """A follow list could not be fetched completely"""
+
+
+class WatchedFetchError(Exception):
+    """A user's watched films could not be fetched completely"""
+
+
+# Shared requests session, created on first use. requests and BeautifulSoup are
+# imported lazily so importing this module (and the GUI) stays cheap.
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+
+                _session = requests.Session()
+                _session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    return _session
+
+
+# Optional limiter shared by all threads; when set it replaces the fixed
+# per-page sleeps, so concurrent fetches stay under one combined rate
+_rate_limiter: Optional[RateLimiter] = None
+_request_listeners: List[RequestListener] = []
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Route every request through a shared RateLimiter (None restores the fixed delays)"""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """The shared RateLimiter, or None when fixed per-page delays are used"""
+    return _rate_limiter
+
+
+def add_request_listener(listener: RequestListener) -> None:
+    """Register a callback invoked after every HTTP request"""
+    _request_listeners.append(listener)
+
+
+def remove_request_listener(listener: RequestListener) -> None:
+    """Unregister a request callback"""
+    try:
+        _request_listeners.remove(listener)
+    except ValueError:
+        pass
+
+
+def _http_get(url: str, limiter: Optional[RateLimiter] = None, **kwargs: Any) -> Any:
+    """GET through the shared session, honouring the rate limiter and listeners"""
+    limiter = limiter or _rate_limiter
+    if limiter is not None:
+        with instrumentation.stage("throttle", instrumentation.classify_url(url)[0]):
+            limiter.acquire()
+    status = None
+    nbytes = 0
+    start = time.perf_counter()
+    try:
+        response = get_session().get(url, **kwargs)
+        status = response.status_code
+        nbytes = len(response.content)
+        return response
+    finally:
+        notify_request_listeners(url, status, time.perf_counter() - start, nbytes)
+
+
+def notify_request_listeners(
+    url: str,
+    status: Optional[int],
+    elapsed: float,
+    nbytes: int = 0,
+) -> None:
+    """
+    Report a finished request to every registered listener and to the
+    active sync instrumentation (which also receives the response size)
+    """
+    for listener in list(_request_listeners):
+        try:
+            listener(url, status, elapsed)
+        except Exception as e:
+            logger.debug(f"Request listener failed: {e}")
+    instrumentation.record_request(url, status, elapsed, nbytes)
+
+
+def _polite_delay(low: float, high: float, username: Optional[str] = None) -> None:
+    """Sleep between pages unless a shared rate limiter already paces requests"""
+    if _rate_limiter is None:
+        # nosec B311: random used for rate limiting, not cryptography
+        sleep_time = random.uniform(low, high)  # nosec B311
+        logger.debug(f"Sleeping for {sleep_time:.2f} seconds to avoid rate limiting.")
+        with instrumentation.stage("throttle", username):
+            time.sleep(sleep_time)
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `web.session` working for callers of the old module-level session
+    if name == "session":
+        return get_session()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_cookies_from_json(session_obj: Any, cookie_path: str) -> None:
+    """Loads cookies from a JSON file and adds them to a requests session."""
+    try:
+        with open(cookie_path, "r") as f:
+            cookies = json.load(f)
+            for cookie in cookies:
+                session_obj.cookies.set(cookie["name"], cookie["value"])
+    except Exception as e:
+        logger.error(f"Error loading cookies from {cookie_path}: {e}")
+
+
+# --- Page parsers (shared by the blocking and the asyncio backends) ---
+def parse_watchlist_count(html: str) -> Optional[int]:
+    """Total watchlist size from the js-watchlist-count element, or None"""
+    from bs4 import BeautifulSoup
+
+    count_tag = BeautifulSoup(html, "html.parser").find("span", class_="js-watchlist-count")
+    if count_tag:
+        # Extract digits from text, e.g. '7,727 films' or '7,727\u00a0films'
+        match = re.search(r"([\d,]+)", count_tag.text)
+        if match:
+            return int(match.group(1).replace(",", ""))
+    return None
+
+
+def parse_watchlist_page(html: str) -> List[str]:
+    """Film titles on one watchlist page, in page order"""
+    from bs4 import BeautifulSoup
+
+    titles = []
+    for item in BeautifulSoup(html, "html.parser").select("li.poster-container"):
+        anchor = item.find("a", attrs={"data-film-name": True})
+        if anchor:
+            title = anchor.get("data-film-name")
+        else:
+            img = item.find("img", alt=True)
+            title = img.get("alt") if img else None
+        if title:
+            titles.append(title)
+    return titles
+
+
+def parse_friends_page(html: str, username: str = "") -> List[str]:
+    """Usernames on one following page (excluding `username` itself)"""
+    from bs4 import BeautifulSoup
+
+    friends = []
+    for div in BeautifulSoup(html, "html.parser").select(".person-summary"):
+        a_tag = div.find("a", class_="avatar")
+        if a_tag and a_tag.has_attr("href"):
+            friend_username = a_tag["href"].strip("/").split("/")[0]
+            if friend_username and friend_username != username:
+                friends.append(friend_username)
+    return friends
+
+
+def parse_last_page(html: str) -> int:
+    """Highest page number in a paginated listing (1 if there is no pagination)"""
+    from bs4 import BeautifulSoup
+
+    pages = [
+        int(link.text.strip())
+        for link in BeautifulSoup(html, "html.parser").select(".paginate-pages li a")
+        if link.text.strip().isdigit()
+    ]
+    return max(pages, default=1)
 
 
 def get_watchlist_count(username: str) -> Optional[int]:
@@ -43,40 +235,53 @@ def get_watchlist_count(username: str) -> Optional[int]:
     url = f"{BASE_URL}/{username}/watchlist/"
     headers = {"User-Agent": DEFAULT_USER_AGENT}
     try:
-        response = session.get(url, headers=headers, timeout=10)
+        response = _http_get(url, headers=headers, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        count_tag = soup.find("span", class_="js-watchlist-count")
-        if count_tag:
-            # Extract digits from text, e.g. '7,727 films' or '7,727\u00a0films'
-            match = re.search(r"([\d,]+)", count_tag.text)
-            if match:
-                count_str = match.group(1).replace(",", "")
-                return int(count_str)
-        return None
+        return parse_watchlist_count(response.text)
     except Exception as e:
         logger.error(f"Error fetching watchlist count for {username}: {e}")
         return None
 
 
-def get_watchlist(username: str, limit: Optional[int] = None) -> Set[str]:
+def get_watchlist(
+    username: str,
+    limit: Optional[int] = None,
+    progress_callback: Optional[PageProgressCallback] = None,
+    total_count: Optional[int] = None,
+    start_page: int = 1,
+    on_page: Optional[PageCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Set[str]:
     """
     Fetches the watchlist for a given Letterboxd username using pagination.
 
     Args:
         username: Letterboxd username
-        limit: Optional limit on number of movies to fetch (for testing)
+        limit: Optional limit on number of movies to fetch
+        progress_callback: Called as progress_callback(fetched, total) once per
+            fetched page; total is None when the watchlist size is unknown.
+            Without a callback, progress is printed to the console.
+        total_count: Watchlist size if already known (skips the count request)
+        start_page: First page to fetch (to resume an interrupted fetch)
+        on_page: Called as on_page(page, titles) after each page, e.g. to
+            checkpoint progress; the empty page that ends the watchlist is
+            reported too, so a fetch that stopped early (error, rate limit,
+            cancellation) can be told apart from a complete one
+        cancel_event: Stop before the next page once this is set
 
     Returns:
-        Set of movie titles in the watchlist
+        Set of movie titles fetched (from start_page on)
     """
+    import requests
+
     movies = set()
-    page = 1
+    page = max(1, start_page)
     headers = {"User-Agent": DEFAULT_USER_AGENT}
 
     logger.info(f"Starting to fetch watchlist for {username}...")
     # Get total movie count for percentage display
-    total_count = get_watchlist_count(username)
+    if total_count is None:
+        total_count = get_watchlist_count(username)
     last_percent = -1
 
     def print_progress(fetched: int, total: Optional[int]) -> None:
@@ -91,63 +296,57 @@ def get_watchlist(username: str, limit: Optional[int] = None) -> Set[str]:
                 )
                 last_percent = percent
         else:
-            if fetched % 10 == 0 or fetched == 1:
-                print(
-                    f"\rFetching watchlist for {username}: {fetched} movies fetched",
-                    end="",
-                    flush=True,
-                )
+            print(
+                f"\rFetching watchlist for {username}: {fetched} movies fetched",
+                end="",
+                flush=True,
+            )
+
+    report = progress_callback or print_progress
 
     while True:
         # Check if we've reached the specified limit
         if limit and len(movies) >= limit:
             logger.info(f"Reached specified limit of {limit} movies for {username}")
             break
+        if cancel_event is not None and cancel_event.is_set():
+            logger.info(f"Watchlist fetch for {username} cancelled before page {page}")
+            break
 
         url = f"{BASE_URL}/{username}/watchlist/page/{page}/"
         logger.debug(f"Fetching page {page} for {username}: {url}")
 
         try:
-            response = session.get(url, headers=headers, timeout=10)
+            response = _http_get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            poster_items = soup.select("li.poster-container")
+            with instrumentation.stage("parse", username):
+                titles = parse_watchlist_page(response.text)
 
-            if not poster_items:
+            if not titles:
                 logger.info(
                     f"No more movies found for {username} on page {page}. Ending pagination."
                 )
+                if on_page:
+                    on_page(page, [])
                 break
 
-            page_movie_count = 0
-            for item in poster_items:
-                anchor = item.find("a", attrs={"data-film-name": True})
-                if anchor:
-                    title = anchor.get("data-film-name")
-                    if title:
-                        movies.add(title)
-                        page_movie_count += 1
-                        print_progress(len(movies), total_count)
-                else:
-                    img = item.find("img", alt=True)
-                    if img:
-                        title = img.get("alt")
-                        if title:
-                            movies.add(title)
-                            page_movie_count += 1
-                            print_progress(len(movies), total_count)
+            if on_page:
+                on_page(page, titles)
 
+            page_movie_count = 0
+            for title in titles:
+                movies.add(title)
+                page_movie_count += 1
                 # Check if we've reached the specified limit
                 if limit and len(movies) >= limit:
                     break
 
+            # Report progress once per page rather than once per film
+            report(len(movies), total_count)
             logger.info(f"Fetched {page_movie_count} movies from page {page} for {username}.")
 
             page += 1
-            # nosec B311: random used for rate limiting, not cryptography
-            sleep_time = random.uniform(1, 1.5)  # nosec B311
-            logger.debug(f"Sleeping for {sleep_time:.2f} seconds to avoid rate limiting.")
-            time.sleep(sleep_time)
+            _polite_delay(1, 1.5, username)
 
         except requests.exceptions.HTTPError as e:
             if response.status_code == 429:
@@ -168,55 +367,167 @@ def get_watchlist(username: str, limit: Optional[int] = None) -> Set[str]:
             logger.error(f"Error scraping watchlist page {page} for {username}: {e}")
             break
 
-    if (
-        total_count
-        and isinstance(total_count, int)
-        and total_count > 0
-        and len(movies) == total_count
-    ):
-        print(
-            f"\rFetching watchlist for {username}: 100% ({len(movies)}/{total_count}) Done!        "
-        )
-    else:
-        print(f"\rFetching watchlist for {username}: {len(movies)} movies fetched. Done!        ")
+    if progress_callback is None:
+        if (
+            total_count
+            and isinstance(total_count, int)
+            and total_count > 0
+            and len(movies) == total_count
+        ):
+            print(
+                f"\rFetching watchlist for {username}: 100% ({len(movies)}/{total_count}) "
+                "Done!        "
+            )
+        else:
+            print(
+                f"\rFetching watchlist for {username}: {len(movies)} movies fetched. Done!        "
+            )
 
     logger.info(f"Finished fetching watchlist for {username}. Total movies fetched: {len(movies)}.")
     return movies
 
 
-def get_friends(username: str) -> List[str]:
+def _fetch_listing(
+    username: str,
+    listing: str,
+    parse: Callable[[str], List[str]],
+    found: Set[str],
+    max_workers: int = DEFAULT_FRIENDS_WORKERS,
+) -> None:
     """
-    Fetches the list of friends for a given Letterboxd username.
-
-    Args:
-        username: Letterboxd username
+    Add every item of the paginated listing /username/listing/ to `found`.
 
-    Returns:
-        List of friend usernames
+    Page 1 is fetched first to read the page count; the remaining pages are
+    fetched concurrently, paced by the shared rate limiter (or, without one,
+    by a limiter matching the old per-page delays). The first failed page
+    raises, leaving the items found so far in `found`.
     """
-    url = f"{BASE_URL}/{username}/following/"
-    friends = []
     headers = {"User-Agent": DEFAULT_USER_AGENT}
+    limiter = _rate_limiter or RateLimiter(FRIENDS_PAGE_RATE)
 
-    try:
-        response = session.get(url, headers=headers, timeout=10)
+    def fetch_page(page: int) -> tuple:
+        url = f"{BASE_URL}/{username}/{listing}/page/{page}/"
+        logger.debug(f"Fetching {listing} page {page} for {username}: {url}")
+        response = _http_get(url, limiter=limiter, headers=headers, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        with instrumentation.stage("parse", username):
+            items = parse(response.text)
+        logger.info(f"Found {len(items)} on {listing} page {page} for {username}.")
+        return items, response.text
+
+    items, html = fetch_page(1)
+    found.update(items)
+    last = parse_last_page(html) if items else 0
+    if last > 1:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for items, _ in executor.map(fetch_page, range(2, last + 1)):
+                found.update(items)
+    # Without pagination links (or when they undercount) continue one page
+    # at a time until an empty page
+    page = last
+    while items:
+        page += 1
+        items, _ = fetch_page(page)
+        found.update(items)
+
+
+def get_friends(
+    username: str, max_workers: int = DEFAULT_FRIENDS_WORKERS, strict: bool = False
+) -> Set[str]:
+    """
+    Fetches the complete list of friends (followed users) for a Letterboxd
+    username, following pagination.
+
+    Page 1 is fetched first to read the page count; the remaining pages are
+    fetched concurrently, paced by the shared rate limiter (or, without one,
+    by a limiter matching the old per-page delays).
 
-        # Find all friend profile links
-        for a in soup.select("a.avatar"):  # Updated selector for friend avatars
-            href = a.get("href")
-            if href:
-                friend = href.strip("/").split("/")[0]
-                if friend and friend != username:
-                    friends.append(friend)
+    Args:
+        username: Letterboxd username
+        max_workers: Pages fetched concurrently
+        strict: Raise FriendsFetchError if any page fails instead of returning
+            the friends found so far (callers that apply follow/unfollow diffs
+            must not mistake a truncated list for unfollows)
 
+    Returns:
+        Set of unique friend usernames
+    """
+    friends: Set[str] = set()
+    logger.info(f"Starting to fetch friends for {username}...")
+    try:
+        _fetch_listing(
+            username,
+            "following",
+            lambda html: parse_friends_page(html, username),
+            friends,
+            max_workers,
+        )
     except Exception as e:
         logger.error(f"Error fetching friends for {username}: {e}")
+        if strict:
+            raise FriendsFetchError(f"Could not fetch all friends of {username}: {e}") from e
 
+    logger.info(
+        f"Finished fetching friends for {username}. Total unique friends found: {len(friends)}."
+    )
     return friends
 
 
+def get_watched_films(
+    username: str,
+    known: Optional[Set[str]] = None,
+    max_workers: int = DEFAULT_FRIENDS_WORKERS,
+    strict: bool = False,
+) -> Set[str]:
+    """
+    Fetches the films a Letterboxd user has marked as watched.
+
+    Without `known`, every page of /username/films/ is fetched like a follow
+    list (concurrently after page 1). With `known`, only what is new is
+    fetched: the films listing is read newest first, one page at a time,
+    until a page holds nothing outside `known`.
+
+    Args:
+        username: Letterboxd username
+        known: Watched films already stored, to fetch only the newer ones
+        max_workers: Pages fetched concurrently (full fetches only)
+        strict: Raise WatchedFetchError if any page fails instead of returning
+            the films found so far (a truncated list would look like films
+            being un-watched)
+
+    Returns:
+        Set of film titles: all watched films, or with `known` only those
+        not in it
+    """
+    films: Set[str] = set()
+    logger.info(f"Starting to fetch watched films for {username}...")
+    try:
+        if known is None:
+            _fetch_listing(username, "films", parse_watchlist_page, films, max_workers)
+        else:
+            headers = {"User-Agent": DEFAULT_USER_AGENT}
+            limiter = _rate_limiter or RateLimiter(FRIENDS_PAGE_RATE)
+            page = 1
+            while True:
+                url = f"{BASE_URL}/{username}/films/by/date/page/{page}/"
+                logger.debug(f"Fetching watched page {page} for {username}: {url}")
+                response = _http_get(url, limiter=limiter, headers=headers, timeout=10)
+                response.raise_for_status()
+                with instrumentation.stage("parse", username):
+                    new = set(parse_watchlist_page(response.text)) - known
+                if not new:
+                    break
+                films.update(new)
+                page += 1
+    except Exception as e:
+        logger.error(f"Error fetching watched films for {username}: {e}")
+        if strict:
+            raise WatchedFetchError(f"Could not fetch the watched films of {username}: {e}") from e
+
+    logger.info(f"Finished fetching watched films for {username}: {len(films)} films.")
+    return films
+
+
 def fetch_movie_data_from_letterboxd(url: str) -> Dict[str, Any]:
     """
     Fetch movie data from a Letterboxd movie page.
@@ -227,9 +538,11 @@ def fetch_movie_data_from_letterboxd(url: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing movie details (director, genres, rating, synopsis)
     """
+    from bs4 import BeautifulSoup
+
     try:
         headers = {"User-Agent": DEFAULT_USER_AGENT}
-        response = session.get(url, headers=headers, timeout=10)
+        response = _http_get(url, headers=headers, timeout=10)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -29,7 +29,10 @@ import re
 import sqlite3
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set
+
+from letterboxd_friend_check.data import database, maintenance
+from letterboxd_friend_check.data.database import MOVIE_TABLE_COLUMNS
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -38,6 +41,29 @@ logger = logging.getLogger(__name__)
 DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "letterboxd.db")
 DB_PATH = DEFAULT_DB_PATH  # Backward compatibility
 
+# FTS5 index over the movies text columns (external content: the text is
+# read from movies, triggers keep the index in sync)
+FTS_TABLE = "movies_fts"
+FTS_COLUMNS = ("title", "original_title", "director", "overview", "synopsis")
+# bm25 weights per FTS_COLUMNS entry: title matches rank above director/plot matches
+FTS_WEIGHTS = (10.0, 5.0, 3.0, 1.0, 1.0)
+
+# movies columns that hold fetched details rather than lookup keys
+DETAIL_COLUMNS = tuple(
+    c for c in MOVIE_TABLE_COLUMNS if c not in ("normalized_title", "year", "last_updated")
+)
+
+# Databases already initialized by this process (saves skip the schema checks)
+_initialized_paths: Set[str] = set()
+
+# Runtime facet buckets: (label, lower bound in minutes, upper bound or None)
+RUNTIME_BUCKETS = (
+    ("Under 90 min", 0, 90),
+    ("90-119 min", 90, 120),
+    ("120-149 min", 120, 150),
+    ("150+ min", 150, None),
+)
+
 
 def get_database_path() -> str:
     """
@@ -137,106 +163,543 @@ def init_movie_database(db_path: Optional[str] = None) -> None:
         # Ensure directory exists
         os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
 
+        # The movies table (one row per film, keyed by movie_id) is owned by
+        # the application database module
+        database.init_db(db_path)
+
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
 
-        # Create movie_details table with comprehensive schema if not exists
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS movie_details (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                normalized_title TEXT,
-                year INTEGER,
-                director TEXT,
-                genres TEXT,
-                rating TEXT,
-                synopsis TEXT,
-                overview TEXT,
-                tmdb_id INTEGER,
-                tmdb_rating REAL,
-                imdb_id TEXT,
-                release_date TEXT,
-                runtime INTEGER,
-                poster_path TEXT,
-                backdrop_path TEXT,
-                budget INTEGER,
-                revenue INTEGER,
-                popularity REAL,
-                vote_count INTEGER,
-                status TEXT,
-                tagline TEXT,
-                homepage TEXT,
-                original_title TEXT,
-                letterboxd_url TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(normalized_title, year)
-            )
-        """
-        )
-
-        # Check if the existing movies table exists and migrate if needed
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='movies'")
-        movies_table_exists = cursor.fetchone() is not None
-
-        if movies_table_exists:
-            # Migrate from old movies table to new movie_details table
-            logger.debug("Migrating from old movies table to new movie_details table")
+        cursor.execute("SELECT type FROM sqlite_master WHERE name='movie_details'")
+        row = cursor.fetchone()
+        if row and row[0] == "table":
+            _migrate_movie_details_table(cursor)
+        if not row or row[0] == "table":
+            # Read-only view for code that still queries movie_details
+            detail_columns = ", ".join(c for c in MOVIE_TABLE_COLUMNS if c != "last_updated")
             cursor.execute(
-                """
-                INSERT OR IGNORE INTO movie_details (
-                    title, director, genres, rating, synopsis, tmdb_id, tmdb_rating,
-                    release_date, runtime, poster_path, backdrop_path, overview, updated_at
-                )
-                SELECT
-                    title, director, genres, rating, synopsis, tmdb_id, tmdb_rating,
-                    release_date, runtime, poster_path, backdrop_path, overview,
-                    COALESCE(last_updated, datetime('now')) as updated_at
+                f"""
+                CREATE VIEW movie_details AS
+                SELECT movie_id AS id, title, {detail_columns}, last_updated AS updated_at
                 FROM movies
             """
             )
 
-        # Create indexes for performance
+        _init_fulltext_index(cursor)
+        _init_genre_tables(cursor)
+
+        conn.commit()
+        conn.close()
+        _initialized_paths.add(db_path)
+
+        logger.debug(f"Movie database initialized at: {db_path}")
+
+    except sqlite3.Error as e:
+        logger.error(f"Database error initializing movie database: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error initializing movie database: {e}")
+        raise
+
+
+def _migrate_movie_details_table(cursor: sqlite3.Cursor) -> None:
+    """
+    One-shot migration from the old separate movie_details table into movies.
+
+    Details are merged onto the film row with the same title (creating it if
+    needed, the movie_details value winning where both are set), then the
+    table and the indexes keyed by its ids are dropped so they are rebuilt
+    against movie_id.
+    """
+    cursor.execute("PRAGMA table_info(movie_details)")
+    old_columns = {row[1] for row in cursor.fetchall()}
+    columns = [c for c in MOVIE_TABLE_COLUMNS if c in old_columns]
+    if "updated_at" in old_columns:
+        columns.append("last_updated")
+    sources = ["updated_at" if c == "last_updated" else c for c in columns]
+    updates = ", ".join(f"{c} = COALESCE(excluded.{c}, movies.{c})" for c in columns)
+    cursor.execute(
+        f"""
+        INSERT INTO movies (title, {", ".join(columns)})
+        SELECT title, {", ".join(sources)} FROM movie_details WHERE true
+        ON CONFLICT(title) DO UPDATE SET {updates}
+    """  # nosec B608 - column names come from MOVIE_TABLE_COLUMNS
+    )
+    migrated = cursor.rowcount
+
+    # Film rows that only ever lived in movies lack the lookup keys
+    rows = cursor.execute(
+        "SELECT movie_id, title FROM movies WHERE normalized_title IS NULL"
+    ).fetchall()
+    keys = []
+    for movie_id, title in rows:
+        clean_title, year = extract_year_from_title(title)
+        keys.append((normalize_title(clean_title), year, movie_id))
+    cursor.executemany("UPDATE movies SET normalized_title = ?, year = ? WHERE movie_id = ?", keys)
+
+    for table in (FTS_TABLE, "movie_details_fts", "film_genres"):
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute("DROP TABLE movie_details")
+    logger.info(f"Migrated {migrated} movie_details rows into the movies table")
+
+
+def _init_fulltext_index(cursor: sqlite3.Cursor) -> bool:
+    """
+    Create the FTS5 index and its sync triggers (indexing existing rows on
+    creation). Returns False if this SQLite build has no FTS5.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,))
+    if cursor.fetchone():
+        return True
+
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    try:
         cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_movie_details_title
-            ON movie_details(normalized_title)
+            f"""
+            CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+                {columns},
+                content='movies', content_rowid='movie_id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
         """
         )
+    except sqlite3.OperationalError as e:
+        logger.info(f"Full-text search unavailable ({e}); searches fall back to LIKE")
+        return False
 
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_movie_details_year
-            ON movie_details(year)
+    cursor.executescript(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS movies_fts_insert AFTER INSERT ON movies
+        BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.movie_id, {new_values});
+        END;
+        CREATE TRIGGER IF NOT EXISTS movies_fts_delete AFTER DELETE ON movies
+        BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns})
+            VALUES ('delete', old.movie_id, {old_values});
+        END;
+        CREATE TRIGGER IF NOT EXISTS movies_fts_update AFTER UPDATE ON movies
+        BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns})
+            VALUES ('delete', old.movie_id, {old_values});
+            INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.movie_id, {new_values});
+        END;
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild');
+    """
+    )
+    logger.debug("Created full-text index for movie details")
+    return True
+
+
+def _init_genre_tables(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the genres lookup and the film_genres junction table, filling them
+    from movies.genres the first time.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='film_genres'")
+    exists = cursor.fetchone() is not None
+
+    cursor.execute(
         """
+        CREATE TABLE IF NOT EXISTS genres (
+            genre_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE
         )
+    """
+    )
+    # Keyed (movie, genre) for "genres of a film"; the index below serves
+    # "films in a genre"
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS film_genres (
+            movie_id INTEGER NOT NULL,
+            genre_id INTEGER NOT NULL,
+            PRIMARY KEY (movie_id, genre_id)
+        ) WITHOUT ROWID
+    """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_film_genres_genre
+        ON film_genres(genre_id, movie_id)
+    """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS movies_genres_delete AFTER DELETE ON movies
+        BEGIN
+            DELETE FROM film_genres WHERE movie_id = old.movie_id;
+        END
+    """
+    )
 
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_movie_details_tmdb_id
-            ON movie_details(tmdb_id)
+    if not exists:
+        rebuild_film_genres(cursor)
+
+
+def split_genres(genres: Any) -> List[str]:
+    """
+    Genre names from a stored or fetched genres value.
+
+    Accepts the comma-joined string kept in movies.genres as well as
+    TMDB-style lists of names or {"name": ...} dicts. Duplicates (ignoring
+    case) are dropped, order is kept.
+    """
+    if not genres:
+        return []
+    if isinstance(genres, str):
+        names = genres.split(",")
+    else:
+        names = [g.get("name", "") if isinstance(g, dict) else str(g) for g in genres]
+
+    result: List[str] = []
+    seen: Set[str] = set()
+    for name in names:
+        name = name.strip()
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            result.append(name)
+    return result
+
+
+def save_film_genres(cursor: sqlite3.Cursor, movie_id: int, genres: Any) -> None:
+    """Replace the film_genres rows of one film"""
+    names = split_genres(genres)
+    cursor.execute("DELETE FROM film_genres WHERE movie_id = ?", (movie_id,))
+    if not names:
+        return
+    cursor.executemany("INSERT OR IGNORE INTO genres (name) VALUES (?)", [(n,) for n in names])
+    cursor.executemany(
         """
-        )
+        INSERT OR IGNORE INTO film_genres (movie_id, genre_id)
+        SELECT ?, genre_id FROM genres WHERE name = ?
+    """,
+        [(movie_id, name) for name in names],
+    )
 
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_movie_details_updated
-            ON movie_details(updated_at)
+
+def rebuild_film_genres(cursor: sqlite3.Cursor) -> int:
+    """
+    Rebuild film_genres from movies.genres for every film.
+
+    Returns:
+        int: Number of movies with at least one genre
+    """
+    cursor.execute("DELETE FROM film_genres")
+    rows = cursor.execute(
+        "SELECT movie_id, genres FROM movies WHERE genres IS NOT NULL AND genres != ''"
+    ).fetchall()
+    for movie_id, genres in rows:
+        save_film_genres(cursor, movie_id, genres)
+    return len(rows)
+
+
+def _runtime_bucket_sql(column: str) -> str:
+    """CASE expression mapping a runtime column to its RUNTIME_BUCKETS label"""
+    cases = []
+    for label, low, high in RUNTIME_BUCKETS:
+        condition = f"{column} >= {low}" + (f" AND {column} < {high}" if high else "")
+        cases.append(f"WHEN {condition} THEN '{label}'")
+    return f"CASE WHEN {column} IS NULL OR {column} <= 0 THEN NULL {' '.join(cases)} END"
+
+
+def _load_facet_films(conn: sqlite3.Connection, movie_titles: Iterable[str]) -> None:
+    """
+    Fill the temp table facet_films with the movie_ids of the given
+    watchlist entries, matched by normalized title and year.
+    """
+    conn.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS facet_titles (normalized_title TEXT, year INTEGER)"
+    )
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS facet_films (movie_id INTEGER PRIMARY KEY)")
+    conn.execute("DELETE FROM facet_titles")
+    conn.execute("DELETE FROM facet_films")
+    rows = []
+    for movie_title in movie_titles:
+        clean_title, year = extract_year_from_title(movie_title)
+        rows.append((normalize_title(clean_title), year))
+    conn.executemany("INSERT INTO facet_titles VALUES (?, ?)", rows)
+    conn.execute(
         """
+        INSERT OR IGNORE INTO facet_films (movie_id)
+        SELECT m.movie_id FROM facet_titles t
+        JOIN movies m ON m.normalized_title = t.normalized_title
+        WHERE t.year IS NULL OR m.year = t.year
+    """
+    )
+
+
+def get_facet_counts(
+    movie_titles: Iterable[str], db_path: Optional[str] = None
+) -> Dict[str, Dict[Any, int]]:
+    """
+    Genre, decade and runtime counts for a set of watchlist entries.
+
+    Args:
+        movie_titles (iterable): Entries as stored in watchlists ("Title (YYYY)"),
+            e.g. a friend's watchlist or the movies in common with them
+        db_path (str, optional): Path to the database file
+
+    Returns:
+        dict: {"genre": {name: count}, "decade": {1990: count},
+        "runtime": {bucket label: count}}; genres are sorted by count, decades
+        and runtime buckets in their natural order. Movies without stored
+        details are not counted.
+
+    Performance: The three facets come from one grouped UNION ALL query over
+    the indexed film_genres junction table
+    """
+    facets: Dict[str, Dict[Any, int]] = {"genre": {}, "decade": {}, "runtime": {}}
+    if db_path is None:
+        db_path = get_database_path()
+    if not os.path.exists(db_path):
+        return facets
+
+    runtime_bucket = _runtime_bucket_sql("m.runtime")
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            _load_facet_films(conn, movie_titles)
+            rows = conn.execute(
+                f"""
+                SELECT 'genre', g.name, COUNT(*) AS n
+                FROM facet_films f
+                JOIN film_genres fg ON fg.movie_id = f.movie_id
+                JOIN genres g ON g.genre_id = fg.genre_id
+                GROUP BY g.genre_id
+                UNION ALL
+                SELECT 'decade', m.year / 10 * 10, COUNT(*)
+                FROM facet_films f JOIN movies m ON m.movie_id = f.movie_id
+                WHERE m.year IS NOT NULL
+                GROUP BY 2
+                UNION ALL
+                SELECT 'runtime', {runtime_bucket}, COUNT(*)
+                FROM facet_films f JOIN movies m ON m.movie_id = f.movie_id
+                WHERE m.runtime > 0
+                GROUP BY 2
+            """  # nosec B608 - the CASE expression is built from constants
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.error(f"Database error computing facet counts: {e}")
+        return facets
+
+    for facet, value, count in rows:
+        facets[facet][value] = count
+    facets["genre"] = dict(sorted(facets["genre"].items(), key=lambda item: (-item[1], item[0])))
+    facets["decade"] = dict(sorted(facets["decade"].items()))
+    order = [label for label, _, _ in RUNTIME_BUCKETS]
+    facets["runtime"] = {
+        label: facets["runtime"][label] for label in order if label in facets["runtime"]
+    }
+    return facets
+
+
+def filter_titles_by_facets(
+    movie_titles: Iterable[str],
+    genre: Optional[str] = None,
+    decade: Optional[int] = None,
+    runtime: Optional[str] = None,
+    db_path: Optional[str] = None,
+) -> Set[str]:
+    """
+    The watchlist entries that fall into every selected facet.
+
+    Args:
+        movie_titles (iterable): Entries as stored in watchlists ("Title (YYYY)")
+        genre (str, optional): Exact genre name (case-insensitive)
+        decade (int, optional): First year of a decade, e.g. 1990
+        runtime (str, optional): A RUNTIME_BUCKETS label
+        db_path (str, optional): Path to the database file
+
+    Returns:
+        set: Matching entries (all of them when no facet is selected)
+    """
+    movie_titles = list(movie_titles)
+    if genre is None and decade is None and runtime is None:
+        return set(movie_titles)
+    if db_path is None:
+        db_path = get_database_path()
+    if not os.path.exists(db_path):
+        return set()
+
+    conditions = []
+    params: List[Any] = []
+    if genre is not None:
+        conditions.append(
+            """m.movie_id IN (
+                SELECT fg.movie_id FROM film_genres fg
+                JOIN genres g ON g.genre_id = fg.genre_id WHERE g.name = ?
+            )"""
         )
+        params.append(genre)
+    if decade is not None:
+        conditions.append("m.year BETWEEN ? AND ?")
+        params.extend([decade, decade + 9])
+    if runtime is not None:
+        conditions.append(f"{_runtime_bucket_sql('m.runtime')} = ?")
+        params.append(runtime)
 
-        conn.commit()
-        conn.close()
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            _load_facet_films(conn, movie_titles)
+            rows = conn.execute(
+                f"""
+                SELECT m.normalized_title, m.year
+                FROM facet_films f JOIN movies m ON m.movie_id = f.movie_id
+                WHERE {" AND ".join(conditions)}
+            """,  # nosec B608 - conditions are fixed SQL with placeholders
+                params,
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.error(f"Database error filtering by facets: {e}")
+        return set()
 
-        logger.debug(f"Movie database initialized at: {db_path}")
+    matched = set(rows)
+    matched_titles = {normalized for normalized, _ in rows}
+    result = set()
+    for movie_title in movie_titles:
+        clean_title, year = extract_year_from_title(movie_title)
+        normalized = normalize_title(clean_title)
+        if (normalized, year) in matched or (year is None and normalized in matched_titles):
+            result.add(movie_title)
+    return result
 
+
+def fulltext_available(conn: sqlite3.Connection) -> bool:
+    """Whether the database has the FTS5 movie index"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def build_fts_query(text: str) -> str:
+    """
+    Turn user input into an FTS5 query: every word must match as a prefix.
+
+    "ali sco" becomes '"ali"* "sco"*', which matches "Alien" directed by
+    Ridley Scott. Quoting each word keeps FTS5 operators in the input inert.
+    """
+    words = re.findall(r"\w+", text.lower())
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _like_filter(words: List[str], alias: str = "") -> tuple:
+    """WHERE clause and parameters matching every word in any text column (no FTS5)"""
+    prefix = f"{alias}." if alias else ""
+    clauses = []
+    params: List[str] = []
+    for word in words:
+        clauses.append(
+            "(" + " OR ".join(f"{prefix}{column} LIKE ?" for column in FTS_COLUMNS) + ")"
+        )
+        params.extend([f"%{word}%"] * len(FTS_COLUMNS))
+    return " AND ".join(clauses), params
+
+
+def search_movie_details(
+    query: str, limit: Optional[int] = 50, db_path: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search stored movie details by title, original title, director and plot.
+
+    Every word of the query must match the start of a word in one of those
+    columns. Results are ranked with bm25 (title matches first); without
+    FTS5, a LIKE scan finds the same rows, title matches first.
+
+    Args:
+        query (str): Search text, e.g. "blade run" or "villeneuve"
+        limit (int, optional): Maximum number of results (None for all)
+        db_path (str, optional): Path to the database file
+
+    Returns:
+        list: Dicts with movie_id, title, normalized_title, year, director, genres,
+        tmdb_rating and score (lower is better), best match first
+
+    Performance: Uses the FTS5 index, so searches over tens of thousands of
+    films take milliseconds
+    """
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return []
+
+    if db_path is None:
+        db_path = get_database_path()
+
+    if not os.path.exists(db_path):
+        return []
+
+    columns = "m.movie_id, m.title, m.normalized_title, m.year, m.director, m.genres, m.tmdb_rating"
+    limit_clause = " LIMIT ?" if limit is not None else ""
+    try:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            if fulltext_available(conn):
+                weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+                sql = f"""
+                    SELECT {columns}, bm25({FTS_TABLE}, {weights}) AS score
+                    FROM {FTS_TABLE}
+                    JOIN movies m ON m.movie_id = {FTS_TABLE}.rowid
+                    WHERE {FTS_TABLE} MATCH ?
+                    ORDER BY score
+                """
+                params: List[Any] = [build_fts_query(query)]
+            else:
+                where, params = _like_filter(words, "m")
+                sql = f"""
+                    SELECT {columns}, CASE WHEN m.title LIKE ? THEN 0 ELSE 1 END AS score
+                    FROM movies m
+                    WHERE {where}
+                    ORDER BY score, m.title
+                """  # nosec B608 - only placeholders are interpolated
+                params = [f"%{words[0]}%"] + params
+            if limit is not None:
+                params.append(limit)
+            rows = conn.execute(sql + limit_clause, params).fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            conn.close()
     except sqlite3.Error as e:
-        logger.error(f"Database error initializing movie database: {e}")
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error initializing movie database: {e}")
-        raise
+        logger.error(f"Database error searching movie details for '{query}': {e}")
+        return []
+
+
+def search_movie_titles(
+    query: str, movie_titles: Iterable[str], db_path: Optional[str] = None
+) -> Set[str]:
+    """
+    Which of the given watchlist entries match a search of their details.
+
+    Args:
+        query (str): Search text (see search_movie_details)
+        movie_titles (iterable): Entries as stored in watchlists ("Title (YYYY)")
+        db_path (str, optional): Path to the database file
+
+    Returns:
+        set: The entries whose stored details match
+    """
+    wanted: Dict[tuple, List[str]] = {}
+    for movie_title in movie_titles:
+        clean_title, year = extract_year_from_title(movie_title)
+        wanted.setdefault((normalize_title(clean_title), year), []).append(movie_title)
+    if not wanted:
+        return set()
+
+    matches: Set[str] = set()
+    for row in search_movie_details(query, limit=None, db_path=db_path):
+        key = (row["normalized_title"], row["year"])
+        matches.update(wanted.get(key, ()))
+        # Entries without a year match on the title alone
+        matches.update(wanted.get((row["normalized_title"], None), ()))
+    return matches
 
 
 def get_movie_details_from_db(movie_title, db_path=None):
@@ -268,63 +731,21 @@ def get_movie_details_from_db(movie_title, db_path=None):
 
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
-
-        # Initialize database if needed
-        init_movie_database(db_path)
-
-        # Try movie_details table first (new schema)
-        if year:
-            cursor.execute(
-                """
-                SELECT * FROM movie_details
-                WHERE normalized_title = ? AND year = ?
-                ORDER BY updated_at DESC LIMIT 1
-            """,
-                (normalized_title, year),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT * FROM movie_details
-                WHERE normalized_title = ?
-                ORDER BY updated_at DESC LIMIT 1
-            """,
-                (normalized_title,),
-            )
-
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-
-        # Fallback to exact title match
-        cursor.execute(
-            """
-            SELECT * FROM movie_details
-            WHERE title = ?
-            ORDER BY updated_at DESC LIMIT 1
-        """,
-            (movie_title,),
-        )
-
-        row = cursor.fetchone()
-
-        if row:
-            return dict(row)
-
-        # Try old movies table for backward compatibility
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='movies'")
-        if cursor.fetchone():
-            cursor.execute("SELECT * FROM movies WHERE title = ? LIMIT 1", (movie_title,))
-            row = cursor.fetchone()
-            if row:
-                # This part needs to be adapted if the schema is different
-                # For now, returning as dict assuming column names are accessible
-                return dict(row)
-
-        conn.close()
-        return None
+        try:
+            # The watchlist title is the film key; fall back to the normalized
+            # title (and year) for spelling variants
+            row = conn.execute("SELECT * FROM movies WHERE title = ?", (movie_title,)).fetchone()
+            if row is None or not _has_details(row):
+                query = "SELECT * FROM movies WHERE normalized_title = ?"
+                params: List[Any] = [normalized_title]
+                if year:
+                    query += " AND year = ?"
+                    params.append(year)
+                row = conn.execute(query + " ORDER BY last_updated DESC LIMIT 1", params).fetchone()
+        finally:
+            conn.close()
+
+        return dict(row) if row is not None and _has_details(row) else None
 
     except sqlite3.Error as e:
         logger.error(f"Database error retrieving movie data for '{movie_title}': {e}")
@@ -334,6 +755,11 @@ def get_movie_details_from_db(movie_title, db_path=None):
         return None
 
 
+def _has_details(row: sqlite3.Row) -> bool:
+    """Whether a movies row holds any details (watchlist syncs store only titles)"""
+    return any(row[column] is not None for column in DETAIL_COLUMNS)
+
+
 def save_movie_details_to_db(movie_title, movie_data, db_path=None):
     """
     Save movie details to the database.
@@ -358,7 +784,8 @@ def save_movie_details_to_db(movie_title, movie_data, db_path=None):
 
     try:
         # Initialize database if it doesn't exist
-        init_movie_database(db_path)
+        if db_path not in _initialized_paths or not os.path.exists(db_path):
+            init_movie_database(db_path)
 
         # Extract year from title if present
         clean_title, year = extract_year_from_title(movie_title)
@@ -373,7 +800,7 @@ def save_movie_details_to_db(movie_title, movie_data, db_path=None):
             "normalized_title": normalized_title,
             "year": year,
             "director": movie_data.get("director"),
-            "genres": movie_data.get("genres"),
+            "genres": ", ".join(split_genres(movie_data.get("genres"))) or None,
             "rating": movie_data.get("rating"),
             "synopsis": movie_data.get("synopsis"),
             "overview": movie_data.get("overview"),
@@ -393,71 +820,26 @@ def save_movie_details_to_db(movie_title, movie_data, db_path=None):
             "homepage": movie_data.get("homepage"),
             "original_title": movie_data.get("original_title"),
             "letterboxd_url": movie_data.get("letterboxd_url"),
-            "updated_at": datetime.now().isoformat(),
+            "last_updated": datetime.now().isoformat(),
         }
 
-        # Use INSERT OR REPLACE to handle duplicates
+        # One upsert on the film row (created by a watchlist sync or here). It
+        # keeps its movie_id, and the update trigger keeps the full-text
+        # index in sync
+        columns = list(data)
+        updates = ", ".join(f"{column}=excluded.{column}" for column in columns[1:])
         cursor.execute(
-            """
-            INSERT OR REPLACE INTO movie_details (
-                title, normalized_title, year, director, genres, rating, synopsis, overview,
-                tmdb_id, tmdb_rating, imdb_id, release_date, runtime, poster_path, backdrop_path,
-                budget, revenue, popularity, vote_count, status, tagline, homepage,
-                original_title, letterboxd_url, updated_at
-            ) VALUES (
-                :title, :normalized_title, :year, :director, :genres, :rating, :synopsis, :overview,
-                :tmdb_id, :tmdb_rating, :imdb_id, :release_date, :runtime, :poster_path,
-                :backdrop_path, :budget, :revenue, :popularity, :vote_count, :status, :tagline,
-                :homepage, :original_title, :letterboxd_url, :updated_at
-            )
-        """,
+            f"""
+            INSERT INTO movies ({", ".join(columns)})
+            VALUES ({", ".join(":" + column for column in columns)})
+            ON CONFLICT(title) DO UPDATE SET {updates}
+        """,  # nosec B608 - column names come from the fixed data dict
             data,
         )
-
-        # Also update old movies table for backward compatibility if it exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='movies'")
-        if cursor.fetchone():
-            cursor.execute("SELECT movie_id FROM movies WHERE title = ?", (movie_title,))
-            result = cursor.fetchone()
-
-            if result:
-                # Movie exists in old table, update it
-                movie_id = result[0]
-                update_sql = """
-                    UPDATE movies SET
-                        director = ?,
-                        genres = ?,
-                        rating = ?,
-                        synopsis = ?,
-                        tmdb_id = ?,
-                        tmdb_rating = ?,
-                        release_date = ?,
-                        runtime = ?,
-                        poster_path = ?,
-                        backdrop_path = ?,
-                        overview = ?,
-                        last_updated = ?
-                    WHERE movie_id = ?
-                """
-
-                cursor.execute(
-                    update_sql,
-                    (
-                        data["director"],
-                        data["genres"],
-                        data["rating"],
-                        data["synopsis"],
-                        data["tmdb_id"],
-                        data["tmdb_rating"],
-                        data["release_date"],
-                        data["runtime"],
-                        data["poster_path"],
-                        data["backdrop_path"],
-                        data["overview"],
-                        data["updated_at"],
-                        movie_id,
-                    ),
-                )
+        movie_id = cursor.execute(
+            "SELECT movie_id FROM movies WHERE title = ?", (movie_title,)
+        ).fetchone()[0]
+        save_film_genres(cursor, movie_id, data["genres"])
 
         conn.commit()
         conn.close()
@@ -496,12 +878,8 @@ def movie_has_details(movie_title, db_path=None):
 
     try:
         details = get_movie_details_from_db(movie_title, db_path)
-        if not details:
-            return False
         # Check for at least one non-title/year detail field
-        return any(
-            details.get(key) for key in details if key not in ["title", "normalized_title", "year"]
-        )
+        return bool(details) and any(details.get(key) for key in DETAIL_COLUMNS)
     except sqlite3.Error as e:
         logger.error(f"Database error checking movie details for '{movie_title}': {e}")
         return False
@@ -510,6 +888,71 @@ def movie_has_details(movie_title, db_path=None):
         return False
 
 
+def get_movie_details_for_titles(
+    movie_titles: List[str], db_path: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up stored details for many movies with one connection.
+
+    Args:
+        movie_titles (list): Titles as stored in watchlists ("Title (YYYY)")
+        db_path (str, optional): Path to the database file
+
+    Returns:
+        dict: {movie_title: details} for every title with a stored row
+
+    Performance: Batches lookups into IN (...) queries instead of one
+    connection and query per title
+    """
+    if not movie_titles:
+        return {}
+
+    if db_path is None:
+        db_path = get_database_path()
+
+    if not os.path.exists(db_path):
+        return {}
+
+    # normalized title -> [(watchlist title, year)]
+    wanted: Dict[str, List[tuple]] = {}
+    for movie_title in movie_titles:
+        clean_title, year = extract_year_from_title(movie_title)
+        wanted.setdefault(normalize_title(clean_title), []).append((movie_title, year))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            keys = list(wanted)
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT title, normalized_title, year, director, genres, rating,
+                           tmdb_rating, runtime, poster_path
+                    FROM movies
+                    WHERE normalized_title IN ({placeholders}) AND last_updated IS NOT NULL
+                    ORDER BY last_updated
+                """,
+                    chunk,
+                ).fetchall()
+                # Later (newer) rows overwrite older ones, matching the
+                # "ORDER BY last_updated DESC LIMIT 1" of the single lookup
+                for row in rows:
+                    for movie_title, year in wanted.get(row["normalized_title"], []):
+                        if year is None or row["year"] == year:
+                            results[movie_title] = dict(row)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.error(f"Database error retrieving details for {len(movie_titles)} movies: {e}")
+
+    return results
+
+
 def bulk_save_movie_details(
     movies_data: List[Dict[str, Any]], db_path: Optional[str] = None
 ) -> int:
@@ -574,7 +1017,7 @@ def cleanup_old_movie_data(days_old: int = 30, db_path: Optional[str] = None) ->
         return 0
 
 
-def get_database_stats(db_path: Optional[str] = None) -> Dict[str, int]:
+def get_database_stats(db_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Get statistics about the movie database.
 
@@ -582,7 +1025,16 @@ def get_database_stats(db_path: Optional[str] = None) -> Dict[str, int]:
         db_path (str, optional): Database path
 
     Returns:
-        dict: Database statistics
+        dict: Database statistics, empty if the database does not exist:
+            file_bytes, wal_bytes: sizes of the database and WAL files
+            page_size, page_count, freelist_count, journal_mode, auto_vacuum,
+            cache_size: the corresponding PRAGMA values
+            tables: {table: {"rows": n, "bytes": size}} (FTS shadow tables omitted)
+            indexes: {index: {"table": table, "bytes": size}}
+            details_cache: films, with_details and hit_rate (share of films whose
+                details are stored, i.e. served without an API call)
+            maintenance: {task: datetime of its last run}
+        Sizes are None when SQLite is built without the dbstat table.
     """
     if db_path is None:
         db_path = get_database_path()
@@ -590,10 +1042,60 @@ def get_database_stats(db_path: Optional[str] = None) -> Dict[str, int]:
     if not os.path.exists(db_path):
         return {}
 
+    wal_path = f"{db_path}-wal"
+    stats: Dict[str, Any] = {
+        "file_bytes": os.path.getsize(db_path),
+        "wal_bytes": os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+    }
     try:
-        # Placeholder for missing implementation
-        logger.warning("get_database_stats needs a proper implementation.")
-        return {}
+        conn = sqlite3.connect(db_path)
+        try:
+            for pragma in (
+                "page_size",
+                "page_count",
+                "freelist_count",
+                "journal_mode",
+                "auto_vacuum",
+                "cache_size",
+            ):
+                stats[pragma] = conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+
+            try:
+                sizes = dict(conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"))
+            except sqlite3.OperationalError:
+                sizes = {}
+
+            fts_tables = maintenance.fts_tables(conn)
+            shadow_prefixes = tuple(f"{table}_" for table in fts_tables)
+            stats["tables"] = {}
+            stats["indexes"] = {}
+            for kind, name, table in conn.execute(
+                """
+                SELECT type, name, tbl_name FROM sqlite_master
+                WHERE type = 'index' OR (type = 'table' AND name NOT LIKE 'sqlite_%')
+                ORDER BY name
+            """
+            ).fetchall():
+                if kind == "index":
+                    stats["indexes"][name] = {"table": table, "bytes": sizes.get(name)}
+                elif name not in fts_tables and not name.startswith(shadow_prefixes):
+                    rows = conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+                    stats["tables"][name] = {"rows": rows, "bytes": sizes.get(name)}
+
+            films = with_details = 0
+            if "movies" in stats["tables"]:
+                films, with_details = conn.execute(
+                    "SELECT COUNT(*), COUNT(last_updated) FROM movies"
+                ).fetchone()
+            stats["details_cache"] = {
+                "films": films,
+                "with_details": with_details,
+                "hit_rate": with_details / films if films else None,
+            }
+            stats["maintenance"] = maintenance.get_last_runs(conn)
+        finally:
+            conn.close()
+        return stats
     except sqlite3.Error as e:
         logger.error(f"Database error getting stats: {e}")
         return {}
@@ -602,12 +1104,20 @@ def get_database_stats(db_path: Optional[str] = None) -> Dict[str, int]:
         return {}
 
 
-def get_filtered_movies_for_friend(username, friend_name, common_only, title_filter, genre_filter):
+def get_filtered_movies_for_friend(
+    username, friend_name, common_only, title_filter, genre_filter, db_path=None
+):
     """
     Gets a list of movies for a given friend, applying specified filters.
     Signature: Copilot (2025-07-20T20:00:00Z)
+
+    Returns (title, year, director, tmdb_rating, genres) rows ordered by
+    title. The watchlist join and the common-movie subquery use the
+    (username, movie_id) watchlist index. The title filter matches the start
+    of words in the title through the FTS5 index ("arr" finds "Arrival"),
+    falling back to a substring LIKE without FTS5.
     """
-    conn = sqlite3.connect(get_database_path())
+    conn = sqlite3.connect(db_path or get_database_path())
     if not conn:
         return []
 
@@ -616,35 +1126,50 @@ def get_filtered_movies_for_friend(username, friend_name, common_only, title_fil
 
         base_query = """
         SELECT DISTINCT
-            md.title,
-            md.year,
-            md.director,
-            md.tmdb_rating,
-            md.genres
-        FROM movie_details md
-        JOIN user_watchlists uw ON md.id = uw.movie_id
-        WHERE uw.username = ?
+            m.title,
+            m.year,
+            m.director,
+            m.tmdb_rating,
+            m.genres
+        FROM watchlists w
+        JOIN movies m ON m.movie_id = w.movie_id
+        WHERE w.username = ?
         """
 
         params = [friend_name]
 
         if common_only:
             base_query += """
-            AND md.id IN (
-                SELECT movie_id FROM user_watchlists WHERE username = ?
+            AND m.movie_id IN (
+                SELECT movie_id FROM watchlists WHERE username = ?
             )
             """
             params.append(username)
 
         if title_filter:
-            base_query += " AND md.title LIKE ?"
-            params.append(f"%{title_filter}%")
+            # Word-prefix match on the FTS5 title column instead of a
+            # leading-wildcard LIKE, which has to scan every joined row
+            if fulltext_available(conn):
+                base_query += (
+                    f" AND m.movie_id IN (SELECT rowid FROM {FTS_TABLE} WHERE title MATCH ?)"
+                )
+                params.append(build_fts_query(title_filter) or '""')
+            else:
+                base_query += " AND m.title LIKE ?"
+                params.append(f"%{title_filter}%")
 
         if genre_filter:
-            base_query += " AND md.genres LIKE ?"
-            params.append(f"%{genre_filter}%")
+            # Exact match: "Fiction" must not match "Science Fiction"
+            base_query += """
+            AND m.movie_id IN (
+                SELECT fg.movie_id FROM film_genres fg
+                JOIN genres g ON g.genre_id = fg.genre_id
+                WHERE g.name = ?
+            )
+            """
+            params.append(genre_filter)
 
-        base_query += " ORDER BY md.title;"
+        base_query += " ORDER BY m.title;"
 
         cursor.execute(base_query, tuple(params))
         return cursor.fetchall()
@@ -656,12 +1181,12 @@ def get_filtered_movies_for_friend(username, friend_name, common_only, title_fil
         conn.close()
 
 
-def get_all_genres_for_friend(username, friend_name):
+def get_all_genres_for_friend(username, friend_name, db_path=None):
     """
     Gets a set of all unique genres for movies in a friend's watchlist.
     Signature: Copilot (2025-07-20T20:00:00Z)
     """
-    conn = sqlite3.connect(get_database_path())
+    conn = sqlite3.connect(db_path or get_database_path())
     if not conn:
         return set()
 
@@ -669,19 +1194,15 @@ def get_all_genres_for_friend(username, friend_name):
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT DISTINCT md.genres
-            FROM movie_details md
-            JOIN user_watchlists uw ON md.id = uw.movie_id
-            WHERE uw.username = ? AND md.genres IS NOT NULL AND md.genres != ''
+            SELECT DISTINCT g.name
+            FROM watchlists w
+            JOIN film_genres fg ON fg.movie_id = w.movie_id
+            JOIN genres g ON g.genre_id = fg.genre_id
+            WHERE w.username = ?
         """,
             (friend_name,),
         )
-
-        all_genres = set()
-        for row in cursor.fetchall():
-            genres = [genre.strip() for genre in row[0].split(",")]
-            all_genres.update(genres)
-        return all_genres
+        return {row[0] for row in cursor.fetchall()}
 
     except sqlite3.Error as e:
         logger.error(f"Database error getting genres for {friend_name}: {e}")
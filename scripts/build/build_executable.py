@@ -85,25 +85,14 @@ block_cipher = None
 main_script = 'run_letterboxd.py'
 
 # Hidden imports - modules that PyInstaller might miss
+# Third-party and stdlib modules (requests, bs4, selenium, webdriver_manager,
+# tkinter, sqlite3) are found by PyInstaller's import analysis even though the
+# application imports them lazily inside functions, so only the project's own
+# modules (loaded through sys.path tweaks at runtime) are listed here.
 hidden_imports = [
-    'tkinter',
-    'tkinter.ttk',
-    'tkinter.messagebox',
-    'tkinter.filedialog',
-    'sqlite3',
-    'requests',
-    'bs4',
-    'selenium',
-    'PIL',
-    'PIL.Image',
-    'PIL.ImageTk',
-    'json',
-    'urllib3',
-    'webdriver_manager',
-    'webdriver_manager.chrome',
     'LBoxFriendCheck',
     'tmdb_api',
-    'SetupDialog',
+    'movie_database',
     'letterboxd_friend_check',
     'letterboxd_friend_check.app',
     'letterboxd_friend_check.config',
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Offline benchmark runner for Letterboxd Friend Check
+
+Runs the suite in tests/benchmarks/suite.py (scraping throughput against a
+local replay server, page parsing, SQLite writes, watchlist comparison and
+results building) and compares every value with the stored baselines in
+benchmark_baselines.json. A benchmark regresses when it is worse than its
+baseline by more than the tolerance factor (timings vary between machines,
+so the default is generous).
+
+Usage:
+    python scripts/perf/benchmarks.py [--repeat N] [--scale S] [--only NAME ...]
+                                      [--tolerance X] [--json] [--update-baseline]
+
+Exit code is 1 if any benchmark regressed.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "benchmark_baselines.json"
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tests.benchmarks.suite import BENCHMARKS, run_benchmark  # noqa: E402
+
+DEFAULT_TOLERANCE = 2.0
+
+
+def compare(value: float, baseline: float, higher_is_better: bool, tolerance: float) -> bool:
+    """Whether value regressed against baseline by more than the tolerance factor"""
+    if higher_is_better:
+        return value * tolerance < baseline
+    return value > baseline * tolerance
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (best is used)")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Workload size (baselines are taken at 1.0)"
+    )
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="Run only these benchmarks")
+    parser.add_argument("--tolerance", type=float, help="Allowed slowdown factor")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store the measured values as baselines"
+    )
+    args = parser.parse_args()
+
+    # The scrapers log every page; keep the report readable
+    logging.disable(logging.INFO)
+
+    baselines = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+    tolerance = args.tolerance or baselines.get("tolerance", DEFAULT_TOLERANCE)
+    check = args.scale == 1.0
+
+    report = {}
+    for bench in BENCHMARKS:
+        if args.only and bench.name not in args.only:
+            continue
+        if not bench.available():
+            report[bench.name] = {"skipped": True, "unit": bench.unit}
+            continue
+        value = run_benchmark(bench, args.scale, args.repeat)
+        baseline = baselines["benchmarks"].get(bench.name, {}).get("value")
+        report[bench.name] = {
+            "value": round(value, 3),
+            "unit": bench.unit,
+            "baseline": baseline,
+            "regressed": bool(
+                check
+                and baseline is not None
+                and compare(value, baseline, bench.higher_is_better, tolerance)
+            ),
+        }
+
+    if args.update_baseline:
+        for bench in BENCHMARKS:
+            entry = report.get(bench.name)
+            if entry and not entry.get("skipped"):
+                baselines["benchmarks"][bench.name] = {
+                    "value": entry["value"],
+                    "unit": bench.unit,
+                    "higher_is_better": bench.higher_is_better,
+                    "description": bench.description,
+                }
+        BASELINE_FILE.write_text(json.dumps(baselines, indent=2) + "\n", encoding="utf-8")
+        print(f"Updated {BASELINE_FILE}")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, entry in report.items():
+            if entry.get("skipped"):
+                print(f"{name:32} {'skipped (dependency missing)':>30}")
+                continue
+            status = "REGRESSED" if entry["regressed"] else "OK"
+            baseline = entry["baseline"]
+            baseline_text = f"baseline {baseline:.2f}" if baseline is not None else "no baseline"
+            print(f"{name:32} {entry['value']:14.2f} {entry['unit']:9} ({baseline_text})  {status}")
+
+    failed = any(entry.get("regressed") for entry in report.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Import-time benchmark for Letterboxd Friend Check
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each
+entry point, reports the cumulative import time and checks it against the
+budgets in import_budget.json. Heavy dependencies that must stay lazy
+(Selenium, webdriver-manager, BeautifulSoup, requests) are reported as
+violations if an entry point loads them at import time.
+
+Usage:
+    python scripts/perf/import_time.py [--runs N] [--json] [--update-budget]
+
+Exit code is 1 if any module is over budget or loads a forbidden dependency.
+
+For reference (CPython 3.11, one developer machine, cumulative -X importtime):
+deferring Selenium, webdriver-manager, bs4 and requests took LBoxFriendCheck
+from about 260 ms to about 50 ms. With the engine, poster, export and
+maintenance modules added since then, the median this script reports has
+ranged from about 50 to 140 ms between runs on a shared machine; the 150 ms
+budget leaves room for that noise.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "import_budget.json"
+
+# Headroom applied when writing a new budget from measured values
+BUDGET_HEADROOM = 1.5
+
+
+def measure_import(module: str) -> dict:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict with the module's cumulative import time in microseconds and the
+        set of top-level packages that were imported along the way
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(parts[1])
+
+    return {"cumulative_us": cumulative_us or 0, "loaded": loaded}
+
+
+def run_benchmark(budget: dict, runs: int) -> dict:
+    """Measure every module in the budget and compare against its limits"""
+    forbidden = set(budget.get("forbidden", []))
+    report = {}
+    for module, limit_ms in budget["modules"].items():
+        samples = [measure_import(module) for _ in range(runs)]
+        median_ms = median(s["cumulative_us"] for s in samples) / 1000
+        leaked = sorted(forbidden.intersection(samples[0]["loaded"]))
+        report[module] = {
+            "median_ms": round(median_ms, 1),
+            "budget_ms": limit_ms,
+            "over_budget": median_ms > limit_ms,
+            "forbidden_loaded": leaked,
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import-time budgets")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module (median is used)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument(
+        "--update-budget",
+        action="store_true",
+        help=f"Rewrite budgets as measured median x {BUDGET_HEADROOM}",
+    )
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text(encoding="utf-8"))
+    report = run_benchmark(budget, max(1, args.runs))
+
+    if args.update_budget:
+        for module, entry in report.items():
+            budget["modules"][module] = round(entry["median_ms"] * BUDGET_HEADROOM)
+        BUDGET_FILE.write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+        print(f"Updated {BUDGET_FILE}")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for module, entry in report.items():
+            status = "OK"
+            if entry["over_budget"]:
+                status = "OVER BUDGET"
+            if entry["forbidden_loaded"]:
+                status = f"LOADS {', '.join(entry['forbidden_loaded'])}"
+            print(
+                f"{module:45} {entry['median_ms']:8.1f} ms "
+                f"(budget {entry['budget_ms']} ms)  {status}"
+            )
+
+    failed = any(e["over_budget"] or e["forbidden_loaded"] for e in report.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
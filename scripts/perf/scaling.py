@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Database and comparison scaling report for Letterboxd Friend Check
+
+Generates synthetic databases with an increasing number of users (each
+with a 1k-10k film watchlist and Zipf-skewed film popularity, see
+letterboxd_friend_check/data/synthetic.py) and reports query latency and
+comparison memory at each size. Use --csv to chart the results.
+
+Usage:
+    python scripts/perf/scaling.py [--users 25 50 100 200] [--films N]
+                                   [--samples N] [--seed N] [--json | --csv]
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+from dataclasses import asdict, fields
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from letterboxd_friend_check.data.synthetic import SyntheticSpec  # noqa: E402
+from tests.benchmarks.scaling import ScalingPoint, run_scaling  # noqa: E402
+
+
+def main():
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(description="Measure DB and comparison scaling")
+    parser.add_argument(
+        "--users", type=int, nargs="+", default=[25, 50, 100, 200], help="Dataset sizes (users)"
+    )
+    parser.add_argument("--films", type=int, default=defaults.films, help="Catalog size")
+    parser.add_argument("--samples", type=int, default=5, help="Users measured per size")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Print the report as JSON")
+    output.add_argument("--csv", action="store_true", help="Print the report as CSV")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    spec = SyntheticSpec(films=args.films, seed=args.seed)
+    quiet = args.json or args.csv
+    points = run_scaling(
+        args.users,
+        spec,
+        args.samples,
+        progress=None if quiet else lambda message: print(message, flush=True),
+    )
+
+    if args.json:
+        print(json.dumps([asdict(point) for point in points], indent=2))
+    elif args.csv:
+        writer = csv.DictWriter(sys.stdout, [f.name for f in fields(ScalingPoint)])
+        writer.writeheader()
+        writer.writerows(asdict(point) for point in points)
+    else:
+        header = (
+            f"{'users':>6} {'rows':>9} {'db MB':>7} {'watchlist':>10} {'friends':>8} "
+            f"{'details':>8} {'compare':>9} {'peak MB':>8}"
+        )
+        print(header)
+        for p in points:
+            print(
+                f"{p.users:>6} {p.watchlist_rows:>9} {p.db_mb:>7.1f} "
+                f"{p.watchlist_query_ms:>8.1f}ms {p.friends_query_ms:>6.2f}ms "
+                f"{p.details_lookup_ms:>6.1f}ms {p.compare_from_db_ms:>7.1f}ms "
+                f"{p.compare_peak_mb:>8.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Offline performance benchmarks (see suite.py and scripts/perf/benchmarks.py)
+"""
@@ -0,0 +1,116 @@
+"""
+Scaling benchmarks for the database layer and watchlist comparison.
+
+Generates synthetic databases (letterboxd_friend_check.data.synthetic) of
+growing size and measures, at each size, the latency of the queries the
+app runs for one user and their friends, and the memory used to compare
+a user with all of their friends. The results are meant to be charted
+against dataset size; see scripts/perf/scaling.py.
+"""
+
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, List, Optional
+
+from letterboxd_friend_check.data import database
+from letterboxd_friend_check.data.synthetic import SyntheticSpec, generate
+from letterboxd_friend_check.engine import compare_watchlists
+
+
+@dataclass
+class ScalingPoint:
+    """Measurements for one dataset size"""
+
+    users: int
+    watchlist_rows: int
+    db_mb: float
+    generate_seconds: float
+    watchlist_query_ms: float
+    friends_query_ms: float
+    details_lookup_ms: float
+    compare_from_db_ms: float
+    compare_peak_mb: float
+
+
+def _median_ms(func: Callable[[str], object], usernames: List[str]) -> float:
+    """Median time of func(username) over the given users"""
+    timings = []
+    for username in usernames:
+        start = time.perf_counter()
+        func(username)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def compare_user_from_db(username: str, db_path: str):
+    """What a comparison run does once everything is cached: load and compare"""
+    user_movies = database.get_watchlist_from_db(username, db_path)
+    friends = {
+        friend: database.get_watchlist_from_db(friend, db_path)
+        for friend in database.get_friends_from_db(username, db_path)
+    }
+    return compare_watchlists(user_movies, friends)
+
+
+def measure(db_path: str, usernames: List[str], samples: int = 5, seed: int = 1) -> dict:
+    """Query latencies (median over `samples` users) and comparison memory"""
+    import movie_database
+
+    sampled = random.Random(seed).sample(usernames, min(samples, len(usernames)))
+    watchlists = {user: list(database.get_watchlist_from_db(user, db_path)) for user in sampled}
+
+    results = {
+        "watchlist_query_ms": _median_ms(
+            lambda user: database.get_watchlist_from_db(user, db_path), sampled
+        ),
+        "friends_query_ms": _median_ms(
+            lambda user: database.get_friends_from_db(user, db_path), sampled
+        ),
+        "details_lookup_ms": _median_ms(
+            lambda user: movie_database.get_movie_details_for_titles(watchlists[user], db_path),
+            sampled,
+        ),
+        "compare_from_db_ms": _median_ms(lambda user: compare_user_from_db(user, db_path), sampled),
+    }
+
+    tracemalloc.start()
+    try:
+        compare_user_from_db(sampled[0], db_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    results["compare_peak_mb"] = peak / (1024 * 1024)
+    return results
+
+
+def run_scaling(
+    user_counts: Iterable[int],
+    spec: SyntheticSpec = SyntheticSpec(),
+    samples: int = 5,
+    progress: Optional[Callable[[str], None]] = None,
+) -> List[ScalingPoint]:
+    """Generate a database per user count in `user_counts` and measure it"""
+    points = []
+    for users in user_counts:
+        sized = replace(spec, users=users, friends_per_user=min(spec.friends_per_user, users - 1))
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "synthetic.db")
+            dataset = generate(db_path, sized, progress=lambda message: None)
+            if progress:
+                progress(f"{users} users: {dataset.watchlist_rows} watchlist rows, measuring...")
+            results = measure(db_path, dataset.usernames, samples)
+            points.append(
+                ScalingPoint(
+                    users=users,
+                    watchlist_rows=dataset.watchlist_rows,
+                    db_mb=os.path.getsize(db_path) / (1024 * 1024),
+                    generate_seconds=dataset.seconds,
+                    **results,
+                )
+            )
+    return points
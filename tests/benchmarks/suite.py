@@ -0,0 +1,183 @@
+"""
+Benchmark suite for Letterboxd Friend Check.
+
+Each benchmark runs real project code against offline inputs (the replay
+server in tests/stub_server.py, recorded fixture pages, temporary SQLite
+databases) and returns one number. `scale` shrinks or grows the workload:
+1.0 is the size the stored baselines were taken at; the unit tests run the
+suite at a tiny scale to keep it working.
+
+Run it with scripts/perf/benchmarks.py.
+"""
+
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Set
+from unittest import mock
+
+from letterboxd_friend_check.data import database
+from letterboxd_friend_check.data.movie_index import FriendMovieIndex
+from letterboxd_friend_check.engine import compare_watchlists
+from letterboxd_friend_check.gui.results_model import ResultsModel
+from letterboxd_friend_check.utils import async_web, web
+from letterboxd_friend_check.utils.rate_limit import RateLimiter
+from tests.stub_server import ReplayServer, load_fixture
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark"""
+
+    name: str
+    unit: str
+    higher_is_better: bool
+    func: Callable[[float], float]
+    description: str
+    available: Callable[[], bool] = lambda: True
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, unit: str, higher_is_better: bool, available=lambda: True):
+    """Register a function taking a scale and returning the measured value"""
+
+    def register(func):
+        description = (func.__doc__ or name).strip().splitlines()[0]
+        BENCHMARKS.append(Benchmark(name, unit, higher_is_better, func, description, available))
+        return func
+
+    return register
+
+
+@contextmanager
+def unthrottled():
+    """Disable the polite per-page delays (a limiter that never waits replaces them)"""
+    previous = web.get_rate_limiter()
+    web.set_rate_limiter(RateLimiter(1e9, burst=10**9))
+    try:
+        yield
+    finally:
+        web.set_rate_limiter(previous)
+
+
+def title_pool(size: int, seed: int = 7) -> List[str]:
+    """Deterministic, realistic-looking film titles"""
+    rng = random.Random(seed)
+    words = ["Night", "Heat", "Blue", "River", "Ghost", "City", "Last", "Summer", "Red", "Home"]
+    return [
+        f"{rng.choice(words)} {rng.choice(words)} {i} ({rng.randint(1920, 2024)})"
+        for i in range(size)
+    ]
+
+
+def random_watchlists(
+    users: int, size: int, pool: List[str], seed: int = 11
+) -> Dict[str, Set[str]]:
+    rng = random.Random(seed)
+    return {f"user{u}": set(rng.sample(pool, size)) for u in range(users)}
+
+
+@benchmark("watchlist_pages_per_sec", "pages/s", True)
+def bench_get_watchlist(scale: float) -> float:
+    """web.get_watchlist page throughput against the replay server"""
+    pages = max(2, int(20 * scale))
+    with ReplayServer(pages) as server, unthrottled():
+        with mock.patch.object(web, "BASE_URL", server.base_url):
+            start = time.perf_counter()
+            movies = web.get_watchlist("bench", progress_callback=lambda *args: None)
+            elapsed = time.perf_counter() - start
+        requests_made = server.request_count
+    assert len(movies) == 28 * pages, len(movies)
+    return requests_made / elapsed
+
+
+@benchmark("async_watchlist_pages_per_sec", "pages/s", True, async_web.is_available)
+def bench_async_get_watchlist(scale: float) -> float:
+    """AsyncBackend.get_watchlist page throughput against the replay server"""
+    pages = max(2, int(20 * scale))
+    with ReplayServer(pages) as server:
+        with async_web.AsyncBackend(base_url=server.base_url) as backend:
+            start = time.perf_counter()
+            movies = backend.get_watchlist("bench")
+            elapsed = time.perf_counter() - start
+        requests_made = server.request_count
+    assert len(movies) == 28 * pages, len(movies)
+    return requests_made / elapsed
+
+
+@benchmark("parse_ms_per_page", "ms", False)
+def bench_parse_page(scale: float) -> float:
+    """web.parse_watchlist_page time for one recorded page"""
+    html = load_fixture("letterboxd/watchlist_page.html")
+    runs = max(3, int(50 * scale))
+    start = time.perf_counter()
+    for _ in range(runs):
+        web.parse_watchlist_page(html)
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+@benchmark("db_movies_per_sec", "movies/s", True)
+def bench_sync_watchlist_to_db(scale: float) -> float:
+    """sync_watchlist_to_db throughput for one large watchlist into a fresh database"""
+    movies = set(title_pool(max(100, int(5000 * scale))))
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        database.init_db(db_path)
+        start = time.perf_counter()
+        database.sync_watchlist_to_db("bench", movies, db_path)
+        elapsed = time.perf_counter() - start
+    return len(movies) / elapsed
+
+
+@benchmark("compare_ms", "ms", False)
+def bench_compare_watchlists(scale: float) -> float:
+    """compare_watchlists for one user against many friends"""
+    pool = title_pool(20000)
+    user = set(random.Random(3).sample(pool, 5000))
+    friends = random_watchlists(max(5, int(200 * scale)), 1000, pool)
+    start = time.perf_counter()
+    compare_watchlists(user, friends)
+    return (time.perf_counter() - start) * 1000
+
+
+@benchmark("results_build_ms", "ms", False)
+def bench_results_build(scale: float) -> float:
+    """Results tab rows plus the movies-tab index for the largest friend"""
+    pool = title_pool(20000)
+    user = set(random.Random(3).sample(pool, 5000))
+    friends = random_watchlists(max(5, int(200 * scale)), 1000, pool)
+    common = compare_watchlists(user, friends)
+    largest = max(common, key=lambda friend: len(common[friend]))
+
+    start = time.perf_counter()
+    rows = list(ResultsModel(common).rows())
+    index = FriendMovieIndex(friends[largest], common[largest], {})
+    index.sorted_by("title")
+    elapsed = time.perf_counter() - start
+    assert rows
+    return elapsed * 1000
+
+
+@benchmark("tmdb_movies_per_sec", "movies/s", True, async_web.is_available)
+def bench_tmdb_enrichment(scale: float) -> float:
+    """AsyncTMDBApi enrichment throughput against the replay server"""
+    from letterboxd_friend_check.api.async_tmdb import bulk_enrich_movies
+
+    movies = [{"title": title} for title in title_pool(max(10, int(200 * scale)))]
+    with ReplayServer() as server:
+        start = time.perf_counter()
+        enriched = bulk_enrich_movies(movies, "bench-key", base_url=server.tmdb_url)
+        elapsed = time.perf_counter() - start
+    assert all(movie.get("tmdb_id") == 949 for movie in enriched)
+    return len(movies) / elapsed
+
+
+def run_benchmark(bench: Benchmark, scale: float = 1.0, repeat: int = 3) -> float:
+    """Best value of `repeat` runs (highest or lowest, depending on the metric)"""
+    values = [bench.func(scale) for _ in range(max(1, repeat))]
+    return max(values) if bench.higher_is_better else min(values)
@@ -0,0 +1,154 @@
+"""
+Offline replay server for tests and benchmarks.
+
+Serves the recorded Letterboxd pages and TMDB responses in tests/fixtures
+from a local ThreadingHTTPServer, so the scrapers and API clients run
+their real HTTP and parsing code without touching the network. Every user
+has the same watchlist shape: `watchlist_pages` pages of the recorded page
+(film titles get a " [page N]" suffix past page 1 so they stay unique),
+followed by an empty page. Following lists work the same way with
+`following_pages` pages (usernames get a "-pN" suffix past page 1).
+Any image under /t/p/ is the recorded poster, standing in for TMDB's image
+server (see `image_url`).
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def load_fixture(name: str) -> str:
+    """Text of a fixture file, e.g. load_fixture("letterboxd/watchlist_page.html")"""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def load_fixture_bytes(name: str) -> bytes:
+    """Raw bytes of a binary fixture file, e.g. load_fixture_bytes("tmdb/poster.jpg")"""
+    return (FIXTURES_DIR / name).read_bytes()
+
+
+def watchlist_page_html(page: int, pages: int) -> str:
+    """The recorded watchlist page rewritten as page `page` of `pages`"""
+    if page > pages:
+        return load_fixture("letterboxd/watchlist_empty.html")
+    html = load_fixture("letterboxd/watchlist_page.html")
+    if page > 1:
+        html = re.sub(r'alt="([^"]*)"', rf'alt="\1 [page {page}]"', html)
+    links = "".join(
+        f'<li class="paginate-page"><a href="/fixture/watchlist/page/{n}/">{n}</a></li>'
+        for n in range(1, pages + 1)
+    )
+    per_page = len(re.findall(r'class="poster-container"', html))
+    html = re.sub(
+        r"(<div class=\"paginate-pages\">\s*<ul>).*?(</ul>)", rf"\1{links}\2", html, 1, re.S
+    )
+    return html.replace("2,774", f"{per_page * pages:,}")
+
+
+def following_page_html(page: int, pages: int) -> str:
+    """The recorded following page rewritten as page `page` of `pages`"""
+    if page > pages:
+        return load_fixture("letterboxd/watchlist_empty.html")
+    html = load_fixture("letterboxd/following_page.html")
+    if page > 1:
+        html = re.sub(r'(class="avatar -a40" href="/)([^/"]+)/', rf"\1\2-p{page}/", html)
+    if pages > 1:
+        links = "".join(
+            f'<li class="paginate-page"><a href="/fixture/following/page/{n}/">{n}</a></li>'
+            for n in range(1, pages + 1)
+        )
+        html = html.replace("</body>", f'<div class="paginate-pages"><ul>{links}</ul></div></body>')
+    return html
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops connections when a concurrent client
+    # opens many at once, adding a 1s SYN retransmit to the timings
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class ReplayServer:
+    """Local HTTP server replaying the fixtures (use as a context manager)"""
+
+    def __init__(self, watchlist_pages: int = 3, following_pages: int = 1) -> None:
+        self.watchlist_pages = watchlist_pages
+        self.following_pages = following_pages
+        self.paths = []
+        self._lock = threading.Lock()
+        self._pages = {}
+        self._httpd = _Server(("127.0.0.1", 0), self._handler_class())
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self.tmdb_url = f"{self.base_url}/3"
+        self.image_url = f"{self.base_url}/t/p/w92"
+
+    def __enter__(self) -> "ReplayServer":
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.paths)
+
+    def _watchlist(self, page: int) -> str:
+        # Rewriting a page is not free; cache it so the server isn't the bottleneck
+        html = self._pages.get(page)
+        if html is None:
+            html = self._pages[page] = watchlist_page_html(page, self.watchlist_pages)
+        return html
+
+    def respond(self, path: str):
+        """(status, content type, body) for a request path; body is str or bytes"""
+        parts = urlparse(path).path.strip("/").split("/")
+        if len(parts) >= 2 and parts[1] == "watchlist":
+            page = int(parts[3]) if len(parts) > 3 else 1
+            return 200, "text/html", self._watchlist(page)
+        if len(parts) >= 2 and parts[1] == "following":
+            page = int(parts[3]) if len(parts) > 3 else 1
+            return 200, "text/html", following_page_html(page, self.following_pages)
+        if parts[:3] == ["3", "search", "movie"]:
+            return 200, "application/json", load_fixture("tmdb/search_movie.json")
+        if parts[:2] == ["3", "movie"]:
+            return 200, "application/json", load_fixture("tmdb/movie_details.json")
+        if parts[:2] == ["t", "p"] and len(parts) == 4:
+            return 200, "image/jpeg", load_fixture_bytes("tmdb/poster.jpg")
+        return 404, "application/json", json.dumps({"status_message": "not found"})
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; without this, keep-alive
+            # clients stall on delayed ACKs and the server dominates timings
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server._lock:
+                    server.paths.append(self.path)
+                status, content_type, body = server.respond(self.path)
+                if isinstance(body, bytes):
+                    data = body
+                else:
+                    data = body.encode("utf-8")
+                    content_type = f"{content_type}; charset=utf-8"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
@@ -0,0 +1,219 @@
+"""
+Unit tests for the asyncio scraping backend, run against a local stub server.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+from letterboxd_friend_check.utils import async_web, web  # noqa: E402
+from letterboxd_friend_check.utils.rate_limit import RateLimiter  # noqa: E402
+
+WATCHLIST = ["Alien", "Heat", "Jaws", "Tron", "Up"]
+FOLLOWING = ["ben", "cat", "dan"]
+PER_PAGE = 2
+
+
+def watchlist_page(page):
+    """HTML for one watchlist page of the stub user"""
+    titles = WATCHLIST[(page - 1) * PER_PAGE : page * PER_PAGE]
+    posters = "".join(
+        f'<li class="poster-container"><a data-film-name="{title}"></a></li>' for title in titles
+    )
+    last = -(-len(WATCHLIST) // PER_PAGE)
+    pages = "".join(f'<li><a href="page/{n}/">{n}</a></li>' for n in range(1, last + 1))
+    return (
+        f'<span class="js-watchlist-count">{len(WATCHLIST)}&nbsp;films</span>'
+        f'<ul class="poster-list">{posters}</ul>'
+        f'<div class="paginate-pages"><ul>{pages}</ul></div>'
+    )
+
+
+def following_page(page):
+    """HTML for one (unpaginated) following page of the stub user"""
+    if page != 1:
+        return "<p>No more</p>"
+    return "".join(
+        f'<div class="person-summary"><a class="avatar" href="/{name}/"></a></div>'
+        for name in FOLLOWING + ["amy"]
+    )
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the stub user 'amy' and a minimal TMDB API"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        self.server.paths.append(url.path)
+        body, content_type = None, "text/html"
+        if url.path in self.server.failing:
+            self.send_response(500)
+            self.end_headers()
+            return
+        if parts[:2] == ["amy", "watchlist"]:
+            body = watchlist_page(int(parts[3]) if len(parts) > 3 else 1)
+        elif parts[:2] == ["amy", "following"]:
+            body = following_page(int(parts[3]))
+        elif parts[:2] == ["3", "search"]:
+            query = parse_qs(url.query)["query"][0]
+            body = json.dumps({"results": [{"id": len(query), "title": query}]})
+            content_type = "application/json"
+        elif parts[:2] == ["3", "movie"]:
+            details = {"runtime": 90, "genres": [{"name": "Drama"}], "vote_average": 7.5}
+            body = json.dumps(details)
+            content_type = "application/json"
+
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@unittest.skipUnless(async_web.is_available(), "aiohttp is not installed")
+class TestAsyncBackend(unittest.TestCase):
+    """Test cases for AsyncBackend against the stub server."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stub server."""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.paths = []
+        cls.server.failing = set()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the stub server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.server.paths.clear()
+        self.server.failing = set()
+        self.backend = async_web.AsyncBackend(base_url=self.base_url)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.backend.close()
+
+    def test_matches_blocking_scraper(self):
+        """Both backends return the same watchlist, friends and count."""
+        web.set_rate_limiter(RateLimiter(1000, burst=100))
+        try:
+            with mock.patch.object(web, "BASE_URL", self.base_url):
+                blocking = (
+                    web.get_watchlist("amy", progress_callback=lambda *args: None),
+                    web.get_friends("amy"),
+                    web.get_watchlist_count("amy"),
+                )
+        finally:
+            web.set_rate_limiter(None)
+
+        progress = []
+        concurrent = (
+            self.backend.get_watchlist("amy", progress_callback=lambda *a: progress.append(a)),
+            self.backend.get_friends("amy"),
+            self.backend.get_watchlist_count("amy"),
+        )
+        self.assertEqual(concurrent, blocking)
+        self.assertEqual(concurrent[0], set(WATCHLIST))
+        self.assertEqual(concurrent[1], set(FOLLOWING))
+        self.assertEqual(sorted(progress)[-1], (5, 5))
+
+    def test_limit_fetches_only_needed_pages(self):
+        """A limit of 3 with 2 films per page stops after page 2."""
+        watchlist = self.backend.get_watchlist("amy", limit=3)
+        self.assertEqual(watchlist, set(WATCHLIST[:3]))
+        pages = [path for path in self.server.paths if "/watchlist/page/" in path]
+        self.assertEqual(sorted(pages), ["/amy/watchlist/page/1/", "/amy/watchlist/page/2/"])
+
+    def test_strict_friends_raise_on_failed_pages(self):
+        """A failed page makes a strict follow list fetch raise instead of truncating."""
+        self.server.failing = {"/amy/following/page/2/"}
+        with self.assertRaises(web.FriendsFetchError):
+            self.backend.get_friends("amy", strict=True)
+        self.assertEqual(self.backend.get_friends("amy"), set(FOLLOWING))
+
+        self.server.failing = set()
+        self.assertEqual(self.backend.get_friends("amy", strict=True), set(FOLLOWING))
+
+    def test_interrupted_fetch_is_journaled_and_resumed(self):
+        """Pages are checkpointed in order, so a failed page is where the next sync resumes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "letterboxd.db")
+            engine = SyncEngine(db_path=db_path, **self.backend.engine_fetchers())
+            self.assertTrue(engine.resumable)
+
+            self.server.failing = {"/amy/watchlist/page/2/"}
+            engine.sync_user("amy")
+            checkpoint = database.get_sync_checkpoint("amy", db_path)
+            self.assertEqual(checkpoint["pages_done"], 1)
+            self.assertEqual(database.get_watchlist_from_db("amy", db_path), set())
+
+            self.server.failing = set()
+            self.server.paths.clear()
+            self.assertEqual(engine.sync_user("amy"), set(WATCHLIST))
+            self.assertIsNone(database.get_sync_checkpoint("amy", db_path))
+            self.assertEqual(database.get_watchlist_from_db("amy", db_path), set(WATCHLIST))
+        self.assertEqual(self.server.paths[0], "/amy/watchlist/page/2/")
+        self.assertNotIn("/amy/watchlist/page/1/", self.server.paths)
+
+    def test_cancel_stops_new_requests(self):
+        """After cancel() nothing more is fetched."""
+        self.backend.cancel()
+        self.assertEqual(self.backend.get_watchlist("amy"), set())
+        self.assertEqual(self.server.paths, [])
+
+    def test_async_tmdb_enrichment(self):
+        """The async TMDB client maps results like TMDBApi."""
+        from letterboxd_friend_check.api.async_tmdb import bulk_enrich_movies
+
+        movies = bulk_enrich_movies(
+            [{"title": "Heat (1995)"}, {"title": "Up"}], "key", base_url=f"{self.base_url}/3"
+        )
+        self.assertEqual([movie["tmdb_id"] for movie in movies], [4, 2])
+        self.assertEqual(movies[0]["genres"], ["Drama"])
+        self.assertEqual(movies[1]["runtime"], 90)
+
+
+class TestPageParsers(unittest.TestCase):
+    """Test cases for the shared page parsers."""
+
+    def test_watchlist_page(self):
+        """Titles, the total count and the last page are read from one page."""
+        html = watchlist_page(1)
+        self.assertEqual(web.parse_watchlist_page(html), ["Alien", "Heat"])
+        self.assertEqual(web.parse_watchlist_count(html), 5)
+        self.assertEqual(web.parse_last_page(html), 3)
+
+    def test_friends_page_excludes_self(self):
+        """The user's own avatar is not counted as a friend."""
+        self.assertEqual(web.parse_friends_page(following_page(1), "amy"), FOLLOWING)
+        self.assertEqual(web.parse_last_page(following_page(1)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
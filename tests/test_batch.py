@@ -0,0 +1,122 @@
+"""
+Unit tests for the headless batch sync and the shared rate limiter.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.batch import RequestTally, read_usernames, run_batch  # noqa: E402
+from letterboxd_friend_check.cli import build_parser  # noqa: E402
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+from letterboxd_friend_check.utils.rate_limit import RateLimiter  # noqa: E402
+
+WATCHLISTS = {
+    "ann": {"Alien", "Heat"},
+    "ben": {"Heat", "Jaws"},
+    "cat": {"Alien", "Jaws", "Tron"},
+    "dan": {"Tron"},
+}
+FOLLOWS = {"ann": ["cat", "dan"], "ben": ["cat", "dan", "ann"]}
+
+
+class TestRunBatch(unittest.TestCase):
+    """Test cases for run_batch with stubbed scrapers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.fetched = []
+        self.lock = threading.Lock()
+
+        def fetch_watchlist(username, limit=None, progress_callback=None):
+            with self.lock:
+                self.fetched.append(username)
+            return set(WATCHLISTS[username])
+
+        self.engine = SyncEngine(
+            db_path=os.path.join(self.tmp.name, "letterboxd.db"),
+            fetch_watchlist=fetch_watchlist,
+            fetch_friends=lambda user: FOLLOWS.get(user, []),
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_shared_friends_are_fetched_once(self):
+        """Friends followed by several accounts are scraped a single time."""
+        summary = run_batch(["ann", "ben"], engine=self.engine, rate=None)
+
+        self.assertEqual(sorted(self.fetched), ["ann", "ben", "cat", "dan"])
+        cache = summary["watchlist_cache"]
+        self.assertEqual((cache["lookups"], cache["scraped"], cache["hits"]), (7, 4, 3))
+        self.assertEqual(summary["accounts"]["ann"]["common_movies"], 1)
+        self.assertEqual(summary["accounts"]["ben"]["friends_with_common_movies"], 2)
+        self.assertEqual(summary["users"]["cat"]["movies"], 3)
+        self.assertEqual(summary["errors"], {})
+
+    def test_recent_watchlists_come_from_the_database(self):
+        """A second run right after the first scrapes nothing."""
+        run_batch(["ann", "ben"], engine=self.engine, rate=None)
+        summary = run_batch(["ann", "ben"], engine=self.engine, rate=None)
+
+        self.assertEqual(len(self.fetched), 4)
+        self.assertEqual(summary["watchlist_cache"]["fresh_from_db"], 4)
+        self.assertEqual(summary["watchlist_cache"]["scraped"], 0)
+        self.assertEqual(summary["accounts"]["ann"]["common_movies"], 1)
+
+
+class TestBatchHelpers(unittest.TestCase):
+    """Test cases for the batch helpers and CLI parsing."""
+
+    def test_read_usernames_merges_file_and_args(self):
+        """Usernames from a file are appended, comments and duplicates dropped."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("ben\n# comment\n\ncat  # trailing\nann\n")
+        try:
+            self.assertEqual(read_usernames(["ann"], f.name), ["ann", "ben", "cat"])
+        finally:
+            os.unlink(f.name)
+
+    def test_request_tally_groups_by_user(self):
+        """Requests are attributed to the user in the URL path."""
+        tally = RequestTally()
+        tally("https://letterboxd.com/ann/watchlist/page/1/", 200, 0.1)
+        tally("https://letterboxd.com/ann/following/page/1/", 429, 0.1)
+        tally("https://letterboxd.com/ben/watchlist/", None, 0.1)
+        self.assertEqual(tally.by_user, {"ann": 2, "ben": 1})
+        self.assertEqual(tally.by_status, {"200": 1, "429": 1, "error": 1})
+
+    def test_batch_subcommand_parsing(self):
+        """The batch subcommand accepts usernames and options."""
+        args = build_parser().parse_args(["batch", "ann", "ben", "--workers", "8", "--rate", "0"])
+        self.assertEqual((args.command, args.usernames, args.workers), ("batch", ["ann", "ben"], 8))
+        self.assertIsNone(build_parser().parse_args([]).command)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for the token bucket rate limiter."""
+
+    def test_waits_once_burst_is_used(self):
+        """Requests beyond the burst wait 1/rate seconds each."""
+        now = [0.0]
+        sleeps = []
+        limiter = RateLimiter(2.0, burst=2, clock=lambda: now[0], sleep=sleeps.append)
+        waits = [limiter.acquire() for _ in range(4)]
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 1.0])
+        self.assertEqual(sleeps, [0.5, 1.0])
+
+    def test_rejects_non_positive_rate(self):
+        """A rate of zero is rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
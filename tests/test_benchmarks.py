@@ -0,0 +1,60 @@
+"""
+Smoke tests for the offline benchmark suite and the replay server.
+"""
+
+import unittest
+import sys
+import os
+import json
+import math
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.utils import web  # noqa: E402
+from tests.benchmarks.suite import BENCHMARKS, run_benchmark  # noqa: E402
+from tests.stub_server import watchlist_page_html  # noqa: E402
+
+BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "perf",
+    "benchmark_baselines.json",
+)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test cases for the benchmark suite."""
+
+    def test_every_benchmark_runs_at_small_scale(self):
+        """Each available benchmark returns a positive, finite value."""
+        for bench in BENCHMARKS:
+            if not bench.available():
+                continue
+            with self.subTest(bench.name):
+                value = run_benchmark(bench, scale=0.05, repeat=1)
+                self.assertTrue(value > 0 and math.isfinite(value))
+
+    def test_every_benchmark_has_a_baseline(self):
+        """The stored baselines cover the whole suite."""
+        with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+            baselines = json.load(f)["benchmarks"]
+        self.assertEqual(set(baselines), {bench.name for bench in BENCHMARKS})
+
+
+class TestReplayPages(unittest.TestCase):
+    """Test cases for the rewritten fixture pages."""
+
+    def test_pages_have_unique_titles_and_pagination(self):
+        """Later pages get distinct titles; pagination and count match the page total."""
+        first, second = watchlist_page_html(1, 4), watchlist_page_html(2, 4)
+        titles = web.parse_watchlist_page(first)
+        self.assertEqual(len(titles), 28)
+        self.assertFalse(set(titles) & set(web.parse_watchlist_page(second)))
+        self.assertEqual(web.parse_last_page(first), 4)
+        self.assertEqual(web.parse_watchlist_count(first), 112)
+        self.assertEqual(web.parse_watchlist_page(watchlist_page_html(5, 4)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
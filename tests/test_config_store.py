@@ -0,0 +1,108 @@
+"""
+Unit tests for the shared config store and friend selections in SQLite.
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.config import Config, ConfigStore, get_config_store  # noqa: E402
+from letterboxd_friend_check.data import database  # noqa: E402
+
+
+class TestConfigStore(unittest.TestCase):
+    """Test cases for ConfigStore."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "config.json")
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"username": "amy", "dark_mode": False}, f)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def read_file(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_changes_are_batched_into_one_write(self):
+        """A burst of updates is written once, after the debounce."""
+        store = ConfigStore(self.path, debounce_seconds=60)
+        store.set("dark_mode", True)
+        store.update({"username": "ben", "remember_user": True})
+        self.assertEqual(self.read_file()["username"], "amy")
+
+        store.flush()
+        self.assertEqual(store.writes, 1)
+        self.assertEqual(
+            self.read_file(), {"username": "ben", "dark_mode": True, "remember_user": True}
+        )
+        self.assertEqual(os.listdir(self.tmp.name), ["config.json"])
+
+    def test_unchanged_values_are_not_written(self):
+        """Setting a key to its current value schedules nothing."""
+        store = ConfigStore(self.path, debounce_seconds=60)
+        store.update({"username": "amy", "dark_mode": False})
+        store.flush()
+        self.assertEqual(store.writes, 0)
+
+    def test_config_instances_share_one_store(self):
+        """Config objects for one path read the file once and share values."""
+        first = Config(self.path)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"username": "changed on disk"}, f)
+        second = Config(self.path)
+
+        self.assertIs(get_config_store(self.path), second._store)
+        self.assertEqual(second.username, "amy")
+        first["tmdb_api_key"] = "key"
+        self.assertEqual(second.get("tmdb_api_key"), "key")
+        second.load()
+        self.assertEqual(first.username, "changed on disk")
+
+    def test_pending_changes_are_written_at_exit(self):
+        """A write still waiting on the debounce timer is flushed when Python exits."""
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "from letterboxd_friend_check.config import get_config_store\n"
+            "get_config_store(sys.argv[2]).set('username', 'ben')\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", script, root, self.path], check=True, timeout=30)
+        self.assertEqual(self.read_file()["username"], "ben")
+
+
+class TestFriendSelections(unittest.TestCase):
+    """Test cases for the friend_selections table."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        database.init_db(self.db_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_selection_round_trip(self):
+        """Ticked friends come back in checklist order; None before any save."""
+        self.assertIsNone(database.get_friend_selection("amy", self.db_path))
+        database.save_friend_selection("amy", ["cat", "ben", "dan"], ["dan", "cat"], self.db_path)
+        self.assertEqual(database.get_friend_selection("amy", self.db_path), ["cat", "dan"])
+
+        database.save_friend_selection("amy", ["cat", "ben"], [], self.db_path)
+        self.assertEqual(database.get_friend_selection("amy", self.db_path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
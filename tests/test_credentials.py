@@ -0,0 +1,67 @@
+"""
+Unit tests for the memoized TMDB credential provider.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.api.credentials import CredentialProvider  # noqa: E402
+from letterboxd_friend_check.config import get_config_store  # noqa: E402
+
+
+class TestCredentialProvider(unittest.TestCase):
+    """Test cases for CredentialProvider."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.missing = os.path.join(self.tmp.name, "missing.json")
+        self.path = os.path.join(self.tmp.name, "config.json")
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"tmdb_api_key": " abc "}, f)
+        self.provider = CredentialProvider([self.missing, self.path])
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("TMDB_API_KEY", None)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_key_is_looked_up_once(self):
+        """Repeated calls reuse the memoized key."""
+        for _ in range(100):
+            self.assertEqual(self.provider.get_tmdb_api_key(), "abc")
+        self.assertEqual(self.provider.lookups, 1)
+
+    def test_invalidate_picks_up_a_new_key(self):
+        """After invalidate() a key saved through the config store is used."""
+        self.assertEqual(self.provider.get_tmdb_api_key(), "abc")
+        get_config_store(self.path).set("tmdb_api_key", "new")
+        self.assertEqual(self.provider.get_tmdb_api_key(), "abc")
+        self.provider.invalidate()
+        self.assertEqual(self.provider.get_tmdb_api_key(), "new")
+        self.assertEqual(self.provider.lookups, 2)
+
+    def test_environment_wins_and_missing_key_is_memoized(self):
+        """TMDB_API_KEY takes precedence; a missing key is not re-probed."""
+        os.environ["TMDB_API_KEY"] = "from-env"
+        self.assertEqual(self.provider.get_tmdb_api_key(), "from-env")
+
+        provider = CredentialProvider([self.missing])
+        del os.environ["TMDB_API_KEY"]
+        self.assertIsNone(provider.get_tmdb_api_key())
+        self.assertIsNone(provider.get_tmdb_api_key())
+        self.assertEqual(provider.lookups, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
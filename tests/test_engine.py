@@ -0,0 +1,92 @@
+"""
+Unit tests for the GUI-free sync engine.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.engine import POLICY_LIMIT, POLICY_SKIP, SyncEngine  # noqa: E402
+
+WATCHLISTS = {
+    "me": {"Alien", "Heat", "Jaws"},
+    "amy": {"Heat", "Rocky"},
+    "bob": {"Alien", "Jaws", "Tron"},
+    "huge": {f"Film {i}" for i in range(600)} | {"Heat"},
+}
+
+
+def fake_fetch_watchlist(username, limit=None, progress_callback=None):
+    """Return a canned watchlist, honouring the limit like the scraper does."""
+    movies = sorted(WATCHLISTS[username])
+    if limit:
+        movies = movies[:limit]
+    if progress_callback:
+        progress_callback(len(movies), len(WATCHLISTS[username]))
+    return set(movies)
+
+
+class TestSyncEngine(unittest.TestCase):
+    """Test cases for SyncEngine with stubbed scrapers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        self.engine = SyncEngine(
+            db_path=self.db_path,
+            fetch_watchlist=fake_fetch_watchlist,
+            fetch_watchlist_count=lambda user: len(WATCHLISTS[user]),
+            fetch_friends=lambda user: ["bob", "amy", "bob"],
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_sync_fetches_persists_and_compares(self):
+        """A full run stores every watchlist and reports common movies."""
+        updates = []
+        result = self.engine.sync("me", ["amy", "bob"], progress=updates.append)
+
+        self.assertEqual(result.common_movies, {"amy": {"Heat"}, "bob": {"Alien", "Jaws"}})
+        self.assertEqual(database.get_watchlist_from_db("bob", self.db_path), WATCHLISTS["bob"])
+        self.assertEqual(updates[-1].stage, "done")
+        self.assertEqual(updates[-1].percent, 100)
+        self.assertFalse(result.cancelled)
+
+    def test_large_watchlist_policy(self):
+        """The policy can skip a friend or limit how much is fetched."""
+        result = self.engine.sync("me", ["huge"], watchlist_policy=lambda f, n: POLICY_SKIP)
+        self.assertEqual(result.skipped, ["huge"])
+        self.assertEqual(result.friends_watchlists, {})
+
+        result = self.engine.sync("me", ["huge"], watchlist_policy=lambda f, n: POLICY_LIMIT)
+        self.assertEqual(len(result.friends_watchlists["huge"]), 500)
+
+    def test_cancel_before_friends(self):
+        """A set cancel event stops before any friend is fetched."""
+        cancel = threading.Event()
+        cancel.set()
+        result = self.engine.sync("me", ["amy", "bob"], cancel_event=cancel)
+        self.assertTrue(result.cancelled)
+        self.assertEqual(result.friends_completed, 0)
+        self.assertEqual(result.user_watchlist, WATCHLISTS["me"])
+
+    def test_parallel_workers_and_friend_sync(self):
+        """Friends can be fetched concurrently; friend lists are deduplicated."""
+        self.engine.max_workers = 3
+        result = self.engine.sync("me", ["amy", "bob", "huge"])
+        self.assertEqual(set(result.friends_watchlists), {"amy", "bob", "huge"})
+        self.assertEqual(self.engine.sync_friends("me"), ["amy", "bob"])
+        self.assertEqual(database.get_friends_from_db("me", self.db_path), ["amy", "bob"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Unit tests for importing a Letterboxd data export ZIP.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import zipfile
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.cli import main as cli_main  # noqa: E402
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.data.export_import import (  # noqa: E402
+    ExportError,
+    import_letterboxd_export,
+)
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+
+HEADER = "Date,Name,Year,Letterboxd URI\n"
+
+
+def write_export(path, watchlist, watched=(), ratings=(), username="me"):
+    """Write an export archive laid out like Letterboxd's (one top-level folder)."""
+    folder = "letterboxd-me-2025-01-01-00-00-utc"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        if username:
+            archive.writestr(
+                f"{folder}/profile.csv", f"Date Joined,Username\n2020-01-01,{username}\n"
+            )
+        rows = "".join(f'2024-01-02,"{name}",2000,https://boxd.it/x\n' for name in watchlist)
+        # Exports start with a byte order mark
+        archive.writestr(f"{folder}/watchlist.csv", "\ufeff" + HEADER + rows)
+        rows = "".join(f"{date},{name},2000,https://boxd.it/x\n" for name, date in watched)
+        archive.writestr(f"{folder}/watched.csv", HEADER + rows)
+        rows = "".join(f"2024-03-01,{name},2000,https://boxd.it/x,{r}\n" for name, r in ratings)
+        archive.writestr(f"{folder}/ratings.csv", HEADER.rstrip("\n") + ",Rating\n" + rows)
+
+
+class TestExportImport(unittest.TestCase):
+    """Test cases for import_letterboxd_export."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        self.zip_path = os.path.join(self.tmp.name, "export.zip")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_large_watchlist_imports_quickly(self):
+        """A 6,000-film export is stored in well under a second."""
+        watchlist = [f"Film, Number {i}" for i in range(6000)]
+        write_export(
+            self.zip_path,
+            watchlist,
+            watched=[("Heat", "2024-02-01"), ("Alien", "2024-02-03")],
+            ratings=[("Heat", "4.5"), ("Ran", "5")],
+        )
+        result = import_letterboxd_export(self.zip_path, db_path=self.db_path)
+
+        self.assertEqual((result.username, result.watchlist), ("me", 6000))
+        self.assertEqual((result.watched, result.ratings), (3, 2))
+        self.assertLess(result.seconds, 1.0)
+        self.assertEqual(database.get_watchlist_from_db("me", self.db_path), set(watchlist))
+        self.assertEqual(database.get_watched_from_db("me", self.db_path), {"Heat", "Alien", "Ran"})
+
+    def test_reimport_updates_the_diff(self):
+        """A newer export replaces the lists and logs the watchlist changes."""
+        write_export(self.zip_path, ["Heat", "Alien"], watched=[("Jaws", "2024-01-01")])
+        import_letterboxd_export(self.zip_path, db_path=self.db_path)
+        write_export(self.zip_path, ["Heat", "Tron"], watched=[("Alien", "2024-05-01")])
+        result = import_letterboxd_export(self.zip_path, db_path=self.db_path)
+
+        self.assertEqual((result.added, result.removed), (1, 1))
+        self.assertEqual(database.get_watched_from_db("me", self.db_path), {"Alien"})
+        events = database.get_watchlist_events("me", db_path=self.db_path)
+        self.assertEqual([(e["title"], e["action"]) for e in events][-1], ("Alien", "removed"))
+
+    def test_sync_uses_the_imported_watchlist(self):
+        """The engine reads an imported watchlist instead of scraping it."""
+        write_export(self.zip_path, ["Heat", "Alien"])
+        import_letterboxd_export(self.zip_path, db_path=self.db_path)
+        fetched = []
+
+        def fetch(username, limit=None, progress_callback=None):
+            fetched.append(username)
+            return {"Heat"}
+
+        engine = SyncEngine(
+            db_path=self.db_path,
+            fetch_watchlist=fetch,
+            fetch_watchlist_count=lambda user: 1,
+            fetch_friends=lambda user: [],
+            freshness_seconds=0,
+        )
+        result = engine.sync("me", ["amy"])
+        self.assertEqual(fetched, ["amy"])
+        self.assertEqual(result.common_movies, {"amy": {"Heat"}})
+
+    def test_bad_exports(self):
+        """Non-exports and exports of unknown accounts are rejected."""
+        with open(self.zip_path, "w") as f:
+            f.write("not a zip")
+        with self.assertRaises(ExportError):
+            import_letterboxd_export(self.zip_path, db_path=self.db_path)
+
+        write_export(self.zip_path, ["Heat"], username=None)
+        with self.assertRaises(ExportError):
+            import_letterboxd_export(self.zip_path, db_path=self.db_path)
+        self.assertEqual(
+            cli_main(["import-export", self.zip_path, "-u", "ann", "--db", self.db_path]), 0
+        )
+        self.assertEqual(database.get_watchlist_from_db("ann", self.db_path), {"Heat"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit tests for the concurrent friends fetcher and the cached, diff-based
+friends sync.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+from letterboxd_friend_check.utils import web  # noqa: E402
+from tests.benchmarks.suite import unthrottled  # noqa: E402
+from tests.stub_server import ReplayServer  # noqa: E402
+
+
+class TestGetFriends(unittest.TestCase):
+    """Test cases for web.get_friends against the replay server."""
+
+    def test_fetches_every_page(self):
+        """All pages are fetched, then one empty page ends the listing."""
+        with ReplayServer(following_pages=4) as server, unthrottled():
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                friends = web.get_friends("fixture")
+
+        self.assertEqual(len(friends), 100)
+        self.assertIn("ana-p4", friends)
+        self.assertNotIn("fixture", friends)
+        self.assertEqual(
+            sorted(server.paths), [f"/fixture/following/page/{n}/" for n in range(1, 6)]
+        )
+
+    def test_strict_raises_on_a_failed_page(self):
+        """A failed page raises in strict mode and truncates otherwise."""
+        with ReplayServer(following_pages=3) as server, unthrottled():
+            respond = server.respond
+            server.respond = lambda path: (
+                (500, "text/html", "") if "/page/3/" in path else respond(path)
+            )
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                self.assertEqual(len(web.get_friends("fixture")), 50)
+                with self.assertRaises(web.FriendsFetchError):
+                    web.get_friends("fixture", strict=True)
+
+
+class TestFriendsSync(unittest.TestCase):
+    """Test cases for the diff-based, cached friends sync."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        self.follows = ["ben", "cat"]
+        self.calls = 0
+
+        def fetch_friends(username, strict=False):
+            self.calls += 1
+            if self.follows is None:
+                raise web.FriendsFetchError("offline")
+            return list(self.follows)
+
+        self.engine = SyncEngine(db_path=self.db_path, fetch_friends=fetch_friends)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_only_differences_are_written(self):
+        """New follows are added and unfollows removed."""
+        database.sync_friends_to_db("amy", ["ben", "cat"], self.db_path)
+        followed, unfollowed = database.sync_friends_to_db("amy", ["cat", "dan"], self.db_path)
+        self.assertEqual((followed, unfollowed), (["dan"], ["ben"]))
+        self.assertEqual(sorted(database.get_friends_from_db("amy", self.db_path)), ["cat", "dan"])
+
+    def test_init_removes_duplicate_follows(self):
+        """Duplicate rows from older versions are dropped and prevented."""
+        path = os.path.join(self.tmp.name, "old.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE friends (username TEXT, friend_username TEXT)")
+            conn.executemany("INSERT INTO friends VALUES (?, ?)", [("amy", "ben")] * 3)
+        database.init_db(path)
+        self.assertEqual(database.get_friends_from_db("amy", path), ["ben"])
+
+    def test_fresh_list_is_served_from_the_database(self):
+        """Within the TTL no fetch happens unless forced."""
+        self.assertEqual(self.engine.sync_friends("amy"), ["ben", "cat"])
+        self.follows = ["ben", "cat", "dan"]
+        self.assertEqual(self.engine.sync_friends("amy"), ["ben", "cat"])
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.engine.sync_friends("amy", force=True), ["ben", "cat", "dan"])
+        self.assertEqual(self.calls, 2)
+
+    def test_failed_fetch_falls_back_to_stored_list(self):
+        """A failed fetch keeps the stored list; with none stored it raises."""
+        self.follows = None
+        with self.assertRaises(web.FriendsFetchError):
+            self.engine.sync_friends("amy")
+        self.follows = ["ben"]
+        self.engine.sync_friends("amy")
+        self.follows = None
+        self.assertEqual(self.engine.sync_friends("amy", force=True), ["ben"])
+
+
+if __name__ == "__main__":
+    unittest.main()
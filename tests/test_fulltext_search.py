@@ -0,0 +1,108 @@
+"""
+Unit tests for the FTS5 full-text search over movie details.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movie_database  # noqa: E402
+from letterboxd_friend_check.data.movie_index import FriendMovieIndex  # noqa: E402
+from letterboxd_friend_check.gui.results_model import search_common_movies  # noqa: E402
+
+MOVIES = {
+    "Blade Runner (1982)": {
+        "director": "Ridley Scott",
+        "overview": "A blade runner must pursue and terminate four replicants.",
+    },
+    "Alien (1979)": {
+        "director": "Ridley Scott",
+        "overview": "The crew of a commercial spacecraft encounters a deadly lifeform.",
+    },
+    "Arrival (2016)": {
+        "director": "Denis Villeneuve",
+        "overview": "A linguist works with the military to communicate with aliens.",
+    },
+    "Amélie (2001)": {
+        "director": "Jean-Pierre Jeunet",
+        "original_title": "Le Fabuleux Destin d'Amélie Poulain",
+    },
+}
+
+
+class TestFullTextSearch(unittest.TestCase):
+    """Test cases for search_movie_details and search_movie_titles."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        for title, data in MOVIES.items():
+            movie_database.save_movie_details_to_db(title, data, self.db_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def search(self, query):
+        return [
+            row["title"] for row in movie_database.search_movie_details(query, db_path=self.db_path)
+        ]
+
+    def test_prefix_words_across_columns(self):
+        """Every word must match a word prefix in some column."""
+        self.assertEqual(sorted(self.search("ridley")), ["Alien (1979)", "Blade Runner (1982)"])
+        self.assertEqual(self.search("blade sco"), ["Blade Runner (1982)"])
+        self.assertEqual(self.search("villen"), ["Arrival (2016)"])
+        self.assertEqual(self.search("amelie poulain"), ["Amélie (2001)"])
+        self.assertEqual(self.search('"OR" *'), [])
+
+    def test_title_matches_rank_first(self):
+        """A title match outranks a match in the plot."""
+        self.assertEqual(self.search("alien"), ["Alien (1979)", "Arrival (2016)"])
+
+    def test_updates_keep_the_index_in_sync(self):
+        """Re-saving a movie keeps its id and re-indexes its text."""
+        before = movie_database.search_movie_details("arrival", db_path=self.db_path)[0]["movie_id"]
+        movie_database.save_movie_details_to_db(
+            "Arrival (2016)", {"director": "Someone Else"}, self.db_path
+        )
+        self.assertEqual(self.search("villeneuve"), [])
+        after = movie_database.search_movie_details("someone", db_path=self.db_path)
+        self.assertEqual(after[0]["movie_id"], before)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                f"INSERT INTO {movie_database.FTS_TABLE}({movie_database.FTS_TABLE}, rank) "
+                "VALUES ('integrity-check', 1)"
+            )
+
+    def test_watchlist_entries_are_matched(self):
+        """search_movie_titles maps results back to watchlist entries."""
+        watchlist = {"Alien (1979)", "Arrival (2016)", "Heat (1995)"}
+        matches = movie_database.search_movie_titles("scott", watchlist, self.db_path)
+        self.assertEqual(matches, {"Alien (1979)"})
+
+        # The results view search combines title and full-text matches
+        index = FriendMovieIndex(watchlist, watchlist)
+        found = search_common_movies(
+            {"amy": watchlist}, lambda friend: index, "scott", also_matching=matches
+        )
+        self.assertEqual(found, {"amy": ["Alien (1979)"]})
+
+    def test_like_fallback_without_fts(self):
+        """Without the FTS table, searches fall back to LIKE."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f"DROP TABLE {movie_database.FTS_TABLE}")
+            self.assertFalse(movie_database.fulltext_available(conn))
+        self.assertEqual(sorted(self.search("ridley")), ["Alien (1979)", "Blade Runner (1982)"])
+        self.assertEqual(self.search("alien")[0], "Alien (1979)")
+
+
+if __name__ == "__main__":
+    unittest.main()
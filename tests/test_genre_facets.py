@@ -0,0 +1,109 @@
+"""
+Unit tests for the film_genres junction table and the facet counts.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movie_database  # noqa: E402
+from letterboxd_friend_check.gui.results_model import (  # noqa: E402
+    ALL_FACET_LABEL,
+    facet_options,
+    filter_common_movies,
+)
+
+MOVIES = {
+    "Alien (1979)": {"genres": "Science Fiction, Horror", "runtime": 117},
+    "Blade Runner (1982)": {"genres": "Science Fiction, Drama", "runtime": 117},
+    "Adaptation. (2002)": {"genres": [{"name": "Fiction"}, {"name": "Comedy"}], "runtime": 115},
+    "Heat (1995)": {"genres": "Crime, Drama", "runtime": 170},
+    "Short Film (1995)": {"runtime": 12},
+}
+
+
+class TestGenreFacets(unittest.TestCase):
+    """Test cases for film_genres and get_facet_counts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        for title, data in MOVIES.items():
+            movie_database.save_movie_details_to_db(title, data, self.db_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def genres_of(self, title):
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT g.name FROM movies m
+                JOIN film_genres fg ON fg.movie_id = m.movie_id
+                JOIN genres g ON g.genre_id = fg.genre_id
+                WHERE m.title = ?
+                """,
+                (title,),
+            ).fetchall()
+        return sorted(row[0] for row in rows)
+
+    def test_junction_follows_saves(self):
+        """Saving a movie replaces its genre links; TMDB-style lists are accepted."""
+        self.assertEqual(self.genres_of("Adaptation. (2002)"), ["Comedy", "Fiction"])
+        movie_database.save_movie_details_to_db(
+            "Alien (1979)", {"genres": "Horror, Thriller"}, self.db_path
+        )
+        self.assertEqual(self.genres_of("Alien (1979)"), ["Horror", "Thriller"])
+
+    def test_existing_rows_are_backfilled(self):
+        """Databases from before the junction table get it filled on init."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DROP TABLE film_genres")
+        movie_database.init_movie_database(self.db_path)
+        self.assertEqual(self.genres_of("Heat (1995)"), ["Crime", "Drama"])
+
+    def test_facet_counts(self):
+        """Genres, decades and runtime buckets are counted in one call."""
+        facets = movie_database.get_facet_counts(list(MOVIES) + ["Unknown (2020)"], self.db_path)
+        self.assertEqual(facets["genre"]["Science Fiction"], 2)
+        self.assertEqual(list(facets["genre"])[:2], ["Drama", "Science Fiction"])
+        self.assertEqual(facets["decade"], {1970: 1, 1980: 1, 1990: 2, 2000: 1})
+        self.assertEqual(facets["runtime"], {"Under 90 min": 1, "90-119 min": 3, "150+ min": 1})
+
+    def test_filter_is_exact(self):
+        """The "Fiction" facet does not match "Science Fiction"."""
+        titles = list(MOVIES)
+        self.assertEqual(
+            movie_database.filter_titles_by_facets(titles, genre="fiction", db_path=self.db_path),
+            {"Adaptation. (2002)"},
+        )
+        self.assertEqual(
+            movie_database.filter_titles_by_facets(
+                titles, genre="Drama", decade=1990, db_path=self.db_path
+            ),
+            {"Heat (1995)"},
+        )
+        self.assertEqual(
+            movie_database.filter_titles_by_facets(
+                titles, runtime="90-119 min", db_path=self.db_path
+            ),
+            {"Alien (1979)", "Blade Runner (1982)", "Adaptation. (2002)"},
+        )
+
+    def test_facet_options(self):
+        """Combobox labels carry the counts and map back to facet values."""
+        options = facet_options("decade", {1990: 2})
+        self.assertEqual(options, {ALL_FACET_LABEL: None, "1990s (2)": 1990})
+        common = {"amy": ["Alien (1979)", "Heat (1995)"]}
+        self.assertEqual(filter_common_movies(common, {"Heat (1995)"}), {"amy": ["Heat (1995)"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
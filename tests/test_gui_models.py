@@ -0,0 +1,208 @@
+"""
+Unit tests for the Tk-independent models behind the GUI views.
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+import tkinter
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.gui.event_bus import GuiEventBus, PipeWakeup  # noqa: E402
+from letterboxd_friend_check.gui.friend_checklist import FriendChecklistModel  # noqa: E402
+from letterboxd_friend_check.gui.results_model import ResultsModel  # noqa: E402
+from letterboxd_friend_check.gui.theme import THEME_COLORS, ThemeRegistry  # noqa: E402
+
+
+class TestResultsModel(unittest.TestCase):
+    """Test cases for the flat model backing the results Treeview."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.model = ResultsModel(
+            {
+                "zed": {"Movie B", "Movie A"},
+                "amy": {"Movie C"},
+                "nobody": set(),
+            }
+        )
+
+    def test_friends_sorted_and_empty_dropped(self):
+        """Friends are sorted and friends without common movies are skipped."""
+        self.assertEqual(self.model.friends, ["amy", "zed"])
+        self.assertEqual(len(self.model), 3)
+        self.assertEqual(self.model.movies_for("zed"), ["Movie A", "Movie B"])
+
+    def test_iid_round_trip(self):
+        """Treeview item ids resolve back to the rows they were created for."""
+        friend_row = self.model.row_for_iid(ResultsModel.friend_iid(1))
+        self.assertEqual(friend_row.friend, "zed")
+        self.assertFalse(friend_row.is_movie)
+
+        movie_row = self.model.row_for_iid(ResultsModel.movie_iid(1, 1))
+        self.assertEqual((movie_row.friend, movie_row.title), ("zed", "Movie B"))
+        self.assertTrue(movie_row.is_movie)
+
+        placeholder = ResultsModel.placeholder_iid(0)
+        self.assertIsNone(self.model.row_for_iid(placeholder))
+        self.assertEqual(ResultsModel.friend_index_for_iid(placeholder), 0)
+        self.assertIsNone(self.model.row_for_iid("movie:9:9"))
+
+    def test_rows_in_display_order(self):
+        """Flat iteration follows friend order, then title order."""
+        rows = [(row.friend, row.title) for row in self.model.rows()]
+        self.assertEqual(rows, [("amy", "Movie C"), ("zed", "Movie A"), ("zed", "Movie B")])
+
+
+class TestFriendChecklistModel(unittest.TestCase):
+    """Test cases for the set-based friends checklist selection."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.model = FriendChecklistModel()
+        self.model.set_friends(["alice", "Bob", "carol"], selected=["Bob", "stranger"])
+
+    def test_saved_selection_is_restricted_to_friends(self):
+        """Unknown names in a saved selection are ignored."""
+        self.assertEqual(self.model.selected, {"Bob"})
+        self.assertEqual(self.model.selected_count, 1)
+
+    def test_toggle_and_select_all(self):
+        """Toggling and (de)selecting everything only touches the set."""
+        self.assertTrue(self.model.toggle("alice"))
+        self.assertEqual(self.model.selected_in_order(), ["alice", "Bob"])
+        self.assertFalse(self.model.toggle("alice"))
+        self.assertFalse(self.model.toggle("stranger"))
+
+        self.model.set_all(True)
+        self.assertTrue(self.model.all_selected)
+        self.model.set_all(False)
+        self.assertEqual(self.model.selected_count, 0)
+
+    def test_filter_is_case_insensitive(self):
+        """Search matches substrings regardless of case."""
+        self.assertEqual(self.model.filtered("b"), ["Bob"])
+        self.assertEqual(self.model.filtered("  "), ["alice", "Bob", "carol"])
+        self.assertTrue(self.model.label("Bob").endswith(" Bob"))
+
+
+class TestGuiEventBus(unittest.TestCase):
+    """Test cases for the coalescing GUI event bus."""
+
+    def test_latest_wins_and_order_follows_last_post(self):
+        """Keyed updates are coalesced and move behind tasks posted before them."""
+        bus = GuiEventBus()
+        calls = []
+        bus.post_latest("status", calls.append, "first")
+        bus.post(calls.append, "finish")
+        bus.post_latest("status", calls.append, "second")
+        bus.post_latest("progress", calls.append, 10)
+        bus.post_latest("progress", calls.append, 20)
+
+        for task, args, kwargs in bus.drain():
+            task(*args, **kwargs)
+
+        self.assertEqual(calls, ["finish", "second", 20])
+        self.assertEqual(bus.coalesced_count, 2)
+
+    def test_drain_is_bounded(self):
+        """Drain returns at most max_items tasks per call."""
+        bus = GuiEventBus()
+        for i in range(5):
+            bus.post(print, i)
+        self.assertEqual(len(bus.drain(3)), 3)
+        self.assertEqual(bus.pending(), 2)
+
+    def test_wakeup_fires_once_per_batch(self):
+        """The wakeup callback only fires when the bus goes from idle to busy."""
+        wakeups = []
+        bus = GuiEventBus(wakeup=lambda: wakeups.append(1))
+        bus.post(print)
+        bus.post_latest("status", print)
+        self.assertEqual(len(wakeups), 1)
+
+        bus.drain()
+        bus.post(print)
+        self.assertEqual(len(wakeups), 2)
+
+    @unittest.skipUnless(PipeWakeup.supported(tkinter.Tcl()), "Tk file handlers unavailable")
+    def test_pipe_wakeup_runs_on_the_tk_thread(self):
+        """A post from a worker thread wakes the Tk event loop, which drains the bus."""
+        interp = tkinter.Tcl()
+        bus = GuiEventBus()
+        ran = []
+
+        def drain():
+            for task, args, kwargs in bus.drain():
+                task(*args, **kwargs)
+
+        wakeup = PipeWakeup(interp, drain)
+        bus.set_wakeup(wakeup)
+        try:
+            worker = threading.Thread(
+                target=bus.post, args=(lambda: ran.append(threading.get_ident()),)
+            )
+            worker.start()
+            worker.join(5)
+            deadline = time.monotonic() + 5
+            while not ran and time.monotonic() < deadline:
+                interp.tk.dooneevent(tkinter._tkinter.DONT_WAIT)
+            self.assertEqual(ran, [threading.get_ident()])
+        finally:
+            wakeup.close()
+
+
+class _FakeWidget:
+    """Minimal stand-in for a Tk widget that records configure() calls."""
+
+    def __init__(self, name):
+        self.name = name
+        self.options = {}
+
+    def __str__(self):
+        return self.name
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def bind(self, sequence, func, add=None):
+        self.destroy_callback = func
+
+
+class TestThemeRegistry(unittest.TestCase):
+    """Test cases for the raw-widget theme registry."""
+
+    def test_apply_only_touches_registered_widgets(self):
+        """Registered widgets get role-specific colors on apply and on register."""
+        registry = ThemeRegistry()
+        text = _FakeWidget(".text")
+        registry.register(text, "text")
+        self.assertEqual(text.options, {})
+
+        registry.apply(THEME_COLORS["dark"])
+        self.assertEqual(text.options["bg"], THEME_COLORS["dark"]["entry_bg"])
+
+        menu = _FakeWidget(".menu")
+        registry.register(menu, "menu")
+        self.assertEqual(menu.options["bg"], THEME_COLORS["dark"]["menu_bg"])
+
+    def test_destroyed_widgets_are_forgotten(self):
+        """A <Destroy> event removes the widget from the registry."""
+        registry = ThemeRegistry()
+        canvas = _FakeWidget(".canvas")
+        registry.register(canvas, "canvas")
+        canvas.destroy_callback(type("Event", (), {"widget": ".canvas"})())
+        self.assertEqual(len(registry), 0)
+
+    def test_unknown_role_rejected(self):
+        """Only known roles can be registered."""
+        with self.assertRaises(ValueError):
+            ThemeRegistry().register(_FakeWidget(".x"), "button")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the sync instrumentation and the timing report rows.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+from letterboxd_friend_check.gui.sync_report import stage_rows, user_rows  # noqa: E402
+from letterboxd_friend_check.utils import instrumentation, web  # noqa: E402
+from letterboxd_friend_check.utils.instrumentation import (  # noqa: E402
+    SyncInstrumentation,
+    classify_url,
+)
+from tests.benchmarks.suite import unthrottled  # noqa: E402
+from tests.stub_server import ReplayServer  # noqa: E402
+
+
+class TestSyncInstrumentation(unittest.TestCase):
+    """Test cases for SyncInstrumentation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_classify_url(self):
+        """Watchlist URLs map to the count and pages stages."""
+        self.assertEqual(classify_url("https://x/amy/watchlist/"), ("amy", "count"))
+        self.assertEqual(classify_url("https://x/amy/watchlist/page/3/"), ("amy", "pages"))
+        self.assertEqual(classify_url("https://x/amy/following/page/1/"), ("amy", "friends"))
+
+    def test_hooks_are_inactive_without_a_recorder(self):
+        """Nothing is recorded outside an instrumented block."""
+        recorder = SyncInstrumentation()
+        instrumentation.add_time("parse", 1.0, "amy")
+        with instrumentation.stage("persist", "amy"):
+            pass
+        self.assertEqual(recorder.report()["stages"], {})
+
+    def test_scraper_requests_and_stages(self):
+        """A real scrape records requests, bytes and per-user stage timings."""
+        with ReplayServer(3) as server, unthrottled():
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                with SyncInstrumentation() as recorder:
+                    web.get_watchlist("amy", progress_callback=lambda *args: None)
+
+        report = recorder.report()
+        self.assertEqual(report["requests"]["count"], 5)  # count + 3 pages + empty page
+        self.assertEqual(report["requests"]["by_status"], {"200": 5})
+        self.assertGreater(report["requests"]["bytes"], 0)
+        stages = report["users"]["amy"]["stages"]
+        self.assertEqual(stages["count"]["count"], 1)
+        self.assertEqual(stages["pages"]["count"], 4)
+        self.assertEqual(stages["parse"]["count"], 4)
+        self.assertIn("throttle", stages)
+
+        path = os.path.join(self.tmp.name, "report.json")
+        recorder.to_json(path)
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["requests"]["count"], 5)
+
+    def test_engine_stages_and_cache_hits(self):
+        """The engine times persist and compare and counts reused watchlists."""
+        engine = SyncEngine(
+            db_path=os.path.join(self.tmp.name, "letterboxd.db"),
+            fetch_watchlist=lambda user, limit=None, progress_callback=None: {"Heat", user},
+            fetch_watchlist_count=lambda user: 2,
+        )
+        engine.sync("amy", ["bob"])
+        with SyncInstrumentation() as recorder:
+            engine.sync("amy", ["bob", "cat"])
+
+        report = recorder.report()
+        self.assertEqual(report["cache_hits"], {"watchlist_from_db": 2})
+        self.assertEqual(report["stages"]["persist"]["count"], 1)  # only cat is new
+        self.assertEqual(report["stages"]["compare"]["count"], 1)
+        self.assertIn("cat", report["users"])
+
+        self.assertEqual({row[0] for row in stage_rows(report)}, {"persist", "compare"})
+        self.assertEqual(user_rows(report)[0][0], "cat")
+
+
+if __name__ == "__main__":
+    unittest.main()
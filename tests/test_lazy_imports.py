@@ -0,0 +1,51 @@
+"""
+Checks that heavy optional dependencies are only imported on first use.
+"""
+
+import unittest
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("selenium", "webdriver_manager", "bs4", "requests")
+
+
+def _loaded_after_import(module):
+    """Import a module in a fresh interpreter and return the heavy modules it loaded."""
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+class TestLazyImports(unittest.TestCase):
+    """Importing the application modules must not pull in network/browser stacks."""
+
+    def test_main_module_defers_heavy_imports(self):
+        """LBoxFriendCheck imports without Selenium, bs4 or requests."""
+        self.assertEqual(_loaded_after_import("LBoxFriendCheck"), [])
+
+    def test_tmdb_and_app_modules_defer_requests(self):
+        """The TMDB helpers only import requests when a request is made."""
+        self.assertEqual(_loaded_after_import("tmdb_api"), [])
+        self.assertEqual(_loaded_after_import("letterboxd_friend_check.app"), [])
+
+    def test_session_attribute_is_created_on_demand(self):
+        """The legacy module-level `session` still resolves to a shared session."""
+        import LBoxFriendCheck
+
+        self.assertIs(LBoxFriendCheck.session, LBoxFriendCheck._get_session())
+
+
+if __name__ == "__main__":
+    unittest.main()
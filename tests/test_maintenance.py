@@ -0,0 +1,162 @@
+"""
+Unit tests for get_database_stats, the maintenance tasks and the idle scheduler.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+import datetime
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movie_database  # noqa: E402
+from letterboxd_friend_check.data import database, maintenance  # noqa: E402
+from letterboxd_friend_check.gui import database_dialog  # noqa: E402
+from letterboxd_friend_check.gui.database_dialog import (  # noqa: E402
+    DatabaseDialog,
+    maintenance_rows,
+    table_rows,
+)
+
+
+class TestDatabaseMaintenance(unittest.TestCase):
+    """Test cases for get_database_stats and run_maintenance."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        movie_database.init_movie_database(self.db_path)
+        titles = {f"Film {n} (2000)" for n in range(300)}
+        database.sync_watchlist_to_db("amy", titles, self.db_path)
+        movie_database.save_movie_details_to_db(
+            "Film 1 (2000)", {"director": "Someone"}, self.db_path
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_stats(self):
+        """Row counts, pages, index sizes and the details cache are reported."""
+        stats = movie_database.get_database_stats(self.db_path)
+        self.assertEqual(stats["tables"]["movies"]["rows"], 300)
+        self.assertEqual(stats["tables"]["watchlists"]["rows"], 300)
+        self.assertNotIn(movie_database.FTS_TABLE, stats["tables"])
+        self.assertNotIn(f"{movie_database.FTS_TABLE}_data", stats["tables"])
+        self.assertEqual(stats["indexes"]["idx_watchlists_username"]["table"], "watchlists")
+        self.assertEqual(stats["page_count"] * stats["page_size"], stats["file_bytes"])
+        self.assertEqual(stats["details_cache"]["with_details"], 1)
+        self.assertEqual(stats["maintenance"], {})
+        self.assertEqual(table_rows(stats)[0][:2], ("movies", 300))
+        self.assertEqual(movie_database.get_database_stats(self.db_path + ".missing"), {})
+
+    def test_maintenance_reclaims_space_and_is_recorded(self):
+        """The first run switches to incremental vacuum; later runs free pages."""
+        results = maintenance.run_maintenance(self.db_path)
+        self.assertEqual(set(results), set(maintenance.TASKS))
+        self.assertEqual(results["optimize"], "analyzed")
+        self.assertEqual(maintenance.run_maintenance(self.db_path), {})
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM watchlists")
+            conn.execute("DELETE FROM movies")
+        before = movie_database.get_database_stats(self.db_path)
+        self.assertGreater(before["freelist_count"], 0)
+
+        results = maintenance.run_maintenance(
+            self.db_path, tasks=["incremental_vacuum"], force=True
+        )
+        self.assertEqual(results["incremental_vacuum"], f"freed {before['freelist_count']} pages")
+        after = movie_database.get_database_stats(self.db_path)
+        self.assertEqual(after["freelist_count"], 0)
+        self.assertLess(after["file_bytes"], before["file_bytes"])
+
+        rows = maintenance_rows(after, datetime.datetime.now() + datetime.timedelta(days=2))
+        self.assertEqual(len(rows), len(maintenance.TASKS))
+        self.assertEqual(dict((task, due) for task, _, due in rows)["optimize"], "now")
+        self.assertNotEqual(dict((task, due) for task, _, due in rows)["vacuum"], "now")
+
+    def test_syncs_can_wait_for_a_running_maintenance(self):
+        """wait_for_maintenance blocks while a run holds the database."""
+        started, release = threading.Event(), threading.Event()
+
+        def slow(conn, first_run):
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        with mock.patch.dict(maintenance._TASK_FUNCTIONS, {"optimize": slow}):
+            thread = threading.Thread(
+                target=maintenance.run_maintenance,
+                args=(self.db_path, ["optimize"], True),
+            )
+            thread.start()
+            self.assertTrue(started.wait(5))
+            self.assertTrue(maintenance.maintenance_running())
+            self.assertFalse(maintenance.wait_for_maintenance(timeout=0.01))
+            release.set()
+            self.assertTrue(maintenance.wait_for_maintenance(timeout=5))
+            thread.join(5)
+        self.assertFalse(maintenance.maintenance_running())
+
+    def test_dialog_runs_maintenance_off_the_tk_thread(self):
+        """The dialog runs maintenance on a worker and posts the results back."""
+        posted = []
+        dialog = DatabaseDialog.__new__(DatabaseDialog)
+        dialog.master = mock.Mock(sync_in_progress=False)
+        dialog.db_path = self.db_path
+        dialog.maintenance_thread = None
+        dialog.post = lambda task, *args: posted.append((task, args))
+        dialog.maintenance_button = mock.Mock()
+        dialog.config = dialog.refresh = mock.Mock()
+        dialog.winfo_exists = mock.Mock(return_value=True)
+
+        with mock.patch.object(database_dialog, "messagebox") as messagebox:
+            with mock.patch.object(maintenance, "maintenance_running", return_value=True):
+                dialog.run_maintenance()
+            self.assertEqual(messagebox.showinfo.call_args[0][0], "Maintenance in Progress")
+            self.assertIsNone(dialog.maintenance_thread)
+
+            dialog.run_maintenance()
+            dialog.maintenance_thread.join(5)
+            self.assertEqual([task for task, _ in posted], [dialog._maintenance_finished])
+            task, args = posted[0]
+            task(*args)
+            self.assertEqual(messagebox.showinfo.call_args[0][0], "Maintenance Complete")
+        dialog.maintenance_button.state.assert_called_with(["!disabled"])
+
+
+class TestIdleMaintenance(unittest.TestCase):
+    """Test cases for the IdleMaintenance scheduler."""
+
+    def test_runs_only_when_idle_and_not_busy(self):
+        """Activity postpones maintenance; it then waits for min_interval."""
+        now = [0.0]
+        runs = []
+        scheduler = maintenance.IdleMaintenance(
+            lambda: runs.append(now[0]), idle_seconds=60, min_interval=600, clock=lambda: now[0]
+        )
+        now[0] = 30
+        self.assertFalse(scheduler.run_if_idle())
+        now[0] = 70
+        self.assertFalse(scheduler.run_if_idle(busy=True))
+        scheduler.note_activity()
+        now[0] = 100
+        self.assertFalse(scheduler.run_if_idle())
+        now[0] = 130
+        self.assertTrue(scheduler.run_if_idle())
+        now[0] = 500
+        self.assertFalse(scheduler.run_if_idle())
+        now[0] = 730
+        self.assertTrue(scheduler.run_if_idle())
+        self.assertEqual(runs, [130, 730])
+
+
+if __name__ == "__main__":
+    unittest.main()
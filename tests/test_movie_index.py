@@ -0,0 +1,102 @@
+"""
+Unit tests for the in-memory friend watchlist index.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movie_database  # noqa: E402
+from letterboxd_friend_check.data.movie_index import (  # noqa: E402
+    FriendMovieIndex,
+    split_title_year,
+)
+from letterboxd_friend_check.gui.results_model import (  # noqa: E402
+    ResultsModel,
+    search_common_movies,
+)
+
+
+class TestFriendMovieIndex(unittest.TestCase):
+    """Test cases for FriendMovieIndex."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = FriendMovieIndex(
+            ["Alien (1979)", "Aliens (1986)", "Heat (1995)", "The Thing"],
+            common_movies={"Heat (1995)", "Alien (1979)"},
+            details={"Heat (1995)": {"tmdb_rating": 7.9, "director": "Michael Mann"}},
+        )
+
+    def test_precomputed_fields(self):
+        """Titles are split from years once and details fill the display columns."""
+        heat = next(m for m in self.index.movies if m.key == "Heat (1995)")
+        self.assertEqual((heat.title, heat.year, heat.lowered), ("Heat", 1995, "heat"))
+        self.assertEqual(heat.values(), ("Heat", "1995", "7.9", "Michael Mann", "—"))
+        self.assertEqual(heat.tags, ("common",))
+        self.assertEqual(self.index.common_count, 2)
+
+    def test_substring_and_prefix_search(self):
+        """Substring search matches anywhere, prefix search only the start."""
+        keys = [m.key for m in self.index.search("li")]
+        self.assertEqual(keys, ["Alien (1979)", "Aliens (1986)"])
+        self.assertEqual(self.index.search("li", prefix=True), [])
+        keys = [m.key for m in self.index.search("ALIEN", prefix=True, common_only=True)]
+        self.assertEqual(keys, ["Alien (1979)"])
+
+    def test_column_sorting(self):
+        """Sorting by a column is cached and can be reversed."""
+        by_year = [m.key for m in self.index.search(sort_column="year", descending=True)]
+        self.assertEqual(by_year, ["Heat (1995)", "Aliens (1986)", "Alien (1979)", "The Thing"])
+        self.assertIs(self.index.sorted_by("year"), self.index.sorted_by("year"))
+        with self.assertRaises(ValueError):
+            self.index.search(sort_column="budget")
+
+    def test_results_search_keeps_index_order(self):
+        """The results view shows the filtered common movies in the index's order."""
+        common = {"amy": ["Alien (1979)", "Heat (1995)"], "bob": []}
+        found = search_common_movies(
+            common, lambda friend: self.index, sort_column="year", descending=True
+        )
+        self.assertEqual(found, {"amy": ["Heat (1995)", "Alien (1979)"], "bob": []})
+        self.assertEqual(
+            search_common_movies(common, lambda friend: self.index, "ali"),
+            {"amy": ["Alien (1979)"], "bob": []},
+        )
+
+        model = ResultsModel()
+        model.load(found, sort=False)
+        self.assertEqual((model.friends, model.movies_for("amy")), (["amy"], found["amy"]))
+
+
+class TestBatchMovieDetails(unittest.TestCase):
+    """Test cases for the batched movie_details lookup."""
+
+    def test_split_title_year(self):
+        """Only a space-separated four-digit suffix after a title is a year."""
+        self.assertEqual(split_title_year("Heat (1995)"), ("Heat", 1995))
+        self.assertEqual(split_title_year("1917 (2019)"), ("1917", 2019))
+        self.assertEqual(split_title_year("The Thing"), ("The Thing", None))
+        self.assertEqual(split_title_year("(1995)"), ("(1995)", None))
+
+    def test_lookup_matches_title_and_year(self):
+        """Stored details are returned keyed by the watchlist title."""
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "movies.db")
+            movie_database.init_movie_database(db_path)
+            movie_database.save_movie_details_to_db(
+                "Heat (1995)", {"director": "Michael Mann", "genres": "Crime"}, db_path
+            )
+            details = movie_database.get_movie_details_for_titles(
+                ["Heat (1995)", "Heat (2023)", "Missing"], db_path
+            )
+        self.assertEqual(list(details), ["Heat (1995)"])
+        self.assertEqual(details["Heat (1995)"]["director"], "Michael Mann")
+
+
+if __name__ == "__main__":
+    unittest.main()
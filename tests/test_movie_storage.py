@@ -0,0 +1,150 @@
+"""
+Unit tests for the unified movies table: the legacy movie_details
+migration, single-row saves and the friend filter queries.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import movie_database  # noqa: E402
+from letterboxd_friend_check.data import database  # noqa: E402
+
+
+class TestLegacyMigration(unittest.TestCase):
+    """Test cases for migrating the separate movie_details table."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript(
+                """
+                CREATE TABLE movies (
+                    movie_id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT UNIQUE,
+                    director TEXT, genres TEXT, rating TEXT, synopsis TEXT, tmdb_id INTEGER,
+                    tmdb_rating REAL, release_date TEXT, runtime INTEGER, poster_path TEXT,
+                    backdrop_path TEXT, overview TEXT, last_updated TIMESTAMP
+                );
+                CREATE TABLE watchlists (username TEXT, movie_id INTEGER);
+                CREATE TABLE movie_details (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,
+                    normalized_title TEXT, year INTEGER, director TEXT, genres TEXT,
+                    runtime INTEGER, updated_at TIMESTAMP, UNIQUE(normalized_title, year)
+                );
+                INSERT INTO movies (movie_id, title) VALUES (7, 'Heat (1995)');
+                INSERT INTO movies (movie_id, title, director) VALUES (8, 'Ran (1985)', 'Kurosawa');
+                INSERT INTO watchlists VALUES ('amy', 7), ('amy', 8);
+                INSERT INTO movie_details (title, normalized_title, year, director, genres,
+                                           runtime, updated_at)
+                VALUES ('Heat (1995)', 'heat', 1995, 'Michael Mann', 'Crime, Drama', 170,
+                        '2025-01-01'),
+                       ('Alien (1979)', 'alien', 1979, 'Ridley Scott', 'Horror', 117,
+                        '2025-01-01');
+                """
+            )
+        movie_database.init_movie_database(self.db_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_details_move_onto_the_film_rows(self):
+        """Details join the existing film row and keep its movie_id."""
+        with sqlite3.connect(self.db_path) as conn:
+            kind = conn.execute(
+                "SELECT type FROM sqlite_master WHERE name = 'movie_details'"
+            ).fetchone()[0]
+            rows = dict(conn.execute("SELECT title, movie_id FROM movies"))
+        self.assertEqual(kind, "view")
+        self.assertEqual(rows["Heat (1995)"], 7)
+        self.assertEqual(len(rows), 3)
+
+        heat = movie_database.get_movie_details_from_db("Heat (1995)", self.db_path)
+        self.assertEqual(
+            (heat["movie_id"], heat["director"], heat["year"]), (7, "Michael Mann", 1995)
+        )
+        self.assertEqual(
+            movie_database.get_movie_details_from_db("Ran (1985)", self.db_path)["director"],
+            "Kurosawa",
+        )
+        genres = movie_database.get_all_genres_for_friend("", "amy", self.db_path)
+        self.assertEqual(genres, {"Crime", "Drama"})
+        found = movie_database.search_movie_details("mann", db_path=self.db_path)
+        self.assertEqual([row["title"] for row in found], ["Heat (1995)"])
+
+
+class TestUnifiedMovies(unittest.TestCase):
+    """Test cases for saves and filters on the movies table."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        movie_database.init_movie_database(self.db_path)
+        database.sync_watchlist_to_db("amy", {"Alien (1979)", "Heat (1995)"}, self.db_path)
+        database.sync_watchlist_to_db(
+            "bob", {"Alien (1979)", "Arrival (2016)", "Heat (1995)"}, self.db_path
+        )
+        movie_database.save_movie_details_to_db(
+            "Alien (1979)", {"genres": "Science Fiction, Horror"}, self.db_path
+        )
+        movie_database.save_movie_details_to_db(
+            "Arrival (2016)", {"genres": "Science Fiction, Drama"}, self.db_path
+        )
+        movie_database.save_movie_details_to_db(
+            "Heat (1995)", {"genres": "Crime, Fiction"}, self.db_path
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_saves_update_the_watchlist_row(self):
+        """Saving details adds no second row for a film already on a watchlist."""
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM movies").fetchone()[0], 3)
+        self.assertFalse(database.movie_has_details("Missing (2000)", self.db_path))
+        self.assertTrue(movie_database.movie_has_details("Heat (1995)", self.db_path))
+
+    def test_friend_filters(self):
+        """Common-only, genre and title filters combine on the watchlist join."""
+
+        def titles(**filters):
+            args = {"common_only": False, "title_filter": "", "genre_filter": ""}
+            args.update(filters)
+            rows = movie_database.get_filtered_movies_for_friend(
+                "amy", "bob", db_path=self.db_path, **args
+            )
+            return [row[0] for row in rows]
+
+        self.assertEqual(titles(), ["Alien (1979)", "Arrival (2016)", "Heat (1995)"])
+        self.assertEqual(titles(common_only=True, genre_filter="Science Fiction"), ["Alien (1979)"])
+        self.assertEqual(titles(genre_filter="Fiction"), ["Heat (1995)"])
+        self.assertEqual(titles(title_filter="arr"), ["Arrival (2016)"])
+        # Word prefixes, not substrings, through the full-text index
+        self.assertEqual(titles(title_filter="rival"), [])
+        self.assertEqual(titles(title_filter="!!"), [])
+
+    def test_watchlist_queries_use_the_index(self):
+        """Per-user watchlist lookups are index searches, not scans."""
+        with sqlite3.connect(self.db_path) as conn:
+            plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT m.title FROM watchlists w "
+                    "JOIN movies m ON m.movie_id = w.movie_id WHERE w.username = ?",
+                    ("amy",),
+                )
+            )
+        self.assertIn("idx_watchlists_username", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
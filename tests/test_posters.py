@@ -0,0 +1,154 @@
+"""
+Unit tests for the poster thumbnail caches and the background poster loader.
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+import threading
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from letterboxd_friend_check.gui import posters  # noqa: E402
+from letterboxd_friend_check.gui.posters import (  # noqa: E402
+    PhotoImageCache,
+    PosterDiskCache,
+    PosterLoader,
+    visible_rows,
+)
+from tests.stub_server import ReplayServer, load_fixture_bytes  # noqa: E402
+
+
+class TestPosterCaches(unittest.TestCase):
+    """Test cases for the on-disk and in-memory LRU caches."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_disk_cache_evicts_least_recently_used(self):
+        """Past the size cap the least recently read thumbnails go first."""
+        cache = PosterDiskCache(self.tmp.name, max_bytes=250)
+        for key in ("/a.jpg", "/b.jpg", "/c.jpg"):
+            cache.put(key, b"x" * 100)
+        self.assertIsNone(cache.get("/a.jpg"))
+        self.assertEqual((len(cache), cache.total_bytes), (2, 200))
+
+        self.assertEqual(cache.get("/b.jpg"), b"x" * 100)
+        cache.put("/d.jpg", b"y" * 100)
+        self.assertIsNone(cache.get("/c.jpg"))
+        self.assertEqual(
+            sorted(os.listdir(self.tmp.name)),
+            sorted(PosterDiskCache.file_name(key) for key in ("/b.jpg", "/d.jpg")),
+        )
+
+        # A new cache picks up the files (and their order) from disk
+        reopened = PosterDiskCache(self.tmp.name, max_bytes=250)
+        self.assertEqual(reopened.total_bytes, 200)
+        self.assertEqual(reopened.get("/d.jpg"), b"y" * 100)
+
+    def test_memory_cache_is_bounded(self):
+        """Decoded images beyond the capacity are dropped, oldest use first."""
+        cache = PhotoImageCache(capacity=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(("a" in cache, "b" in cache, "c" in cache), (True, False, True))
+
+    def test_thumbnails_are_small_pngs(self):
+        """Posters are downscaled into the thumbnail box and stored as PNG."""
+        data = posters.make_thumbnail(load_fixture_bytes("tmdb/poster.jpg"), (24, 36))
+        with Image.open(io.BytesIO(data)) as image:
+            self.assertEqual((image.format, image.size), ("PNG", (24, 36)))
+
+
+class TestPosterLoader(unittest.TestCase):
+    """Test cases for PosterLoader against the replay server's image route."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = ReplayServer().__enter__()
+        self.delivered = threading.Event()
+
+        def post(task, *args):
+            # Stands in for the GUI event bus: run the task and note it ran
+            task(*args)
+            self.delivered.set()
+
+        self.loader = PosterLoader(
+            post,
+            PosterDiskCache(self.tmp.name),
+            base_url=self.server.image_url,
+            image_factory=lambda data: ("image", len(data)),
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.loader.close()
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def load(self, poster_path):
+        received = []
+        self.delivered.clear()
+        image = self.loader.request(poster_path, received.append)
+        if image is None:
+            self.assertTrue(self.delivered.wait(5))
+        return image, received
+
+    def test_poster_is_fetched_once(self):
+        """The first request loads in the background; later ones hit the caches."""
+        image, received = self.load("/poster.jpg")
+        self.assertIsNone(image)
+        self.assertEqual(received[0][0], "image")
+        self.assertEqual(self.server.paths, ["/t/p/w92/poster.jpg"])
+
+        image, _ = self.load("/poster.jpg")
+        self.assertEqual(image, received[0])
+
+        # A fresh loader over the same directory reads the disk cache
+        loader = PosterLoader(lambda task, *args: task(*args), self.loader.disk_cache)
+        self.assertIsNotNone(loader.thumbnail_bytes("/poster.jpg"))
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_failed_posters_are_not_retried(self):
+        """A poster that cannot be loaded is skipped for the rest of the session."""
+        self.loader.base_url = f"{self.server.base_url}/missing"
+        image, received = self.load("/poster.jpg")
+        self.assertEqual((image, received), (None, []))
+        self.assertIsNone(self.loader.request("/poster.jpg", received.append))
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_offscreen_requests_are_dropped(self):
+        """Queued loads for rows no longer visible are cancelled before they run."""
+        gate = threading.Event()
+        self.loader.max_workers = 1
+        with mock.patch.object(self.loader, "fetch", side_effect=lambda url: gate.wait(5)):
+            for n in range(4):
+                self.loader.request(f"/{n}.jpg", lambda image: None)
+            self.assertEqual(self.loader.retain(["/0.jpg", "/3.jpg"]), 2)
+            gate.set()
+            self.loader.close()
+
+    def test_visible_rows(self):
+        """Rows are read off the Treeview one row height apart, without duplicates."""
+        tree = mock.Mock()
+        tree.winfo_height.return_value = 100
+        tree.identify_row.side_effect = lambda y: ["", "a", "a", "b", ""][min(y // 25, 4)]
+        self.assertEqual(visible_rows(tree, 20), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for the single-flight fetch registry and watchlist freshness.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+from letterboxd_friend_check.utils.single_flight import SingleFlight  # noqa: E402
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Callers arriving while a call is in flight wait for its result."""
+        registry = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"Heat"}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.do("amy", slow)))
+            for _ in range(4)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # Let the followers reach the wait before the leader finishes
+        while registry.stats()["joined"] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"Heat"}] * 4)
+        self.assertEqual(registry.do("amy", slow), {"Heat"})
+        self.assertEqual(registry.stats(), {"executed": 1, "joined": 3, "reused": 1})
+
+    def test_failures_are_not_cached(self):
+        """A failed call is retried by the next caller."""
+        registry = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            registry.do("amy", fail)
+        self.assertEqual(registry.do("amy", lambda: 42), 42)
+
+
+class TestWatchlistFreshness(unittest.TestCase):
+    """Test cases for reusing recently synced watchlists from SQLite."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.scraped = []
+
+        def fetch_watchlist(username, limit=None, progress_callback=None):
+            self.scraped.append(username)
+            return {"Heat", "Jaws"}
+
+        self.engine = SyncEngine(
+            db_path=os.path.join(self.tmp.name, "letterboxd.db"),
+            fetch_watchlist=fetch_watchlist,
+            fetch_watchlist_count=lambda user: 2,
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_recent_sync_is_reused(self):
+        """A watchlist synced moments ago is read back instead of scraped."""
+        self.engine.sync_user("amy")
+        self.assertEqual(self.engine.sync_user("amy"), {"Heat", "Jaws"})
+        self.assertEqual(self.scraped, ["amy"])
+
+        result = self.engine.sync("me", ["amy"])
+        self.assertEqual(result.reused_from_db, ["amy"])
+        self.assertEqual(self.scraped, ["amy", "me"])
+
+    def test_limited_sync_is_not_reused(self):
+        """Only a complete watchlist counts as fresh; a limited one is fetched again."""
+        self.engine.sync_user("amy", limit=1)
+        self.engine.sync_user("amy")
+        self.engine.sync_user("amy")
+        self.assertEqual(self.scraped, ["amy", "amy"])
+
+    def test_freshness_can_be_disabled(self):
+        """With freshness_seconds=0 every call scrapes."""
+        self.engine.freshness_seconds = 0
+        self.engine.sync_user("amy")
+        self.engine.sync_user("amy")
+        self.assertEqual(self.scraped, ["amy", "amy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
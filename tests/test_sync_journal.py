@@ -0,0 +1,118 @@
+"""
+Unit tests for the sync journal and resumable watchlist fetches.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.engine import SyncEngine  # noqa: E402
+from letterboxd_friend_check.utils import web  # noqa: E402
+from tests.benchmarks.suite import unthrottled  # noqa: E402
+from tests.stub_server import ReplayServer  # noqa: E402
+
+
+class TestSyncJournal(unittest.TestCase):
+    """Test cases for the sync journal tables."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        database.init_db(self.db_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_checkpoint_roundtrip(self):
+        """Pages accumulate films; clearing removes the entry."""
+        self.assertIsNone(database.get_sync_checkpoint("amy", self.db_path))
+        database.save_sync_checkpoint("amy", "run1", 1, ["Heat", "Alien"], self.db_path)
+        films = database.save_sync_checkpoint("amy", "run2", 2, ["Jaws", "Heat"], self.db_path)
+        self.assertEqual(films, 3)
+
+        checkpoint = database.get_sync_checkpoint("amy", self.db_path)
+        self.assertEqual(checkpoint["run_id"], "run2")
+        self.assertEqual(checkpoint["pages_done"], 2)
+        self.assertEqual(checkpoint["films"], {"Heat", "Alien", "Jaws"})
+        self.assertLessEqual(checkpoint["started_at"], checkpoint["updated_at"])
+
+        database.clear_sync_checkpoint("amy", self.db_path)
+        self.assertIsNone(database.get_sync_checkpoint("amy", self.db_path))
+
+
+class TestResumableSync(unittest.TestCase):
+    """Test cases for resuming interrupted watchlist fetches."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        self.engine = SyncEngine(db_path=self.db_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_cancelled_fetch_resumes_from_checkpoint(self):
+        """A cancelled fetch keeps its pages; the next sync fetches only the rest."""
+        self.assertTrue(self.engine.resumable)
+        cancel = threading.Event()
+
+        def cancel_after_two_pages(fetched, total):
+            if fetched >= 56:
+                cancel.set()
+
+        with ReplayServer(5) as server, unthrottled():
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                partial = self.engine.sync_user(
+                    "amy", page_callback=cancel_after_two_pages, cancel_event=cancel
+                )
+                checkpoint = database.get_sync_checkpoint("amy", self.db_path)
+                self.assertEqual(len(partial), 56)
+                self.assertEqual(checkpoint["pages_done"], 2)
+                self.assertEqual(database.get_watchlist_from_db("amy", self.db_path), set())
+
+                del server.paths[:]
+                result = self.engine.sync("amy", [])
+
+        pages = [path for path in server.paths if "/page/" in path]
+        self.assertEqual(pages[0], "/amy/watchlist/page/3/")
+        self.assertEqual(len(result.user_watchlist), 140)
+        self.assertEqual(result.incomplete, [])
+        self.assertIsNone(database.get_sync_checkpoint("amy", self.db_path))
+        self.assertEqual(len(database.get_watchlist_from_db("amy", self.db_path)), 140)
+
+    def test_known_count_is_not_requested_again(self):
+        """The size fetched for the large-watchlist check is passed on to the scraper."""
+        with ReplayServer(2) as server, unthrottled():
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                result = self.engine.sync("amy", ["bob"])
+
+        self.assertEqual(len(result.friends_watchlists["bob"]), 56)
+        self.assertEqual(server.paths.count("/bob/watchlist/"), 1)
+
+    def test_stale_checkpoint_is_discarded(self):
+        """Checkpoints older than checkpoint_max_age are not resumed."""
+        database.save_sync_checkpoint("amy", "old", 4, ["Stale Film"], self.db_path)
+        self.engine.checkpoint_max_age = -1
+
+        with ReplayServer(2) as server, unthrottled():
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                films = self.engine.sync_user("amy", page_callback=lambda *args: None)
+
+        self.assertEqual(len(films), 56)
+        self.assertNotIn("Stale Film", films)
+        self.assertIn("/amy/watchlist/page/1/", server.paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
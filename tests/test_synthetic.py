@@ -0,0 +1,87 @@
+"""
+Unit tests for the synthetic dataset generator and the scaling benchmarks.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from collections import Counter
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.data.synthetic import SyntheticSpec, generate  # noqa: E402
+from movie_database import get_movie_details_for_titles  # noqa: E402
+from tests.benchmarks.scaling import run_scaling  # noqa: E402
+
+SMALL = SyntheticSpec(
+    users=12, films=3000, min_watchlist=100, max_watchlist=1000, friends_per_user=5, seed=3
+)
+
+
+class TestSyntheticGenerator(unittest.TestCase):
+    """Test cases for the synthetic dataset generator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "synthetic.db")
+        self.dataset = generate(self.db_path, SMALL, progress=lambda message: None)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_populates_all_tables(self):
+        """Users, watchlists, follows and details are readable through the normal API."""
+        self.assertEqual(len(self.dataset.usernames), 12)
+        total = 0
+        for username in self.dataset.usernames:
+            movies = database.get_watchlist_from_db(username, self.db_path)
+            self.assertGreaterEqual(len(movies), 100)
+            self.assertLessEqual(len(movies), 1000)
+            self.assertEqual(len(database.get_friends_from_db(username, self.db_path)), 5)
+            total += len(movies)
+        self.assertEqual(total, self.dataset.watchlist_rows)
+
+        movies = sorted(database.get_watchlist_from_db(self.dataset.usernames[0], self.db_path))
+        details = get_movie_details_for_titles(movies, self.db_path)
+        self.assertGreater(len(details), len(movies) // 2)
+
+    def test_popularity_is_skewed_and_deterministic(self):
+        """Popular films are on many more watchlists; the same seed gives the same data."""
+        with sqlite3.connect(self.db_path) as conn:
+            counts = Counter(
+                dict(conn.execute("SELECT movie_id, COUNT(*) FROM watchlists GROUP BY movie_id"))
+            )
+        ranked = [count for _, count in counts.most_common()]
+        self.assertGreater(ranked[0], 3 * ranked[len(ranked) // 2])
+
+        other = os.path.join(self.tmp.name, "again.db")
+        again = generate(other, SMALL, progress=lambda message: None)
+        self.assertEqual(again.watchlist_rows, self.dataset.watchlist_rows)
+        user = self.dataset.usernames[4]
+        self.assertEqual(
+            database.get_watchlist_from_db(user, other),
+            database.get_watchlist_from_db(user, self.db_path),
+        )
+
+
+class TestScalingBenchmarks(unittest.TestCase):
+    """Smoke test for the scaling benchmarks at a tiny size."""
+
+    def test_run_scaling(self):
+        """Every size produces a full set of measurements."""
+        points = run_scaling([4, 8], SMALL, samples=2)
+        self.assertEqual([point.users for point in points], [4, 8])
+        self.assertLess(points[0].watchlist_rows, points[1].watchlist_rows)
+        for point in points:
+            self.assertGreater(point.compare_peak_mb, 0)
+            self.assertGreaterEqual(point.compare_from_db_ms, point.watchlist_query_ms)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Unit tests for fetching the user's watched films and leaving them out of
+the comparison.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from unittest import mock
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.engine import SyncEngine, compare_watchlists  # noqa: E402
+from letterboxd_friend_check.utils import web  # noqa: E402
+from tests.benchmarks.suite import unthrottled  # noqa: E402
+from tests.stub_server import ReplayServer  # noqa: E402
+
+WATCHLISTS = {
+    "me": {"Heat", "Alien", "Ran", "Jaws"},
+    "amy": {"Heat", "Alien", "Dune"},
+    "bob": {"Ran", "Jaws"},
+}
+
+
+def serve_films_as_watchlist(server):
+    """Answer /films/ listings with the recorded watchlist pages"""
+    respond = server.respond
+    server.respond = lambda path: respond(
+        path.replace("/films/by/date/", "/watchlist/").replace("/films/", "/watchlist/")
+    )
+
+
+class TestGetWatchedFilms(unittest.TestCase):
+    """Test cases for web.get_watched_films against the replay server."""
+
+    def test_full_and_incremental_fetch(self):
+        """A full fetch reads every page; an incremental one stops at known films."""
+        with ReplayServer(watchlist_pages=3) as server, unthrottled():
+            serve_films_as_watchlist(server)
+            with mock.patch.object(web, "BASE_URL", server.base_url):
+                films = web.get_watched_films("fixture")
+                first_page = set(web.parse_watchlist_page(server.respond("/x/films/page/1/")[2]))
+                server.paths.clear()
+                new = web.get_watched_films("fixture", known=films - first_page)
+
+        self.assertEqual(len(films), 3 * len(first_page))
+        self.assertEqual(new, first_page)
+        self.assertEqual(
+            server.paths, ["/fixture/films/by/date/page/1/", "/fixture/films/by/date/page/2/"]
+        )
+
+
+class TestWatchedExclusion(unittest.TestCase):
+    """Test cases for the watched films sync and the watched-aware comparison."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        self.watched = {"Heat", "Ran"}
+        self.calls = []
+
+        def fetch_watched(username, known=None, strict=False):
+            self.calls.append("full" if known is None else "delta")
+            if self.watched is None:
+                raise web.WatchedFetchError("offline")
+            return set(self.watched) if known is None else self.watched - known
+
+        self.engine = SyncEngine(
+            db_path=self.db_path,
+            fetch_watchlist=lambda user, limit=None, progress_callback=None: WATCHLISTS[user],
+            fetch_watchlist_count=lambda user: len(WATCHLISTS[user]),
+            fetch_friends=lambda user: [],
+            fetch_watched=fetch_watched,
+            freshness_seconds=0,
+            watched_ttl_seconds=0,
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_watched_films_are_not_common(self):
+        """Films the user has watched drop out of every friend's common movies."""
+        result = self.engine.sync("me", ["amy", "bob"])
+        self.assertEqual(result.watched, {"Heat", "Ran"})
+        self.assertEqual(result.common_movies, {"amy": {"Alien"}, "bob": {"Jaws"}})
+        self.assertEqual(
+            compare_watchlists(WATCHLISTS["me"], {"bob": WATCHLISTS["bob"]}, {"Ran", "Jaws"}), {}
+        )
+
+    def test_resync_fetches_only_the_delta(self):
+        """Between full scrapes only new films are fetched and stored."""
+        self.engine.sync_watched("me")
+        self.watched = {"Heat", "Ran", "Jaws"}
+        self.assertEqual(self.engine.sync_watched("me"), {"Heat", "Ran", "Jaws"})
+        self.assertEqual(self.calls, ["full", "delta"])
+
+        self.engine.watched_full_ttl_seconds = 0
+        self.watched = {"Jaws"}
+        self.assertEqual(self.engine.sync_watched("me"), {"Jaws"})
+        self.assertEqual(database.get_watched_from_db("me", self.db_path), {"Jaws"})
+
+        self.watched = None
+        self.assertEqual(self.engine.sync_watched("me"), {"Jaws"})
+
+    def test_stored_films_are_reused(self):
+        """Recent scrapes and imported exports are served from the database."""
+        database.sync_watched_to_db("me", {"Heat": ("2024-01-01", 4.5)}, self.db_path)
+        self.engine.watched_ttl_seconds = 3600
+        self.engine.sync_watched("me")
+        self.assertEqual(self.engine.sync_watched("me"), {"Heat", "Ran"})
+        self.assertEqual(self.calls, ["full"])
+
+        # Scraped films keep the date and rating of an imported export
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT w.watched_date, w.rating FROM watched w JOIN movies m "
+                "ON m.movie_id = w.movie_id WHERE m.title = 'Heat'"
+            ).fetchone()
+        self.assertEqual(row, ("2024-01-01", 4.5))
+
+        database.record_export_import("amy", "export.zip", self.db_path)
+        self.assertEqual(self.engine.sync_watched("amy"), set())
+        self.assertEqual(self.calls, ["full"])
+
+    def test_new_overlaps_skip_watched_films(self):
+        """The new overlaps query anti-joins the watched table."""
+        database.sync_watchlist_to_db("me", {"Alien"}, self.db_path)
+        database.sync_watchlist_to_db("amy", {"Dune"}, self.db_path)
+        database.sync_watchlist_to_db("amy", {"Dune", "Alien"}, self.db_path)
+        self.assertEqual(
+            database.get_new_overlaps("me", ["amy"], db_path=self.db_path), {"amy": {"Alien"}}
+        )
+        database.update_watched_in_db("me", {"Alien"}, self.db_path)
+        self.assertEqual(database.get_new_overlaps("me", ["amy"], db_path=self.db_path), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
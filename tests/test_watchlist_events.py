@@ -0,0 +1,124 @@
+"""
+Unit tests for the watchlist event log and the new overlaps query.
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+import datetime
+
+# Add parent directory to path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from letterboxd_friend_check.data import database  # noqa: E402
+from letterboxd_friend_check.gui.results_model import (  # noqa: E402
+    new_overlap_movies,
+    new_overlaps_summary,
+)
+
+
+class TestWatchlistEvents(unittest.TestCase):
+    """Test cases for diff-based watchlist syncs and get_new_overlaps."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "letterboxd.db")
+        database.init_db(self.db_path)
+        self.sync("me", {"Alien (1979)", "Heat (1995)", "Ran (1985)"})
+        self.sync("amy", {"Alien (1979)", "Arrival (2016)"})
+        self.sync("bob", {"Heat (1995)"})
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def sync(self, username, titles, **kwargs):
+        return database.sync_watchlist_to_db(username, titles, self.db_path, **kwargs)
+
+    def overlaps(self, since=None):
+        return database.get_new_overlaps("me", ["amy", "bob"], since, self.db_path)
+
+    def test_first_sync_is_the_baseline(self):
+        """The first sync of a user logs no events and finds no new overlaps."""
+        self.assertEqual(database.get_watchlist_events("amy", db_path=self.db_path), [])
+        self.assertEqual(self.overlaps(), {})
+
+    def test_changes_are_logged(self):
+        """Only the diff is written; removals keep their first and last sighting."""
+        added, removed = self.sync("amy", {"Alien (1979)", "Heat (1995)"})
+        self.assertEqual((added, removed), (["Heat (1995)"], ["Arrival (2016)"]))
+        self.assertEqual(self.sync("amy", {"Alien (1979)", "Heat (1995)"}), ([], []))
+
+        events = database.get_watchlist_events("amy", db_path=self.db_path)
+        self.assertEqual(
+            [(e["title"], e["action"]) for e in events],
+            [("Heat (1995)", "added"), ("Arrival (2016)", "removed")],
+        )
+        removal = events[1]
+        self.assertLess(removal["first_seen"], removal["at"])
+        self.assertEqual(removal["last_seen"], removal["first_seen"])
+        self.assertEqual(
+            database.get_watchlist_from_db("amy", self.db_path), {"Alien (1979)", "Heat (1995)"}
+        )
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(
+                conn.execute("SELECT COUNT(*) FROM users WHERE username = 'amy'").fetchone()[0], 1
+            )
+
+    def test_new_overlaps_since_last_sync(self):
+        """Additions on either side that complete an overlap are reported."""
+        self.sync("amy", {"Alien (1979)", "Arrival (2016)", "Heat (1995)", "Dune (2021)"})
+        self.sync("me", {"Alien (1979)", "Heat (1995)", "Ran (1985)", "Arrival (2016)"})
+        self.assertEqual(self.overlaps(), {"amy": {"Heat (1995)", "Arrival (2016)"}})
+
+        # A later sync of amy without changes: nothing new on her side any more
+        self.sync("amy", {"Alien (1979)", "Arrival (2016)", "Heat (1995)", "Dune (2021)"})
+        self.assertEqual(self.overlaps(), {"amy": {"Arrival (2016)"}})
+
+        week_ago = datetime.datetime.now() - datetime.timedelta(days=7)
+        self.assertEqual(self.overlaps(since=week_ago), {"amy": {"Heat (1995)", "Arrival (2016)"}})
+
+    def first_seen(self, username):
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(
+                conn.execute(
+                    "SELECT m.title, w.first_seen FROM watchlists w "
+                    "JOIN movies m ON m.movie_id = w.movie_id WHERE w.username = ?",
+                    (username,),
+                )
+            )
+
+    def test_limited_sync_then_full_sync(self):
+        """A limited sync only adds films; the next full sync logs the removals."""
+        before = self.first_seen("amy")
+        added, removed = self.sync("amy", {"Alien (1979)", "Dune (2021)"}, complete=False)
+        self.assertEqual((added, removed), (["Dune (2021)"], []))
+        after = self.first_seen("amy")
+        self.assertEqual(set(after), {"Alien (1979)", "Arrival (2016)", "Dune (2021)"})
+        self.assertEqual(after["Arrival (2016)"], before["Arrival (2016)"])
+
+        self.assertEqual(
+            self.sync("amy", {"Alien (1979)", "Dune (2021)"}), ([], ["Arrival (2016)"])
+        )
+        events = database.get_watchlist_events("amy", db_path=self.db_path)
+        self.assertEqual(
+            [(e["title"], e["action"]) for e in events],
+            [("Dune (2021)", "added"), ("Arrival (2016)", "removed")],
+        )
+        self.assertEqual(str(events[1]["first_seen"]), before["Arrival (2016)"])
+        self.assertEqual(self.first_seen("amy")["Dune (2021)"], after["Dune (2021)"])
+
+    def test_results_helpers(self):
+        """The results view narrows common movies to the new overlaps."""
+        common = {"amy": {"Alien (1979)", "Heat (1995)"}, "bob": {"Heat (1995)"}}
+        new = {"amy": {"Heat (1995)"}}
+        self.assertEqual(new_overlap_movies(common, new), {"amy": ["Heat (1995)"], "bob": []})
+        self.assertEqual(new_overlaps_summary(new), "1 new common movies with 1 friends: amy (1)")
+        self.assertEqual(new_overlaps_summary({}), "No new common movies since the last sync.")
+
+
+if __name__ == "__main__":
+    unittest.main()
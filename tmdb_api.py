@@ -4,10 +4,7 @@ TMDB API Integration for Letterboxd Friend Check App
 This module provides functions to fetch movie details from the TMDB API.
 """
 
-import os
 import logging
-import requests
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -20,36 +17,11 @@ MOVIE_DETAILS_URL = f"{TMDB_BASE_URL}/movie"
 REQUEST_TIMEOUT = 10
 
 
-# Get API key from environment or config
+# Get API key from environment or config (memoized; see api.credentials)
 def get_api_key():
-    # First try environment variable
-    api_key = os.environ.get("TMDB_API_KEY")
+    from letterboxd_friend_check.api.credentials import get_tmdb_api_key
 
-    # If not in environment, try config file
-    if not api_key:
-        try:
-            # Try different config locations
-            config_paths = [
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json"),
-                os.path.join(
-                    os.path.dirname(os.path.abspath(__file__)),
-                    "letterboxd_friend_check",
-                    "data",
-                    "config.json",
-                ),
-            ]
-
-            for config_path in config_paths:
-                if os.path.exists(config_path):
-                    with open(config_path, "r") as f:
-                        config = json.load(f)
-                        if "tmdb_api_key" in config:
-                            api_key = config["tmdb_api_key"]
-                            break
-        except Exception as e:
-            logger.error(f"Error loading TMDB API key from config: {e}")
-
-    return api_key
+    return get_tmdb_api_key()
 
 
 def search_movie(title, year=None):
@@ -85,6 +57,8 @@ def search_movie(title, year=None):
         params["year"] = year
 
     try:
+        import requests  # deferred so importing this module stays cheap
+
         response = requests.get(SEARCH_MOVIE_URL, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
@@ -124,6 +98,8 @@ def get_movie_details(title, year=None):
 
     # Fetch detailed movie information
     try:
+        import requests
+
         url = f"{MOVIE_DETAILS_URL}/{movie_id}"
         params = {"api_key": api_key, "language": "en-US", "append_to_response": "credits,keywords"}
 